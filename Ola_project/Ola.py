@@ -1,8 +1,7 @@
 import streamlit as st
 import pandas as pd
 import sqlite3 as sql
-import matplotlib.pyplot as plt
-import seaborn as sns
+from lazy_charts import plt, sns
 import os # Import the os module
 
 # Function to connect to the database and run queries
@@ -0,0 +1,29 @@
+"""
+matplotlib.pyplot and seaborn, imported on first use.
+
+Importing the two takes the best part of a second. The app takes `plt` and
+`sns` from here instead, so a rerun that shows no chart never pays for them.
+The module stands alone, so this project still deploys from its own folder.
+"""
+
+import importlib
+
+
+class LazyModule:
+    """Stands in for a module, importing it the first time one of its attributes is read."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def loaded(self):
+        return self._module is not None
+
+
+plt = LazyModule('matplotlib.pyplot')
+sns = LazyModule('seaborn')
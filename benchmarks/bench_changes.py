@@ -0,0 +1,247 @@
+"""
+Parity check and benchmark: the changelog and precise cache invalidation
+(foodwaste_changes).
+
+Checks, on a synthetic database:
+
+    log       every row written through the base tables is logged once per
+              row image (twice for an update), with its key
+    bulk      a foodwaste_import batch is logged as one keyless change per
+              distinct set of dimension values
+    parity    ROUNDS rounds of a few random writes against a cache of every
+              analysis under COMBOS filter combinations: each entry the
+              feed's changes do not match must still equal a fresh
+              recompute. Reports how many entries a round kept, where
+              flushing on the data version keeps none.
+
+Timed: WRITES random row writes with and without the changelog triggers, the
+changelog statement of a bulk batch next to the whole import, matching the
+batch's changes against a cache, and one poll delivering a round's changes
+to the cache.
+
+Run from the repository root:  python benchmarks/bench_changes.py [claims ...]
+"""
+
+import os
+import random
+import shutil
+import sqlite3 as sql
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import foodwaste_changes  # noqa: E402
+import foodwaste_import  # noqa: E402
+import foodwaste_queries as fq  # noqa: E402
+import foodwaste_rollups  # noqa: E402
+import synthetic  # noqa: E402
+from bench_grid import combos  # noqa: E402
+
+SIZES = (100_000,)
+PARITY_CLAIMS = 10_000
+COMBOS = 8
+ROUNDS = 40
+WRITES = 5_000
+BULK = 100_000
+
+
+def statement(analysis):
+    """The statement the dashboard runs for an analysis, as in foodwaste_management_app2."""
+    return foodwaste_rollups.ANALYSES.get(analysis, fq.ANALYSES[analysis])
+
+
+def bound(analysis, params):
+    if analysis in foodwaste_rollups.ANALYSES:
+        return dict(params, **foodwaste_rollups.range_params())
+    return params
+
+
+def dependency(analysis, params):
+    return foodwaste_changes.analysis_dependency(analysis, statement(analysis))
+
+
+def tops(conn):
+    return {t: conn.execute(f"SELECT MAX({k}) FROM {t}").fetchone()[0]
+            for t, (k, _, _, _) in foodwaste_changes.CAPTURE.items()}
+
+
+def random_write(conn, rng, top):
+    """One random insert, update or delete on a random base table, as (table, key, op, rows written)."""
+    table = rng.choice(list(foodwaste_changes.CAPTURE))
+    key = foodwaste_changes.CAPTURE[table][0]
+    op = rng.random()
+    if table == 'claims_data' and op < 0.3:
+        top[table] += 1
+        conn.execute("INSERT INTO claims_data (Claim_ID, Food_ID, Receiver_ID, Status, Timestamp) "
+                     "VALUES (?, ?, ?, ?, '2025-03-01 10:00:00')",
+                     (top[table], rng.randint(1, top['food_listings_data']),
+                      rng.randint(1, top['receivers_data']), rng.choice(synthetic.STATUSES)))
+        return table, top[table], 'I', 1
+    row = rng.randint(1, top[table])
+    # Writes through the views report no rowcount, so count the row beforehand
+    written = conn.execute(f"SELECT COUNT(*) FROM {table} WHERE {key} = ?", (row,)).fetchone()[0]
+    if table == 'claims_data' and op < 0.45:
+        conn.execute("DELETE FROM claims_data WHERE Claim_ID = ?", (row,))
+        return table, row, 'D', written
+    if table == 'claims_data':
+        conn.execute("UPDATE claims_data SET Status = ? WHERE Claim_ID = ?", (rng.choice(synthetic.STATUSES), row))
+    elif table == 'food_listings_data':
+        column, values = rng.choice((('Food_type', synthetic.FOOD_TYPES), ('Meal_Type', synthetic.MEAL_TYPES),
+                                     ('Provider_Type', synthetic.PROVIDER_TYPES)))
+        conn.execute(f"UPDATE food_listings_data SET {column} = ? WHERE Food_ID = ?", (rng.choice(values), row))
+    else:
+        types = synthetic.PROVIDER_TYPES if table == 'provider_data' else synthetic.RECEIVER_TYPES
+        conn.execute(f"UPDATE {table} SET Type = ? WHERE {key} = ?", (rng.choice(types), row))
+    return table, row, 'U', written
+
+
+def check_log(path):
+    rng = random.Random(7)
+    conn = sql.connect(path)
+    start = conn.execute("SELECT IFNULL(MAX(Seq), 0) FROM changelog").fetchone()[0]
+    expected, top = [], tops(conn)
+    with conn:
+        for _ in range(500):
+            table, row, op, written = random_write(conn, rng, top)
+            expected += [(table, row, op)] * (2 if op == 'U' else 1) * written
+    logged = conn.execute("SELECT Table_Name, Row_ID, Op FROM changelog WHERE Seq > ? ORDER BY Seq",
+                          (start,)).fetchall()
+    assert expected == logged, 'changelog disagrees with the writes'
+    conn.close()
+    print(f"  log: {len(logged):,} changes for 500 writes, one per row image")
+
+
+def claim_rows(conn, n, rng):
+    foods = conn.execute("SELECT MAX(Food_ID) FROM food_listings_data").fetchone()[0]
+    receivers = conn.execute("SELECT MAX(Receiver_ID) FROM receivers_data").fetchone()[0]
+    return [{'Food_ID': rng.randint(1, foods), 'Receiver_ID': rng.randint(1, receivers),
+             'Status': rng.choice(synthetic.STATUSES), 'Timestamp': '2025-03-02 09:00:00'} for _ in range(n)]
+
+
+def check_bulk(path, n):
+    conn = foodwaste_import.connect_writer(path)
+    first_seq = conn.execute("SELECT IFNULL(MAX(Seq), 0) FROM changelog").fetchone()[0]
+    first = conn.execute("SELECT MAX(Claim_ID) FROM claims_data").fetchone()[0]
+    result = foodwaste_import.import_rows(conn, 'claims', claim_rows(conn, n, random.Random(9)))
+    # Each batch collapses its own rows, so a combination can be logged once per batch
+    logged = conn.execute(f"SELECT DISTINCT {', '.join(foodwaste_changes.DIMENSIONS)} FROM changelog WHERE Seq > ? "
+                          "ORDER BY 1, 2, 3, 4, 5, 6", (first_seq,)).fetchall()
+    assert conn.execute("SELECT COUNT(*) FROM changelog WHERE Seq > ? AND (Row_ID IS NOT NULL OR Op <> 'I' "
+                        "OR Table_Name <> 'claims_data')", (first_seq,)).fetchone()[0] == 0
+    # The same changes, recomputed from the imported rows
+    source = f"(SELECT * FROM claims_data WHERE Claim_ID > {first})"
+    conn.execute("CREATE TEMP TABLE expected AS SELECT * FROM changelog WHERE 0")
+    conn.execute(foodwaste_changes.record('claims_data', source, 'I', collapse=True).replace(
+        'INSERT INTO changelog', 'INSERT INTO temp.expected'))
+    expected = conn.execute(f"SELECT {', '.join(foodwaste_changes.DIMENSIONS)} FROM temp.expected "
+                            "ORDER BY 1, 2, 3, 4, 5, 6").fetchall()
+    assert logged == expected, 'bulk changes disagree with the imported rows'
+    conn.execute("DROP TABLE temp.expected")
+    start = time.perf_counter()
+    conn.execute("BEGIN")
+    conn.execute(foodwaste_changes.record('claims_data', source, 'I', collapse=True))
+    changelog = time.perf_counter() - start
+    conn.execute("ROLLBACK")
+    changes = [foodwaste_changes.Change(*row) for row in conn.execute(
+        "SELECT * FROM changelog WHERE Seq > ?", (first_seq,))]
+    keys = [(analysis, tuple(sorted(bound(analysis, params).items())), 0)
+            for params in combos(conn, COMBOS) for analysis in fq.ANALYSES]
+    start = time.perf_counter()
+    matched = sum(map(foodwaste_changes.matcher(changes, dependency), keys))
+    matching = time.perf_counter() - start
+    conn.close()
+    print(f"  bulk: {result.rows:,} imported claims logged as {len(logged):,} changes, "
+          f"matching {matched:,} of {len(keys):,} cached results in {matching * 1000:.0f} ms")
+    return result.seconds, changelog
+
+
+class Cache:
+    """Every analysis under every filter combination, keyed like the dashboard's caches."""
+
+    def __init__(self, conn, work):
+        self.conn = conn
+        self.entries = {}
+        for params in work:
+            for analysis in fq.ANALYSES:
+                key = (analysis, tuple(sorted(bound(analysis, params).items())), 0)
+                self.entries[key] = self.compute(key)
+
+    def compute(self, key):
+        analysis, params = key[0], dict(key[1])
+        return self.conn.execute(statement(analysis), params).fetchall()
+
+
+def check_parity(path):
+    conn = fq.connect(path)
+    work = combos(conn, COMBOS)
+    cache = Cache(conn, work)
+    writer = sql.connect(path)
+    feed = foodwaste_changes.ChangeFeed(path)
+    stale = []
+    feed.subscribe(lambda changes: stale.extend(
+        filter(foodwaste_changes.matcher(changes, dependency), cache.entries)))
+    rng, top = random.Random(13), tops(writer)
+    kept = polls = 0
+    for _ in range(ROUNDS):
+        with writer:
+            for _ in range(rng.randint(1, 4)):
+                random_write(writer, rng, top)
+        stale.clear()
+        start = time.perf_counter()
+        feed.poll()
+        polls += time.perf_counter() - start
+        dropped = set(stale)
+        for key in cache.entries:
+            fresh = cache.compute(key)
+            if key in dropped:
+                cache.entries[key] = fresh
+            else:
+                assert cache.entries[key] == fresh, ('kept a stale entry', key)
+                kept += 1
+    feed.close()
+    writer.close()
+    conn.close()
+    total = len(cache.entries) * ROUNDS
+    print(f"  parity: {ROUNDS} rounds of 1-4 writes over {len(cache.entries):,} cached results: no stale entry kept")
+    print(f"    kept {kept / total:.0%} of the entries per round (flushing on the data version keeps 0%), "
+          f"poll and match {polls * 1000 / ROUNDS:.2f} ms per round")
+
+
+def timed_writes(path, writes):
+    rng = random.Random(21)
+    conn = sql.connect(path)
+    top = tops(conn)
+    start = time.perf_counter()
+    with conn:
+        for _ in range(writes):
+            random_write(conn, rng, top)
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed
+
+
+def main(sizes=SIZES):
+    directory = tempfile.mkdtemp()
+    path = synthetic.build(os.path.join(directory, 'bench_changes_parity.db'), claims=PARITY_CLAIMS)
+    print(f"\n{PARITY_CLAIMS:,} claims")
+    check_log(path)
+    check_parity(path)
+    for claims in sizes:
+        path = synthetic.build(os.path.join(directory, f'bench_changes_{claims}.db'), claims=claims)
+        bare = shutil.copy(path, os.path.join(directory, 'bench_changes_bare.db'))
+        conn = sql.connect(bare)
+        conn.executescript(''.join(f"DROP TRIGGER {name};" for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_changes_%'").fetchall()))
+        conn.close()
+        print(f"\n{claims:,} claims")
+        logged, plain = timed_writes(path, WRITES), timed_writes(bare, WRITES)
+        print(f"  {WRITES:,} random row writes: {logged * 1e6 / WRITES:.0f} us each with the changelog, "
+              f"{plain * 1e6 / WRITES:.0f} us without ({logged / plain - 1:+.0%})")
+        seconds, changelog = check_bulk(path, BULK)
+        print(f"    import {seconds:.2f} s, of which the changelog statement {changelog * 1000:.0f} ms")
+    shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or SIZES)
@@ -0,0 +1,90 @@
+"""
+Benchmark: providers and receivers per city, from the City join vs city_stats.
+
+The number of cities is held fixed while providers and receivers grow, so each
+city gets bigger. The join answers by building providers x receivers pairs per
+city and grows quadratically; city_stats is read by primary key and stays
+linear in the number of cities, as does building it in the migration. Where
+the join still finishes in reasonable time, both must return the same rows,
+including after writes have gone through the triggers.
+
+Run from the repository root:  python benchmarks/bench_city_stats.py [providers+receivers ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import foodwaste_migrate  # noqa: E402
+import foodwaste_queries as fq  # noqa: E402
+import synthetic  # noqa: E402
+
+SIZES = (10_000, 100_000, 300_000, 1_000_000)
+CITIES = 100
+# Pairs the join may build before it is skipped
+JOIN_BUDGET = 200_000_000
+
+ANALYSIS = 'Number of Food Providers and Receivers in Each City'
+
+JOIN = """
+    SELECT
+        T1.City,
+        COUNT(DISTINCT T1.Provider_ID) AS Number_of_Providers,
+        COUNT(DISTINCT T2.Receiver_ID) AS Number_of_Receivers
+    FROM provider_data AS T1
+    LEFT JOIN receivers_data AS T2 ON T1.City = T2.City
+    WHERE 1=1""" + fq.where(provider_type='T1.Type', receiver_type='T2.Type') + """
+    GROUP BY T1.City;
+    """
+
+FILTERS = [
+    fq.filter_params(),
+    fq.filter_params(provider_type='Restaurant'),
+    fq.filter_params(receiver_type='Shelter'),
+    fq.filter_params(provider_type='Supermarket', receiver_type='NGO'),
+]
+
+
+def write_some(conn):
+    """Moves, retypes, inserts and deletes on both sides."""
+    with conn:
+        conn.execute("UPDATE provider_data SET City = 'City 1' WHERE Provider_ID % 17 = 0")
+        conn.execute("UPDATE receivers_data SET Type = 'NGO', City = 'New City' WHERE Receiver_ID % 19 = 0")
+        conn.execute("DELETE FROM receivers_data WHERE Receiver_ID % 23 = 0 AND Receiver_ID NOT IN "
+                     "(SELECT Receiver_ID FROM claims_data)")
+        conn.execute("INSERT INTO provider_data (Name, Type, Address, City, Contact) "
+                     "VALUES ('Late Provider', 'Restaurant', '1 Road', 'Brand New City', '')")
+
+
+def timed(conn, statement):
+    start = time.perf_counter()
+    results = [conn.execute(statement, fq.bind_ids(conn, params)).fetchall() for params in FILTERS]
+    return results, (time.perf_counter() - start) * 1000 / len(FILTERS)
+
+
+def main(sizes=SIZES):
+    print(f"{'providers+receivers':>20} {'cities':>7} {'build ms':>9} {'join ms':>10} {'city_stats ms':>14}")
+    for people in sizes:
+        path = synthetic.build(os.path.join(tempfile.gettempdir(), f'bench_city_{people}.db'), claims=1000,
+                               providers=people // 2, receivers=people // 2, cities=CITIES, migrate=False)
+        start = time.perf_counter()
+        foodwaste_migrate.migrate(path)
+        build = (time.perf_counter() - start) * 1000
+        conn = fq.connect(path)
+        stats, stats_ms = timed(conn, fq.ANALYSES[ANALYSIS])
+        join_ms = '-'
+        if (people // 2) ** 2 // CITIES <= JOIN_BUDGET:
+            expected, elapsed = timed(conn, JOIN)
+            assert stats == expected, 'city_stats disagrees with the City join'
+            write_some(conn)
+            assert timed(conn, fq.ANALYSES[ANALYSIS])[0] == timed(conn, JOIN)[0], 'city_stats drifted after writes'
+            join_ms = f'{elapsed:.1f}'
+        print(f"{people:>20,} {CITIES:>7} {build:>9.0f} {join_ms:>10} {stats_ms:>14.3f}")
+        conn.close()
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or SIZES)
@@ -0,0 +1,112 @@
+"""
+Parity check and benchmark: percentage-of-total analyses from metrics_cube.
+
+'Percentage of Food Claims by Status' used to divide by a separate
+(SELECT COUNT(*) FROM claims_data) that ignored every sidebar filter. Both
+percentage analyses now come from foodwaste_cube.claim_shares(). For random
+filter combinations they must return the same rows as a single scan of
+claims ⨝ listings ⨝ receivers with SUM(COUNT(*)) OVER () as the denominator,
+which is also timed, next to the old statement.
+
+Run from the repository root:  python benchmarks/bench_claim_shares.py [claims ...]
+"""
+
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import foodwaste_queries as fq  # noqa: E402
+import synthetic  # noqa: E402
+
+SIZES = (100_000, 1_000_000)
+COMBOS = 50
+
+COLUMNS = {'status': 'c.Status', 'receiver_type': 'r.Type', 'food_type': 'l.Food_type',
+           'meal_type': 'l.Meal_Type', 'location': 'l.Location'}
+
+OLD_STATUS = """
+    SELECT
+        Status,
+        COUNT(*) AS Number_of_Claims,
+        (COUNT(*) * 100.0 / (SELECT COUNT(*) FROM claims_data)) AS Percentage
+    FROM claims_data
+    WHERE 1=1""" + fq.where(status='Status') + """
+    GROUP BY Status;
+    """
+
+
+def window_scan(name, label, order_by):
+    """The same analysis as one pass over the base tables."""
+    others = {n: c for n, c in COLUMNS.items() if n != name}
+    return f"""
+    SELECT {label}, Number_of_Claims, Percentage
+    FROM (
+        SELECT {COLUMNS[name]} AS {label}, COUNT(*) AS Number_of_Claims,
+               COUNT(*) * 100.0 / SUM(COUNT(*)) OVER () AS Percentage
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID
+        WHERE 1=1""" + fq.where(**others) + f"""
+        GROUP BY 1
+    )
+    WHERE (:{name} IS NULL OR {label} = :{name})
+    ORDER BY {order_by};
+    """
+
+
+CASES = {
+    'Percentage of Food Claims by Status': window_scan('status', 'Status', 'Status'),
+    'Percentage of Food Claims by Meal Type': window_scan('meal_type', 'Meal_Type',
+                                                          'Number_of_Claims DESC, Meal_Type'),
+}
+
+
+def combos(conn, n):
+    values = {name: [row[0] for row in conn.execute(
+        f"SELECT DISTINCT {column} FROM claims_data AS c JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID "
+        f"JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID")] for name, column in COLUMNS.items()}
+    yield fq.bind_ids(conn, fq.filter_params())
+    for _ in range(n - 1):
+        yield fq.bind_ids(conn, fq.filter_params(**{name: random.choice(options + ['All'] * len(options))
+                                                    for name, options in values.items()}))
+
+
+def same(expected, got):
+    return len(expected) == len(got) and all(
+        a[:2] == b[:2] and math.isclose(a[2], b[2], rel_tol=1e-12) for a, b in zip(expected, got))
+
+
+def timed(conn, statement, work):
+    start = time.perf_counter()
+    for params in work:
+        conn.execute(statement, params).fetchall()
+    return (time.perf_counter() - start) * 1000 / len(work)
+
+
+def main(sizes=SIZES):
+    random.seed(0)
+    for claims in sizes:
+        path = synthetic.build(os.path.join(tempfile.gettempdir(), f'bench_shares_{claims}.db'), claims=claims)
+        conn = fq.connect(path)
+        work = list(combos(conn, COMBOS))
+        print(f"\n{claims:,} claims, {len(work)} filter combinations")
+        for analysis, reference in CASES.items():
+            for params in work:
+                expected = conn.execute(reference, params).fetchall()
+                got = conn.execute(fq.ANALYSES[analysis], params).fetchall()
+                assert same(expected, got), (analysis, params, expected, got)
+            print(f"  {analysis}: same rows as the base-table scan")
+            print(f"    base tables, SUM(COUNT(*)) OVER ()  {timed(conn, reference, work):9.3f} ms")
+            if analysis == 'Percentage of Food Claims by Status':
+                print(f"    old statement (unfiltered total)    {timed(conn, OLD_STATUS, work):9.3f} ms")
+            print(f"    metrics_cube                        {timed(conn, fq.ANALYSES[analysis], work):9.3f} ms")
+        conn.close()
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or SIZES)
@@ -0,0 +1,148 @@
+"""
+Load test: many concurrent claimers against a copy of database.db.
+
+Each claimer thread repeatedly claims a random listing from a small hot set
+(so receivers really do race for the same Food_ID), and settles some of its
+claims as Completed or Cancelled, sometimes with a stale version. The same
+workload runs three ways:
+
+    direct        every thread has its own connection, one transaction per write
+    service x1    foodwaste_claims.ClaimService without group commit
+    service       ClaimService with group commit
+
+and prints writes/sec, the conflict rate and the mean group-commit size. After
+each run it asserts that no listing ended up with two live claims.
+
+Run from the repository root:  python benchmarks/bench_claims.py [claimers] [writes per claimer]
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import foodwaste_claims  # noqa: E402
+import foodwaste_import  # noqa: E402
+import foodwaste_migrate  # noqa: E402
+import foodwaste_queries as fq  # noqa: E402
+
+CLAIMERS = 32
+WRITES = 100
+HOT_LISTINGS = 500
+
+
+def claimer(seed, session, foods, receivers, writes, tally):
+    rng = random.Random(seed)
+    mine = []
+    with session() as (create, settle):
+        for _ in range(writes):
+            try:
+                if mine and rng.random() < 0.4:
+                    claim = mine.pop(rng.randrange(len(mine)))
+                    version = claim.version if rng.random() < 0.8 else claim.version - 1
+                    settle(claim.claim_id, 'Completed' if rng.random() < 0.3 else 'Cancelled', version)
+                else:
+                    mine.append(create(rng.choice(foods), rng.choice(receivers)))
+                tally['ok'] += 1
+            except foodwaste_claims.ClaimConflict:
+                tally['conflicts'] += 1
+
+
+def run(path, label, make):
+    conn = fq.connect(path)
+    foods = [r[0] for r in conn.execute(f"""
+        SELECT Food_ID FROM food_listings_data AS l
+        WHERE NOT EXISTS (SELECT 1 FROM claims_data AS c
+                          WHERE c.Food_ID = l.Food_ID AND c.Status IN {foodwaste_claims.LIVE})
+        ORDER BY random() LIMIT ?""", (HOT_LISTINGS,))]
+    receivers = [r[0] for r in conn.execute("SELECT Receiver_ID FROM receivers_data")]
+    first = conn.execute("SELECT MAX(Claim_ID) FROM claims_data").fetchone()[0]
+    conn.close()
+
+    tallies = [{'ok': 0, 'conflicts': 0} for _ in range(CLAIMERS)]
+    session, close = make()
+    threads = [threading.Thread(target=claimer, args=(i, session, foods, receivers, WRITES, tallies[i]))
+               for i in range(CLAIMERS)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    extra = close()
+
+    ok = sum(t['ok'] for t in tallies)
+    conflicts = sum(t['conflicts'] for t in tallies)
+    print(f"{label:<12} {(ok + conflicts) / elapsed:>10,.0f} {conflicts / (ok + conflicts):>10.1%} {extra:>12}")
+
+    conn = fq.connect(path)
+    doubles = conn.execute("""
+        SELECT COUNT(*) FROM (
+            SELECT Food_ID FROM claims_data
+            WHERE Claim_ID > ? AND Status IN ('Pending', 'Completed')
+            GROUP BY Food_ID HAVING COUNT(*) > 1)""", (first,)).fetchone()[0]
+    conn.close()
+    assert doubles == 0, f'{doubles} listings were claimed twice'
+
+
+def direct(path):
+    """Each claimer opens its own writer connection and commits every write on its own."""
+    @contextmanager
+    def session():
+        conn = foodwaste_import.connect_writer(path)
+        try:
+            yield (lambda food, receiver: foodwaste_claims.create_claim(conn, food, receiver),
+                   lambda claim_id, status, version: foodwaste_claims.transition(conn, claim_id, status, version))
+        finally:
+            conn.close()
+
+    return lambda: (session, lambda: '-')
+
+
+def service(path, **options):
+    """All claimers share one ClaimService."""
+    def make():
+        svc = foodwaste_claims.ClaimService(path, **options)
+
+        @contextmanager
+        def session():
+            yield svc.create, svc.transition
+
+        def close():
+            svc.close()
+            return f"{svc.stats()['mean_batch']:.1f}"
+        return session, close
+    return make
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    migrated = os.path.join(directory, 'migrated.db')
+    shutil.copy(fq.DATABASE, migrated)
+    foodwaste_migrate.migrate(migrated)
+    print(f"{CLAIMERS} claimers x {WRITES} writes on {fq.DATABASE}, {HOT_LISTINGS} hot listings")
+    print(f"{'mode':<12} {'writes/s':>10} {'conflicts':>10} {'mean batch':>12}")
+    modes = [('direct', direct), ('service x1', lambda p: service(p, max_batch=1)), ('service', service),
+             ('service 2ms', lambda p: service(p, max_wait=0.002))]
+    for label, mode in modes:
+        # A fresh copy per mode, so every mode starts with the same unclaimed listings
+        path = os.path.join(directory, 'bench_claims.db')
+        shutil.copy(migrated, path)
+        run(path, label, mode(path))
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+    shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        CLAIMERS = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        WRITES = int(sys.argv[2])
+    main()
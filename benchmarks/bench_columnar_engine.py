@@ -0,0 +1,119 @@
+"""
+Benchmark: foodwaste_engine.ColumnarEngine vs SQLite.
+
+Times filter resolution with the claims bitmap index against plain boolean
+masks. Then, for every analysis the engine covers, times both engines over
+random sidebar filter combinations. That both return the same rows is
+checked by tests/test_engine.py.
+
+Run from the repository root:
+    python benchmarks/bench_columnar_engine.py              database.db, then 1M claims
+    python benchmarks/bench_columnar_engine.py 10000000     10M claims (several GB of RAM)
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import foodwaste_engine  # noqa: E402
+import foodwaste_migrate  # noqa: E402
+import foodwaste_queries as fq  # noqa: E402
+import synthetic  # noqa: E402
+
+COMBOS = 20
+
+
+def combos(engine, n):
+    rng = random.Random(3)
+    choices = {
+        'status': engine.status.values,
+        'provider_type': engine.provider_type.values,
+        'receiver_type': engine.receiver_type.values,
+        'food_type': engine.food_type.values,
+        'meal_type': engine.meal_type.values,
+        'location': engine.location.values[:50],
+    }
+    yield fq.filter_params()
+    for _ in range(n - 1):
+        yield fq.filter_params(**{k: rng.choice(v) if rng.random() < 0.4 else 'All' for k, v in choices.items()})
+
+
+def reference_rows(engine, params):
+    """Claims matching the five fact-view filters, computed with plain boolean masks."""
+    np = foodwaste_engine.np
+    listing_ok, receiver_ok = engine.claim_listing >= 0, engine.claim_receiver >= 0
+    mask = listing_ok & receiver_ok
+    for name, rows in (('food_type', engine.claim_listing), ('meal_type', engine.claim_listing),
+                       ('location', engine.claim_listing), ('receiver_type', engine.claim_receiver)):
+        if params[name] is not None:
+            column = getattr(engine, name)
+            mask &= column.codes[np.where(rows >= 0, rows, 0)] == column.code(params[name])
+    if params['status'] is not None:
+        mask &= engine.status.codes == engine.status.code(params['status'])
+    return np.flatnonzero(mask)
+
+
+def bitmap_filters(engine, work):
+    """Time resolving each filter set: boolean masks vs bitmaps (first use, then memoized)."""
+    masks = cold = warm = 0.0
+    for params in work:
+        start = time.perf_counter()
+        expected = reference_rows(engine, params)
+        masks += time.perf_counter() - start
+        engine.claim_index._cache.clear()
+        start = time.perf_counter()
+        rows = engine._claim_mask(params)
+        cold += time.perf_counter() - start
+        start = time.perf_counter()
+        engine._claim_mask(params)
+        warm += time.perf_counter() - start
+        assert list(rows) == list(expected), params
+    n = len(work)
+    print(f"filter resolution over the claims fact view ({engine.claim_index.nbytes() / 2 ** 20:.1f} MiB of bitmaps): "
+          f"masks {masks * 1000 / n:.3f} ms, bitmaps {cold * 1000 / n:.3f} ms, memoized {warm * 1000 / n:.4f} ms")
+
+
+def run(path):
+    start = time.perf_counter()
+    engine = foodwaste_engine.ColumnarEngine(path)
+    load = time.perf_counter() - start
+    conn = fq.connect(path)
+    work = [fq.bind_ids(conn, params) for params in combos(engine, COMBOS)]
+    print(f"\n{path}: {len(engine.status.codes):,} claims, loaded in {load:.2f}s")
+    bitmap_filters(engine, work)
+    print(f"{'analysis':<72} {'sqlite ms':>10} {'columnar ms':>12}")
+    for analysis in engine.ANALYSES:
+        sqlite_time = columnar_time = 0.0
+        for params in work:
+            start = time.perf_counter()
+            fq.fetch(conn, fq.ANALYSES[analysis], params)
+            sqlite_time += time.perf_counter() - start
+            start = time.perf_counter()
+            engine.run(analysis, params)
+            columnar_time += time.perf_counter() - start
+        print(f"{analysis:<72} {sqlite_time * 1000 / len(work):>10.2f} {columnar_time * 1000 / len(work):>12.2f}")
+    conn.close()
+
+
+def main(sizes):
+    # A migrated copy, since some analyses read the derived tables
+    path = os.path.join(tempfile.gettempdir(), 'bench_engine_small.db')
+    if os.path.exists(fq.DATABASE):
+        shutil.copy(fq.DATABASE, path)
+        foodwaste_migrate.migrate(path)
+    else:
+        synthetic.build(path, claims=1000)
+    run(path)
+    os.remove(path)
+    for claims in sizes:
+        path = synthetic.build(os.path.join(tempfile.gettempdir(), f'bench_engine_{claims}.db'), claims=claims)
+        run(path)
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or [1_000_000])
@@ -0,0 +1,111 @@
+"""
+Benchmark: the food waste tables before and after migration 16 (dimension tables).
+
+Migrates one copy of the database to version 15 and another to version 16,
+then prints the on-disk size of the four food waste tables with their indexes
+(the *_facts tables and the dim_* tables on the migrated side) and of the
+whole file. It runs every analysis under random sidebar filters on both,
+checks that they return the same rows, and prints the mean latency of each
+analysis before and after.
+
+Run from the repository root:  python benchmarks/bench_dimensions.py [claims ...]
+    (no arguments: database.db, then 300k synthetic claims)
+"""
+
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import foodwaste_dimensions  # noqa: E402
+import foodwaste_migrate  # noqa: E402
+import foodwaste_queries as fq  # noqa: E402
+import synthetic  # noqa: E402
+from bench_metrics_cube import combos  # noqa: E402
+
+LOOKUPS = 20
+CODED = {column for columns in foodwaste_dimensions.CODED.values() for column in columns}
+
+
+def table_sizes(path):
+    """Bytes used by each table, its indexes included."""
+    conn = fq.connect(path)
+    sizes = {}
+    for name, table, size in conn.execute("""
+            SELECT d.name, m.tbl_name, SUM(d.pgsize) FROM dbstat AS d
+            JOIN sqlite_master AS m ON m.name = d.name GROUP BY d.name"""):
+        sizes[table] = sizes.get(table, 0) + size
+    conn.close()
+    return sizes
+
+
+def report_sizes(before, after):
+    old, new = table_sizes(before), table_sizes(after)
+    print(f"{'table':<24} {'text KiB':>10} {'IDs KiB':>10}")
+    for table, (facts, _, _, _) in foodwaste_dimensions.TABLES.items():
+        print(f"{table:<24} {old[table] / 1024:>10.0f} {new[facts] / 1024:>10.0f}")
+    dims = sum(size for name, size in new.items() if name in foodwaste_dimensions.DIMENSIONS)
+    print(f"{'dim_* tables':<24} {'':>10} {dims / 1024:>10.0f}")
+    print(f"{'whole file':<24} {os.path.getsize(before) / 1024:>10.0f} {os.path.getsize(after) / 1024:>10.0f}")
+
+
+def on_text(statement):
+    """The statement as it ran before migration 16, on the text columns."""
+    statement = re.sub(r"\b(\w+)_ID = \(SELECT ID FROM dim_\w+ WHERE Value = ([^)]+)\)", r"\1 = \2", statement)
+    statement = re.sub(r"\b(\w+)_ID = (:\w+)_id\b", r"\1 = \2", statement)
+    return re.sub(r"\b(" + '|'.join(CODED) + r")_ID\b", r"\1", statement)
+
+
+def timed(conn, statement, work):
+    start = time.perf_counter()
+    for params in work:
+        conn.execute(statement, params).fetchall()
+    return (time.perf_counter() - start) * 1000 / len(work)
+
+
+def run(before):
+    """before is at schema version 15; a copy is migrated to 16 next to it."""
+    after = before.replace('.db', '_16.db')
+    shutil.copy(before, after)
+    foodwaste_migrate.migrate(after)
+    for path in (before, after):
+        conn = fq.connect(path)
+        conn.execute("VACUUM")
+        conn.close()
+    report_sizes(before, after)
+    old, new = fq.connect(before), fq.connect(after)
+    work = [dict(p, city=None) for p in combos(new, LOOKUPS)]
+    print(f"\n{'analysis':<72} {'text ms':>9} {'IDs ms':>9}")
+    for name, statement in fq.ANALYSES.items():
+        text = on_text(statement)
+        for params in work:
+            assert new.execute(statement, params).fetchall() == old.execute(text, params).fetchall(), (name, params)
+        print(f"{name:<72} {timed(old, text, work):>9.3f} {timed(new, statement, work):>9.3f}")
+    old.close()
+    new.close()
+    os.remove(after)
+
+
+def main(sizes=None):
+    if not sizes:
+        path = os.path.join(tempfile.gettempdir(), 'bench_dimensions.db')
+        shutil.copy(fq.DATABASE, path)
+        foodwaste_migrate.migrate(path, target=15)
+        print(f"== {fq.DATABASE}")
+        run(path)
+        os.remove(path)
+        sizes = (300_000,)
+    for claims in sizes:
+        path = synthetic.build(os.path.join(tempfile.gettempdir(), f'bench_dimensions_{claims}.db'), claims=claims,
+                               migrate=False)
+        foodwaste_migrate.migrate(path, target=15)
+        print(f"\n== {claims:,} synthetic claims")
+        run(path)
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]])
@@ -0,0 +1,104 @@
+"""
+Benchmark: next available listings to expire, from the base tables vs expiry_queue.
+
+The base-table version anti-joins every listing against its Completed claims
+and sorts what is left by Expiry_Date, so it grows with food_listings_data;
+expiry_queue answers with a primary key range scan that stops after LIMIT
+rows. Both must return the same listings, including after claims are created,
+completed and cancelled through foodwaste_claims and listings are moved,
+re-dated and deleted.
+
+Run from the repository root:  python benchmarks/bench_expiry.py [claims ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import foodwaste_claims  # noqa: E402
+import foodwaste_expiry  # noqa: E402
+import foodwaste_import  # noqa: E402
+import foodwaste_queries as fq  # noqa: E402
+import synthetic  # noqa: E402
+
+SIZES = (10_000, 100_000, 1_000_000)
+REPEAT = 20
+
+BASE = """
+    SELECT l.Food_ID
+    FROM food_listings_data AS l
+    WHERE (:location IS NULL OR l.Location = :location)
+      AND l.Expiry_Epoch >= :after
+      AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status = 'Completed')
+    ORDER BY l.Expiry_Epoch, l.Food_ID
+    LIMIT :limit;
+    """
+
+
+def cases(conn):
+    location, after = conn.execute("SELECT Location, Expiry_Date FROM food_listings_data "
+                                   "ORDER BY Food_ID LIMIT 1 OFFSET 7").fetchone()
+    # The synthetic dates are long past, so the open cases start from their first day instead of now
+    start = f"{synthetic.START} 00:00:00"
+    return [(None, start), (location, start), (None, after), (location, after)]
+
+
+def queue(conn, location, after):
+    return [row[0] for row in foodwaste_expiry.next_expiring(conn, location, after=after)[1]]
+
+
+def base(conn, location, after):
+    return [row[0] for row in conn.execute(BASE, foodwaste_expiry.expiry_params(location, after=after))]
+
+
+def write_some(path):
+    """Claim, complete and cancel through the claim API, then edit and delete listings directly."""
+    conn = foodwaste_import.connect_writer(path)
+    receiver = conn.execute("SELECT MIN(Receiver_ID) FROM receivers_data").fetchone()[0]
+    foods = [row[0] for row in conn.execute("SELECT Food_ID FROM expiry_queue ORDER BY Expiry_Epoch LIMIT 30")]
+    for i, food in enumerate(foods):
+        try:
+            claim = foodwaste_claims.create_claim(conn, food, receiver)
+        except foodwaste_claims.ClaimConflict:
+            continue
+        if i % 3:
+            claim = foodwaste_claims.transition(conn, claim.claim_id, 'Completed', claim.version)
+        if i % 5 == 0 and claim.status == 'Completed':
+            conn.execute("UPDATE claims_data SET Status = 'Cancelled' WHERE Claim_ID = ?", (claim.claim_id,))
+    conn.execute("BEGIN")
+    conn.execute("UPDATE food_listings_data SET Location = 'City 1' WHERE Food_ID % 13 = 0")
+    conn.execute("UPDATE food_listings_data SET Expiry_Date = datetime(Expiry_Date, '-3 days') WHERE Food_ID % 11 = 0")
+    conn.execute("DELETE FROM claims_data WHERE Claim_ID % 29 = 0")
+    conn.execute("DELETE FROM food_listings_data WHERE Food_ID % 31 = 0 "
+                 "AND Food_ID NOT IN (SELECT Food_ID FROM claims_data)")
+    conn.execute("COMMIT")
+    conn.close()
+
+
+def timed(conn, answer):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        results = [answer(conn, location, after) for location, after in cases(conn)]
+    return results, (time.perf_counter() - start) * 1000 / REPEAT / 4
+
+
+def main(sizes=SIZES):
+    print(f"{'claims':>10} {'listings':>10} {'base ms':>9} {'queue ms':>9}")
+    for claims in sizes:
+        path = synthetic.build(os.path.join(tempfile.gettempdir(), f'bench_expiry_{claims}.db'), claims=claims)
+        conn = fq.connect(path)
+        listings = conn.execute("SELECT COUNT(*) FROM food_listings_data").fetchone()[0]
+        expected, base_ms = timed(conn, base)
+        got, queue_ms = timed(conn, queue)
+        assert got == expected, 'expiry_queue disagrees with the base tables'
+        write_some(path)
+        assert timed(conn, queue)[0] == timed(conn, base)[0], 'expiry_queue drifted after writes'
+        print(f"{claims:>10,} {listings:>10,} {base_ms:>9.2f} {queue_ms:>9.3f}")
+        conn.close()
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or SIZES)
@@ -0,0 +1,87 @@
+"""
+Benchmark: exporting every claim row with foodwaste_export vs pandas.
+
+The pandas version is what the dashboard would otherwise do: read_sql the
+whole result into a DataFrame, then write it out. foodwaste_export streams
+record batches from the cursor to the file. Each export runs in its own
+process so its peak RSS can be read with getrusage; the streaming exports
+should stay near the same peak at every size while the pandas one grows with
+the row count. The files must hold the same rows.
+
+Run from the repository root:  python benchmarks/bench_export.py [claims ...]
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import pyarrow.parquet as pq
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import foodwaste_export  # noqa: E402
+import foodwaste_queries as fq  # noqa: E402
+import synthetic  # noqa: E402
+
+SIZES = (100_000, 1_000_000)
+METHODS = ('stream parquet', 'stream csv', 'pandas parquet')
+
+
+def run(method, path, out):
+    """Export in this process and print: seconds rows bytes peak_rss_kib."""
+    conn = fq.connect(path)
+    params = fq.bind_ids(conn, fq.filter_params())
+    sql = foodwaste_export.FACTS['claims']
+    start = time.perf_counter()
+    if method == 'pandas parquet':
+        import pandas as pd
+        frame = pd.read_sql(sql, conn, params=params)
+        frame.to_parquet(out, index=False)
+        rows = len(frame)
+    else:
+        rows = foodwaste_export.export(conn, sql, params, out, method.split()[1]).rows
+    elapsed = time.perf_counter() - start
+    print(elapsed, rows, os.path.getsize(out), resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def measure(method, path, out):
+    output = subprocess.run([sys.executable, __file__, '--run', method, path, out],
+                            check=True, capture_output=True, text=True).stdout.split()
+    seconds, rows, size, peak = output
+    return float(seconds), int(rows), int(size), int(peak)
+
+
+def same_rows(streamed, baseline):
+    """pandas writes text as large_string; compare the values, not the Arrow types."""
+    streamed, baseline = pq.read_table(streamed), pq.read_table(baseline)
+    return streamed.equals(baseline.cast(streamed.schema))
+
+
+def main(sizes=SIZES):
+    for claims in sizes:
+        path = synthetic.build(os.path.join(tempfile.gettempdir(), f'bench_export_{claims}.db'), claims=claims)
+        print(f"\n{claims:,} claims")
+        counts, files = set(), {}
+        for method in METHODS:
+            ext = method.split()[1]
+            out = os.path.join(tempfile.gettempdir(), f"bench_export_{claims}_{method.split()[0]}.{ext}")
+            seconds, rows, size, peak = measure(method, path, out)
+            counts.add(rows)
+            files[method] = out
+            print(f"  {method:<15} {seconds:8.2f} s  {rows / seconds:>11,.0f} rows/s  "
+                  f"{size / 2**20:8.1f} MB file  peak RSS {peak / 1024:8.1f} MB")
+        assert len(counts) == 1, counts
+        assert same_rows(files['stream parquet'], files['pandas parquet'])
+        print(f"  same {counts.pop():,} rows in every file")
+        for out in files.values():
+            os.remove(out)
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--run']:
+        run(*sys.argv[2:5])
+    else:
+        main([int(a) for a in sys.argv[1:]] or SIZES)
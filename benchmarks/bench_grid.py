@@ -0,0 +1,165 @@
+"""
+Parity check and benchmark: keyset-paginated grids (foodwaste_grid).
+
+For random filter combinations, walking every page of a grid with
+fetch_page() must give the same rows in the same order as the grid's source
+query sorted in full, and the same rows as the analysis in
+foodwaste_queries.ANALYSES. item_claims is then checked against a recount
+from claims_data after random inserts, status changes, moves and deletes.
+
+The timings compare three ways of showing the rows at DEPTH of a grid: a
+keyset page starting after the row before them, the same page through
+LIMIT / OFFSET, and the whole sorted result the dashboard used to send.
+
+Run from the repository root:  python benchmarks/bench_grid.py [claims ...]
+"""
+
+import os
+import random
+import sqlite3 as sql
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import foodwaste_grid  # noqa: E402
+import foodwaste_queries as fq  # noqa: E402
+import synthetic  # noqa: E402
+
+SIZES = (100_000, 1_000_000)
+COMBOS = 10
+WRITES = 2_000
+# Where in each grid the timed page starts, as a fraction of its rows
+DEPTH = 0.9
+REPEAT = 20
+
+RECOUNT = """
+    SELECT IFNULL(Status, ''), Food_ID, COUNT(*) FROM claims_data WHERE Food_ID IS NOT NULL GROUP BY 1, 2
+    UNION ALL
+    SELECT 'All', Food_ID, COUNT(*) FROM claims_data WHERE Food_ID IS NOT NULL GROUP BY 2
+    ORDER BY 1, 2;
+    """
+
+
+def combos(conn, n):
+    rng = random.Random(11)
+    choices = {
+        'status': synthetic.STATUSES,
+        'provider_type': synthetic.PROVIDER_TYPES,
+        'receiver_type': synthetic.RECEIVER_TYPES,
+        'food_type': synthetic.FOOD_TYPES,
+        'meal_type': synthetic.MEAL_TYPES,
+        'location': [r[0] for r in conn.execute("SELECT DISTINCT Location FROM food_listings_data LIMIT 50")],
+    }
+    cities = [r[0] for r in conn.execute("SELECT DISTINCT City FROM provider_data LIMIT 50")]
+    work = [fq.bind_ids(conn, dict(fq.filter_params(), city=cities[0]))]
+    for _ in range(n - 1):
+        params = fq.filter_params(**{k: rng.choice(v) if rng.random() < 0.3 else 'All' for k, v in choices.items()})
+        work.append(fq.bind_ids(conn, dict(params, city=rng.choice(cities))))
+    return work
+
+
+def full(grid, sort):
+    """The grid's source in the page order, without a LIMIT."""
+    column, descending = grid.sorts[sort]
+    direction = 'DESC' if descending else 'ASC'
+    return f"SELECT * FROM ({grid.source}) ORDER BY {column} {direction}, {grid.key} {direction};"
+
+
+def walk(conn, grid, params, sort, limit):
+    rows, after = [], None
+    while True:
+        page = foodwaste_grid.fetch_page(conn, grid, params, sort, after, limit)
+        rows += page.rows
+        if page.after is None:
+            return rows
+        after = page.after
+
+
+def check_pages(conn, work):
+    for name, grid in foodwaste_grid.GRIDS.items():
+        for params in work:
+            analysis = sorted(conn.execute(fq.ANALYSES[name], params).fetchall())
+            for sort in grid.sorts:
+                rows = walk(conn, grid, params, sort, random.choice(foodwaste_grid.PAGE_SIZES[-2:]))
+                assert rows == conn.execute(full(grid, sort), params).fetchall(), (name, sort, params)
+                assert len(rows) == foodwaste_grid.row_count(conn, grid, params), (name, params)
+                columns = [d[0] for d in conn.execute(full(grid, sort), params).description]
+                shown = [i for i, c in enumerate(columns) if c not in grid.hidden]
+                assert sorted(tuple(r[i] for i in shown) for r in rows) == analysis, (name, sort, params)
+        print(f"  {name}: pages match the sorted query and the analysis")
+
+
+def check_triggers(path, writes):
+    rng = random.Random(5)
+    conn = sql.connect(path)
+    foods = conn.execute("SELECT MAX(Food_ID) FROM food_listings_data").fetchone()[0]
+    claims = conn.execute("SELECT MAX(Claim_ID) FROM claims_data").fetchone()[0]
+    statuses = synthetic.STATUSES + (None,)
+    with conn:
+        for _ in range(writes):
+            op = rng.random()
+            if op < 0.4:
+                claims += 1
+                conn.execute("INSERT INTO claims_data (Claim_ID, Food_ID, Receiver_ID, Status, Timestamp) "
+                             "VALUES (?, ?, 1, ?, '2025-01-01 10:00:00')",
+                             (claims, rng.randint(1, foods), rng.choice(statuses)))
+            elif op < 0.6:
+                conn.execute("UPDATE claims_data SET Status = ? WHERE Claim_ID = ?",
+                             (rng.choice(statuses), rng.randint(1, claims)))
+            elif op < 0.8:
+                conn.execute("UPDATE claims_data SET Food_ID = ? WHERE Claim_ID = ?",
+                             (rng.randint(1, foods), rng.randint(1, claims)))
+            else:
+                conn.execute("DELETE FROM claims_data WHERE Claim_ID = ?", (rng.randint(1, claims),))
+    kept = conn.execute("SELECT Status, Food_ID, Claims FROM item_claims ORDER BY 1, 2").fetchall()
+    assert kept == conn.execute(RECOUNT).fetchall(), 'item_claims disagrees with a recount'
+    conn.close()
+    print(f"  item_claims matches a recount after {writes:,} claim writes")
+
+
+def timed(conn, statement, params):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        conn.execute(statement, params).fetchall()
+    return (time.perf_counter() - start) * 1000 / REPEAT
+
+
+def offset(grid, sort):
+    return full(grid, sort).rstrip(';') + " LIMIT :limit OFFSET :offset;"
+
+
+def time_depth(conn, params):
+    limit = foodwaste_grid.PAGE_SIZE
+    for name, grid in foodwaste_grid.GRIDS.items():
+        sort = next(iter(grid.sorts))
+        rows = conn.execute(full(grid, sort), params).fetchall()
+        depth = int(len(rows) * DEPTH)
+        if depth < 1:
+            continue
+        columns = [d[0] for d in conn.execute(full(grid, sort), params).description]
+        before = rows[depth - 1]
+        after = (before[columns.index(grid.sorts[sort][0])], before[columns.index(grid.key)])
+        keyset = foodwaste_grid.page_params(params, after, limit)
+        print(f"  {name}, {sort}, rows {depth + 1:,}-{min(depth + limit, len(rows)):,} of {len(rows):,}")
+        print(f"    keyset page     {timed(conn, foodwaste_grid.page_statement(grid, sort, False), keyset):9.3f} ms")
+        print(f"    LIMIT / OFFSET  {timed(conn, offset(grid, sort), dict(params, limit=limit, offset=depth)):9.3f} ms")
+        print(f"    whole result    {timed(conn, full(grid, sort), params):9.3f} ms")
+
+
+def main(sizes=SIZES):
+    random.seed(0)
+    for claims in sizes:
+        path = synthetic.build(os.path.join(tempfile.gettempdir(), f'bench_grid_{claims}.db'), claims=claims)
+        conn = fq.connect(path)
+        work = combos(conn, COMBOS)
+        print(f"\n{claims:,} claims, {len(work)} filter combinations")
+        check_pages(conn, work)
+        time_depth(conn, work[0])
+        conn.close()
+        check_triggers(path, WRITES)
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or SIZES)
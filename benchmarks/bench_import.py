@@ -0,0 +1,143 @@
+"""
+Benchmark: foodwaste_import bulk loads, with a dashboard reading concurrently.
+
+Writes a CSV of new listings and a JSON Lines file of new claims, imports both
+into a synthetic database while another thread keeps running dashboard
+queries, and reports rows/sec, the share of the time spent on the derived
+tables, plus the reader's worst query latency. Then it checks that the derived
+tables the import maintains in bulk (metrics_cube, the rollups,
+expiry_queue, item_claims, table_versions) match the base tables, and
+compares against the row-at-a-time INSERT path that goes through the triggers.
+
+Run from the repository root:  python benchmarks/bench_import.py [listings claims]
+"""
+
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import foodwaste_cube  # noqa: E402
+import foodwaste_expiry  # noqa: E402
+import foodwaste_import  # noqa: E402
+import foodwaste_queries as fq  # noqa: E402
+import foodwaste_rollups  # noqa: E402
+import synthetic  # noqa: E402
+from bench_metrics_cube import combos  # noqa: E402
+
+BASE_CLAIMS = 100_000
+LISTINGS = 100_000
+CLAIMS = 200_000
+# Seconds between the reader's queries, about a dashboard session clicking through filters
+PAUSE = 0.01
+
+
+def write_inputs(directory, conn, listings, claims):
+    rng = random.Random(11)
+    providers = conn.execute("SELECT MAX(Provider_ID) FROM provider_data").fetchone()[0]
+    receivers = conn.execute("SELECT MAX(Receiver_ID) FROM receivers_data").fetchone()[0]
+    first_food = conn.execute("SELECT MAX(Food_ID) FROM food_listings_data").fetchone()[0] + 1
+    listings_path = os.path.join(directory, 'new_listings.csv')
+    with open(listings_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(foodwaste_import.TARGETS['listings'][1])
+        for food_id in range(first_food, first_food + listings):
+            writer.writerow([food_id, rng.choice(synthetic.FOOD_NAMES), rng.randint(1, 50),
+                             f'2025-04-{rng.randint(1, 30):02d} 00:00:00', rng.randint(1, providers),
+                             rng.choice(synthetic.PROVIDER_TYPES), f'City {rng.randint(0, 500)}',
+                             rng.choice(synthetic.MEAL_TYPES), rng.choice(synthetic.FOOD_TYPES)])
+    claims_path = os.path.join(directory, 'new_claims.jsonl')
+    with open(claims_path, 'w') as f:
+        for _ in range(claims):
+            f.write(json.dumps({'Food_ID': rng.randint(1, first_food + listings - 1),
+                                'Receiver_ID': rng.randint(1, receivers), 'Status': rng.choice(synthetic.STATUSES),
+                                'Timestamp': f'2025-04-{rng.randint(1, 30):02d} {rng.randint(0, 23):02d}:00:00'}) + '\n')
+    return listings_path, claims_path
+
+
+class Reader(threading.Thread):
+    """Runs one dashboard analysis in a loop and records the slowest run."""
+
+    def __init__(self, path):
+        super().__init__(daemon=True)
+        self.path = path
+        self.stop = threading.Event()
+        self.queries = 0
+        self.worst = 0.0
+
+    def run(self):
+        conn = fq.connect(self.path)
+        statement = fq.ANALYSES['Percentage of Food Claims by Status']
+        params = fq.bind_ids(conn, fq.filter_params())
+        while not self.stop.is_set():
+            start = time.perf_counter()
+            conn.execute(statement, params).fetchall()
+            self.worst = max(self.worst, time.perf_counter() - start)
+            self.queries += 1
+            time.sleep(PAUSE)
+        conn.close()
+
+
+def check(conn):
+    for params in combos(conn, 20):
+        expected = [conn.execute(q, params).fetchone()[0] or 0 for q in fq.METRICS.values()]
+        assert list(foodwaste_cube.key_metrics(conn, params).values()) == expected, 'metrics_cube drifted'
+        for name, statement in foodwaste_rollups.ANALYSES.items():
+            got = conn.execute(statement, dict(params, **foodwaste_rollups.range_params())).fetchall()
+            assert got == conn.execute(fq.ANALYSES[name], params).fetchall(), f'{name}: rollup drifted'
+    claimed = ', '.join(repr(s) for s in foodwaste_expiry.CLAIMED)
+    assert conn.execute("SELECT * FROM expiry_queue ORDER BY 1, 2, 3").fetchall() == conn.execute(f"""
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID FROM food_listings_data AS l
+        WHERE l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ({claimed}))
+        ORDER BY 1, 2, 3""").fetchall(), 'expiry_queue drifted'
+    assert conn.execute("SELECT Status, Food_ID, Claims FROM item_claims ORDER BY 1, 2").fetchall() == conn.execute("""
+        SELECT IFNULL(Status, ''), Food_ID, COUNT(*) FROM claims_data WHERE Food_ID IS NOT NULL GROUP BY 1, 2
+        UNION ALL
+        SELECT 'All', Food_ID, COUNT(*) FROM claims_data WHERE Food_ID IS NOT NULL GROUP BY 2
+        ORDER BY 1, 2""").fetchall(), 'item_claims drifted'
+    for name, version, row_count in conn.execute("SELECT name, version, row_count FROM table_versions"):
+        assert row_count == conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0], f'{name}: row_count drifted'
+
+
+def main(listings=LISTINGS, claims=CLAIMS):
+    directory = tempfile.mkdtemp()
+    path = synthetic.build(os.path.join(directory, 'bench_import.db'), claims=BASE_CLAIMS)
+    conn = foodwaste_import.connect_writer(path)
+    listings_path, claims_path = write_inputs(directory, conn, listings, claims)
+
+    reader = Reader(path)
+    reader.start()
+    for kind, source in (('listings', listings_path), ('claims', claims_path)):
+        result = foodwaste_import.import_rows(conn, kind, foodwaste_import.read_rows(source))
+        load = result.seconds - result.refresh
+        print(f"{kind:<9} {result.rows:>9,} rows  {result.batches:>3} batches  {result.seconds:>6.2f}s  "
+              f"{result.rows / result.seconds:>10,.0f} rows/sec  (loading {result.rows / load:,.0f} rows/sec, "
+              f"derived tables {result.refresh:.2f}s)")
+    reader.stop.set()
+    reader.join()
+    print(f"concurrent reader: {reader.queries:,} queries, slowest {reader.worst * 1000:.1f} ms")
+
+    check(conn)
+    print("derived tables match the base tables")
+
+    rows = [(None, row['Food_ID'], row['Receiver_ID'], row['Status'], row['Timestamp'])
+            for row in foodwaste_import.read_rows(claims_path)][:20_000]
+    start = time.perf_counter()
+    conn.execute("BEGIN IMMEDIATE")
+    conn.executemany("INSERT INTO claims_data (Claim_ID, Food_ID, Receiver_ID, Status, Timestamp) "
+                     "VALUES (?, ?, ?, ?, ?)", rows)
+    conn.execute("COMMIT")
+    elapsed = time.perf_counter() - start
+    print(f"row-at-a-time INSERT through the triggers: {len(rows) / elapsed:,.0f} rows/sec")
+    check(conn)
+    conn.close()
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:3]])
@@ -0,0 +1,86 @@
+"""
+Benchmark: proposed claims from foodwaste_matching as the listings grow.
+
+The number of cities is held fixed, so each city's score matrix grows with
+the data. Loading (three SQL reads into arrays) and matching (scoring plus
+greedy assignment) are timed separately. Every run checks that a proposal
+never crosses cities, never repeats a listing and never exceeds a receiver's
+capacity. On the smaller sizes it also compares the total score with a plain
+Python greedy over all pairs of each city, sorted best first.
+
+Run from the repository root:  python benchmarks/bench_matching.py [listings ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import foodwaste_matching  # noqa: E402
+import foodwaste_queries as fq  # noqa: E402
+import synthetic  # noqa: E402
+
+SIZES = (1_000, 10_000, 100_000)
+CITIES = 200
+CAPACITY = 2
+# Pairs the Python greedy may sort before it is skipped
+REFERENCE_BUDGET = 2_000_000
+
+
+def reference(data, capacity):
+    """Total score of a plain greedy: every pair of a city, best first, taken if both ends are free."""
+    weights = foodwaste_matching.WEIGHTS
+    receivers_by_city = {}
+    for j, city in enumerate(data.receiver_city):
+        receivers_by_city.setdefault(city, []).append(j)
+    pairs = []
+    for i, city in enumerate(data.listing_city):
+        for j in receivers_by_city.get(city, ()):
+            score = (weights['food_type'] * data.food_share[j, data.food_type[i]]
+                     + weights['meal_type'] * data.meal_share[j, data.meal_type[i]]
+                     + weights['history'] * data.history[j] + weights['urgency'] * data.urgency[i])
+            pairs.append((-score, i, j))
+    pairs.sort()
+    taken, left, total = set(), Counter(), 0.0
+    for score, i, j in pairs:
+        if i not in taken and left[j] < capacity:
+            taken.add(i)
+            left[j] += 1
+            total -= score
+    return total
+
+
+def check(conn, proposals, capacity):
+    cities = dict(conn.execute("SELECT Receiver_ID, City FROM receivers_data"))
+    assert all(cities[p.receiver_id] == p.location for p in proposals), 'a proposal crosses cities'
+    assert len({p.food_id for p in proposals}) == len(proposals), 'a listing was proposed twice'
+    assert max(Counter(p.receiver_id for p in proposals).values(), default=0) <= capacity, 'capacity exceeded'
+
+
+def main(sizes=SIZES):
+    print(f"{'listings':>10} {'open':>8} {'receivers':>10} {'load ms':>9} {'match ms':>9} {'proposals':>10} "
+          f"{'vs greedy':>10}")
+    for listings in sizes:
+        path = synthetic.build(os.path.join(tempfile.gettempdir(), f'bench_matching_{listings}.db'),
+                               claims=listings, listings=listings, receivers=listings // 5, cities=CITIES)
+        conn = fq.connect(path)
+        start = time.perf_counter()
+        data = foodwaste_matching.MatchingInput(conn, synthetic.START)  # the synthetic dates are long past
+        load = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        proposals = foodwaste_matching.match(data, CAPACITY)
+        elapsed = (time.perf_counter() - start) * 1000
+        check(conn, proposals, CAPACITY)
+        ratio = '-'
+        if len(data.food_id) * len(data.receiver_id) // CITIES <= REFERENCE_BUDGET:
+            ratio = f"{sum(p.score for p in proposals) / reference(data, CAPACITY):.3f}"
+        print(f"{listings:>10,} {len(data.food_id):>8,} {len(data.receiver_id):>10,} {load:>9.1f} {elapsed:>9.1f} "
+              f"{len(proposals):>10,} {ratio:>10}")
+        conn.close()
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or SIZES)
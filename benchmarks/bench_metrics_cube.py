@@ -0,0 +1,63 @@
+"""
+Benchmark: Key Metrics from the four join queries vs one metrics_cube lookup.
+
+Builds synthetic databases of growing size and times both ways of answering
+random sidebar filter combinations. The cube lookup should stay flat while the
+join queries grow with claims_data.
+
+Run from the repository root:  python benchmarks/bench_metrics_cube.py [claims ...]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import foodwaste_cube  # noqa: E402
+import foodwaste_queries as fq  # noqa: E402
+import synthetic  # noqa: E402
+
+SIZES = (10_000, 100_000, 300_000)
+LOOKUPS = 200
+
+
+def combos(conn, n):
+    rng = random.Random(7)
+    choices = {
+        'status': synthetic.STATUSES,
+        'provider_type': synthetic.PROVIDER_TYPES,
+        'receiver_type': synthetic.RECEIVER_TYPES,
+        'food_type': synthetic.FOOD_TYPES,
+        'meal_type': synthetic.MEAL_TYPES,
+        'location': [r[0] for r in conn.execute("SELECT DISTINCT Location FROM food_listings_data LIMIT 50")],
+    }
+    return [fq.bind_ids(conn, fq.filter_params(**{k: rng.choice(v) if rng.random() < 0.5 else 'All'
+                                                  for k, v in choices.items()}))
+            for _ in range(n)]
+
+
+def main(sizes=SIZES):
+    print(f"{'claims':>10} {'joins ms':>10} {'cube ms':>10}")
+    for claims in sizes:
+        path = synthetic.build(os.path.join(tempfile.gettempdir(), f'bench_cube_{claims}.db'), claims=claims)
+        conn = fq.connect(path)
+        work = combos(conn, LOOKUPS)
+
+        start = time.perf_counter()
+        expected = [[conn.execute(q, p).fetchone()[0] or 0 for q in fq.METRICS.values()] for p in work]
+        joins = time.perf_counter() - start
+
+        start = time.perf_counter()
+        got = [list(foodwaste_cube.key_metrics(conn, p).values()) for p in work]
+        cube = time.perf_counter() - start
+
+        assert got == expected, 'metrics_cube disagrees with the join queries'
+        print(f"{claims:>10} {joins * 1000 / LOOKUPS:>10.3f} {cube * 1000 / LOOKUPS:>10.3f}")
+        conn.close()
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or SIZES)
@@ -0,0 +1,83 @@
+"""
+Benchmark: dashboard reruns per second with several sessions at once.
+
+Each rerun runs on a fresh thread, as Streamlit does, and reads the Key
+Metrics cube plus one analysis with random sidebar filters. Every session
+reruns back to back, and all sessions run at the same time:
+
+    connect per rerun   sql.connect() on every rerun (the old app)
+    shared connection   one connection for the whole process (the old app2)
+    pool                foodwaste_pool.ReadPool, one warm read-only connection per thread
+
+Run from the repository root:  python benchmarks/bench_pool.py [database.db]
+"""
+
+import os
+import shutil
+import sqlite3 as sql
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import foodwaste_cube  # noqa: E402
+import foodwaste_migrate  # noqa: E402
+import foodwaste_pool  # noqa: E402
+import foodwaste_queries as fq  # noqa: E402
+from bench_query_cache import interactions  # noqa: E402
+
+SESSIONS = (1, 4, 16)
+RERUNS = 100
+
+
+def rerun(connection, params, analysis, done):
+    conn = connection()
+    foodwaste_cube.key_metrics(conn, params)
+    conn.execute(fq.ANALYSES[analysis], params).fetchall()
+    done(conn)
+
+
+def session(connection, done, work):
+    for params, analysis in work:
+        thread = threading.Thread(target=rerun, args=(connection, params, analysis, done))
+        thread.start()
+        thread.join()
+
+
+def modes(path):
+    shared = fq.connect(path)
+    pool = foodwaste_pool.ReadPool(path)
+    yield 'connect per rerun', (lambda: sql.connect(path)), (lambda conn: conn.close())
+    yield 'shared connection', (lambda: shared), (lambda conn: None)
+    yield 'pool', pool.connection, (lambda conn: None)
+    shared.close()
+    pool.close()
+
+
+def main(path=fq.DATABASE):
+    directory = tempfile.mkdtemp()
+    copy = os.path.join(directory, 'bench_pool.db')
+    shutil.copy(path, copy)
+    foodwaste_migrate.migrate(copy)
+    conn = fq.connect(copy)
+    work = list(interactions(conn, RERUNS))
+    conn.close()
+
+    print(f"{'mode':<20}" + ''.join(f"{f'{n} session(s)':>14}" for n in SESSIONS) + "   reruns/s")
+    for label, connection, done in modes(copy):
+        rates = []
+        for n in SESSIONS:
+            threads = [threading.Thread(target=session, args=(connection, done, work)) for _ in range(n)]
+            start = time.perf_counter()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            rates.append(n * len(work) / (time.perf_counter() - start))
+        print(f"{label:<20}" + ''.join(f"{rate:>14,.0f}" for rate in rates))
+    shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:2])
@@ -0,0 +1,85 @@
+"""
+Benchmark: waiting time of a user stepping through the analyses, with and
+without foodwaste_prefetch.
+
+A simulated user picks a filter set, then views every analysis in selectbox
+order, pausing THINK seconds on each. The time the user waits for each result
+is summed. With prefetching on, the process starts with a warmup of every
+analysis for the 'All' filters, and every view queues its neighbours. Results
+must match a plain computation.
+
+Run from the repository root:  python benchmarks/bench_prefetch.py [claims]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import foodwaste_pool  # noqa: E402
+import foodwaste_prefetch  # noqa: E402
+import foodwaste_queries as fq  # noqa: E402
+import foodwaste_rollups  # noqa: E402
+import synthetic  # noqa: E402
+
+CLAIMS = 200_000
+THINK = 0.5
+# Contact lists need a city and are left out, as the app does
+ANALYSES = [a for a in fq.ANALYSES if 'Contact' not in a]
+FILTER_SETS = [fq.filter_params(), fq.filter_params(status='Completed'), fq.filter_params(food_type='Vegan')]
+
+
+def request(analysis, params):
+    if analysis in foodwaste_rollups.ANALYSES:
+        params = dict(params, **foodwaste_rollups.range_params())
+    return analysis, params
+
+
+def session(pool, prefetcher, version):
+    waited = []
+    for params in FILTER_SETS:
+        for analysis in ANALYSES:
+            analysis, bound = request(analysis, params)
+            start = time.perf_counter()
+            prefetcher.get(analysis, bound, version)
+            waited.append(time.perf_counter() - start)
+            prefetcher.prefetch([request(a, params) for a in foodwaste_prefetch.neighbours(ANALYSES, analysis)],
+                                version)
+            time.sleep(THINK)
+    return waited
+
+
+def main(claims=CLAIMS):
+    path = synthetic.build(os.path.join(tempfile.gettempdir(), 'bench_prefetch.db'), claims=claims)
+    pool = foodwaste_pool.ReadPool(path)
+
+    def compute(analysis, params):
+        conn = pool.connection()
+        return pd.read_sql(fq.ANALYSES[analysis] if 'grain' not in params else
+                           foodwaste_rollups.ANALYSES[analysis], conn, params=fq.bind_ids(conn, params))
+
+    print(f"{claims:,} claims, {len(ANALYSES)} analyses x {len(FILTER_SETS)} filter sets, {THINK}s think time")
+    print(f"{'prefetch':<9} {'mean wait ms':>13} {'max wait ms':>12} {'hit rate':>9} {'prefetched':>11} "
+          f"{'wasted':>7}")
+    for active in (False, True):
+        prefetcher = foodwaste_prefetch.Prefetcher(compute, active=active)
+        prefetcher.prefetch([request(a, fq.filter_params()) for a in ANALYSES], version=0)
+        waited = session(pool, prefetcher, version=0)
+        stats = prefetcher.stats()
+        for params in FILTER_SETS:
+            for analysis in ANALYSES:
+                analysis, bound = request(analysis, params)
+                assert prefetcher.get(analysis, bound, 0).equals(compute(analysis, bound)), analysis
+        prefetcher.close()
+        print(f"{'on' if active else 'off':<9} {sum(waited) * 1000 / len(waited):>13.1f} "
+              f"{max(waited) * 1000:>12.1f} {stats['hit_rate']:>9.1%} {stats['prefetched']:>11} "
+              f"{stats['wasted']:>7}")
+    pool.close()
+    os.remove(path)
+
+
+if __name__ == '__main__':
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,99 @@
+"""
+Benchmark: parse/plan time saved per sidebar interaction by foodwaste_queries.
+
+Simulates a user clicking through random sidebar filter combinations. Each
+interaction runs the four Key Metrics queries plus one analysis, the way a
+Streamlit rerun of foodwaste_management_app2.py does.
+
+  literal      - old behaviour: values pasted into the SQL text and a fresh
+                 connection per rerun, so every statement is parsed and planned
+  parameterized - one stable statement per analysis on a long-lived connection,
+                 so repeat statements come straight from the sqlite3 cache
+
+Run from the repository root:  python benchmarks/bench_query_cache.py
+"""
+
+import os
+import random
+import re
+import sqlite3 as sql
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import foodwaste_queries as fq  # noqa: E402
+
+INTERACTIONS = 500
+
+
+def literal(statement, params):
+    """Inline the bound values, reproducing the old f-string SQL text."""
+    def value(match):
+        v = params[match.group(1)]
+        return 'NULL' if v is None else "'" + str(v).replace("'", "''") + "'"
+    return re.sub(r":(\w+)", value, statement)
+
+
+def sidebar_choices(conn):
+    columns = {
+        'status': "SELECT DISTINCT Status FROM claims_data",
+        'provider_type': "SELECT DISTINCT Type FROM provider_data",
+        'receiver_type': "SELECT DISTINCT Type FROM receivers_data",
+        'food_type': "SELECT DISTINCT Food_type FROM food_listings_data",
+        'meal_type': "SELECT DISTINCT Meal_Type FROM food_listings_data",
+        'location': "SELECT DISTINCT Location FROM food_listings_data",
+    }
+    return {name: ['All'] + [r[0] for r in conn.execute(q)] for name, q in columns.items()}
+
+
+def interactions(conn, n):
+    rng = random.Random(42)
+    choices = sidebar_choices(conn)
+    cities = [r[0] for r in conn.execute("SELECT DISTINCT City FROM provider_data")]
+    analyses = list(fq.ANALYSES)
+    for _ in range(n):
+        params = fq.filter_params(**{k: rng.choice(v) for k, v in choices.items()})
+        params['city'] = rng.choice(cities)
+        yield fq.bind_ids(conn, params), rng.choice(analyses)
+
+
+def run(path, n, parameterized):
+    conn = fq.connect(path)
+    work = list(interactions(conn, n))
+    conn.close()
+
+    shared = fq.connect(path) if parameterized else None
+    start = time.perf_counter()
+    for params, analysis in work:
+        conn = shared or sql.connect(path)
+        for statement in list(fq.METRICS.values()) + [fq.ANALYSES[analysis]]:
+            if parameterized:
+                conn.execute(statement, params).fetchall()
+            else:
+                conn.execute(literal(statement, params)).fetchall()
+        if not parameterized:
+            conn.close()
+    elapsed = time.perf_counter() - start
+    if shared:
+        shared.close()
+    return elapsed
+
+
+def main(path=fq.DATABASE, n=INTERACTIONS):
+    # Parity: the parameterized and literal forms must return the same rows
+    conn = fq.connect(path)
+    for params, analysis in interactions(conn, 100):
+        for statement in list(fq.METRICS.values()) + [fq.ANALYSES[analysis]]:
+            assert conn.execute(statement, params).fetchall() == conn.execute(literal(statement, params)).fetchall()
+    conn.close()
+
+    old = run(path, n, parameterized=False)
+    new = run(path, n, parameterized=True)
+    print(f"{n} sidebar interactions (4 metrics + 1 analysis each)")
+    print(f"  literal SQL, connection per rerun : {old * 1000 / n:8.3f} ms/interaction")
+    print(f"  parameterized, cached statements  : {new * 1000 / n:8.3f} ms/interaction")
+    print(f"  saved                             : {(old - new) * 1000 / n:8.3f} ms/interaction")
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:2])
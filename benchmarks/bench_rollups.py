@@ -0,0 +1,75 @@
+"""
+Benchmark: the over-time analyses from the base tables vs the rollups.
+
+For each synthetic database size, checks that the day-grain rollup queries
+return the same rows as the original analyses (also after a batch of writes
+has gone through the triggers), then times both under random sidebar filters
+and the rollups at week and month grain.
+
+Run from the repository root:  python benchmarks/bench_rollups.py [claims ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import foodwaste_queries as fq  # noqa: E402
+import foodwaste_rollups  # noqa: E402
+import synthetic  # noqa: E402
+from bench_metrics_cube import combos  # noqa: E402
+
+SIZES = (10_000, 100_000, 300_000)
+LOOKUPS = 50
+
+
+def check(conn, work):
+    for params in work:
+        for name, statement in foodwaste_rollups.ANALYSES.items():
+            expected = conn.execute(fq.ANALYSES[name], params).fetchall()
+            got = conn.execute(statement, dict(params, **foodwaste_rollups.range_params())).fetchall()
+            assert got == expected, f'{name}: rollup disagrees with the base tables'
+
+
+def write_some(conn):
+    """Inserts, status and type updates and deletes across all four tables."""
+    with conn:
+        conn.execute("UPDATE claims_data SET Status = 'Completed' WHERE Claim_ID % 7 = 0")
+        conn.execute("UPDATE claims_data SET Timestamp = datetime(Timestamp, '+3 days') WHERE Claim_ID % 11 = 0")
+        conn.execute("DELETE FROM claims_data WHERE Claim_ID % 13 = 0")
+        conn.execute("UPDATE receivers_data SET Type = 'NGO' WHERE Receiver_ID % 5 = 0")
+        conn.execute("UPDATE provider_data SET Type = 'Restaurant' WHERE Provider_ID % 6 = 0")
+        conn.execute("UPDATE food_listings_data SET Location = 'Elsewhere', Expiry_Date = date(Expiry_Date, '-1 day') "
+                     "WHERE Food_ID % 9 = 0")
+        conn.execute("INSERT INTO claims_data (Food_ID, Receiver_ID, Status, Timestamp) "
+                     "SELECT Food_ID, 1, 'Pending', '2025-03-20 10:00:00' FROM food_listings_data LIMIT 100")
+
+
+def timed(conn, statement, work, extra):
+    start = time.perf_counter()
+    for params in work:
+        conn.execute(statement, dict(params, **extra)).fetchall()
+    return (time.perf_counter() - start) * 1000 / len(work)
+
+
+def main(sizes=SIZES):
+    print(f"{'claims':>10} {'analysis':<52} {'tables ms':>12} {'day ms':>8} {'week ms':>8} {'month ms':>9}")
+    for claims in sizes:
+        path = synthetic.build(os.path.join(tempfile.gettempdir(), f'bench_rollups_{claims}.db'), claims=claims)
+        conn = fq.connect(path)
+        work = combos(conn, LOOKUPS)
+        check(conn, work)
+        write_some(conn)
+        check(conn, work)
+        for name, statement in foodwaste_rollups.ANALYSES.items():
+            base = timed(conn, fq.ANALYSES[name], work, {})
+            grains = [timed(conn, statement, work, foodwaste_rollups.range_params(grain))
+                      for grain in foodwaste_rollups.GRAINS]
+            print(f"{claims:>10} {name:<52} {base:>12.3f} {grains[0]:>8.3f} {grains[1]:>8.3f} {grains[2]:>9.3f}")
+        conn.close()
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or SIZES)
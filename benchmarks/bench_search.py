@@ -0,0 +1,163 @@
+"""
+Parity check and benchmark: trigram contact search vs LIKE scans.
+
+Builds a synthetic database with the given number of providers and
+receivers in total, named from FIRST x LAST x SUFFIXES so that search terms
+range from rare to very common. For every query, the rows the FTS5 indexes match must be exactly
+the rows found by LIKE '%term%' on the same columns, before and after a batch
+of random inserts, renames and deletes through the base tables.
+
+A query with no more than CANDIDATES matches per table must also come back
+from foodwaste_search.search() exactly as when every match is scored.
+
+Timed per query:
+
+    fts top N      foodwaste_search.search(): the best N of the first CANDIDATES matches
+    fts exact      the same, scoring every match
+    like first N   LIKE on every column, stopping at the first N rows (unranked)
+    like all       every LIKE match, which ranking them would need
+
+Run from the repository root:  python benchmarks/bench_search.py [contacts ...]
+"""
+
+import os
+import random
+import sqlite3 as sql
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import foodwaste_migrate  # noqa: E402
+import foodwaste_queries as fq  # noqa: E402
+import foodwaste_search  # noqa: E402
+import synthetic  # noqa: E402
+
+SIZES = (1_000_000,)
+WRITES = 2_000
+REPEAT = 10
+
+FIRST = ('Maria', 'James', 'Aisha', 'Chen', 'Olga', 'Pedro', 'Fatima', 'Noah', 'Priya', 'Lukas',
+         'Amara', 'Diego', 'Yuki', 'Omar', 'Sofia', 'Kwame', 'Elena', 'Ravi', 'Ingrid', 'Tariq')
+LAST = ('Okafor', 'Hartwell', 'Nguyen', 'Silva', 'Kowalski', 'Haddad', 'Lindqvist', 'Moreau', 'Tanaka',
+        'Adeyemi', 'Rossi', 'Petrov', 'Castillo', 'Nakamura', 'Brennan', 'Oyelaran', 'Fischer', 'Mendez')
+SUFFIXES = ('Foods', 'Kitchen', 'Market', 'Pantry', 'Trust', 'House')
+
+QUERIES = ('Maria Okafor', 'maria', 'artwe', 'Pantry', '555-0012', 'City 123', 'Ingrid Lindqvist Trust',
+           'nosuchname')
+
+
+def _words(words, expr):
+    return 'CASE ' + expr + ' ' + ' '.join(f"WHEN {i} THEN '{w}'" for i, w in enumerate(words)) + ' END'
+
+
+def _name():
+    return (f"{_words(FIRST, f'abs(random()) % {len(FIRST)}')} || ' ' || "
+            f"{_words(LAST, f'abs(random()) % {len(LAST)}')} || ' ' || "
+            f"{_words(SUFFIXES, f'abs(random()) % {len(SUFFIXES)}')}")
+
+
+def build(contacts):
+    """Synthetic database with contacts // 2 providers and receivers, renamed before migrating."""
+    path = synthetic.build(os.path.join(tempfile.gettempdir(), f'bench_search_{contacts}.db'), claims=10_000,
+                           providers=contacts // 2, receivers=contacts // 2, migrate=False)
+    conn = sql.connect(path)
+    with conn:
+        conn.execute(f"UPDATE provider_data SET Name = {_name()}")
+        conn.execute(f"UPDATE receivers_data SET Name = {_name()}")
+    conn.close()
+    foodwaste_migrate.migrate(path)
+    return path
+
+
+def like_terms(text):
+    """Terms of text as LIKE patterns, matching what foodwaste_search.match_query keeps."""
+    return ['%' + word + '%' for word in text.split() if len(word) >= foodwaste_search.MIN_LENGTH]
+
+
+def like_statement(name, terms, limit=None):
+    table, key, columns, _ = foodwaste_search.TABLES[name]
+    where = ' AND '.join('(' + ' OR '.join(f"{c} LIKE ?" for c in columns) + ')' for _ in terms)
+    return (f"SELECT {key} FROM {table} WHERE {where}" + (f" LIMIT {limit}" if limit else ''),
+            [term for term in terms for _ in columns])
+
+
+def like_rows(conn, text, limit=None):
+    terms = like_terms(text)
+    rows = []
+    for name in foodwaste_search.TABLES:
+        statement, args = like_statement(name, terms, limit)
+        rows += [(name, row[0]) for row in conn.execute(statement, args)]
+    return rows[:limit] if limit else rows
+
+
+def fts_rows(conn, text):
+    query = foodwaste_search.match_query(text)
+    return [(name, row[0]) for name in foodwaste_search.TABLES
+            for row in conn.execute(f"SELECT rowid FROM {name} WHERE {name} MATCH ?", (query,))]
+
+
+def exact(conn, text, limit=foodwaste_search.LIMIT):
+    return foodwaste_search.search(conn, text, limit=limit, candidates=-1)[1]
+
+
+def check(conn, label):
+    for text in QUERIES:
+        matches = fts_rows(conn, text)
+        assert sorted(matches) == sorted(like_rows(conn, text)), (label, text)
+        if max([sum(name == n for n, _ in matches) for name in foodwaste_search.TABLES]) <= foodwaste_search.CANDIDATES:
+            assert foodwaste_search.search(conn, text)[1] == exact(conn, text), (label, text)
+    for name in foodwaste_search.TABLES:
+        conn.execute(f"INSERT INTO {name} ({name}, rank) VALUES ('integrity-check', 1)")
+    print(f"  {label}: FTS matches equal the LIKE matches for every query")
+
+
+def write(conn, n):
+    rng = random.Random(3)
+    top = {name: conn.execute(f"SELECT MAX({key}) FROM {table}").fetchone()[0]
+           for name, (table, key, _, _) in foodwaste_search.TABLES.items()}
+    with conn:
+        for _ in range(n):
+            name = rng.choice(list(foodwaste_search.TABLES))
+            table, key = foodwaste_search.TABLES[name][:2]
+            op = rng.random()
+            person = f"{rng.choice(FIRST)} {rng.choice(LAST)} {rng.choice(SUFFIXES)}"
+            if op < 0.4:
+                conn.execute(f"INSERT INTO {table} (Name, Type, City, Contact) VALUES (?, 'NGO', 'City 123', ?)",
+                             (person, f"+1-777-{rng.randint(0, 9_999_999):07d}"))
+            elif op < 0.8:
+                conn.execute(f"UPDATE {table} SET Name = ? WHERE {key} = ?", (person, rng.randint(1, top[name])))
+            else:
+                conn.execute(f"DELETE FROM {table} WHERE {key} = ?", (rng.randint(1, top[name]),))
+
+
+def timed(run):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = run()
+    return (time.perf_counter() - start) * 1000 / REPEAT, len(result)
+
+
+def main(sizes=SIZES):
+    for contacts in sizes:
+        start = time.perf_counter()
+        path = build(contacts)
+        print(f"\n{contacts:,} providers and receivers (built and indexed in {time.perf_counter() - start:.0f} s)")
+        conn = fq.connect(path)
+        check(conn, 'after migration')
+        write(conn, WRITES)
+        check(conn, f'after {WRITES:,} writes')
+        limit = foodwaste_search.LIMIT
+        print(f"  {'query':<24} {'matches':>9} {'fts top N':>11} {'fts exact':>11} {'like first N':>13} {'like all':>10}")
+        for text in QUERIES:
+            fts, _ = timed(lambda: foodwaste_search.search(conn, text, limit=limit)[1])
+            scored, _ = timed(lambda: exact(conn, text, limit))
+            first, _ = timed(lambda: like_rows(conn, text, limit))
+            every, matches = timed(lambda: like_rows(conn, text))
+            print(f"  {text:<24} {matches:>9,} {fts:>8.2f} ms {scored:>8.2f} ms {first:>10.2f} ms {every:>7.1f} ms")
+        conn.close()
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or SIZES)
@@ -0,0 +1,125 @@
+"""
+Startup profile of the Streamlit entry points, with a budget check.
+
+Each entry point is run once, cold, in its own `python -X importtime`
+process through Streamlit's AppTest, from its own directory as
+`streamlit run` would. Streamlit itself is imported before the clock starts,
+as the server has already loaded it when a script first runs. The apps run on
+a scratch copy of the repository, so the databases they migrate on start are
+not the checked-in ones. Reported per entry point:
+
+    imports   milliseconds spent importing the modules the script pulls in
+              (the self times that -X importtime prints, summed per top-level package)
+    render    milliseconds from the start of the script to the end of its first run
+    plotting  whether matplotlib was loaded by that first run
+
+An entry point over either budget, or one that loads matplotlib on a first
+page without charts, fails the run (exit status 1), so a regression such as
+an eager plotting import shows up at once.
+
+Run from the repository root:  python benchmarks/bench_startup.py [entry.py ...] [--top N]
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Budgets on the reference machine: (imports ms, render ms, whether the first page draws a chart).
+# The food waste dashboards open on a chart, so their imports include matplotlib.
+BUDGETS = {
+    'foodwaste_management_app.py': (1600, 5000, True),
+    'foodwaste_management_app2.py': (1600, 5000, True),
+    'tennish_group_project/appnew3.py': (800, 2000, False),
+    'tennish_group_project/appnew4.py': (800, 2000, False),
+    'Ola_project/Ola.py': (800, 2000, False),
+}
+# Packages listed per entry point
+TOP = 8
+MARKER = '--- script starts ---'
+
+
+def run(root, entry):
+    """Run one entry point of the tree at root in this process and print its figures as JSON."""
+    from streamlit.testing.v1 import AppTest
+    path = os.path.join(root, entry)
+    os.chdir(os.path.dirname(path))
+    sys.path.insert(0, os.path.dirname(path))
+    print(MARKER, file=sys.stderr, flush=True)
+    start = time.perf_counter()
+    at = AppTest.from_file(path, default_timeout=300).run()
+    render = (time.perf_counter() - start) * 1000
+    print(json.dumps({'render_ms': render, 'plotting': 'matplotlib' in sys.modules,
+                      'exception': bool(at.exception)}))
+
+
+def import_times(stderr):
+    """Self time in milliseconds per top-level package, from -X importtime output after MARKER."""
+    lines = stderr.splitlines()
+    lines = lines[lines.index(MARKER) + 1:] if MARKER in lines else []
+    packages = Counter()
+    for line in lines:
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        packages[name.strip().split('.')[0]] += int(self_us) / 1000
+    return packages
+
+
+def profile(root, entry):
+    result = subprocess.run([sys.executable, '-X', 'importtime', __file__, '--run', root, entry],
+                            capture_output=True, text=True)
+    if result.returncode:
+        raise RuntimeError(f"{entry} failed:\n{result.stderr[-2000:]}")
+    figures = json.loads(result.stdout.strip().splitlines()[-1])
+    figures['packages'] = import_times(result.stderr)
+    figures['imports_ms'] = sum(figures['packages'].values())
+    return figures
+
+
+def scratch_copy():
+    root = os.path.join(tempfile.mkdtemp(prefix='bench_startup_'), 'tree')
+    shutil.copytree(ROOT, root, ignore=shutil.ignore_patterns('.git', 'benchmarks', '*.pdf', '*.pptx', '*.ipynb'))
+    return root
+
+
+def main(entries, top=TOP):
+    over = []
+    root = scratch_copy()
+    for entry in entries:
+        figures = profile(root, entry)
+        import_budget, render_budget, charts = BUDGETS.get(entry, (float('inf'), float('inf'), True))
+        status = 'ok'
+        if (figures['imports_ms'] > import_budget or figures['render_ms'] > render_budget
+                or figures['plotting'] and not charts):
+            status = 'OVER BUDGET'
+            over.append(entry)
+        print(f"\n{entry}  [{status}]")
+        print(f"  imports {figures['imports_ms']:8.1f} ms  (budget {import_budget})")
+        print(f"  render  {figures['render_ms']:8.1f} ms  (budget {render_budget})")
+        print(f"  plotting loaded: {'yes' if figures['plotting'] else 'no'}"
+              f"{'  (first run raised an exception)' if figures['exception'] else ''}")
+        for package, ms in figures['packages'].most_common(top):
+            print(f"    {package:<24} {ms:8.1f} ms")
+    shutil.rmtree(os.path.dirname(root))
+    if over:
+        sys.exit(f"\nOver budget: {', '.join(over)}")
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    if args[:1] == ['--run']:
+        run(args[1], args[2])
+    else:
+        top = TOP
+        if '--top' in args:
+            i = args.index('--top')
+            top = int(args[i + 1])
+            del args[i:i + 2]
+        main(args or list(BUDGETS), top)
@@ -0,0 +1,81 @@
+"""
+Synthetic food waste databases for the benchmarks.
+
+Builds the four tables with the same columns and value vocabularies as
+database.db, at any size, then brings the file up to the current schema with
+foodwaste_migrate so the benchmarks see the same indexes, cube and triggers as
+the apps.
+"""
+
+import os
+import sqlite3 as sql
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import foodwaste_migrate  # noqa: E402
+
+PROVIDER_TYPES = ('Supermarket', 'Grocery Store', 'Restaurant', 'Catering Service')
+RECEIVER_TYPES = ('Shelter', 'Individual', 'NGO', 'Charity')
+FOOD_TYPES = ('Vegetarian', 'Non-Vegetarian', 'Vegan', 'Vegan or Vegetarian')
+MEAL_TYPES = ('Breakfast', 'Lunch', 'Dinner', 'Snacks')
+FOOD_NAMES = ('Bread', 'Soup', 'Fruits', 'Vegetables', 'Dairy', 'Rice', 'Pasta', 'Salad', 'Chicken', 'Fish')
+STATUSES = ('Pending', 'Completed', 'Cancelled')
+# First day of the synthetic expiry dates and claim timestamps, which span a month from it
+START = '2025-03-01'
+
+
+def _pick(values, expr):
+    return 'CASE ' + expr + ' ' + ' '.join(f"WHEN {i} THEN '{v}'" for i, v in enumerate(values)) + ' END'
+
+
+def _rows(n):
+    return f"WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < {n}) "
+
+
+def build(path, claims=100_000, listings=None, providers=None, receivers=None, cities=None, migrate=True):
+    """Create (or replace) a synthetic database at path and return the path."""
+    listings = listings or max(claims // 2, 1)
+    providers = providers or max(listings // 10, 1)
+    receivers = receivers or max(claims // 10, 1)
+    cities = cities or max((providers + receivers) // 20, 1)
+    if os.path.exists(path):
+        os.remove(path)
+    conn = sql.connect(path)
+    conn.executescript(f"""
+    PRAGMA journal_mode = OFF;
+    PRAGMA synchronous = OFF;
+    CREATE TABLE provider_data (Provider_ID INTEGER PRIMARY KEY, Name TEXT, Type TEXT, Address TEXT, City TEXT, Contact TEXT);
+    CREATE TABLE receivers_data (Receiver_ID INTEGER, Name TEXT, Type TEXT, City TEXT, Contact TEXT);
+    CREATE TABLE food_listings_data (Food_ID INTEGER, Food_Name TEXT, Quantity INTEGER, Expiry_Date TIMESTAMP,
+        Provider_ID INTEGER, Provider_Type TEXT, Location TEXT, Meal_Type TEXT, Food_type TEXT);
+    CREATE TABLE claims_data (Claim_ID INTEGER, Food_ID INTEGER, Receiver_ID INTEGER, Status TEXT, Timestamp TIMESTAMP);
+
+    {_rows(providers)}
+    INSERT INTO provider_data
+    SELECT i, 'Provider ' || i, {_pick(PROVIDER_TYPES, 'i % 4')}, i || ' Market Street',
+           'City ' || (abs(random()) % {cities}), '+1-555-' || printf('%07d', i)
+    FROM n;
+
+    {_rows(receivers)}
+    INSERT INTO receivers_data
+    SELECT i, 'Receiver ' || i, {_pick(RECEIVER_TYPES, 'abs(random()) % 4')},
+           'City ' || (abs(random()) % {cities}), '+1-666-' || printf('%07d', i)
+    FROM n;
+
+    {_rows(listings)}, x AS MATERIALIZED (SELECT i, 1 + abs(random()) % {providers} AS Provider_ID FROM n)
+    INSERT INTO food_listings_data
+    SELECT x.i, {_pick(FOOD_NAMES, 'abs(random()) % 10')}, 1 + abs(random()) % 50,
+           datetime('{START}', '+' || (abs(random()) % 30) || ' days'), p.Provider_ID, p.Type, p.City,
+           {_pick(MEAL_TYPES, 'abs(random()) % 4')}, {_pick(FOOD_TYPES, 'abs(random()) % 4')}
+    FROM x JOIN provider_data AS p ON p.Provider_ID = x.Provider_ID;
+
+    {_rows(claims)}
+    INSERT INTO claims_data
+    SELECT i, 1 + abs(random()) % {listings}, 1 + abs(random()) % {receivers}, {_pick(STATUSES, 'abs(random()) % 3')},
+           datetime('{START}', '+' || (abs(random()) % 43200) || ' minutes')
+    FROM n;
+    """)
+    conn.close()
+    if migrate:
+        foodwaste_migrate.migrate(path)
+    return path
@@ -0,0 +1,154 @@
+"""
+Process-wide caches for the food waste dashboards.
+
+Streamlit re-executes the whole script on every widget interaction, for every
+session. The objects here are created once per process (via st.cache_resource)
+and shared by all sessions, so steady-state reruns are served from memory.
+"""
+
+import sqlite3 as sql
+import threading
+from collections import namedtuple
+
+import foodwaste_queries as fq
+
+# Sidebar and selectbox option lists
+DIMENSIONS = {
+    'status': "SELECT DISTINCT Status FROM claims_data",
+    'provider_type': "SELECT DISTINCT Type FROM provider_data",
+    'receiver_type': "SELECT DISTINCT Type FROM receivers_data",
+    'food_type': "SELECT DISTINCT Food_type FROM food_listings_data",
+    'meal_type': "SELECT DISTINCT Meal_Type FROM food_listings_data",
+    'location': "SELECT DISTINCT Location FROM food_listings_data",
+    'provider_city': "SELECT DISTINCT City FROM provider_data ORDER BY City",
+    'receiver_city': "SELECT DISTINCT City FROM receivers_data ORDER BY City",
+}
+
+
+class DimensionDictionary:
+    """
+    The distinct values of every filter dimension, loaded once and kept in
+    memory until another connection commits a write.
+
+    `PRAGMA data_version` only changes when some other connection has
+    committed to the database file, so the check costs no table access. The
+    dictionary keeps a private connection because data_version values are only
+    comparable on the connection that produced them.
+    """
+
+    def __init__(self, path=fq.DATABASE):
+        self._conn = sql.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._version = None
+        self._values = {}
+
+    def _refresh(self):
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._version:
+            self._values = {name: [row[0] for row in self._conn.execute(query)]
+                            for name, query in DIMENSIONS.items()}
+            self._version = version
+
+    def values(self, name):
+        """Distinct values of one dimension, e.g. values('food_type')."""
+        with self._lock:
+            self._refresh()
+            return list(self._values[name])
+
+    def options(self, name):
+        """Selectbox options for one sidebar filter, with 'All' first."""
+        return ['All'] + self.values(name)
+
+    def close(self):
+        self._conn.close()
+
+
+TABLES = ('provider_data', 'receivers_data', 'food_listings_data', 'claims_data')
+
+
+def version_triggers(when=''):
+    """CREATE TRIGGER statements feeding table_versions, each with an optional WHEN clause."""
+    return ''.join(f"""
+    CREATE TRIGGER trg_version_{table}_insert AFTER INSERT ON {table}{when}
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count + 1 WHERE name = '{table}';
+    END;
+    CREATE TRIGGER trg_version_{table}_delete AFTER DELETE ON {table}{when}
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count - 1 WHERE name = '{table}';
+    END;
+    CREATE TRIGGER trg_version_{table}_update AFTER UPDATE ON {table}{when}
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE name = '{table}';
+    END;
+""" for table in TABLES)
+
+
+# Per-table write counters and row counts, bumped by triggers on every write
+TABLE_VERSIONS_SCHEMA = """
+    CREATE TABLE table_versions (
+        name TEXT PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0,
+        row_count INTEGER NOT NULL DEFAULT 0
+    );
+""" + ''.join(f"""
+    INSERT INTO table_versions (name, row_count) SELECT '{table}', COUNT(*) FROM {table};""" for table in TABLES) + \
+    version_triggers()
+
+TableInfo = namedtuple('TableInfo', 'name row_count schema columns sample')
+
+
+class CatalogSnapshot:
+    """
+    Row count, CREATE statement and first rows of every food waste table, for
+    the "Dataset Information" header.
+
+    The snapshot is built once. On later reads it looks at table_versions only
+    when `PRAGMA data_version` says another connection has committed, and then
+    reloads just the tables whose counter moved. Row counts come from the
+    counter table, never from a COUNT(*) scan.
+    """
+
+    def __init__(self, path=fq.DATABASE, sample_size=5):
+        self._conn = sql.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._sample_size = sample_size
+        self._data_version = None
+        self._schema_version = None
+        self._versions = {}
+        self._tables = {}
+
+    def _load(self, name, row_count):
+        schema = self._conn.execute("SELECT sql FROM sqlite_master WHERE name = ?", (name,)).fetchone()[0]
+        cursor = self._conn.execute(f"SELECT * FROM {name} LIMIT ?", (self._sample_size,))
+        columns = [d[0] for d in cursor.description]
+        self._tables[name] = TableInfo(name, row_count, schema, columns, cursor.fetchall())
+
+    def _refresh(self):
+        data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version == self._data_version:
+            return
+        schema_version = self._conn.execute("PRAGMA schema_version").fetchone()[0]
+        if schema_version != self._schema_version:
+            self._versions = {}
+        for name, version, row_count in self._conn.execute("SELECT name, version, row_count FROM table_versions"):
+            if self._versions.get(name) != version:
+                self._load(name, row_count)
+                self._versions[name] = version
+        self._data_version = data_version
+        self._schema_version = schema_version
+
+    def table(self, name):
+        """TableInfo for one table, e.g. table('claims_data').row_count."""
+        with self._lock:
+            self._refresh()
+            return self._tables[name]
+
+    def data_version(self):
+        """Write counters of every table; changes whenever any table is written."""
+        with self._lock:
+            self._refresh()
+            return tuple(sorted(self._versions.items()))
+
+    def close(self):
+        self._conn.close()
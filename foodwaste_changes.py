@@ -0,0 +1,296 @@
+"""
+Change-data capture for the four food waste tables, and precise invalidation
+of the results cached from them.
+
+Triggers append one changelog row per written row image: the new row of an
+insert, the old row of a delete, both rows of an update. Besides the table,
+key and operation, a change records the values the sidebar filters (and the
+contact pages' city) compare against. A claim also carries its listing's and
+receiver's values, because the analyses join them. A NULL dimension means the
+table has no such value, so the change may touch rows of every value:
+renaming a provider can change claim counts of any status.
+
+Bulk imports skip the per-row triggers (they are guarded by bulk_load) and
+add one change per distinct set of dimension values in the batch instead,
+with no key. changelog keeps the last KEEP changes. An insert trims the
+oldest one, so it needs no maintenance.
+
+A ChangeFeed delivers new changes to its subscribers. The dashboards'
+result and chart caches subscribe and drop only the entries that a change
+can alter. An entry is left alone when none of its tables changed, or when
+every change has a value that its filters exclude: a new claim in Chennai
+leaves the cached analyses filtered to Delhi untouched. A feed that falls
+more than KEEP changes behind cannot tell what changed. It then tells the
+subscribers that everything may have, and bumps its epoch.
+
+    python foodwaste_changes.py [database.db] [--last N]
+"""
+
+import re
+import sqlite3 as sql
+import sys
+import threading
+from collections import namedtuple
+from functools import lru_cache
+from itertools import product
+
+import foodwaste_cache
+import foodwaste_cities
+import foodwaste_cube
+import foodwaste_queries as fq
+import foodwaste_rollups
+
+# Bound parameters a change can be matched against
+DIMENSIONS = fq.FILTERS + ('city',)
+
+KEEP = 100_000
+
+# The provider type the analyses see for a listing: theirs and their provider's
+# agree, and when they do not the change may touch either, so it is left open
+_PROVIDER_TYPE = "CASE WHEN l.Provider_Type IS p.Type THEN IFNULL(l.Provider_Type, '') END"
+
+# Base table -> (key, columns the change reads from the row, joins, dimension -> value)
+CAPTURE = {
+    'claims_data': ('Claim_ID', ('Claim_ID', 'Food_ID', 'Receiver_ID', 'Status'), """
+        LEFT JOIN food_listings_data AS l ON l.Food_ID = r.Food_ID
+        LEFT JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID
+        LEFT JOIN receivers_data AS v ON v.Receiver_ID = r.Receiver_ID""", {
+        'status': "IFNULL(r.Status, '')",
+        'provider_type': _PROVIDER_TYPE,
+        'receiver_type': "IFNULL(v.Type, '')",
+        'food_type': "IFNULL(l.Food_type, '')",
+        'meal_type': "IFNULL(l.Meal_Type, '')",
+        'location': "IFNULL(l.Location, '')",
+    }),
+    'food_listings_data': ('Food_ID', ('Food_ID', 'Provider_ID', 'Provider_Type', 'Food_type', 'Meal_Type',
+                                       'Location'), """
+        LEFT JOIN provider_data AS p ON p.Provider_ID = r.Provider_ID""", {
+        'provider_type': _PROVIDER_TYPE.replace('l.', 'r.'),
+        'food_type': "IFNULL(r.Food_type, '')",
+        'meal_type': "IFNULL(r.Meal_Type, '')",
+        'location': "IFNULL(r.Location, '')",
+    }),
+    'provider_data': ('Provider_ID', ('Provider_ID', 'Type', 'City'), '', {
+        'provider_type': "IFNULL(r.Type, '')",
+        'city': "IFNULL(r.City, '')",
+    }),
+    'receivers_data': ('Receiver_ID', ('Receiver_ID', 'Type', 'City'), '', {
+        'receiver_type': "IFNULL(r.Type, '')",
+        'city': "IFNULL(r.City, '')",
+    }),
+}
+
+SCHEMA = f"""
+    CREATE TABLE changelog (
+        Seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        Table_Name TEXT NOT NULL,
+        Row_ID INTEGER,
+        Op TEXT NOT NULL,
+        {', '.join(f'{d} TEXT' for d in DIMENSIONS)}
+    );
+    CREATE TRIGGER trg_changelog_trim AFTER INSERT ON changelog
+    BEGIN
+        DELETE FROM changelog WHERE Seq <= NEW.Seq - {KEEP};
+    END;
+"""
+
+
+def record(table, source, op, collapse=False):
+    """
+    Statement appending a change per row of source, shaped like table. With
+    collapse, rows with the same dimension values share one change, without a key.
+    """
+    key, _, joins, values = CAPTURE[table]
+    return f"""
+        INSERT INTO changelog (Table_Name, Row_ID, Op, {', '.join(DIMENSIONS)})
+        SELECT {'DISTINCT ' if collapse else ''}'{table}', {'NULL' if collapse else f'r.{key}'}, '{op}',
+               {', '.join(values.get(d, 'NULL') for d in DIMENSIONS)}
+        FROM {source} AS r{joins};"""
+
+
+def triggers(when=''):
+    """CREATE TRIGGER statements feeding changelog, each with an optional WHEN clause."""
+    script = ''
+    for table, (_, columns, _, _) in CAPTURE.items():
+        def change(ref, op):
+            return record(table, foodwaste_cube.row_subquery(ref, columns), op)
+
+        script += f"""
+    CREATE TRIGGER trg_changes_{table}_insert AFTER INSERT ON {table}{when}
+    BEGIN{change('NEW', 'I')}
+    END;
+    CREATE TRIGGER trg_changes_{table}_delete AFTER DELETE ON {table}{when}
+    BEGIN{change('OLD', 'D')}
+    END;
+    CREATE TRIGGER trg_changes_{table}_update AFTER UPDATE ON {table}{when}
+    BEGIN{change('OLD', 'U')}{change('NEW', 'U')}
+    END;
+    """
+    return script
+
+
+Change = namedtuple('Change', ('seq', 'table', 'row_id', 'op') + DIMENSIONS)
+
+# tables: base tables whose changes can alter a result
+# filters: bound dimensions that narrow the rows the result is computed from
+Dependency = namedtuple('Dependency', 'tables filters')
+
+EVERYTHING = Dependency(frozenset(foodwaste_cache.TABLES), ())
+
+# Derived table -> the base tables its triggers maintain it from
+DERIVED = dict(
+    {rollup: tuple(t for t, (_, _, rollups) in foodwaste_rollups.TABLES.items() if rollup in rollups)
+     for rollup in foodwaste_rollups.ROLLUPS},
+    metrics_cube=tuple(foodwaste_cube.TABLES),
+    city_stats=tuple(foodwaste_cities.SIDES),
+    item_claims=('claims_data',),
+    expiry_queue=('food_listings_data', 'claims_data'),
+)
+
+# Analyses that bind a filter without narrowing their rows: the percentage
+# analyses divide by the total over every value of their own dimension
+UNFILTERED = {
+    'Percentage of Food Claims by Status': ('status',),
+    'Percentage of Food Claims by Meal Type': ('meal_type',),
+}
+
+
+@lru_cache(maxsize=None)
+def depends(statement, unfiltered=()):
+    """The Dependency of a SQL statement, from the tables it names and the dimensions it binds."""
+    names = set(re.findall(r'\w+', statement))
+    tables = {t for t in foodwaste_cache.TABLES if t in names}
+    tables.update(t for derived, sources in DERIVED.items() if derived in names for t in sources)
+    bound = set(re.findall(r':(\w+)', statement))
+    return Dependency(frozenset(tables), tuple(d for d in DIMENSIONS if d in bound and d not in unfiltered))
+
+
+def analysis_dependency(analysis, statement):
+    return depends(statement, UNFILTERED.get(analysis, ()))
+
+
+def affects(change, dependency, params):
+    """Whether change can alter a result with dependency, computed under the bound params."""
+    if change.table not in dependency.tables:
+        return False
+    for name in dependency.filters:
+        wanted, value = params.get(name), getattr(change, name)
+        if wanted is not None and value is not None and value != wanted:
+            return False
+    return True
+
+
+def matcher(changes, dependency):
+    """
+    match(key) for cache keys shaped (analysis, sorted param items, version),
+    as used by the prefetcher and the render cache: whether any of changes can
+    alter that entry. dependency(analysis, params) gives its Dependency.
+    changes None means they are unknown, and every key matches.
+    """
+    if changes is None:
+        return lambda key: True
+    # The values of the named dimensions found among the changes of a table,
+    # so that a key costs a few set lookups however many changes there are
+    columns, projections = {}, {}
+    for change in changes:
+        values = columns.setdefault(change.table, {name: [] for name in DIMENSIONS})
+        for name in DIMENSIONS:
+            values[name].append(getattr(change, name))
+
+    def seen(table, names):
+        if (table, names) not in projections:
+            values = columns.get(table)
+            projections[table, names] = (set() if values is None else
+                                         set(zip(*(values[name] for name in names))) if names else {()})
+        return projections[table, names]
+
+    def match(key):
+        analysis, items = key[0], dict(key[1])
+        found = dependency(analysis, items)
+        names = tuple(name for name in found.filters if items.get(name) is not None)
+        # affects(): each value is the wanted one, or NULL for a table without it
+        candidates = list(product(*[(items[name], None) for name in names]))
+        return any(any(c in seen(table, names) for c in candidates) for table in found.tables)
+    return match
+
+
+class ChangeFeed:
+    """
+    Delivers changelog rows to subscribers, in order, on each poll(). It
+    reads the log on a private connection, and only when `PRAGMA
+    data_version` says another connection has committed. It starts at the
+    end of the log: anything cached after it opens already reflects the
+    earlier changes.
+    """
+
+    def __init__(self, path=fq.DATABASE):
+        self._conn = sql.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._subscribers = []
+        self._data_version = None
+        self.position = self._top()
+        self.epoch = 0
+        self.counts = dict.fromkeys(('polls', 'deliveries', 'changes', 'resets'), 0)
+
+    def _top(self):
+        """Seq of the last change ever logged, including trimmed ones."""
+        row = self._conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'changelog'").fetchone()
+        return row[0] if row else 0
+
+    def subscribe(self, callback):
+        """
+        Call callback(changes) with each batch of new Change rows, or with None
+        when changes were lost and anything may have changed. Callbacks run
+        while the feed is locked and must not poll it.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def poll(self):
+        """Deliver the changes committed since the last poll and return how many there were."""
+        with self._lock:
+            self.counts['polls'] += 1
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if version == self._data_version:
+                return 0
+            self._data_version = version
+            top = self._top()
+            count = top - self.position
+            if count <= 0:
+                return 0
+            changes = [Change(*row) for row in self._conn.execute(
+                f"SELECT Seq, Table_Name, Row_ID, Op, {', '.join(DIMENSIONS)} FROM changelog "
+                "WHERE Seq > ? AND Seq <= ? ORDER BY Seq", (self.position, top))]
+            lost = not changes or changes[0].seq != self.position + 1
+            self.position = top
+            if lost:
+                self.epoch += 1
+                self.counts['resets'] += 1
+                changes = None
+            else:
+                self.counts['changes'] += len(changes)
+            self.counts['deliveries'] += 1
+            for callback in self._subscribers:
+                callback(changes)
+            return count
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counts, position=self.position, epoch=self.epoch)
+
+    def close(self):
+        self._conn.close()
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    last = 20
+    if '--last' in args:
+        i = args.index('--last')
+        last = int(args[i + 1])
+        del args[i:i + 2]
+    conn = sql.connect(args[0] if args else fq.DATABASE)
+    cursor = conn.execute("SELECT * FROM (SELECT * FROM changelog ORDER BY Seq DESC LIMIT ?) ORDER BY Seq", (last,))
+    print(' | '.join(d[0] for d in cursor.description))
+    for row in cursor:
+        print(' | '.join('' if v is None else str(v) for v in row))
@@ -0,0 +1,120 @@
+"""
+Chart facade and render cache for the dashboard charts.
+
+Charts are drawn by matplotlib/seaborn on the server and shipped to the
+browser as an image. Importing matplotlib.pyplot and seaborn takes the best
+part of a second, so the apps take `plt` and `sns` from here: stand-ins that
+import the real module on first use. A run that draws no chart never loads
+either library, and one that does has already sent everything above the
+first chart to the browser.
+
+The finished image bytes are kept in a process-wide LRU cache keyed by
+(analysis, filters, data version), so a repeat view never touches matplotlib,
+and every figure is closed as soon as it has been saved.
+"""
+
+import importlib
+import io
+import os
+import threading
+from collections import OrderedDict
+
+
+class LazyModule:
+    """Stands in for a module, importing it the first time one of its attributes is read."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def loaded(self):
+        return self._module is not None
+
+    def __repr__(self):
+        return f"<lazy module {self._name!r}{'' if self.loaded() else ' (not imported)'}>"
+
+
+plt = LazyModule('matplotlib.pyplot')
+sns = LazyModule('seaborn')
+
+# Memory budget for cached images, in megabytes
+DEFAULT_BUDGET_MB = float(os.environ.get('FOODWASTE_CHART_CACHE_MB', 64))
+
+
+class RenderCache:
+    """
+    Image bytes of rendered charts in least-recently-used order, within a
+    budget of budget_mb megabytes; an image larger than the whole budget is
+    not kept. Shared by every session, so every method takes the lock.
+    """
+
+    def __init__(self, budget_mb=DEFAULT_BUDGET_MB, fmt='png', dpi=200):
+        self.budget = int(budget_mb * 2 ** 20)
+        self.fmt = fmt
+        self.dpi = dpi
+        self.hits = 0
+        self.misses = 0
+        self._images = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return image
+
+    def put(self, key, image):
+        with self._lock:
+            if key in self._images:
+                self._size -= len(self._images.pop(key))
+            if len(image) > self.budget:
+                return
+            self._images[key] = image
+            self._size += len(image)
+            while self._size > self.budget:
+                _, evicted = self._images.popitem(last=False)
+                self._size -= len(evicted)
+
+    def render(self, key, draw):
+        """
+        Image bytes for key, calling draw() to build the figure only on a miss.
+        draw must return the matplotlib Figure; it is closed once saved.
+        """
+        image = self.get(key)
+        if image is not None:
+            return image
+        fig = draw()
+        try:
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format=self.fmt, dpi=self.dpi, bbox_inches='tight')
+        finally:
+            plt.close(fig)
+        image = buffer.getvalue()
+        self.put(key, image)
+        return image
+
+    def invalidate(self, match=lambda key: True):
+        """Drop every cached image whose key satisfies match."""
+        with self._lock:
+            for key in [k for k in self._images if match(k)]:
+                self._size -= len(self._images.pop(key))
+
+    def stats(self):
+        with self._lock:
+            return {'images': len(self._images), 'bytes': self._size, 'budget': self.budget,
+                    'hits': self.hits, 'misses': self.misses}
+
+
+def chart_key(analysis, params, data_version):
+    """Cache key for one analysis under one set of bound filter parameters."""
+    return analysis, tuple(sorted(params.items())), data_version
@@ -0,0 +1,79 @@
+"""
+Per-city provider and receiver counts.
+
+"Number of Food Providers and Receivers in Each City" used to join
+provider_data to receivers_data on City and count distinct ids, which builds
+providers x receivers pairs for every city. city_stats counts each side on its
+own instead, one row per (Provider_Type, Receiver_Type, City) where the other
+side's type is always 'All':
+
+    (Type, 'All', City)    providers of one Type in the city
+    ('All', Type, City)    receivers of one Type in the city
+    ('All', 'All', City)   all providers and all receivers in the city
+
+Triggers on provider_data and receivers_data keep it current, and the
+analysis in foodwaste_queries merges the two sides with primary key lookups.
+"""
+
+import foodwaste_cube
+
+# Base table -> (column city_stats keys its Type under, measure it counts)
+SIDES = {
+    'provider_data': ('Provider_Type', 'Providers'),
+    'receivers_data': ('Receiver_Type', 'Receivers'),
+}
+
+COLUMNS = ('Type', 'City')
+
+
+def apply_delta(table, source, sign='+'):
+    """Add (or subtract) the rows of source, shaped like table, into city_stats."""
+    type_column, measure = SIDES[table]
+    types = {column: "'All'" for column, _ in SIDES.values()}
+    types[type_column] = "CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END"
+    counts = {m: '0' for _, m in SIDES.values()}
+    counts[measure] = f'{sign}COUNT(*)'
+    return f"""
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT {types['Provider_Type']}, {types['Receiver_Type']}, s.City, {counts['Providers']}, {counts['Receivers']}
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM {source}) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    """
+
+
+def triggers(when=''):
+    """CREATE TRIGGER statements feeding city_stats, each with an optional WHEN clause."""
+    script = ''
+    for table in SIDES:
+        def delta(ref, sign):
+            return apply_delta(table, foodwaste_cube.row_subquery(ref, COLUMNS), sign)
+
+        script += f"""
+    CREATE TRIGGER trg_city_{table}_insert AFTER INSERT ON {table}{when}
+    BEGIN{delta('NEW', '+')}
+    END;
+    CREATE TRIGGER trg_city_{table}_delete AFTER DELETE ON {table}{when}
+    BEGIN{delta('OLD', '-')}
+    END;
+    CREATE TRIGGER trg_city_{table}_update AFTER UPDATE OF {', '.join(COLUMNS)} ON {table}{when}
+    BEGIN{delta('OLD', '-')}{delta('NEW', '+')}
+    END;
+    """
+    return script
+
+
+SCHEMA = f"""
+    CREATE TABLE city_stats (
+        Provider_Type TEXT NOT NULL,
+        Receiver_Type TEXT NOT NULL,
+        City TEXT NOT NULL,
+        Providers INTEGER NOT NULL DEFAULT 0,
+        Receivers INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (Provider_Type, Receiver_Type, City)
+    ) WITHOUT ROWID;
+    {''.join(apply_delta(table, table) for table in SIDES)}
+    {triggers()}
+"""
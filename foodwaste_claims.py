@@ -0,0 +1,242 @@
+"""
+Transactional writes for claims: creation and status transitions.
+
+    Pending -> Completed
+    Pending -> Cancelled
+
+A Food_ID can have at most one live (Pending or Completed) claim, so two
+receivers can never both claim the same listing. Every write is a short
+BEGIN IMMEDIATE transaction, which takes the write lock up front, and the
+claim row carries a Version column that each transition bumps: a transition
+names the version it was based on and loses with ClaimConflict if someone got
+there first.
+
+ClaimService puts an in-process queue in front of one writer connection. Writes
+that arrive together are applied in one transaction (group commit), so a burst
+of claimers pays for one lock and one WAL commit instead of one each, and
+each write still succeeds or conflicts on its own.
+"""
+
+import datetime
+import queue
+import threading
+from collections import namedtuple
+from concurrent.futures import Future
+
+import foodwaste_import
+import foodwaste_queries as fq
+
+TRANSITIONS = {
+    'Pending': ('Completed', 'Cancelled'),
+    'Completed': (),
+    'Cancelled': (),
+}
+
+# Claims that hold their Food_ID
+LIVE = ('Pending', 'Completed')
+
+# Most writes applied in one group commit, and how long the writer waits for
+# more once the queue is empty (0: commit whatever was already queued)
+MAX_BATCH = 256
+MAX_WAIT = 0
+
+# The IDs of a list of statuses in dim_status (migration 16)
+_STATUS_IDS = "SELECT ID FROM dim_status WHERE Value IN ({})"
+_LIVE_IDS = _STATUS_IDS.format(', '.join(repr(s) for s in LIVE))
+
+Claim = namedtuple('Claim', 'claim_id food_id receiver_id status version')
+
+
+class ClaimConflict(Exception):
+    """The write lost to a concurrent one: the listing is taken, or the claim moved on."""
+
+
+def now():
+    return datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _create(conn, food_id, receiver_id, timestamp=None):
+    # Written to claims_facts: the claims_data view reports no rowcount or lastrowid
+    cursor = conn.execute(f"""
+        INSERT INTO claims_facts (Food_ID, Receiver_ID, Status_ID, Timestamp, Version)
+        SELECT :food_id, :receiver_id, {fq.id_of('status', "'Pending'")}, :timestamp, 0
+        WHERE EXISTS (SELECT 1 FROM food_listings_facts WHERE Food_ID = :food_id)
+          AND EXISTS (SELECT 1 FROM receivers_facts WHERE Receiver_ID = :receiver_id)
+          AND NOT EXISTS (SELECT 1 FROM claims_facts
+                          WHERE Food_ID = :food_id AND Status_ID IN ({_LIVE_IDS}))
+        """, {'food_id': food_id, 'receiver_id': receiver_id, 'timestamp': timestamp or now()})
+    if cursor.rowcount == 1:
+        return Claim(cursor.lastrowid, food_id, receiver_id, 'Pending', 0)
+    if conn.execute("SELECT 1 FROM food_listings_data WHERE Food_ID = ?", (food_id,)).fetchone() is None:
+        raise KeyError(f"no food listing {food_id}")
+    if conn.execute("SELECT 1 FROM receivers_data WHERE Receiver_ID = ?", (receiver_id,)).fetchone() is None:
+        raise KeyError(f"no receiver {receiver_id}")
+    raise ClaimConflict(f"food listing {food_id} is already claimed")
+
+
+def _transition(conn, claim_id, status, version):
+    sources = [s for s, targets in TRANSITIONS.items() if status in targets]
+    if not sources:
+        raise ValueError(f"no transition leads to {status!r}")
+    cursor = conn.execute(f"""
+        UPDATE claims_facts SET Status_ID = {fq.id_of('status', '?')}, Version = Version + 1
+        WHERE Claim_ID = ? AND Version = ? AND Status_ID IN ({_STATUS_IDS.format(', '.join('?' * len(sources)))})
+        """, (status, claim_id, version, *sources))
+    if cursor.rowcount == 0:
+        row = conn.execute("SELECT Status, Version FROM claims_data WHERE Claim_ID = ?", (claim_id,)).fetchone()
+        if row is None:
+            raise KeyError(f"no claim {claim_id}")
+        raise ClaimConflict(f"claim {claim_id} is {row[0]} at version {row[1]}, "
+                            f"cannot move to {status} from version {version}")
+    food_id, receiver_id = conn.execute("SELECT Food_ID, Receiver_ID FROM claims_data WHERE Claim_ID = ?",
+                                        (claim_id,)).fetchone()
+    return Claim(claim_id, food_id, receiver_id, status, version + 1)
+
+
+def _in_transaction(conn, write, *args):
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        result = write(conn, *args)
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    return result
+
+
+def create_claim(conn, food_id, receiver_id, timestamp=None):
+    """
+    Claim a listing for a receiver in its own transaction. conn should come
+    from foodwaste_import.connect_writer (autocommit, WAL, busy timeout).
+    """
+    return _in_transaction(conn, _create, food_id, receiver_id, timestamp)
+
+
+def transition(conn, claim_id, status, version):
+    """Move a claim to status if it is still at version, in its own transaction."""
+    return _in_transaction(conn, _transition, claim_id, status, version)
+
+
+def get_claim(conn, claim_id):
+    row = conn.execute("SELECT Claim_ID, Food_ID, Receiver_ID, Status, Version FROM claims_data WHERE Claim_ID = ?",
+                       (claim_id,)).fetchone()
+    return Claim(*row) if row else None
+
+
+class ClaimService:
+    """
+    Queue of claim writes drained by one writer thread with group commit.
+
+    create() and transition() block until the write has committed and return
+    the resulting Claim, or raise the write's own error (ClaimConflict,
+    KeyError, ValueError, or a sqlite3 error such as IntegrityError): each
+    write runs in a savepoint, so a failing one leaves the rest of its batch
+    alone. Only a failed BEGIN or COMMIT fails the whole batch. submit_*()
+    return a Future instead. If the writer cannot open the database, the
+    constructor raises its error.
+    """
+
+    def __init__(self, path=fq.DATABASE, max_batch=MAX_BATCH, max_wait=MAX_WAIT):
+        self.path = path
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.batches = 0
+        self.writes = 0
+        self.conflicts = 0
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._ready = threading.Event()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name='claim-writer', daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            self._thread.join()
+            raise self._error
+
+    def _next_batch(self):
+        """Block for one write, then take whatever else is queued (or arrives within max_wait), up to max_batch."""
+        batch = [self._queue.get()]
+        while len(batch) < self.max_batch and batch[-1] is not None:
+            try:
+                batch.append(self._queue.get(timeout=self.max_wait) if self.max_wait else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        try:
+            conn = foodwaste_import.connect_writer(self.path)
+        except Exception as error:
+            self._error = error
+            return
+        finally:
+            self._ready.set()
+        try:
+            while True:
+                batch = self._next_batch()
+                stop = batch[-1] is None
+                writes = [item for item in batch if item is not None]
+                if writes:
+                    self._commit(conn, writes)
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    def _commit(self, conn, writes):
+        outcomes = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for future, write, args in writes:
+                # A write that fails, for whatever reason, undoes only its own changes
+                conn.execute("SAVEPOINT w")
+                try:
+                    outcomes.append((future, write(conn, *args), None))
+                except Exception as error:
+                    conn.execute("ROLLBACK TO w")
+                    outcomes.append((future, None, error))
+                conn.execute("RELEASE w")
+            conn.execute("COMMIT")
+        except Exception as error:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            for future, _, _ in writes:
+                future.set_exception(error)
+            return
+        with self._lock:
+            self.batches += 1
+            self.writes += len(writes)
+            self.conflicts += sum(isinstance(error, ClaimConflict) for _, _, error in outcomes)
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+    def _submit(self, write, *args):
+        future = Future()
+        self._queue.put((future, write, args))
+        return future
+
+    def submit_create(self, food_id, receiver_id, timestamp=None):
+        return self._submit(_create, food_id, receiver_id, timestamp)
+
+    def submit_transition(self, claim_id, status, version):
+        return self._submit(_transition, claim_id, status, version)
+
+    def create(self, food_id, receiver_id, timestamp=None):
+        return self.submit_create(food_id, receiver_id, timestamp).result()
+
+    def transition(self, claim_id, status, version):
+        return self.submit_transition(claim_id, status, version).result()
+
+    def stats(self):
+        with self._lock:
+            return {'batches': self.batches, 'writes': self.writes, 'conflicts': self.conflicts,
+                    'mean_batch': self.writes / self.batches if self.batches else 0.0}
+
+    def close(self):
+        """Commit everything already queued, then stop the writer."""
+        self._queue.put(None)
+        self._thread.join()
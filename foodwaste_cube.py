@@ -0,0 +1,184 @@
+"""
+Pre-aggregated filter cube for the Key Metrics cards.
+
+metrics_cube sums the four Key Metrics per combination of the six sidebar
+filter dimensions:
+
+    Providers  providers of a Type                  (provider_data)
+    Receivers  receivers of a Type                  (receivers_data)
+    Claims     claims ⨝ listings ⨝ receivers        (claims_data)
+    Quantity   listed quantity ⨝ provider Type      (food_listings_data)
+
+Each metric keeps the filters it honoured as a live query; the dimensions it
+ignores are stored as 'All'. A row is kept at two Location levels, its own
+Location and Location 'All', but never rolled up along the other five
+dimensions: they have a handful of values each, so a lookup sums the few
+hundred cells of one Location instead of reading a precomputed roll-up.
+Triggers on the four base tables push every insert, update and delete into
+the cube as a delta, two cells per distinct row, and a sidebar combination is
+answered from one primary key range whatever the size of claims_data.
+"""
+
+# In primary key order: every lookup fixes Location first
+DIMENSIONS = ('Location', 'Status', 'Provider_Type', 'Receiver_Type', 'Food_type', 'Meal_Type')
+MEASURES = ('Providers', 'Receivers', 'Claims', 'Quantity')
+
+# Base-grain rows per measure. {claims}, {listings}, {providers} and {receivers}
+# are the base tables, or a single OLD/NEW row when used inside a trigger.
+SOURCES = {
+    'providers': """
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               1 AS Providers, 0 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM {providers} AS p""",
+    'receivers': """
+        SELECT 'All' AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               0 AS Providers, 1 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM {receivers} AS r""",
+    'claims': """
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM {claims} AS c
+        JOIN {listings} AS l ON l.Food_ID = c.Food_ID
+        JOIN {receivers} AS r ON r.Receiver_ID = c.Receiver_ID""",
+    'quantity': """
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM {listings} AS l
+        JOIN {providers} AS p ON p.Provider_ID = l.Provider_ID""",
+}
+
+# Base table -> (placeholder, columns the cube reads, sources that depend on it)
+TABLES = {
+    'claims_data': ('claims', ('Claim_ID', 'Food_ID', 'Receiver_ID', 'Status'), ('claims',)),
+    'food_listings_data': ('listings', ('Food_ID', 'Quantity', 'Provider_ID', 'Food_type', 'Meal_Type', 'Location'),
+                           ('claims', 'quantity')),
+    'provider_data': ('providers', ('Provider_ID', 'Type'), ('providers', 'quantity')),
+    'receivers_data': ('receivers', ('Receiver_ID', 'Type'), ('receivers', 'claims')),
+}
+
+TABLE_NAMES = {placeholder: table for table, (placeholder, _, _) in TABLES.items()}
+
+
+def apply_delta(source, sign='+'):
+    """
+    Add (or subtract) the rows of a base-grain source into the cube cells they
+    count in. The source is first summed at full grain, then each group goes
+    to its own cell and to the cell with Location rolled up to 'All' (a source
+    that already reports Location as 'All' only has the first), where the
+    upsert adds up the groups of every Location.
+    """
+    grain = ', '.join(f"IFNULL({d}, '') AS {d}" for d in DIMENSIONS)
+    totals = ', '.join(f"SUM({m}) AS {m}" for m in MEASURES)
+    dims = ', '.join(f"s.{d}" for d in DIMENSIONS[1:])
+    sums = ', '.join(f"{sign}s.{m}" for m in MEASURES)
+    update = ', '.join(f"{m} = {m} + excluded.{m}" for m in MEASURES)
+    return f"""
+    INSERT INTO metrics_cube ({', '.join(DIMENSIONS + MEASURES)})
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, {dims}, {sums}
+    FROM (SELECT {grain}, {totals} FROM ({source}) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT ({', '.join(DIMENSIONS)}) DO UPDATE SET {update};
+    """
+
+
+def row_subquery(ref, columns):
+    """A one-row table of the trigger's OLD or NEW values, usable in place of a base table."""
+    return '(SELECT ' + ', '.join(f"{ref}.{c} AS {c}" for c in columns) + ')'
+
+
+def triggers(when=''):
+    """CREATE TRIGGER statements feeding metrics_cube, each with an optional WHEN clause."""
+    script = ''
+    for table, (placeholder, columns, sources) in TABLES.items():
+        def deltas(ref, sign):
+            tables = dict(TABLE_NAMES, **{placeholder: row_subquery(ref, columns)})
+            return ''.join(apply_delta(SOURCES[s].format(**tables), sign) for s in sources)
+
+        script += f"""
+    CREATE TRIGGER trg_cube_{table}_insert AFTER INSERT ON {table}{when}
+    BEGIN{deltas('NEW', '+')}
+    END;
+    CREATE TRIGGER trg_cube_{table}_delete AFTER DELETE ON {table}{when}
+    BEGIN{deltas('OLD', '-')}
+    END;
+    CREATE TRIGGER trg_cube_{table}_update AFTER UPDATE OF {', '.join(columns)} ON {table}{when}
+    BEGIN{deltas('OLD', '-')}{deltas('NEW', '+')}
+    END;
+    """
+    return script
+
+
+SCHEMA = f"""
+    CREATE TABLE metrics_cube (
+        {', '.join(d + ' TEXT NOT NULL' for d in DIMENSIONS)},
+        Providers INTEGER NOT NULL DEFAULT 0,
+        Receivers INTEGER NOT NULL DEFAULT 0,
+        Claims INTEGER NOT NULL DEFAULT 0,
+        Quantity INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY ({', '.join(DIMENSIONS)})
+    ) WITHOUT ROWID;
+    {''.join(apply_delta(source.format(**TABLE_NAMES)) for source in SOURCES.values())}
+    {triggers()}
+"""
+
+
+def _sum(measure, location="'All'", **filters):
+    where = ''.join(f"\n          AND (:{p} IS NULL OR {d} = :{p})" for d, p in filters.items())
+    return f"(SELECT IFNULL(SUM({measure}), 0) FROM metrics_cube\n        WHERE Location = {location}{where})"
+
+
+# Bound with foodwaste_queries.filter_params(); a NULL parameter sums the cells of every value
+LOOKUP = f"""
+    SELECT
+        {_sum('Providers', Provider_Type='provider_type')},
+        {_sum('Receivers', Receiver_Type='receiver_type')},
+        {_sum('Claims', "IFNULL(:location, 'All')", Status='status', Receiver_Type='receiver_type',
+              Food_type='food_type', Meal_Type='meal_type')},
+        {_sum('Quantity', "IFNULL(:location, 'All')", Provider_Type='provider_type', Food_type='food_type',
+              Meal_Type='meal_type')};
+"""
+
+
+# Dimension -> sidebar filter, for the dimensions the Claims measure honours
+CLAIM_FILTERS = {'Status': 'status', 'Receiver_Type': 'receiver_type', 'Food_type': 'food_type',
+                 'Meal_Type': 'meal_type', 'Location': 'location'}
+
+
+def claim_shares(dimension, order_by):
+    """
+    Percentage-of-total analysis: claims per value of one dimension and each
+    value's percentage of their total, bound with foodwaste_queries.filter_params().
+    Both come from one pass over the cube cells of the other filters, the
+    total as SUM() OVER (), so the percentages follow every filter the Claims
+    card does. The dimension's own filter only picks the row shown: with
+    Status = 'Completed' it is still the share of all claims that pass the
+    other filters.
+    """
+    location = '' if dimension == 'Location' else "Location = IFNULL(:location, 'All') AND "
+    fixed = ''.join(f"\n          AND (:{p} IS NULL OR {d} = :{p})"
+                    for d, p in CLAIM_FILTERS.items() if d not in (dimension, 'Location'))
+    own = CLAIM_FILTERS[dimension]
+    return f"""
+    SELECT {dimension}, Number_of_Claims, Percentage
+    FROM (
+        SELECT NULLIF({dimension}, '') AS {dimension}, SUM(Claims) AS Number_of_Claims,
+               SUM(Claims) * 100.0 / SUM(SUM(Claims)) OVER () AS Percentage
+        FROM metrics_cube
+        WHERE {location}{dimension} <> 'All' AND Provider_Type = 'All'{fixed}
+        GROUP BY 1
+        HAVING SUM(Claims) > 0
+    )
+    WHERE (:{own} IS NULL OR {dimension} = :{own})
+    ORDER BY {order_by};
+    """
+
+
+def key_metrics(conn, params):
+    """Return the four Key Metrics for a set of sidebar filters, keyed like foodwaste_queries.METRICS."""
+    return dict(zip(('Number of Providers', 'Number of Receivers', 'Number of Claims', 'Total Quantity (Units)'),
+                    conn.execute(LOOKUP, params).fetchone()))
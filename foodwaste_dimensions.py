@@ -0,0 +1,248 @@
+"""
+Integer-keyed dimension tables for the repeated text columns.
+
+Type, Status, Meal_Type, Food_type, Location, Provider_Type and City repeat a
+handful of strings in every row of the four food waste tables. Migration 16
+moves each of them into a small dim_* table (ID INTEGER PRIMARY KEY, Value
+TEXT UNIQUE) and rewrites the tables as *_facts tables that store the ID, with
+every index rebuilt on the ID columns. A NULL value is stored as a NULL ID.
+
+Views under the original table names decode the IDs again, column for
+column, and expose the IDs as extra *_ID columns. Readers run unchanged, and
+the sidebar filters bind the IDs of their values (foodwaste_queries.bind_ids),
+so they compare integers on the integer indexes. INSTEAD OF triggers on the
+views route INSERT, UPDATE and DELETE to the facts tables and add new values
+to their dimension. The triggers that keep the derived tables current now sit on the
+facts tables and decode the IDs they read.
+
+SQLite reports neither the row count nor the new key of a write made through
+an INSTEAD OF trigger, so writers that need them (foodwaste_claims,
+foodwaste_import) write the facts tables directly, foodwaste_import through
+insert().
+
+The migration script is generated from a database at version 15, whose
+trigger and index definitions it moves across:
+
+    python foodwaste_dimensions.py database.db > migrations/16_dimensions.sql
+"""
+
+import re
+import sqlite3 as sql
+import sys
+
+import foodwaste_queries as fq
+
+# Dimension table -> the (table, column) pairs it encodes. City and Location
+# share a dimension, as do both Provider_Type columns, so one filter value has one ID.
+DIMENSIONS = {
+    'dim_status': (('claims_data', 'Status'),),
+    'dim_provider_type': (('provider_data', 'Type'), ('food_listings_data', 'Provider_Type')),
+    'dim_receiver_type': (('receivers_data', 'Type'),),
+    'dim_food_type': (('food_listings_data', 'Food_type'),),
+    'dim_meal_type': (('food_listings_data', 'Meal_Type'),),
+    'dim_city': (('provider_data', 'City'), ('receivers_data', 'City'), ('food_listings_data', 'Location')),
+}
+
+# Table -> (facts table, key, columns in table order, the generated ones among them)
+TABLES = {
+    'provider_data': ('provider_facts', 'Provider_ID',
+                      ('Provider_ID', 'Name', 'Type', 'Address', 'City', 'Contact'), ()),
+    'receivers_data': ('receivers_facts', 'Receiver_ID',
+                       ('Receiver_ID', 'Name', 'Type', 'City', 'Contact'), ()),
+    'food_listings_data': ('food_listings_facts', 'Food_ID',
+                           ('Food_ID', 'Food_Name', 'Quantity', 'Expiry_Date', 'Provider_ID', 'Provider_Type',
+                            'Location', 'Meal_Type', 'Food_type', 'Expiry_Epoch', 'Expiry_Day'),
+                           ('Expiry_Epoch', 'Expiry_Day')),
+    'claims_data': ('claims_facts', 'Claim_ID',
+                    ('Claim_ID', 'Food_ID', 'Receiver_ID', 'Status', 'Timestamp', 'Timestamp_Epoch', 'Timestamp_Day',
+                     'Version'), ('Timestamp_Epoch', 'Timestamp_Day')),
+}
+
+# Column defaults a view cannot apply: an INSERT through it that leaves them out passes NULL
+DEFAULTS = {'Version': '0'}
+
+# Table -> coded column -> its dimension table
+CODED = {}
+for _dim, _columns in DIMENSIONS.items():
+    for _table, _column in _columns:
+        CODED.setdefault(_table, {})[_column] = _dim
+
+# Values foodwaste_claims writes, which must have an ID before the first claim does
+STATUSES = ('Cancelled', 'Completed', 'Pending')
+
+FACTS = """
+    CREATE TABLE provider_facts (
+        Provider_ID INTEGER PRIMARY KEY,
+        Name TEXT,
+        Type_ID INTEGER REFERENCES dim_provider_type (ID),
+        Address TEXT,
+        City_ID INTEGER REFERENCES dim_city (ID),
+        Contact TEXT
+    );
+    CREATE TABLE receivers_facts (
+        Receiver_ID INTEGER PRIMARY KEY,
+        Name TEXT,
+        Type_ID INTEGER REFERENCES dim_receiver_type (ID),
+        City_ID INTEGER REFERENCES dim_city (ID),
+        Contact TEXT
+    );
+    CREATE TABLE food_listings_facts (
+        Food_ID INTEGER PRIMARY KEY,
+        Food_Name TEXT,
+        Quantity INTEGER,
+        Expiry_Date TIMESTAMP,
+        Provider_ID INTEGER REFERENCES provider_facts (Provider_ID),
+        Provider_Type_ID INTEGER REFERENCES dim_provider_type (ID),
+        Location_ID INTEGER REFERENCES dim_city (ID),
+        Meal_Type_ID INTEGER REFERENCES dim_meal_type (ID),
+        Food_type_ID INTEGER REFERENCES dim_food_type (ID),
+        Expiry_Epoch INTEGER GENERATED ALWAYS AS (CAST(strftime('%s', Expiry_Date) AS INTEGER)) VIRTUAL,
+        Expiry_Day INTEGER GENERATED ALWAYS AS (CAST(strftime('%s', Expiry_Date) AS INTEGER) / 86400) VIRTUAL
+    );
+    CREATE TABLE claims_facts (
+        Claim_ID INTEGER PRIMARY KEY,
+        Food_ID INTEGER REFERENCES food_listings_facts (Food_ID),
+        Receiver_ID INTEGER REFERENCES receivers_facts (Receiver_ID),
+        Status_ID INTEGER REFERENCES dim_status (ID),
+        Timestamp TIMESTAMP,
+        Timestamp_Epoch INTEGER GENERATED ALWAYS AS (CAST(strftime('%s', Timestamp) AS INTEGER)) VIRTUAL,
+        Timestamp_Day INTEGER GENERATED ALWAYS AS (CAST(strftime('%s', Timestamp) AS INTEGER) / 86400) VIRTUAL,
+        Version INTEGER NOT NULL DEFAULT 0
+    );
+"""
+
+
+def code(dimension, value):
+    """SQL expression for the ID of value (an SQL expression) in dimension; NULL when it has none."""
+    return f"(SELECT ID FROM {dimension} WHERE Value = {value})"
+
+
+def decode(dimension, expression):
+    """SQL expression for the value of the ID expression in dimension."""
+    return f"(SELECT Value FROM {dimension} WHERE ID = {expression})"
+
+
+def _facts_column(table, column):
+    return f"{column}_ID" if column in CODED.get(table, {}) else column
+
+
+def _writable(table):
+    _, _, columns, generated = TABLES[table]
+    return [c for c in columns if c not in generated]
+
+
+def _encoded(table, ref, column):
+    dim = CODED.get(table, {}).get(column)
+    return code(dim, f"{ref}.{column}") if dim else f"{ref}.{column}"
+
+
+def _new_values(table, ref, source=''):
+    """Statements adding the non-NULL values of ref's coded columns to their dimensions."""
+    return [f"INSERT OR IGNORE INTO {dim} (Value) SELECT {ref}.{column}{source} WHERE {ref}.{column} IS NOT NULL"
+            for column, dim in CODED.get(table, {}).items()]
+
+
+def insert(table, columns, source):
+    """Statements inserting the rows of source, with columns named like table's, into table's facts table."""
+    return _new_values(table, 's', f' FROM {source} AS s') + [f"""
+        INSERT INTO {TABLES[table][0]} ({', '.join(_facts_column(table, c) for c in columns)})
+        SELECT {', '.join(_encoded(table, 's', c) for c in columns)} FROM {source} AS s"""]
+
+
+def view(table):
+    """The view presenting table's facts with decoded values, then the IDs."""
+    facts, _, columns, _ = TABLES[table]
+    coded = CODED.get(table, {})
+    decoded = [f"{decode(coded[c], f'f.{c}_ID')} AS {c}" if c in coded else f"f.{c}" for c in columns]
+    return f"""
+    CREATE VIEW {table} AS
+    SELECT {', '.join(decoded + [f'f.{c}_ID' for c in coded])}
+    FROM {facts} AS f;"""
+
+
+def instead_of(table):
+    """INSTEAD OF triggers that write the view's rows to its facts table."""
+    facts, key, _, _ = TABLES[table]
+    writable = _writable(table)
+    targets = ', '.join(_facts_column(table, c) for c in writable)
+    values = [_encoded(table, 'NEW', c) if c not in DEFAULTS else f"IFNULL(NEW.{c}, {DEFAULTS[c]})" for c in writable]
+    new_values = ''.join(f"\n        {statement};" for statement in _new_values(table, 'NEW'))
+    return f"""
+    CREATE TRIGGER trg_{table}_insert INSTEAD OF INSERT ON {table}
+    BEGIN{new_values}
+        INSERT INTO {facts} ({targets}) VALUES ({', '.join(values)});
+    END;
+    CREATE TRIGGER trg_{table}_delete INSTEAD OF DELETE ON {table}
+    BEGIN
+        DELETE FROM {facts} WHERE {key} = OLD.{key};
+    END;
+    CREATE TRIGGER trg_{table}_update INSTEAD OF UPDATE ON {table}
+    BEGIN{new_values}
+        UPDATE {facts} SET ({targets}) = ({', '.join(values)})
+        WHERE {key} = OLD.{key};
+    END;"""
+
+
+def _rename(table, columns):
+    """A column list with each coded column of table replaced by its ID column."""
+    return re.sub(r'\b\w+\b', lambda m: _facts_column(table, m.group(0)), columns)
+
+
+def on_facts(table, trigger):
+    """A trigger on table, rewritten for its facts table: OLD and NEW values of coded columns are decoded."""
+    facts = TABLES[table][0]
+    coded = CODED.get(table, {})
+    header, body = trigger.split('BEGIN', 1)
+    header = re.sub(r'(AFTER (?:INSERT|DELETE|UPDATE(?: OF ([\w, ]+?))?) ON )' + table + r'\b',
+                    lambda m: (m.group(1).replace(m.group(2), _rename(table, m.group(2))) if m.group(2)
+                               else m.group(1)) + facts, header)
+
+    def values(text):
+        return re.sub(r'\b(NEW|OLD)\.(\w+)\b',
+                      lambda m: decode(coded[m.group(2)], f"{m.group(1)}.{m.group(2)}_ID")
+                      if m.group(2) in coded else m.group(0), text)
+
+    return values(header) + 'BEGIN' + values(body)
+
+
+def migration(conn):
+    """The script of migration 16, from a database at version 15."""
+    script = ''.join(f"""
+    CREATE TABLE {dim} (ID INTEGER PRIMARY KEY, Value TEXT NOT NULL UNIQUE);
+    INSERT INTO {dim} (Value)
+    SELECT DISTINCT * FROM ({' UNION ALL '.join(f'SELECT {c} FROM {t} WHERE {c} IS NOT NULL' for t, c in pairs)})
+    ORDER BY 1;"""
+                     for dim, pairs in DIMENSIONS.items())
+    script += f"""
+    INSERT OR IGNORE INTO dim_status (Value) VALUES {', '.join(f"('{s}')" for s in STATUSES)};"""
+    script += FACTS
+    for table in TABLES:
+        script += insert(table, _writable(table), table)[-1] + ';'  # the dimensions are already full
+
+    indexes, triggers = [], []
+    for table in TABLES:
+        for name, create in conn.execute(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL "
+                "ORDER BY name", (table,)):
+            columns = create[create.index('(') + 1:create.rindex(')')]
+            indexes.append(f"CREATE INDEX {name} ON {TABLES[table][0]} ({_rename(table, columns)});")
+        for (create,) in conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = ? ORDER BY name", (table,)):
+            triggers.append(on_facts(table, create) + ';')
+    for table in ('claims_data', 'food_listings_data', 'receivers_data', 'provider_data'):
+        script += f"\n    DROP TABLE {table};"
+    script += ''.join(view(table) + instead_of(table) for table in TABLES)
+    script += '\n\n    ' + '\n    '.join(indexes)
+    script += '\n\n    ' + '\n\n    '.join(triggers) + '\n'
+    return script
+
+
+if __name__ == '__main__':
+    path = sys.argv[1] if len(sys.argv) > 1 else fq.DATABASE
+    conn = sql.connect(path)
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version != 15:
+        sys.exit(f"{path} is at schema version {version}; the script is generated from version 15")
+    print("-- Migration 16: dimension tables for the repeated text columns")
+    print("-- Frozen when released; never edit, append a new migration instead.", end='')
+    print(migration(conn))
@@ -0,0 +1,432 @@
+"""
+Optional in-memory columnar engine for the app2 analyses.
+
+The four food waste tables are loaded once into NumPy column arrays. Text
+columns are dictionary-encoded (int32 codes plus a value list, where NULL
+has a code of its own that decodes to None) and the
+claims -> listings -> receivers/providers joins are resolved up front into row
+indexes, so an analysis is a boolean mask over the fact columns followed by a
+`bincount` group-by. Results have the same columns and rows as the SQL in
+foodwaste_queries.ANALYSES; analyses the engine does not cover (time series,
+contact lists) fall back to SQL.
+
+Select it with the FOODWASTE_ENGINE=columnar environment variable. The
+default, sqlite, runs every analysis in SQLite.
+"""
+
+import os
+import sqlite3 as sql
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+import foodwaste_dimensions
+import foodwaste_queries as fq
+
+ENGINES = ('sqlite', 'columnar')
+
+
+def selected_engine():
+    """The engine named by the FOODWASTE_ENGINE setting."""
+    engine = os.environ.get('FOODWASTE_ENGINE', 'sqlite').lower()
+    if engine not in ENGINES:
+        raise ValueError(f"FOODWASTE_ENGINE must be one of {ENGINES}, not {engine!r}")
+    return engine
+
+
+class Column:
+    """A dictionary-encoded text column: codes[i] indexes into values."""
+
+    def __init__(self, codes, values):
+        self.codes = codes
+        self.values = values
+        self._index = {v: i for i, v in enumerate(values)}
+
+    def code(self, value):
+        """Code of a value, or -1 when the value never occurs."""
+        return self._index.get(value, -1)
+
+
+# Every column is read in primary key order, so the key arrays come out sorted
+KEYS = {'provider_data': 'Provider_ID', 'receivers_data': 'Receiver_ID',
+        'food_listings_data': 'Food_ID', 'claims_data': 'Claim_ID'}
+
+
+def _ints(conn, table, column, count):
+    query = f"SELECT {column} FROM {table} ORDER BY {KEYS[table]}"
+    return np.fromiter((v if v is not None else 0 for (v,) in conn.execute(query)), dtype=np.int64, count=count)
+
+
+def _known(conn, table, column, count):
+    """Mask of the rows where column is not NULL."""
+    query = f"SELECT {column} IS NOT NULL FROM {table} ORDER BY {KEYS[table]}"
+    return np.fromiter((v for (v,) in conn.execute(query)), dtype=bool, count=count)
+
+
+def _text(conn, table, column, count, index=None):
+    index = {} if index is None else index
+    dimension = foodwaste_dimensions.CODED.get(table, {}).get(column)
+    if dimension:
+        # Read the IDs and decode them here, rather than row by row in the view
+        labels = dict(conn.execute(f"SELECT ID, Value FROM {dimension}"))
+        query = f"SELECT {column}_ID FROM {table} ORDER BY {KEYS[table]}"
+        values = (labels.get(i) for (i,) in conn.execute(query))
+    else:
+        query = f"SELECT {column} FROM {table} ORDER BY {KEYS[table]}"
+        values = (v for (v,) in conn.execute(query))
+    codes = np.fromiter((index.setdefault(v, len(index)) for v in values), dtype=np.int32, count=count)
+    return codes, index
+
+
+def _label(value):
+    """Sort key for a text value that puts NULL first, as SQLite does."""
+    return (value is not None, value or '')
+
+
+def _resolve(keys, foreign):
+    """Row index of each foreign key in the sorted key array, -1 when dangling."""
+    rows = np.searchsorted(keys, foreign)
+    rows[rows >= len(keys)] = 0
+    found = len(keys) > 0 and keys[rows] == foreign
+    return np.where(found, rows, -1)
+
+
+class BitmapIndex:
+    """
+    One compressed bitmap per (dimension, value) over a fact table's rows.
+
+    Each value is stored in whichever form is smaller: a packed bitmap
+    (n / 8 bytes) for common values, or the sorted row numbers (4 bytes per
+    row) for rare ones such as a single Location. A filter combination is
+    resolved by intersecting its bitmaps, starting from the rarest value, and
+    the resulting row numbers are memoized so every analysis of a rerun shares
+    them.
+    """
+
+    CACHE_SIZE = 64
+
+    def __init__(self, size):
+        self.size = size
+        self._bitmaps = {}
+        self._cache = OrderedDict()
+
+    def add(self, dimension, codes):
+        """Index one dimension; rows whose code is negative are left out of every bitmap."""
+        order = np.argsort(codes, kind='stable')
+        ordered = codes[order]
+        first = np.searchsorted(ordered, 0)
+        values, starts = np.unique(ordered[first:], return_index=True)
+        ends = np.append(starts[1:], len(ordered) - first)
+        for code, start, end in zip(values, starts + first, ends + first):
+            rows = order[start:end].astype(np.int32)
+            if 4 * len(rows) < self.size / 8:
+                self._bitmaps[dimension, int(code)] = ('rows', rows)
+            else:
+                bits = np.zeros(self.size, dtype=bool)
+                bits[rows] = True
+                self._bitmaps[dimension, int(code)] = ('bits', np.packbits(bits))
+
+    @staticmethod
+    def _test(bits, rows):
+        return ((bits[rows >> 3] >> (7 - (rows & 7))) & 1).astype(bool)
+
+    def rows(self, selection):
+        """Sorted row numbers matching every (dimension, code) in selection."""
+        key = tuple(sorted(selection.items()))
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        operands = [self._bitmaps.get(item, ('rows', np.empty(0, dtype=np.int32))) for item in key]
+        sparse = sorted((a for kind, a in operands if kind == 'rows'), key=len)
+        dense = [a for kind, a in operands if kind == 'bits']
+        if sparse:
+            rows = sparse[0]
+            for other in sparse[1:]:
+                rows = np.intersect1d(rows, other, assume_unique=True)
+            for bits in dense:
+                rows = rows[self._test(bits, rows)]
+        elif dense:
+            rows = np.flatnonzero(np.unpackbits(np.bitwise_and.reduce(dense), count=self.size)).astype(np.int32)
+        else:
+            rows = np.arange(self.size, dtype=np.int32)
+        self._cache[key] = rows
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return rows
+
+    def nbytes(self):
+        return sum(a.nbytes for _, a in self._bitmaps.values())
+
+
+class ColumnarEngine:
+    """
+    Column arrays for the four tables. They are reloaded in full on the next
+    run() after another connection commits (seen through `PRAGMA data_version`
+    on a private connection).
+    """
+
+    def __init__(self, path=fq.DATABASE):
+        self._conn = sql.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._version = None
+        self._refresh()
+
+    def _refresh(self):
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._version:
+            self._load(self._conn)
+            self._version = version
+
+    def _load(self, conn):
+        n = {t: conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0] for t in KEYS}
+
+        # Cities share one dictionary so providers and receivers can be matched by code
+        cities = {}
+        self.provider_id = _ints(conn, 'provider_data', 'Provider_ID', n['provider_data'])
+        self.provider_name = self._column(conn, 'provider_data', 'Name', n['provider_data'])
+        self.provider_type = self._column(conn, 'provider_data', 'Type', n['provider_data'])
+        provider_city, _ = _text(conn, 'provider_data', 'City', n['provider_data'], cities)
+
+        self.receiver_id = _ints(conn, 'receivers_data', 'Receiver_ID', n['receivers_data'])
+        self.receiver_name = self._column(conn, 'receivers_data', 'Name', n['receivers_data'])
+        self.receiver_type = self._column(conn, 'receivers_data', 'Type', n['receivers_data'])
+        receiver_city, _ = _text(conn, 'receivers_data', 'City', n['receivers_data'], cities)
+        city_values = list(cities)
+        self.provider_city = Column(provider_city, city_values)
+        self.receiver_city = Column(receiver_city, city_values)
+
+        m = n['food_listings_data']
+        self.food_id = _ints(conn, 'food_listings_data', 'Food_ID', m)
+        self.food_name = self._column(conn, 'food_listings_data', 'Food_Name', m)
+        # NULL quantities are stored as 0 and left out of SUM and AVG through quantity_known
+        self.quantity = _ints(conn, 'food_listings_data', 'Quantity', m)
+        self.quantity_known = _known(conn, 'food_listings_data', 'Quantity', m)
+        self.listing_provider_type = self._column(conn, 'food_listings_data', 'Provider_Type', m)
+        self.location = self._column(conn, 'food_listings_data', 'Location', m)
+        self.meal_type = self._column(conn, 'food_listings_data', 'Meal_Type', m)
+        self.food_type = self._column(conn, 'food_listings_data', 'Food_type', m)
+
+        c = n['claims_data']
+        self.status = self._column(conn, 'claims_data', 'Status', c)
+
+        # Pre-resolved join keys (row numbers, -1 where the key dangles)
+        self.listing_provider = _resolve(self.provider_id, _ints(conn, 'food_listings_data', 'Provider_ID', m))
+        self.claim_listing = _resolve(self.food_id, _ints(conn, 'claims_data', 'Food_ID', c))
+        self.claim_receiver = _resolve(self.receiver_id, _ints(conn, 'claims_data', 'Receiver_ID', c))
+
+        # Bitmaps over the claims ⨝ listings ⨝ receivers fact view. 'listing' and
+        # 'receiver' mark claims whose join key resolves.
+        listing_ok = self.claim_listing >= 0
+        receiver_ok = self.claim_receiver >= 0
+        self.claim_index = BitmapIndex(c)
+        self.claim_index.add('listing', np.where(listing_ok, 0, -1))
+        self.claim_index.add('receiver', np.where(receiver_ok, 0, -1))
+        self.claim_index.add('status', self.status.codes)
+        self.claim_index.add('receiver_type', np.where(receiver_ok, self.receiver_type.codes[self.claim_receiver], -1))
+        for name in ('food_type', 'meal_type', 'location'):
+            self.claim_index.add(name, np.where(listing_ok, getattr(self, name).codes[self.claim_listing], -1))
+
+    @staticmethod
+    def _column(conn, table, column, count):
+        codes, index = _text(conn, table, column, count)
+        return Column(codes, list(index))
+
+    # --- filtering ---
+
+    @staticmethod
+    def _match(column, value, rows=None):
+        codes = column.codes if rows is None else column.codes[rows]
+        if value is None:
+            return np.ones(len(codes), dtype=bool)
+        return codes == column.code(value)
+
+    def _listing_mask(self, params, provider_type_column=None):
+        mask = (self._match(self.food_type, params['food_type'])
+                & self._match(self.meal_type, params['meal_type'])
+                & self._match(self.location, params['location']))
+        if provider_type_column == 'listing':
+            mask &= self._match(self.listing_provider_type, params['provider_type'])
+        elif provider_type_column == 'provider':
+            valid = self.listing_provider >= 0
+            mask &= valid
+            mask[valid] &= self._match(self.provider_type, params['provider_type'], self.listing_provider[valid])
+        return mask
+
+    def _claim_mask(self, params, status=True, receiver=True, provider_type=False):
+        """
+        Row numbers of the claims surviving the sidebar filters, resolved from
+        the bitmap index; always requires the listing join.
+        """
+        selection = {'listing': 0}
+        names = ('food_type', 'meal_type', 'location') + (('status',) if status else ())
+        if receiver:
+            selection['receiver'] = 0
+            names += ('receiver_type',)
+        for name in names:
+            if params[name] is not None:
+                selection[name] = getattr(self, name).code(params[name])
+        rows = self.claim_index.rows(selection)
+        if provider_type:
+            providers = self.listing_provider[self.claim_listing[rows]]
+            keep = providers >= 0
+            keep[keep] = self._match(self.provider_type, params['provider_type'], providers[keep])
+            rows = rows[keep]
+        return rows
+
+    # --- group-bys ---
+
+    @staticmethod
+    def _group(codes, size, weights=None):
+        counts = np.bincount(codes, minlength=size)
+        sums = counts if weights is None else np.bincount(codes, weights=weights, minlength=size)
+        present = np.nonzero(counts)[0]
+        return present, counts[present], sums[present]
+
+    @staticmethod
+    def _ranked(keys, values, labels, limit=None):
+        """Rows ordered by value descending, NULLs last and ties by label, like ORDER BY ... DESC."""
+        order = sorted(range(len(keys)), key=lambda i: (values[i] is None, -(values[i] or 0), _label(labels[keys[i]])))
+        if limit is not None:
+            order = order[:limit]
+        return [(labels[keys[i]], values[i]) for i in order]
+
+    def _top(self, column, codes, limit=None, weights=None, known=None, average=False):
+        """
+        Count per value of column, or the SUM / AVG of weights. Like SQL, the
+        rows where known is False are left out, and a value without any known
+        weight gets None.
+        """
+        size = len(column.values)
+        keys, counts, sums = self._group(codes, size, weights)
+        if weights is None:
+            return self._ranked(keys, [int(v) for v in counts], column.values, limit)
+        if known is not None:
+            counts = np.bincount(codes, weights=known, minlength=size)[keys]
+        values = [None if not c else float(s) / c if average else int(s) for s, c in zip(sums, counts)]
+        return self._ranked(keys, values, column.values, limit)
+
+    # --- analyses ---
+
+    def _providers_and_receivers_by_city(self, p):
+        providers = self.provider_city.codes[self._match(self.provider_type, p['provider_type'])]
+        receivers = self.receiver_city.codes[self._match(self.receiver_type, p['receiver_type'])]
+        size = len(self.provider_city.values)
+        n_providers = np.bincount(providers, minlength=size)
+        n_receivers = np.bincount(receivers, minlength=size)
+        keep = n_providers > 0
+        if p['receiver_type'] is not None:
+            keep &= n_receivers > 0
+        rows = [(self.provider_city.values[i], int(n_providers[i]), int(n_receivers[i])) for i in np.nonzero(keep)[0]]
+        return ['City', 'Number_of_Providers', 'Number_of_Receivers'], sorted(rows, key=lambda r: _label(r[0]))
+
+    def _providers_by_type(self, p):
+        codes = self.provider_type.codes[self._match(self.provider_type, p['provider_type'])]
+        return ['Type', 'Number_of_Providers'], self._top(self.provider_type, codes)
+
+    def _receivers_most_claims(self, p, completed=False):
+        if completed:
+            p = dict(p, status='Completed')
+        mask = self._claim_mask(p)
+        codes = self.receiver_name.codes[self.claim_receiver[mask]]
+        return ['Name', 'Number_of_Claims'], self._top(self.receiver_name, codes)
+
+    def _total_quantity(self, p):
+        mask = self._listing_mask(p, 'listing') & self.quantity_known
+        total = int(self.quantity[mask].sum()) if mask.any() else None
+        return ['Total_Quantity'], [(total,)]
+
+    def _listings_by(self, column, p, limit=None):
+        mask = self._listing_mask(p, 'listing')
+        label = {'location': 'Location', 'food_type': 'Food_type'}[column]
+        col = getattr(self, column)
+        return [label, 'Number_of_Listings'], self._top(col, col.codes[mask], limit)
+
+    def _cities_most_listings(self, p):
+        mask = self._listing_mask(p, 'provider')
+        codes = self.provider_city.codes[self.listing_provider[mask]]
+        return ['City', 'Number_of_Listings'], self._top(self.provider_city, codes, 20)
+
+    def _claims_per_food_item(self, p):
+        mask = self._claim_mask(p, receiver=False)
+        rows = self.claim_listing[mask]
+        counts = np.bincount(rows, minlength=len(self.food_id))
+        present = np.nonzero(counts)[0]
+        order = sorted(present, key=lambda i: (-counts[i], self.food_id[i]))
+        result = [(int(self.food_id[i]), self.food_name.values[self.food_name.codes[i]], int(counts[i]))
+                  for i in order]
+        return ['Food_ID', 'Food_Name', 'Number_of_Claims'], result
+
+    def _providers_most_successful(self, p):
+        mask = self._claim_mask(dict(p, status='Completed'), receiver=False, provider_type=True)
+        listings = self.claim_listing[mask]
+        codes = self.provider_name.codes[self.listing_provider[listings]]
+        return ['Name', 'Number_of_Claims'], self._top(self.provider_name, codes, 20)
+
+    def _claim_shares(self, name, p):
+        """
+        Claims per value of one claim filter with their percentage of the
+        claims passing the other filters, like foodwaste_cube.claim_shares.
+        """
+        column = getattr(self, name)
+        rows = self._claim_mask(dict(p, **{name: None}))
+        if name == 'receiver_type':
+            rows = self.claim_receiver[rows]
+        elif name != 'status':
+            rows = self.claim_listing[rows]
+        ranked = self._top(column, column.codes[rows])
+        total = sum(count for _, count in ranked)
+        return [(label, count, count * 100.0 / total) for label, count in ranked
+                if p[name] is None or label == p[name]]
+
+    def _claims_by_status(self, p):
+        rows = sorted(self._claim_shares('status', p))
+        return ['Status', 'Number_of_Claims', 'Percentage'], rows
+
+    def _claimed_by_receiver(self, p, average=False, limit=None):
+        mask = self._claim_mask(p)
+        codes = self.receiver_name.codes[self.claim_receiver[mask]]
+        listings = self.claim_listing[mask]
+        label = 'Average_Quantity' if average else 'Total_Quantity'
+        return ['Receiver_Name', label], self._top(self.receiver_name, codes, limit, self.quantity[listings],
+                                                   self.quantity_known[listings], average)
+
+    def _claims_by_meal_type(self, p):
+        return ['Meal_Type', 'Number_of_Claims', 'Percentage'], self._claim_shares('meal_type', p)
+
+    def _quantity_by_provider(self, p, limit=None):
+        mask = self._listing_mask(p, 'provider')
+        codes = self.provider_name.codes[self.listing_provider[mask]]
+        return ['Name', 'Total_Quantity'], self._top(self.provider_name, codes, limit, self.quantity[mask],
+                                                     self.quantity_known[mask])
+
+    ANALYSES = {
+        'Number of Food Providers and Receivers in Each City': _providers_and_receivers_by_city,
+        'Percentage of Food Providers by Type': _providers_by_type,
+        'Receivers with the Most Claims': _receivers_most_claims,
+        'Receivers with the Most Completed Claims': lambda self, p: self._receivers_most_claims(p, completed=True),
+        'Total Quantity of Food Available from All Providers': _total_quantity,
+        'Location with the Highest Number of Food Listings': lambda self, p: self._listings_by('location', p, 1),
+        'Cities with the Highest Number of Food Listings (Top 20)': _cities_most_listings,
+        'Most Commonly Available Food Types': lambda self, p: self._listings_by('food_type', p),
+        'Number of Food Claims for Each Food Item': _claims_per_food_item,
+        'Providers with the Highest Number of Successful Food Claims (Top 20)': _providers_most_successful,
+        'Percentage of Food Claims by Status': _claims_by_status,
+        'Average Quantity of Food Claimed per Receiver': lambda self, p: self._claimed_by_receiver(p, average=True),
+        'Percentage of Food Claims by Meal Type': _claims_by_meal_type,
+        'Total Quantity of Food Donated by Each Provider': _quantity_by_provider,
+        'Total Quantity Donated by Provider (Top 20)': lambda self, p: self._quantity_by_provider(p, 20),
+        'Total Quantity Claimed by Receiver (Top 20)': lambda self, p: self._claimed_by_receiver(p, limit=20),
+    }
+
+    def supports(self, analysis):
+        return analysis in self.ANALYSES
+
+    def run(self, analysis, params):
+        """Run one analysis with foodwaste_queries.filter_params(); returns (columns, rows) like fq.fetch."""
+        with self._lock:
+            self._refresh()
+            return self.ANALYSES[analysis](self, params)
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,175 @@
+"""
+Available food ordered by expiry, per Location.
+
+expiry_queue holds one row per listing that has an Expiry_Date and no
+Completed claim, keyed (Location, Expiry_Epoch, Food_ID). "What expires next
+in this city" is then a range scan of the primary key that stops after N rows,
+and "what expires next anywhere" the same scan of idx_expiry_queue_epoch,
+instead of an anti-join and sort over every listing.
+
+Triggers on food_listings_data and claims_data re-evaluate a listing whenever
+its Location, Expiry_Date or claims change, so a claim completed through
+foodwaste_claims drops its listing from the queue in the same transaction,
+and cancelling it puts the listing back. Bulk imports skip them and
+re-evaluate the imported rows' listings with one statement instead.
+"""
+
+import datetime
+
+import foodwaste_queries as fq
+
+# Claim statuses that take a listing out of the queue
+CLAIMED = ('Completed',)
+
+LIMIT = 10
+
+_CLAIMED = ', '.join(repr(s) for s in CLAIMED)
+
+
+def _refresh(food_id):
+    """Statements that drop a listing's queue row and re-add it if it is still available."""
+    return f"""
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = {food_id});
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = {food_id}
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ({_CLAIMED}));"""
+
+
+_FORGET = """
+        DELETE FROM expiry_queue
+        WHERE Location = IFNULL(OLD.Location, '') AND Expiry_Epoch = OLD.Expiry_Epoch AND Food_ID = OLD.Food_ID;"""
+
+
+def _when(when, condition):
+    """A WHEN clause for condition, AND-ed with the optional WHEN clause of triggers()."""
+    return f"{when} AND ({condition})" if when else f"\n    WHEN {condition}"
+
+
+def triggers(when=''):
+    """CREATE TRIGGER statements keeping expiry_queue current, each with an optional WHEN clause."""
+    update = _when(when, f"OLD.Status IN ({_CLAIMED}) OR NEW.Status IN ({_CLAIMED})")
+    return f"""
+    CREATE TRIGGER trg_expiry_listings_insert AFTER INSERT ON food_listings_data{when}
+    BEGIN{_refresh('NEW.Food_ID')}
+    END;
+    CREATE TRIGGER trg_expiry_listings_delete AFTER DELETE ON food_listings_data{when}
+    BEGIN{_FORGET}
+    END;
+    CREATE TRIGGER trg_expiry_listings_update AFTER UPDATE OF Food_ID, Location, Expiry_Date ON food_listings_data{when}
+    BEGIN{_FORGET}{_refresh('NEW.Food_ID')}
+    END;
+    CREATE TRIGGER trg_expiry_claims_insert AFTER INSERT ON claims_data{_when(when, f"NEW.Status IN ({_CLAIMED})")}
+    BEGIN{_refresh('NEW.Food_ID')}
+    END;
+    CREATE TRIGGER trg_expiry_claims_delete AFTER DELETE ON claims_data{_when(when, f"OLD.Status IN ({_CLAIMED})")}
+    BEGIN{_refresh('OLD.Food_ID')}
+    END;
+    CREATE TRIGGER trg_expiry_claims_update AFTER UPDATE OF Food_ID, Status ON claims_data{update}
+    BEGIN{_refresh('OLD.Food_ID')}{_refresh('NEW.Food_ID')}
+    END;
+"""
+
+
+def apply_delta(table, rows):
+    """
+    Statement for rows newly inserted into table: new listings join the queue
+    unless already claimed, listings with a new Completed claim leave it.
+    """
+    if table == 'claims_data':
+        return f"""
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data
+            WHERE Food_ID IN (SELECT Food_ID FROM {rows} WHERE Status IN ({_CLAIMED})));"""
+    return f"""
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID IN (SELECT Food_ID FROM {rows})
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ({_CLAIMED}));"""
+
+
+SCHEMA = f"""
+    CREATE TABLE expiry_queue (
+        Location TEXT NOT NULL,
+        Expiry_Epoch INTEGER NOT NULL,
+        Food_ID INTEGER NOT NULL,
+        PRIMARY KEY (Location, Expiry_Epoch, Food_ID)
+    ) WITHOUT ROWID;
+    CREATE INDEX idx_expiry_queue_epoch ON expiry_queue (Expiry_Epoch, Food_ID);
+
+    INSERT INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+    SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+    FROM food_listings_data AS l
+    WHERE l.Expiry_Epoch IS NOT NULL
+      AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ({_CLAIMED}));
+""" + triggers()
+
+_SELECT = """
+    SELECT
+        q.Food_ID,
+        l.Food_Name,
+        l.Quantity,
+        l.Expiry_Date,
+        l.Location,
+        l.Food_type,
+        l.Meal_Type,
+        l.Provider_ID
+    FROM expiry_queue AS q
+    JOIN food_listings_data AS l ON l.Food_ID = q.Food_ID"""
+
+# One statement per access path, so the planner never has to choose at run time
+NEXT_EXPIRING = {
+    'location': _SELECT + """
+    WHERE q.Location = :location AND q.Expiry_Epoch >= :after
+    ORDER BY q.Expiry_Epoch, q.Food_ID
+    LIMIT :limit;
+    """,
+    'all': _SELECT + """
+    WHERE q.Expiry_Epoch >= :after
+    ORDER BY q.Expiry_Epoch, q.Food_ID
+    LIMIT :limit;
+    """,
+}
+
+
+def epoch(value):
+    """Seconds since 1970-01-01 of a date, datetime or ISO string, matching the *_Epoch columns."""
+    if isinstance(value, datetime.datetime):
+        moment = value
+    elif isinstance(value, datetime.date):
+        moment = datetime.datetime.combine(value, datetime.time())
+    else:
+        moment = datetime.datetime.fromisoformat(str(value))
+    return int((moment.replace(tzinfo=None) - datetime.datetime(1970, 1, 1)).total_seconds())
+
+
+def expiry_params(location=None, limit=LIMIT, after=None):
+    """
+    Bound parameters for NEXT_EXPIRING. location 'All' or None means every
+    Location; after is a date, datetime or ISO string, None for now, so food
+    that has already expired is left out.
+    """
+    return {'location': None if location == 'All' else location, 'limit': limit,
+            'after': epoch(datetime.datetime.now() if after is None else after)}
+
+
+def expiry_statement(params):
+    """The NEXT_EXPIRING statement for a set of expiry_params()."""
+    return NEXT_EXPIRING['all' if params['location'] is None else 'location']
+
+
+def next_expiring(conn, location=None, limit=LIMIT, after=None):
+    """
+    The next `limit` available listings to expire at or after `after` (by
+    default now), soonest first, in one Location or everywhere. Returns
+    (columns, rows).
+    """
+    params = expiry_params(location, limit, after)
+    return fq.fetch(conn, expiry_statement(params), params)
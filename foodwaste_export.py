@@ -0,0 +1,178 @@
+"""
+Streaming export of analysis results and filtered fact rows.
+
+Rows are read from the cursor BATCH_SIZE at a time, turned into an Arrow
+record batch and written straight to a Parquet file (one row group per batch)
+or a CSV file, so memory stays at about one batch however many rows the query
+returns. No pandas DataFrame is built.
+
+Besides the analyses in foodwaste_queries.ANALYSES, two fact exports give the
+raw rows behind them with the sidebar filters applied:
+
+    claims     one row per claim, with its listing and receiver
+    listings   one row per listing, with its provider
+
+    python foodwaste_export.py claims claims.parquet [database.db] [--status Completed] [--location ...]
+    python foodwaste_export.py "Percentage of Food Claims by Status" out.csv
+    python foodwaste_export.py "Provider Contact Information" contacts.csv --city Chennai
+"""
+
+import os
+import sys
+from collections import namedtuple
+
+import pyarrow as pa
+import pyarrow.csv
+import pyarrow.parquet
+
+import foodwaste_queries as fq
+import foodwaste_rollups
+
+BATCH_SIZE = 65_536
+FORMATS = ('parquet', 'csv')
+
+FACTS = {
+    'claims': """
+    SELECT
+        c.Claim_ID, c.Food_ID, c.Receiver_ID, c.Status, c.Timestamp,
+        l.Food_Name, l.Quantity, l.Expiry_Date, l.Provider_ID, l.Provider_Type, l.Location, l.Meal_Type, l.Food_type,
+        r.Name AS Receiver_Name, r.Type AS Receiver_Type, r.City AS Receiver_City
+    FROM claims_data AS c
+    JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+    JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID
+    WHERE 1=1""" + fq.where(status='c.Status_ID', provider_type='l.Provider_Type_ID', receiver_type='r.Type_ID',
+                            food_type='l.Food_type_ID', meal_type='l.Meal_Type_ID', location='l.Location_ID') + """
+    ORDER BY c.Claim_ID;
+    """,
+    'listings': """
+    SELECT
+        l.Food_ID, l.Food_Name, l.Quantity, l.Expiry_Date, l.Provider_ID, l.Provider_Type, l.Location,
+        l.Meal_Type, l.Food_type, p.Name AS Provider_Name, p.Type AS Provider_Kind, p.City AS Provider_City
+    FROM food_listings_data AS l
+    LEFT JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID
+    WHERE 1=1""" + fq.where(provider_type='l.Provider_Type_ID', food_type='l.Food_type_ID',
+                            meal_type='l.Meal_Type_ID', location='l.Location_ID') + """
+    ORDER BY l.Food_ID;
+    """,
+}
+
+ExportResult = namedtuple('ExportResult', 'path rows batches bytes')
+
+
+class ExportTooLarge(Exception):
+    """The file passed the export's byte limit, so the export was abandoned."""
+
+
+def statement(name, params):
+    """SQL of a fact export or an analysis, taking the rollup version when params carry a grain."""
+    if name in FACTS:
+        return FACTS[name]
+    if name in foodwaste_rollups.ANALYSES and 'grain' in params:
+        return foodwaste_rollups.ANALYSES[name]
+    return fq.ANALYSES[name]
+
+
+def _text(column):
+    return pa.array([None if v is None else str(v) for v in column], type=pa.string())
+
+
+def _infer(column):
+    """Arrow array of a first-batch column. All-NULL and mixed-type columns are typed as text."""
+    try:
+        array = pa.array(column)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return _text(column)
+    return _text(column) if pa.types.is_null(array.type) else array
+
+
+def _convert(column, field):
+    try:
+        return pa.array(column, type=field.type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        if field.type != pa.string():
+            raise
+        return _text(column)
+
+
+def _arrays(rows, width, schema):
+    columns = list(zip(*rows)) if rows else [()] * width
+    if schema is None:
+        return [_infer(column) for column in columns]
+    return [_convert(column, field) for column, field in zip(columns, schema)]
+
+
+def record_batches(cursor, batch_size=BATCH_SIZE):
+    """
+    Yield the cursor's remaining rows as Arrow record batches with one schema,
+    taken from the first batch. A later value that does not fit its column's
+    type raises pyarrow.ArrowInvalid, except in text columns.
+    """
+    names = [d[0] for d in cursor.description]
+    schema = None
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows and schema is not None:
+            return
+        arrays = _arrays(rows, len(names), schema)
+        if schema is None:
+            schema = pa.schema([pa.field(name, array.type) for name, array in zip(names, arrays)])
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+        if len(rows) < batch_size:
+            return
+
+
+def write(batches, path, fmt, max_bytes=None):
+    """
+    Write record batches to path as Parquet or CSV; returns (rows, batches).
+    Raises ExportTooLarge once the file passes max_bytes.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of {FORMATS}, not {fmt!r}")
+    writer = None
+    rows = count = 0
+    try:
+        for batch in batches:
+            if writer is None:
+                writer = (pa.parquet.ParquetWriter(path, batch.schema) if fmt == 'parquet'
+                          else pa.csv.CSVWriter(path, batch.schema))
+            writer.write_batch(batch)
+            rows += batch.num_rows
+            count += 1
+            if max_bytes is not None and os.path.getsize(path) > max_bytes:
+                raise ExportTooLarge(f"{path} passed {max_bytes:,} bytes after {rows:,} rows")
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows, count
+
+
+def export(conn, sql, params, path, fmt=None, batch_size=BATCH_SIZE, max_bytes=None):
+    """
+    Stream the rows of sql, bound to params (see foodwaste_queries.filter_params),
+    into path. fmt defaults to the file's extension. Raises ExportTooLarge,
+    leaving a partial file, once path passes max_bytes.
+    """
+    fmt = fmt or os.path.splitext(path)[1].lstrip('.').lower()
+    cursor = conn.execute(sql, fq.bind_ids(conn, params))
+    try:
+        rows, batches = write(record_batches(cursor, batch_size), path, fmt, max_bytes)
+    finally:
+        cursor.close()
+    return ExportResult(path, rows, batches, os.path.getsize(path))
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    filters = {}
+    for name in fq.FILTERS + ('city',):
+        flag = '--' + name.replace('_', '-')
+        if flag in args:
+            i = args.index(flag)
+            filters[name] = args[i + 1]
+            del args[i:i + 2]
+    if len(args) < 2:
+        sys.exit(__doc__)
+    conn = fq.connect(args[2] if len(args) > 2 else fq.DATABASE)
+    params = fq.filter_params(**filters)
+    result = export(conn, statement(args[0], params), params, args[1])
+    print(f"{result.rows:,} rows in {result.batches} batch(es) -> {result.path} ({result.bytes:,} bytes)")
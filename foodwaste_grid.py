@@ -0,0 +1,236 @@
+"""
+Keyset-paginated result grids for the analyses with long outputs.
+
+A grid fetches one page of an analysis at a time. Each page starts from the
+sort value and key of the previous page's last row, a seek on an index,
+instead of an OFFSET that would read and throw away every earlier row. Only
+that page is fetched and sent to the browser, so the cost of a page does not
+depend on how many pages come before it or how many rows the analysis has.
+
+    Number of Food Claims for Each Food Item
+        item_claims, one row per (Status, Food_ID) plus an 'All' row per
+        Food_ID, kept current by triggers on claims_data (and by one
+        statement per bulk import, which skips them). Sorted by count on
+        idx_item_claims_rank, by Food_ID on its primary key.
+    Provider / Receiver Contact Information
+        idx_provider_city_name / idx_receivers_city_name on City and Name,
+        with NULL names indexed as LOWEST.
+    Total Quantity of Food Donated by Each Provider
+        Grouped per page: the seek only trims the sort and the rows sent,
+        since the per-provider totals depend on every listing filter.
+
+Sort values and keys that may be NULL are compared as LOWEST, which sorts
+where SQLite puts NULL, so a page that ends on a NULL still has a next page.
+
+Each grid also has a row-count statement. It reads the grid's index alone
+when no listing filter is set.
+"""
+
+from collections import namedtuple
+
+import foodwaste_queries as fq
+
+PAGE_SIZE = 50
+PAGE_SIZES = (25, 50, 100, 250)
+
+# source: SELECT of the grid's rows under the sidebar filters, without ORDER BY
+# count:  statement counting those rows
+# key:    unique output column that breaks ties in every sort
+# sorts:  label -> (output column, descending), the first being the default
+# hidden: output columns that are only there for paging
+# nullable: sort and key columns that may be NULL
+Grid = namedtuple('Grid', 'source count key sorts hidden nullable')
+
+Page = namedtuple('Page', 'columns rows after')
+
+# Stands in for NULL in sorts and seeks: -Infinity, below every number and text value
+LOWEST = '-9e999'
+
+INDEXES = f"""
+    CREATE INDEX idx_provider_city_name ON provider_data (City, IFNULL(Name, {LOWEST}));
+    CREATE INDEX idx_receivers_city_name ON receivers_data (City, IFNULL(Name, {LOWEST}));
+"""
+
+SCHEMA = """
+    CREATE TABLE item_claims (
+        Status TEXT NOT NULL,
+        Food_ID INTEGER NOT NULL,
+        Claims INTEGER NOT NULL,
+        PRIMARY KEY (Status, Food_ID)
+    ) WITHOUT ROWID;
+    CREATE INDEX idx_item_claims_rank ON item_claims (Status, Claims, Food_ID);
+
+    INSERT INTO item_claims (Status, Food_ID, Claims)
+    SELECT IFNULL(Status, ''), Food_ID, COUNT(*) FROM claims_data WHERE Food_ID IS NOT NULL GROUP BY 1, 2
+    UNION ALL
+    SELECT 'All', Food_ID, COUNT(*) FROM claims_data WHERE Food_ID IS NOT NULL GROUP BY 2;
+""" + INDEXES
+
+
+def _count(ref, sign):
+    """Statements adding sign (+1 or -1) to the claim's Status and 'All' rows; empty rows are dropped."""
+    return f"""
+        INSERT INTO item_claims (Status, Food_ID, Claims)
+        SELECT s.Status, {ref}.Food_ID, {sign}1
+        FROM (SELECT IFNULL({ref}.Status, '') AS Status UNION ALL SELECT 'All') AS s
+        WHERE {ref}.Food_ID IS NOT NULL
+        ON CONFLICT (Status, Food_ID) DO UPDATE SET Claims = Claims + excluded.Claims;
+        DELETE FROM item_claims
+        WHERE Status IN (IFNULL({ref}.Status, ''), 'All') AND Food_ID = {ref}.Food_ID AND Claims = 0;"""
+
+
+def triggers(when=''):
+    """CREATE TRIGGER statements keeping item_claims current, each with an optional WHEN clause."""
+    return f"""
+    CREATE TRIGGER trg_item_claims_insert AFTER INSERT ON claims_data{when}
+    BEGIN{_count('NEW', '+')}
+    END;
+    CREATE TRIGGER trg_item_claims_delete AFTER DELETE ON claims_data{when}
+    BEGIN{_count('OLD', '-')}
+    END;
+    CREATE TRIGGER trg_item_claims_update AFTER UPDATE OF Food_ID, Status ON claims_data{when}
+    BEGIN{_count('OLD', '-')}{_count('NEW', '+')}
+    END;
+"""
+
+
+SCHEMA += triggers()
+
+
+def apply_delta(rows):
+    """Add rows newly inserted into claims_data to their Status and 'All' rows of item_claims."""
+    return f"""
+    INSERT INTO item_claims (Status, Food_ID, Claims)
+    SELECT IFNULL(Status, ''), Food_ID, COUNT(*) FROM {rows} WHERE Food_ID IS NOT NULL GROUP BY 1, 2
+    UNION ALL
+    SELECT 'All', Food_ID, COUNT(*) FROM {rows} WHERE Food_ID IS NOT NULL GROUP BY 2
+    ON CONFLICT (Status, Food_ID) DO UPDATE SET Claims = Claims + excluded.Claims;
+    """
+
+
+_PROVIDER_TOTALS = """
+    SELECT T1.Name, SUM(T2.Quantity) AS Total_Quantity
+    FROM provider_data AS T1
+    JOIN food_listings_data AS T2 ON T1.Provider_ID = T2.Provider_ID
+    WHERE 1=1""" + fq.where(provider_type='T1.Type_ID', food_type='T2.Food_type_ID',
+                            meal_type='T2.Meal_Type_ID', location='T2.Location_ID') + """
+    GROUP BY T1.Name"""
+
+_LISTING_FILTERS = fq.where(food_type='l.Food_type_ID', meal_type='l.Meal_Type_ID', location='l.Location_ID')
+
+GRIDS = {
+    'Number of Food Claims for Each Food Item': Grid(
+        source="""
+    SELECT i.Food_ID, l.Food_Name, i.Claims AS Number_of_Claims
+    FROM item_claims AS i
+    JOIN food_listings_data AS l ON l.Food_ID = i.Food_ID
+    WHERE i.Status = IFNULL(:status, 'All')""" + _LISTING_FILTERS,
+        count="""
+    SELECT COUNT(*)
+    FROM item_claims AS i
+    WHERE i.Status = IFNULL(:status, 'All')
+      AND (:food_type IS NULL AND :meal_type IS NULL AND :location IS NULL
+           OR EXISTS (SELECT 1 FROM food_listings_data AS l WHERE l.Food_ID = i.Food_ID""" + _LISTING_FILTERS + "));",
+        key='Food_ID',
+        sorts={'Most claims': ('Number_of_Claims', True), 'Food_ID': ('Food_ID', False)},
+        hidden=(),
+        nullable=(),
+    ),
+    'Provider Contact Information': Grid(
+        source="""
+    SELECT Provider_ID, Name, Contact, Type
+    FROM provider_data
+    WHERE City_ID = """ + fq.id_of('city') + fq.where(provider_type='Type_ID'),
+        count="""
+    SELECT COUNT(*) FROM provider_data
+    WHERE City_ID = """ + fq.id_of('city') + fq.where(provider_type='Type_ID') + ";",
+        key='Provider_ID',
+        sorts={'Name': ('Name', False)},
+        hidden=('Provider_ID',),
+        nullable=('Name',),
+    ),
+    'Receiver Contact Information': Grid(
+        source="""
+    SELECT Receiver_ID, Name, Contact, Type
+    FROM receivers_data
+    WHERE City_ID = """ + fq.id_of('city') + fq.where(receiver_type='Type_ID'),
+        count="""
+    SELECT COUNT(*) FROM receivers_data
+    WHERE City_ID = """ + fq.id_of('city') + fq.where(receiver_type='Type_ID') + ";",
+        key='Receiver_ID',
+        sorts={'Name': ('Name', False)},
+        hidden=('Receiver_ID',),
+        nullable=('Name',),
+    ),
+    'Total Quantity of Food Donated by Each Provider': Grid(
+        source=_PROVIDER_TOTALS,
+        count=f"SELECT COUNT(*) FROM ({_PROVIDER_TOTALS});",
+        key='Name',
+        sorts={'Most quantity': ('Total_Quantity', True), 'Name': ('Name', False)},
+        hidden=(),
+        nullable=('Total_Quantity', 'Name'),
+    ),
+}
+
+
+def _sortable(grid, column, expression=None):
+    """expression (by default column itself) with NULL read as LOWEST when column is in grid.nullable."""
+    expression = expression or column
+    return f"IFNULL({expression}, {LOWEST})" if column in grid.nullable else expression
+
+
+def page_statement(grid, sort, first):
+    """
+    SQL of the first page, or of a later one starting after the bound
+    :after_value / :after_key, in one of grid.sorts. The page size is :limit.
+    """
+    column, descending = grid.sorts[sort]
+    direction = 'DESC' if descending else 'ASC'
+    value, key = _sortable(grid, column), _sortable(grid, grid.key)
+    order = f"{value} {direction}" if column == grid.key else f"{value} {direction}, {key} {direction}"
+    seek = ''
+    if not first:
+        operator = '<' if descending else '>'
+        after_value = _sortable(grid, column, ':after_value')
+        if column == grid.key:
+            seek = f"\n    WHERE {value} {operator} {after_value}"
+        else:
+            seek = f"\n    WHERE ({value}, {key}) {operator} ({after_value}, {_sortable(grid, grid.key, ':after_key')})"
+            # SQLite seeks an expression index for a plain comparison, not for a row value
+            if column in grid.nullable:
+                seek += f"\n      AND {value} {operator}= {after_value}"
+    return f"""
+    SELECT * FROM ({grid.source}
+    ){seek}
+    ORDER BY {order}
+    LIMIT :limit;
+    """
+
+
+def page_params(params, after=None, limit=PAGE_SIZE):
+    """Bound parameters of page_statement(): the filters, the seek position and one row more than a page."""
+    bound = dict(params, limit=limit + 1)
+    if after is not None:
+        bound['after_value'], bound['after_key'] = after
+    return bound
+
+
+def fetch_page(conn, grid, params, sort, after=None, limit=PAGE_SIZE):
+    """
+    One page of grid, bound to params (see foodwaste_queries.filter_params).
+    after is the previous page's Page.after, None for the first page; the
+    returned Page.after is None on the last page.
+    """
+    bound = page_params(fq.bind_ids(conn, params), after, limit)
+    columns, rows = fq.fetch(conn, page_statement(grid, sort, after is None), bound)
+    more = len(rows) > limit
+    rows = rows[:limit]
+    if not more:
+        return Page(columns, rows, None)
+    last = rows[-1]
+    column = grid.sorts[sort][0]
+    return Page(columns, rows, (last[columns.index(column)], last[columns.index(grid.key)]))
+
+
+def row_count(conn, grid, params):
+    return conn.execute(grid.count, fq.bind_ids(conn, params)).fetchone()[0]
@@ -0,0 +1,222 @@
+"""
+Bulk import of new food listings and claims.
+
+Rows are streamed from CSV, JSON Lines or a JSON array and written in large
+batches, one transaction each:
+
+    1. executemany() of the batch into a TEMP staging table (no indexes,
+       no triggers)
+    2. every foreign key of the batch checked with one anti-join per key
+    3. INSERT ... SELECT of the batch from staging into the real table
+    4. metrics_cube, the rollups, city_stats, expiry_queue, item_claims,
+       table_versions and changelog updated set-based from the staged rows
+
+The per-row triggers that maintain the derived tables are skipped while a
+batch loads (they are guarded by the bulk_load table, which marks the derived
+tables out of date until step 4), because step 4 applies the same deltas for
+the whole batch at once.
+
+The database is switched to WAL, so the dashboards keep reading the last
+committed state during an import. The write lock is only held while a batch
+loads and is released at each commit, so other writers get in between batches
+and the WAL can be checkpointed; a writer here that finds the file locked
+waits up to BUSY_TIMEOUT seconds instead of failing.
+
+    python foodwaste_import.py listings new_listings.csv [database.db] [--batch-size N]
+    python foodwaste_import.py claims new_claims.jsonl [database.db]
+"""
+
+import csv
+import json
+import re
+import sqlite3 as sql
+import sys
+import time
+from collections import namedtuple
+from itertools import islice
+
+import foodwaste_cache
+import foodwaste_changes
+import foodwaste_cities
+import foodwaste_cube
+import foodwaste_dimensions
+import foodwaste_expiry
+import foodwaste_grid
+import foodwaste_queries as fq
+import foodwaste_rollups
+
+# Rows per transaction; a batch of claims holds the write lock for about five seconds
+BATCH_SIZE = 50_000
+BUSY_TIMEOUT = 30
+# Page cache of the write connection, in KiB, so index maintenance stays in memory
+CACHE_SIZE_KIB = 131_072
+
+# Import kind -> (table, columns read from the input), the primary key first.
+# A missing or empty key is assigned after the largest one in use.
+TARGETS = {
+    'listings': ('food_listings_data', ('Food_ID', 'Food_Name', 'Quantity', 'Expiry_Date', 'Provider_ID',
+                                        'Provider_Type', 'Location', 'Meal_Type', 'Food_type')),
+    'claims': ('claims_data', ('Claim_ID', 'Food_ID', 'Receiver_ID', 'Status', 'Timestamp')),
+}
+
+# Table -> (column, referenced table, referenced key)
+FOREIGN_KEYS = {
+    'food_listings_data': (('Provider_ID', 'provider_data', 'Provider_ID'),),
+    'claims_data': (('Food_ID', 'food_listings_data', 'Food_ID'), ('Receiver_ID', 'receivers_data', 'Receiver_ID')),
+}
+
+# Trigger guard: a row in bulk_load means an import is loading and applies its deltas in bulk
+BULK_LOAD_GUARD = "\n    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)"
+
+
+def _reinstall(script):
+    """Drop the triggers that script creates, then create them again."""
+    return ''.join(f"\n    DROP TRIGGER {name};" for name in re.findall(r'CREATE TRIGGER (\w+)', script)) + script
+
+
+SCHEMA = """
+    CREATE TABLE bulk_load (name TEXT PRIMARY KEY);
+""" + _reinstall(foodwaste_cube.triggers(BULK_LOAD_GUARD) + foodwaste_cache.version_triggers(BULK_LOAD_GUARD) +
+                 foodwaste_rollups.triggers(BULK_LOAD_GUARD) + foodwaste_cities.triggers(BULK_LOAD_GUARD))
+
+# seconds: the whole import; refresh: the part of it spent bringing the derived tables up to date
+ImportResult = namedtuple('ImportResult', 'table rows batches seconds refresh')
+
+
+def connect_writer(path=fq.DATABASE):
+    """Open a write connection in WAL mode, with explicit transactions, a busy timeout and a large cache."""
+    conn = sql.connect(path, timeout=BUSY_TIMEOUT, isolation_level=None)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    return conn
+
+
+def read_rows(path):
+    """Yield one dict per input row; empty CSV fields become None."""
+    if path.endswith('.csv'):
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                yield {k: (v if v != '' else None) for k, v in row.items()}
+    elif path.endswith(('.jsonl', '.ndjson')):
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif path.endswith('.json'):
+        with open(path, encoding='utf-8') as f:
+            yield from json.load(f)
+    else:
+        raise ValueError(f"unsupported input format: {path} (expected .csv, .jsonl, .ndjson or .json)")
+
+
+def _check_foreign_keys(conn, table, staged):
+    for column, parent, key in FOREIGN_KEYS[table]:
+        missing = [row[0] for row in conn.execute(f"""
+            SELECT DISTINCT s.{column} FROM {staged} AS s
+            WHERE s.{column} IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM {parent} AS p WHERE p.{key} = s.{column})
+            LIMIT 5""")]
+        if missing:
+            raise sql.IntegrityError(f"{table}.{column} references rows missing from {parent}: {missing}")
+
+
+def _apply_deltas(conn, table, staged, count):
+    """What the per-row triggers would have done for the staged rows, as one statement per derived table."""
+    placeholder, _, sources = foodwaste_cube.TABLES[table]
+    tables = dict(foodwaste_cube.TABLE_NAMES, **{placeholder: staged})
+    for source in sources:
+        conn.execute(foodwaste_cube.apply_delta(foodwaste_cube.SOURCES[source].format(**tables)))
+    placeholder, _, rollups = foodwaste_rollups.TABLES[table]
+    tables = {p: t for t, (p, _, _) in foodwaste_rollups.TABLES.items()}
+    tables[placeholder] = staged
+    for rollup in rollups:
+        source = foodwaste_rollups.ROLLUPS[rollup]['source'].format(**tables)
+        conn.execute(foodwaste_rollups.apply_delta(rollup, source))
+    if table in foodwaste_cities.SIDES:
+        conn.execute(foodwaste_cities.apply_delta(table, staged))
+    conn.execute(foodwaste_expiry.apply_delta(table, staged))
+    if table == 'claims_data':
+        conn.execute(foodwaste_grid.apply_delta(staged))
+    conn.execute(foodwaste_changes.record(table, staged, 'I', collapse=True))
+    conn.execute("UPDATE table_versions SET version = version + 1, row_count = row_count + ? WHERE name = ?",
+                 (count, table))
+
+
+def _load_batch(conn, table, columns, staged, batch):
+    """Stage one batch, check its foreign keys and insert it."""
+    conn.execute(f"DELETE FROM {staged}")
+    conn.executemany(f"INSERT INTO {staged} VALUES ({', '.join('?' * len(columns))})", batch)
+    # Keys are assigned here rather than by SQLite, so the deltas can find the rows' listings
+    key = columns[0]
+    top = conn.execute(f"SELECT MAX(IFNULL((SELECT MAX({key}) FROM {table}), 0), "
+                       f"IFNULL((SELECT MAX({key}) FROM {staged}), 0))").fetchone()[0]
+    # Staging restarts at rowid 1, and top + rowid is past every key, staged or stored
+    conn.execute(f"UPDATE {staged} SET {key} = ? + rowid WHERE {key} IS NULL", (top,))
+    _check_foreign_keys(conn, table, staged)
+    # Into the facts table, not row by row through the view's INSTEAD OF trigger
+    for statement in foodwaste_dimensions.insert(table, columns, staged):
+        conn.execute(statement)
+
+
+def import_rows(conn, kind, rows, batch_size=BATCH_SIZE):
+    """
+    Import an iterable of dicts as new rows of one kind ('listings' or
+    'claims'), batch_size rows per transaction. Each batch commits together
+    with its deltas to the derived tables. A batch with a dangling foreign key
+    or a duplicate primary key raises sqlite3.IntegrityError and is rolled
+    back; earlier batches stay committed.
+    """
+    table, columns = TARGETS[kind]
+    staged = f"temp.staged_{table}"
+    conn.execute(f"CREATE TEMP TABLE IF NOT EXISTS staged_{table} AS SELECT {', '.join(columns)} FROM {table} WHERE 0")
+    rows = iter(rows)
+    total = batches = 0
+    refresh = 0.0
+    start = time.perf_counter()
+    while True:
+        # Read outside the transaction, so the lock is only held while the batch loads
+        batch = [tuple(row.get(c) for c in columns) for row in islice(rows, batch_size)]
+        if not batch:
+            break
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Marks the derived tables out of date until the deltas below are applied
+            conn.execute("INSERT INTO bulk_load (name) VALUES (?)", (table,))
+            _load_batch(conn, table, columns, staged, batch)
+            applied = time.perf_counter()
+            _apply_deltas(conn, table, staged, len(batch))
+            refresh += time.perf_counter() - applied
+            conn.execute("DELETE FROM bulk_load")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        total += len(batch)
+        batches += 1
+    return ImportResult(table, total, batches, time.perf_counter() - start, refresh)
+
+
+def import_file(path, kind, database=fq.DATABASE, batch_size=BATCH_SIZE):
+    """Stream a CSV / JSON Lines / JSON file of listings or claims into database."""
+    conn = connect_writer(database)
+    try:
+        return import_rows(conn, kind, read_rows(path), batch_size)
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    batch_size = BATCH_SIZE
+    if '--batch-size' in args:
+        i = args.index('--batch-size')
+        batch_size = int(args[i + 1])
+        del args[i:i + 2]
+    if len(args) < 2 or args[0] not in TARGETS:
+        sys.exit(__doc__)
+    result = import_file(args[1], args[0], args[2] if len(args) > 2 else fq.DATABASE, batch_size)
+    print(f"{result.rows:,} rows into {result.table} in {result.batches} batch(es), {result.seconds:.2f}s "
+          f"({result.rows / max(result.seconds, 1e-9):,.0f} rows/sec), "
+          f"{result.refresh:.2f}s of it on the derived tables")
@@ -1,14 +1,48 @@
 
 import streamlit as st
 import pandas as pd
-import sqlite3 as sql
-import matplotlib.pyplot as plt
-import seaborn as sns
+import atexit
 import warnings
+import foodwaste_cache
+from foodwaste_charts import plt, sns
+import foodwaste_migrate
+import foodwaste_pool
 warnings.filterwarnings('ignore')
 
-# Connect to the database
-conn = sql.connect('database.db')
+
+# The dashboards only read database.db; `python foodwaste_migrate.py` brings its schema up to date
+def check_schema():
+    try:
+        foodwaste_migrate.require_current('database.db')
+    except foodwaste_migrate.OutdatedSchema as error:
+        st.error(str(error))
+        st.stop()
+
+
+# Read-only connections shared by every session; each script thread keeps one
+@st.cache_resource
+def get_pool():
+    pool = foodwaste_pool.ReadPool('database.db')
+    atexit.register(pool.close)
+    return pool
+
+
+# Row counts, schemas and sample rows, shared by every session until the data changes
+@st.cache_resource
+def get_catalog():
+    return foodwaste_cache.CatalogSnapshot('database.db')
+
+
+def sample_rows(table):
+    info = catalog.table(table)
+    return pd.DataFrame(info.sample, columns=info.columns)
+
+
+check_schema()
+catalog = get_catalog()
+
+# This thread's connection from the pool; it goes back to the pool when the rerun's thread ends
+conn = get_pool().connection()
 
 st.title('Food Waste Management Dashboard')
 
@@ -16,23 +50,23 @@ st.title('Food Waste Management Dashboard')
 st.header('Dataset Information')
 
 st.subheader('Provider Data')
-st.dataframe(pd.read_sql("SELECT * FROM provider_data LIMIT 5", conn))
-st.write(pd.read_sql("SELECT sql FROM sqlite_master WHERE name='provider_data'", conn).iloc[0, 0])
+st.dataframe(sample_rows('provider_data'))
+st.write(catalog.table('provider_data').schema)
 
 
 st.subheader('Receivers Data')
-st.dataframe(pd.read_sql("SELECT * FROM receivers_data LIMIT 5", conn))
-st.write(pd.read_sql("SELECT sql FROM sqlite_master WHERE name='receivers_data'", conn).iloc[0, 0])
+st.dataframe(sample_rows('receivers_data'))
+st.write(catalog.table('receivers_data').schema)
 
 
 st.subheader('Food Listings Data')
-st.dataframe(pd.read_sql("SELECT * FROM food_listings_data LIMIT 5", conn))
-st.write(pd.read_sql("SELECT sql FROM sqlite_master WHERE name='food_listings_data'", conn).iloc[0, 0])
+st.dataframe(sample_rows('food_listings_data'))
+st.write(catalog.table('food_listings_data').schema)
 
 
 st.subheader('Claims Data')
-st.dataframe(pd.read_sql("SELECT * FROM claims_data LIMIT 5", conn))
-st.write(pd.read_sql("SELECT sql FROM sqlite_master WHERE name='claims_data'", conn).iloc[0, 0])
+st.dataframe(sample_rows('claims_data'))
+st.write(catalog.table('claims_data').schema)
 
 
 # --- Analysis and Visualizations ---
@@ -70,12 +104,12 @@ if analysis_option == 'Number of Food Providers and Receivers in Each City':
     st.subheader('Q1: Number of Food Providers and Receivers in Each City')
     query_1 = """
     SELECT
-        T1.City,
-        COUNT(DISTINCT T1.Provider_ID) AS Number_of_Providers,
-        COUNT(DISTINCT T2.Receiver_ID) AS Number_of_Receivers
-    FROM provider_data AS T1
-    LEFT JOIN receivers_data AS T2 ON T1.City = T2.City
-    GROUP BY T1.City;
+        City,
+        Providers AS Number_of_Providers,
+        Receivers AS Number_of_Receivers
+    FROM city_stats
+    WHERE Provider_Type = 'All' AND Receiver_Type = 'All' AND Providers > 0
+    ORDER BY City;
     """
     result_1 = pd.read_sql(query_1, conn)
     st.dataframe(result_1)
@@ -276,7 +310,7 @@ elif analysis_option == 'Percentage of Food Claims by Status':
     SELECT
         Status,
         COUNT(*) AS Number_of_Claims,
-        (COUNT(*) * 100.0 / (SELECT COUNT(*) FROM claims_data)) AS Percentage
+        COUNT(*) * 100.0 / SUM(COUNT(*)) OVER () AS Percentage
     FROM claims_data
     GROUP BY Status;
     """
@@ -317,7 +351,10 @@ elif analysis_option == 'Average Quantity of Food Claimed per Receiver':
 elif analysis_option == 'Percentage of Food Claims by Meal Type':
     st.subheader('Q12: Percentage of Food Claims by Meal Type')
     query_12 = """
-    SELECT Meal_Type, COUNT(*) AS Number_of_Claims
+    SELECT
+        Meal_Type,
+        COUNT(*) AS Number_of_Claims,
+        COUNT(*) * 100.0 / SUM(COUNT(*)) OVER () AS Percentage
     FROM food_listings_data
     JOIN claims_data ON food_listings_data.Food_ID = claims_data.Food_ID
     GROUP BY Meal_Type
@@ -356,20 +393,20 @@ elif analysis_option == 'Number of Food Listings and Claims Over Time':
     st.subheader('Q15: Number of Food Listings and Claims Over Time')
     query_15 = """
     SELECT
-        strftime('%Y-%m-%d', Timestamp) AS Date,
+        date(Timestamp_Day * 86400, 'unixepoch') AS Date,
         COUNT(Claim_ID) AS Number_of_Claims,
         0 AS Number_of_Listings
     FROM claims_data
-    GROUP BY Date
+    GROUP BY Timestamp_Day
 
     UNION ALL
 
     SELECT
-        strftime('%Y-%m-%d', Expiry_Date) AS Date,
+        date(Expiry_Day * 86400, 'unixepoch') AS Date,
         0 AS Number_of_Claims,
         COUNT(Food_ID) AS Number_of_Listings
     FROM food_listings_data
-    GROUP BY Date
+    GROUP BY Expiry_Day
     ORDER BY Date;
     """
     result_15 = pd.read_sql(query_15, conn)
@@ -389,12 +426,12 @@ elif analysis_option == 'Number of Food Claims by Status Over Time':
     st.subheader('Number of Food Claims by Status Over Time')
     query_claims_status_time = """
     SELECT
-        strftime('%Y-%m-%d', Timestamp) AS Date,
+        date(Timestamp_Day * 86400, 'unixepoch') AS Date,
         Status,
         COUNT(Claim_ID) AS Number_of_Claims
     FROM claims_data
-    GROUP BY Date, Status
-    ORDER BY Date, Status;
+    GROUP BY Timestamp_Day, Status
+    ORDER BY Timestamp_Day, Status;
     """
     claims_status_time_result = pd.read_sql(query_claims_status_time, conn)
     st.dataframe(claims_status_time_result)
@@ -412,12 +449,12 @@ elif analysis_option == 'Number of Food Listings by Provider Type Over Time':
     st.subheader('Number of Food Listings by Provider Type Over Time')
     query_listings_provider_time = """
     SELECT
-        strftime('%Y-%m-%d', Expiry_Date) AS Date,
+        date(Expiry_Day * 86400, 'unixepoch') AS Date,
         Provider_Type,
         COUNT(Food_ID) AS Number_of_Listings
     FROM food_listings_data
-    GROUP BY Date, Provider_Type
-    ORDER BY Date, Provider_Type;
+    GROUP BY Expiry_Day, Provider_Type
+    ORDER BY Expiry_Day, Provider_Type;
     """
     listings_provider_time_result = pd.read_sql(query_listings_provider_time, conn)
     st.dataframe(listings_provider_time_result)
@@ -476,6 +513,3 @@ elif analysis_option == 'Total Quantity Claimed by Receiver (Top 20)':
     plt.tight_layout()
     st.pyplot(fig19)
 
-
-# Close the connection
-conn.close()
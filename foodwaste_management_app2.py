@@ -1,14 +1,249 @@
 
 import streamlit as st
 import pandas as pd
-import sqlite3 as sql
-import matplotlib.pyplot as plt
-import seaborn as sns
+import atexit
+import os
+import tempfile
 import warnings
+import foodwaste_cache
+import foodwaste_changes
+import foodwaste_charts
+import foodwaste_cube
+import foodwaste_engine
+import foodwaste_expiry
+import foodwaste_grid
+import foodwaste_migrate
+import foodwaste_monitor
+import foodwaste_pool
+import foodwaste_prefetch
+import foodwaste_queries as fq
+import foodwaste_rollups
+import foodwaste_search
+from foodwaste_charts import plt, sns
 warnings.filterwarnings('ignore')
 
-# Connect to the database
-conn = sql.connect('database.db')
+# Analyses in the order the selectbox lists them, which is also the order users step through them
+ANALYSIS_OPTIONS = (
+    'Number of Food Providers and Receivers in Each City',
+    'Percentage of Food Providers by Type',
+    'Contact Information by City',
+    'Receivers with the Most Claims',
+    'Receivers with the Most Completed Claims',
+    'Total Quantity of Food Available from All Providers',
+    'Location with the Highest Number of Food Listings',
+    'Cities with the Highest Number of Food Listings (Top 20)',
+    'Most Commonly Available Food Types',
+    'Number of Food Claims for Each Food Item',
+    'Providers with the Highest Number of Successful Food Claims (Top 20)',
+    'Percentage of Food Claims by Status',
+    'Average Quantity of Food Claimed per Receiver',
+    'Percentage of Food Claims by Meal Type',
+    'Total Quantity of Food Donated by Each Provider',
+    'Number of Food Listings and Claims Over Time',
+    'Number of Food Claims by Status Over Time',
+    'Number of Food Listings by Provider Type Over Time',
+    'Total Quantity Donated by Provider (Top 20)',
+    'Total Quantity Claimed by Receiver (Top 20)',
+    'Available Food Nearing Expiry'
+)
+
+
+# The dashboards only read database.db; `python foodwaste_migrate.py` brings its schema up to date
+def check_schema():
+    try:
+        foodwaste_migrate.require_current('database.db')
+    except foodwaste_migrate.OutdatedSchema as error:
+        st.error(str(error))
+        st.stop()
+
+
+# Read-only connections shared by every session; each script thread keeps one,
+# with its statement and page caches, and later reruns reuse it
+@st.cache_resource
+def get_pool():
+    pool = foodwaste_pool.ReadPool('database.db')
+    atexit.register(pool.close)
+    return pool
+
+
+# Filter option lists, shared by every session until the data changes
+@st.cache_resource
+def get_dimensions():
+    return foodwaste_cache.DimensionDictionary('database.db')
+
+
+# Row counts, schemas and sample rows, shared by every session until the data changes
+@st.cache_resource
+def get_catalog():
+    return foodwaste_cache.CatalogSnapshot('database.db')
+
+
+def sample_rows(table):
+    info = catalog.table(table)
+    return pd.DataFrame(info.sample, columns=info.columns)
+
+
+# In-memory columnar engine, only loaded when FOODWASTE_ENGINE=columnar
+@st.cache_resource
+def get_engine():
+    if foodwaste_engine.selected_engine() == 'columnar':
+        return foodwaste_engine.ColumnarEngine('database.db')
+    return None
+
+
+def analysis_statement(analysis, params):
+    if analysis in foodwaste_rollups.ANALYSES and 'grain' in params:
+        return foodwaste_rollups.ANALYSES[analysis]
+    return fq.ANALYSES[analysis]
+
+
+# Runs on the script thread or on a prefetch thread, with that thread's pooled
+# connection, and is timed by the query monitor on that connection. Results
+# served from the prefetch cache are not queries and are not timed.
+def compute_analysis(pool, engine, monitor, analysis, params):
+    conn = pool.connection()
+    if engine is not None and engine.supports(analysis):
+        def run():
+            columns, rows = engine.run(analysis, params)
+            return pd.DataFrame(rows, columns=columns)
+        return monitor.observe(conn, analysis, params, None, run)
+    statement = analysis_statement(analysis, params)
+    return monitor.observe(conn, analysis, params, statement,
+                           lambda: pd.read_sql(statement, conn, params=params))
+
+
+# Bound parameters a prefetch uses for an analysis: the over-time ones get the
+# default granularity and open date range of their widgets
+def prefetch_params(analysis, params):
+    if analysis in foodwaste_rollups.ANALYSES:
+        return dict(params, **foodwaste_rollups.range_params())
+    return params
+
+
+# The paginated grids fetch one page at a time, so only the other analyses are computed ahead
+def prefetchable(analysis):
+    return analysis in fq.ANALYSES and analysis not in foodwaste_grid.GRIDS
+
+
+# Analysis results shared by every session, warmed for the 'All' filters at start-up
+@st.cache_resource
+def get_prefetcher():
+    pool, engine, monitor = get_pool(), get_engine(), get_monitor()
+    prefetcher = foodwaste_prefetch.Prefetcher(
+        lambda analysis, params: compute_analysis(pool, engine, monitor, analysis, params))
+    defaults = fq.bind_ids(pool.connection(), fq.filter_params())
+    prefetcher.prefetch([(a, prefetch_params(a, defaults)) for a in ANALYSIS_OPTIONS if prefetchable(a)],
+                        get_feed().epoch)
+    atexit.register(prefetcher.close)
+    return prefetcher
+
+
+def run_analysis(analysis, params):
+    result = prefetcher.get(analysis, params, feed.epoch)
+    return result.copy()  # cached results are shared between sessions
+
+
+# Granularity and date range for the over-time analyses, read from the rollup tables
+def time_range_params():
+    col1, col2, col3 = st.columns(3)
+    grain = col1.selectbox('Granularity', foodwaste_rollups.GRAINS, format_func=str.title)
+    start = col2.date_input('From', value=None)
+    end = col3.date_input('To', value=None)
+    return foodwaste_rollups.range_params(grain, start, end)
+
+
+# Latency, VM steps and result size of every query, shared by every session
+@st.cache_resource
+def get_monitor():
+    return foodwaste_monitor.QueryMonitor()
+
+
+# Finished chart images, shared by every session
+@st.cache_resource
+def get_render_cache():
+    return foodwaste_charts.RenderCache()
+
+
+# The tables and filters a cached result or chart depends on; the pages
+# that are not a single analysis depend on everything
+def analysis_dependency(analysis, params):
+    if analysis in fq.ANALYSES:
+        return foodwaste_changes.analysis_dependency(analysis, analysis_statement(analysis, params))
+    return foodwaste_changes.EVERYTHING
+
+
+# Runs on the script thread that polls the feed
+def invalidate(changes):
+    match = foodwaste_changes.matcher(changes, analysis_dependency)
+    get_prefetcher().invalidate(match)
+    get_render_cache().invalidate(match)
+
+
+# Data changes, polled at the start of every run. Each batch drops only the
+# cached results and charts it can alter; lost changes drop them all.
+@st.cache_resource
+def get_feed():
+    feed = foodwaste_changes.ChangeFeed('database.db')
+    feed.subscribe(invalidate)
+    atexit.register(feed.close)
+    return feed
+
+
+def show_chart(draw):
+    key = foodwaste_charts.chart_key(analysis_option, params, feed.epoch)
+    st.image(render_cache.render(key, draw))
+
+
+# One page of a grid, timed and logged by the query monitor like the analyses
+def grid_page(name, grid_params, sort, after, limit):
+    grid = foodwaste_grid.GRIDS[name]
+    return monitor.observe(conn, name, foodwaste_grid.page_params(grid_params, after, limit),
+                           foodwaste_grid.page_statement(grid, sort, after is None),
+                           lambda: foodwaste_grid.fetch_page(conn, grid, grid_params, sort, after, limit))
+
+
+# The first rows of a grid in its default order, e.g. the top 20 for a chart
+def grid_top(name, grid_params, limit):
+    sort = next(iter(foodwaste_grid.GRIDS[name].sorts))
+    page = grid_page(name, grid_params, sort, None, limit)
+    return pd.DataFrame(page.rows, columns=page.columns)
+
+
+# One keyset page of a long analysis. The seek positions of the pages before it
+# are kept in the session, so Previous and Next never re-read earlier rows.
+def show_grid(name, grid_params, key):
+    grid = foodwaste_grid.GRIDS[name]
+    col1, col2 = st.columns(2)
+    sort = col1.selectbox('Sort by', list(grid.sorts), key=f'{key}_sort')
+    limit = col2.selectbox('Rows per page', foodwaste_grid.PAGE_SIZES, key=f'{key}_limit',
+                           index=foodwaste_grid.PAGE_SIZES.index(foodwaste_grid.PAGE_SIZE))
+    # Back to the first page whenever the filters, sort or page size change
+    view = (tuple(sorted(grid_params.items())), sort, limit)
+    state = st.session_state.get(key)
+    if state is None or state['view'] != view:
+        state = st.session_state[key] = {'view': view, 'pages': [None]}
+    page = grid_page(name, grid_params, sort, state['pages'][-1], limit)
+    total = foodwaste_grid.row_count(conn, grid, grid_params)
+    st.dataframe(pd.DataFrame(page.rows, columns=page.columns).drop(columns=list(grid.hidden)))
+    first = (len(state['pages']) - 1) * limit + 1
+    st.caption(f"Rows {first:,}-{first + len(page.rows) - 1:,} of {total:,}" if page.rows else f"No rows of {total:,}")
+    col1, col2 = st.columns(2)
+    col1.button('Previous', key=f'{key}_previous', disabled=len(state['pages']) == 1,
+                on_click=state['pages'].pop)
+    col2.button('Next', key=f'{key}_next', disabled=page.after is None,
+                on_click=state['pages'].append, args=(page.after,))
+
+
+check_schema()
+conn = get_pool().connection()
+engine = get_engine()
+feed = get_feed()
+feed.poll()
+monitor = get_monitor()
+prefetcher = get_prefetcher()
+render_cache = get_render_cache()
+dimensions = get_dimensions()
+catalog = get_catalog()
 
 st.title('Food Waste Management Dashboard')
 
@@ -16,10 +251,10 @@ st.title('Food Waste Management Dashboard')
 st.header('Dataset Information')
 
 # Get and display the total number of records for each table
-provider_count = pd.read_sql("SELECT COUNT(*) FROM provider_data", conn).iloc[0, 0]
-receivers_count = pd.read_sql("SELECT COUNT(*) FROM receivers_data", conn).iloc[0, 0]
-food_listings_count = pd.read_sql("SELECT COUNT(*) FROM food_listings_data", conn).iloc[0, 0]
-claims_count = pd.read_sql("SELECT COUNT(*) FROM claims_data", conn).iloc[0, 0]
+provider_count = catalog.table('provider_data').row_count
+receivers_count = catalog.table('receivers_data').row_count
+food_listings_count = catalog.table('food_listings_data').row_count
+claims_count = catalog.table('claims_data').row_count
 
 st.write(f"**Provider Data:** {provider_count} records available.")
 st.write(f"**Receivers Data:** {receivers_count} records available.")
@@ -28,27 +263,27 @@ st.write(f"**Claims Data:** {claims_count} records available.")
 
 
 st.subheader('Provider Data Schema')
-st.write(pd.read_sql("SELECT sql FROM sqlite_master WHERE name='provider_data'", conn).iloc[0, 0])
+st.write(catalog.table('provider_data').schema)
 st.subheader('First 5 Rows of Provider Data')
-st.dataframe(pd.read_sql("SELECT * FROM provider_data LIMIT 5", conn))
+st.dataframe(sample_rows('provider_data'))
 
 
 st.subheader('Receivers Data Schema')
-st.write(pd.read_sql("SELECT sql FROM sqlite_master WHERE name='receivers_data'", conn).iloc[0, 0])
+st.write(catalog.table('receivers_data').schema)
 st.subheader('First 5 Rows of Receivers Data')
-st.dataframe(pd.read_sql("SELECT * FROM receivers_data LIMIT 5", conn))
+st.dataframe(sample_rows('receivers_data'))
 
 
 st.subheader('Food Listings Data Schema')
-st.write(pd.read_sql("SELECT sql FROM sqlite_master WHERE name='food_listings_data'", conn).iloc[0, 0])
+st.write(catalog.table('food_listings_data').schema)
 st.subheader('First 5 Rows of Food Listings Data')
-st.dataframe(pd.read_sql("SELECT * FROM food_listings_data LIMIT 5", conn))
+st.dataframe(sample_rows('food_listings_data'))
 
 
 st.subheader('Claims Data Schema')
-st.write(pd.read_sql("SELECT sql FROM sqlite_master WHERE name='claims_data'", conn).iloc[0, 0])
+st.write(catalog.table('claims_data').schema)
 st.subheader('First 5 Rows of Claims Data')
-st.dataframe(pd.read_sql("SELECT * FROM claims_data LIMIT 5", conn))
+st.dataframe(sample_rows('claims_data'))
 
 
 
@@ -58,89 +293,46 @@ st.header('Analysis and Visualizations')
 # Add filters to the sidebar
 st.sidebar.header("Filter Options")
 
-status_options = ['All'] + list(pd.read_sql("SELECT DISTINCT Status FROM claims_data", conn)['Status'])
+status_options = dimensions.options('status')
 selected_status = st.sidebar.selectbox('Select Claim Status:', status_options)
 
-provider_type_options = ['All'] + list(pd.read_sql("SELECT DISTINCT Type FROM provider_data", conn)['Type'])
+provider_type_options = dimensions.options('provider_type')
 selected_provider_type = st.sidebar.selectbox('Select Provider Type:', provider_type_options)
 
-receiver_type_options = ['All'] + list(pd.read_sql("SELECT DISTINCT Type FROM receivers_data", conn)['Type'])
+receiver_type_options = dimensions.options('receiver_type')
 selected_receiver_type = st.sidebar.selectbox('Select Receiver Type:', receiver_type_options)
 
-food_type_options = ['All'] + list(pd.read_sql("SELECT DISTINCT Food_type FROM food_listings_data", conn)['Food_type'])
+food_type_options = dimensions.options('food_type')
 selected_food_type = st.sidebar.selectbox('Select Food Type:', food_type_options)
 
-meal_type_options = ['All'] + list(pd.read_sql("SELECT DISTINCT Meal_Type FROM food_listings_data", conn)['Meal_Type'])
+meal_type_options = dimensions.options('meal_type')
 selected_meal_type = st.sidebar.selectbox('Select Meal Type:', meal_type_options)
 
-location_options = ['All'] + list(pd.read_sql("SELECT DISTINCT Location FROM food_listings_data", conn)['Location'])
+location_options = dimensions.options('location')
 selected_location = st.sidebar.selectbox('Select Location:', location_options)
 
 
 # --- Dynamic Metric Cards ---
 st.subheader("Key Metrics")
 
-# Query for number of providers with filters
-query_provider_count_filtered = "SELECT COUNT(DISTINCT Provider_ID) FROM provider_data WHERE 1=1"
-if selected_provider_type != 'All':
-    query_provider_count_filtered += f" AND Type = '{selected_provider_type}'"
-# Location filter is not directly applicable to provider count unless we join with food_listings_data
-# For simplicity, I will not apply location filter here.
-
-filtered_provider_count = pd.read_sql(query_provider_count_filtered, conn).iloc[0, 0]
-
-# Query for number of receivers with filters
-query_receiver_count_filtered = "SELECT COUNT(DISTINCT Receiver_ID) FROM receivers_data WHERE 1=1"
-if selected_receiver_type != 'All':
-    query_receiver_count_filtered += f" AND Type = '{selected_receiver_type}'"
-# Location filter is not directly applicable to receiver count unless we join with claims_data and food_listings_data
-# For simplicity, I will not apply location filter here.
-filtered_receiver_count = pd.read_sql(query_receiver_count_filtered, conn).iloc[0, 0]
-
-
-# Query for number of claims with filters
-query_claims_count_filtered = """
-SELECT COUNT(T1.Claim_ID)
-FROM claims_data AS T1
-JOIN food_listings_data AS T2 ON T1.Food_ID = T2.Food_ID
-JOIN receivers_data AS T3 ON T1.Receiver_ID = T3.Receiver_ID
-WHERE 1=1
-"""
-if selected_status != 'All':
-    query_claims_count_filtered += f" AND T1.Status = '{selected_status}'"
-if selected_receiver_type != 'All':
-    query_claims_count_filtered += f" AND T3.Type = '{selected_receiver_type}'"
-if selected_food_type != 'All':
-    query_claims_count_filtered += f" AND T2.Food_type = '{selected_food_type}'"
-if selected_meal_type != 'All':
-    query_claims_count_filtered += f" AND T2.Meal_Type = '{selected_meal_type}'"
-if selected_location != 'All':
-    query_claims_count_filtered += f" AND T2.Location = '{selected_location}'"
-
-filtered_claims_count = pd.read_sql(query_claims_count_filtered, conn).iloc[0, 0]
-if filtered_claims_count is None:
-    filtered_claims_count = 0
-
-# Query for total quantity with filters
-query_total_quantity_filtered = """
-SELECT SUM(T1.Quantity)
-FROM food_listings_data AS T1
-JOIN provider_data AS T2 ON T1.Provider_ID = T2.Provider_ID
-WHERE 1=1
-"""
-if selected_provider_type != 'All':
-    query_total_quantity_filtered += f" AND T2.Type = '{selected_provider_type}'"
-if selected_food_type != 'All':
-    query_total_quantity_filtered += f" AND T1.Food_type = '{selected_food_type}'"
-if selected_meal_type != 'All':
-    query_total_quantity_filtered += f" AND T1.Meal_Type = '{selected_meal_type}'"
-if selected_location != 'All':
-    query_total_quantity_filtered += f" AND T1.Location = '{selected_location}'"
-
-
-filtered_total_quantity = pd.read_sql(query_total_quantity_filtered, conn).iloc[0, 0]
-if filtered_total_quantity is None:
-    filtered_total_quantity = 0
+params = fq.bind_ids(conn, fq.filter_params(
+    status=selected_status,
+    provider_type=selected_provider_type,
+    receiver_type=selected_receiver_type,
+    food_type=selected_food_type,
+    meal_type=selected_meal_type,
+    location=selected_location,
+))
+
+# Location filter is not directly applicable to provider/receiver counts unless we join
+# with food_listings_data, so those two metrics only honour their own Type filter.
+# All four cards come from one lookup in the pre-aggregated metrics_cube
+key_metrics = monitor.observe(conn, 'Key Metrics', params, foodwaste_cube.LOOKUP,
+                              lambda: foodwaste_cube.key_metrics(conn, params))
+filtered_provider_count = key_metrics['Number of Providers']
+filtered_receiver_count = key_metrics['Number of Receivers']
+filtered_claims_count = key_metrics['Number of Claims']
+filtered_total_quantity = key_metrics['Total Quantity (Units)']
 
 # Display metrics in columns
 col1, col2, col3, col4 = st.columns(4)
@@ -159,713 +351,427 @@ with col4:
 
 
 # Create a selection box for the user to choose the analysis
-analysis_option = st.selectbox(
-    'Select an analysis to view:',
-    (
-        'Number of Food Providers and Receivers in Each City',
-        'Percentage of Food Providers by Type',
-        'Contact Information by City',
-        'Receivers with the Most Claims',
-        'Receivers with the Most Completed Claims',
-        'Total Quantity of Food Available from All Providers',
-        'Location with the Highest Number of Food Listings',
-        'Cities with the Highest Number of Food Listings (Top 20)',
-        'Most Commonly Available Food Types',
-        'Number of Food Claims for Each Food Item',
-        'Providers with the Highest Number of Successful Food Claims (Top 20)',
-        'Percentage of Food Claims by Status',
-        'Average Quantity of Food Claimed per Receiver',
-        'Percentage of Food Claims by Meal Type',
-        'Total Quantity of Food Donated by Each Provider',
-        'Number of Food Listings and Claims Over Time',
-        'Number of Food Claims by Status Over Time',
-        'Number of Food Listings by Provider Type Over Time',
-        'Total Quantity Donated by Provider (Top 20)',
-        'Total Quantity Claimed by Receiver (Top 20)'
-    )
-)
+analysis_option = st.selectbox('Select an analysis to view:', ANALYSIS_OPTIONS)
+sidebar_params = params  # before a branch adds the parameters of its own widgets
 
 # Display the selected analysis and visualization
 if analysis_option == 'Number of Food Providers and Receivers in Each City':
     st.subheader('Q1: Number of Food Providers and Receivers in Each City')
-    query_1 = """
-    SELECT
-        T1.City,
-        COUNT(DISTINCT T1.Provider_ID) AS Number_of_Providers,
-        COUNT(DISTINCT T2.Receiver_ID) AS Number_of_Receivers
-    FROM provider_data AS T1
-    LEFT JOIN receivers_data AS T2 ON T1.City = T2.City
-    WHERE 1=1
-    """
-    if selected_provider_type != 'All':
-        query_1 += f" AND T1.Type = '{selected_provider_type}'"
-    if selected_receiver_type != 'All':
-        query_1 += f" AND T2.Type = '{selected_receiver_type}'"
-    # Location filter is not directly applicable at the city level unless we join
-
-    query_1 += """
-    GROUP BY T1.City;
-    """
-    result_1 = pd.read_sql(query_1, conn)
+    result_1 = run_analysis('Number of Food Providers and Receivers in Each City', params)
     st.dataframe(result_1)
 
     st.subheader('Top 20 Cities by Number of Food Providers and Receivers')
     result_1['Total_Count'] = result_1['Number_of_Providers'] + result_1['Number_of_Receivers']
     top_20_cities = result_1.sort_values(by='Total_Count', ascending=False).head(20)
-    fig1, ax1 = plt.subplots(figsize=(12, 7))
-    sns.barplot(x='City', y='Number_of_Providers', data=top_20_cities, ax=ax1)
-    sns.barplot(x='City', y='Number_of_Receivers', data=top_20_cities, ax=ax1)
-    plt.title('Top 20 Cities by Number of Food Providers and Receivers')
-    plt.xlabel('City')
-    plt.ylabel('Number of Providers/Receivers')
-    plt.xticks(rotation=90)
-    ax1.legend(['Providers', 'Receivers'])
-    plt.tight_layout()
-    st.pyplot(fig1)
+
+    def draw():
+        fig1, ax1 = plt.subplots(figsize=(12, 7))
+        sns.barplot(x='City', y='Number_of_Providers', data=top_20_cities, ax=ax1)
+        sns.barplot(x='City', y='Number_of_Receivers', data=top_20_cities, ax=ax1)
+        plt.title('Top 20 Cities by Number of Food Providers and Receivers')
+        plt.xlabel('City')
+        plt.ylabel('Number of Providers/Receivers')
+        plt.xticks(rotation=90)
+        ax1.legend(['Providers', 'Receivers'])
+        plt.tight_layout()
+        return fig1
+
+    show_chart(draw)
 
 
 elif analysis_option == 'Percentage of Food Providers by Type':
     st.subheader('Q2: Percentage of Food Providers by Type')
-    query_2 = """
-    SELECT
-        Type,
-        COUNT(*) AS Number_of_Providers
-    FROM provider_data
-    WHERE 1=1
-    """
-    if selected_provider_type != 'All':
-        query_2 += f" AND Type = '{selected_provider_type}'"
-    # Location filter is not directly applicable
-
-    query_2 += """
-    GROUP BY Type
-    ORDER BY Number_of_Providers DESC;
-    """
-    result_2 = pd.read_sql(query_2, conn)
+    result_2 = run_analysis('Percentage of Food Providers by Type', params)
     st.dataframe(result_2)
 
-    fig2, ax2 = plt.subplots(figsize=(6, 6))
-    ax2.pie(result_2['Number_of_Providers'], labels=result_2['Type'], autopct='%1.1f%%', startangle=90)
-    ax2.set_title('Percentage of Food Providers by Type')
-    st.pyplot(fig2)
+    if result_2.empty:
+        st.info('No providers match the selected filters.')
+    else:
+        def draw():
+            fig2, ax2 = plt.subplots(figsize=(6, 6))
+            ax2.pie(result_2['Number_of_Providers'], labels=result_2['Type'], autopct='%1.1f%%', startangle=90)
+            ax2.set_title('Percentage of Food Providers by Type')
+            return fig2
+
+        show_chart(draw)
 
 elif analysis_option == 'Contact Information by City':
     st.subheader('Contact Information by City')
-    provider_city_query = "SELECT DISTINCT City FROM provider_data ORDER BY City;"
-    provider_cities = pd.read_sql(provider_city_query, conn)['City'].tolist()
+    search_text = st.text_input('Search providers and receivers by name, address, city or phone:')
+    if search_text:
+        bound = foodwaste_search.search_params(search_text, params)
+        if bound['query'] is None:
+            st.caption(f"Type at least {foodwaste_search.MIN_LENGTH} characters to search.")
+        else:
+            columns, rows = monitor.observe(conn, 'Contact search', bound, foodwaste_search.SEARCH,
+                                            lambda: foodwaste_search.search(conn, search_text, params))
+            st.dataframe(pd.DataFrame(rows, columns=columns))
+            st.caption(f"Best {len(rows)} match(es), ranked by relevance." if rows else "No matches.")
+
+    provider_cities = dimensions.values('provider_city')
     selected_provider_city = st.selectbox('Select a city for Provider Contact Information:', provider_cities)
 
     st.subheader(f"Provider Contact Information in {selected_provider_city}:")
-    query_provider_contact = f"""
-    SELECT
-        Name,
-        Contact,
-        Type
-    FROM provider_data
-    WHERE City = '{selected_provider_city}'
-    """
-    if selected_provider_type != 'All':
-        query_provider_contact += f" AND Type = '{selected_provider_type}'"
-    query_provider_contact += ";"
-    result_provider_contact = pd.read_sql(query_provider_contact, conn)
-    st.dataframe(result_provider_contact)
-
-    receiver_city_query = "SELECT DISTINCT City FROM receivers_data ORDER BY City;"
-    receiver_cities = pd.read_sql(receiver_city_query, conn)['City'].tolist()
+    show_grid('Provider Contact Information', dict(params, city=selected_provider_city), 'provider_contacts')
+
+    receiver_cities = dimensions.values('receiver_city')
     selected_receiver_city = st.selectbox('Select a city for Receiver Contact Information:', receiver_cities)
 
     st.subheader(f"Receiver Contact Information in {selected_receiver_city}:")
-    query_receiver_contact = f"""
-    SELECT
-        Name,
-        Contact,
-        Type
-    FROM receivers_data
-    WHERE City = '{selected_receiver_city}'
-    """
-    if selected_receiver_type != 'All':
-        query_receiver_contact += f" AND Type = '{selected_receiver_type}'"
-    query_receiver_contact += ";"
-    result_receiver_contact = pd.read_sql(query_receiver_contact, conn)
-    st.dataframe(result_receiver_contact)
+    show_grid('Receiver Contact Information', dict(params, city=selected_receiver_city), 'receiver_contacts')
 
 
 elif analysis_option == 'Receivers with the Most Claims':
     st.subheader('Q4: Receivers with the Most Claims')
-    query_4 = """
-    SELECT T1.Name, COUNT(*) AS Number_of_Claims
-    FROM receivers_data AS T1
-    JOIN claims_data AS T2 ON T1.Receiver_ID = T2.Receiver_ID
-    JOIN food_listings_data AS T3 ON T2.Food_ID = T3.Food_ID
-    WHERE 1=1
-    """
-    if selected_receiver_type != 'All':
-        query_4 += f" AND T1.Type = '{selected_receiver_type}'"
-    if selected_status != 'All':
-        query_4 += f" AND T2.Status = '{selected_status}'"
-    if selected_food_type != 'All':
-        query_4 += f" AND T3.Food_type = '{selected_food_type}'"
-    if selected_meal_type != 'All':
-        query_4 += f" AND T3.Meal_Type = '{selected_meal_type}'"
-    if selected_location != 'All':
-        query_4 += f" AND T3.Location = '{selected_location}'"
-
-
-    query_4 += """
-    GROUP BY T1.Name
-    ORDER BY Number_of_Claims DESC;
-    """
-    result_4 = pd.read_sql(query_4, conn)
+    result_4 = run_analysis('Receivers with the Most Claims', params)
     st.dataframe(result_4)
 
     st.subheader('Top 20 Receivers by Number of Claims')
-    fig4, ax4 = plt.subplots(figsize=(12, 7))
-    sns.barplot(x='Name', y='Number_of_Claims', data=result_4.head(20), ax=ax4)
-    plt.title('Top 20 Receivers by Number of Claims')
-    plt.xlabel('Receiver Name')
-    plt.ylabel('Number of Claims')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(fig4)
+
+    def draw():
+        fig4, ax4 = plt.subplots(figsize=(12, 7))
+        sns.barplot(x='Name', y='Number_of_Claims', data=result_4.head(20), ax=ax4)
+        plt.title('Top 20 Receivers by Number of Claims')
+        plt.xlabel('Receiver Name')
+        plt.ylabel('Number of Claims')
+        plt.xticks(rotation=90)
+        plt.tight_layout()
+        return fig4
+
+    show_chart(draw)
 
 elif analysis_option == 'Receivers with the Most Completed Claims':
     st.subheader('Receivers with the Most Completed Claims')
-    extra_query2 = """
-    SELECT T1.Name, COUNT(*) AS Number_of_Claims
-    FROM receivers_data AS T1
-    JOIN claims_data AS T2 ON T1.Receiver_ID = T2.Receiver_ID
-    JOIN food_listings_data AS T3 ON T2.Food_ID = T3.Food_ID
-    WHERE T2.Status = 'Completed'
-    """
-    if selected_receiver_type != 'All':
-        extra_query2 += f" AND T1.Type = '{selected_receiver_type}'"
-    if selected_food_type != 'All':
-        extra_query2 += f" AND T3.Food_type = '{selected_food_type}'"
-    if selected_meal_type != 'All':
-        extra_query2 += f" AND T3.Meal_Type = '{selected_meal_type}'"
-    if selected_location != 'All':
-        extra_query2 += f" AND T3.Location = '{selected_location}'"
-
-
-    extra_query2 += """
-    GROUP BY T1.Name
-    ORDER BY Number_of_Claims DESC;
-    """
-    extra_result2 = pd.read_sql(extra_query2, conn)
+    extra_result2 = run_analysis('Receivers with the Most Completed Claims', params)
     st.dataframe(extra_result2)
 
     st.subheader('Top 20 Receivers by Number of Completed Claims')
-    fig_extra2, ax_extra2 = plt.subplots(figsize=(12, 7))
-    sns.barplot(x='Name', y='Number_of_Claims', data=extra_result2.head(20), ax=ax_extra2)
-    plt.title('Top 20 Receivers by Number of Completed Claims')
-    plt.xlabel('Receiver Name')
-    plt.ylabel('Number of Completed Claims')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(fig_extra2)
+
+    def draw():
+        fig_extra2, ax_extra2 = plt.subplots(figsize=(12, 7))
+        sns.barplot(x='Name', y='Number_of_Claims', data=extra_result2.head(20), ax=ax_extra2)
+        plt.title('Top 20 Receivers by Number of Completed Claims')
+        plt.xlabel('Receiver Name')
+        plt.ylabel('Number of Completed Claims')
+        plt.xticks(rotation=90)
+        plt.tight_layout()
+        return fig_extra2
+
+    show_chart(draw)
 
 elif analysis_option == 'Total Quantity of Food Available from All Providers':
     st.subheader('Q5: Total Quantity of Food Available from All Providers')
-    query_5 = """
-    SELECT SUM(Quantity) AS Total_Quantity
-    FROM food_listings_data
-    WHERE 1=1
-    """
-    if selected_provider_type != 'All':
-        query_5 += f" AND Provider_Type = '{selected_provider_type}'"
-    if selected_food_type != 'All':
-        query_5 += f" AND Food_type = '{selected_food_type}'"
-    if selected_meal_type != 'All':
-        query_5 += f" AND Meal_Type = '{selected_meal_type}'"
-    if selected_location != 'All':
-        query_5 += f" AND Location = '{selected_location}'"
-
-    query_5 += ";"
-    result_5 = pd.read_sql(query_5, conn)
+    result_5 = run_analysis('Total Quantity of Food Available from All Providers', params)
     st.dataframe(result_5)
 
 elif analysis_option == 'Location with the Highest Number of Food Listings':
     st.subheader('Q6: Location with the Highest Number of Food Listings')
-    query_6 = """
-    SELECT Location, COUNT(*) AS Number_of_Listings
-    FROM food_listings_data
-    WHERE 1=1
-    """
-    if selected_provider_type != 'All':
-        query_6 += f" AND Provider_Type = '{selected_provider_type}'"
-    if selected_food_type != 'All':
-        query_6 += f" AND Food_type = '{selected_food_type}'"
-    if selected_meal_type != 'All':
-        query_6 += f" AND Meal_Type = '{selected_meal_type}'"
-    if selected_location != 'All':
-        query_6 += f" AND Location = '{selected_location}'"
-    query_6 += """
-    GROUP BY Location
-    ORDER BY Number_of_Listings DESC
-    LIMIT 1;
-    """
-    result_6 = pd.read_sql(query_6, conn)
+    result_6 = run_analysis('Location with the Highest Number of Food Listings', params)
     st.dataframe(result_6)
 
 elif analysis_option == 'Cities with the Highest Number of Food Listings (Top 20)':
     st.subheader('Cities with the Highest Number of Food Listings (Top 20)')
-    query_Extra = """
-    SELECT T1.City, COUNT(T2.Food_ID) AS Number_of_Listings
-    FROM provider_data AS T1
-    JOIN food_listings_data AS T2 ON T1.Provider_ID = T2.Provider_ID
-    WHERE 1=1
-    """
-    if selected_provider_type != 'All':
-        query_Extra += f" AND T1.Type = '{selected_provider_type}'"
-    if selected_food_type != 'All':
-        query_Extra += f" AND T2.Food_type = '{selected_food_type}'"
-    if selected_meal_type != 'All':
-        query_Extra += f" AND T2.Meal_Type = '{selected_meal_type}'"
-    if selected_location != 'All':
-        query_Extra += f" AND T2.Location = '{selected_location}'"
-
-    query_Extra += """
-    GROUP BY T1.City
-    ORDER BY Number_of_Listings DESC
-    LIMIT 20;
-    """
-    result_Extra = pd.read_sql(query_Extra, conn)
+    result_Extra = run_analysis('Cities with the Highest Number of Food Listings (Top 20)', params)
     st.dataframe(result_Extra)
 
 elif analysis_option == 'Most Commonly Available Food Types':
     st.subheader('Q7: Most Commonly Available Food Types')
-    query_7 = """
-    SELECT Food_type, COUNT(*) AS Number_of_Listings
-    FROM food_listings_data
-    WHERE 1=1
-    """
-    if selected_provider_type != 'All':
-        query_7 += f" AND Provider_Type = '{selected_provider_type}'"
-    if selected_food_type != 'All':
-        query_7 += f" AND Food_type = '{selected_food_type}'"
-    if selected_meal_type != 'All':
-        query_7 += f" AND Meal_Type = '{selected_meal_type}'"
-    if selected_location != 'All':
-        query_7 += f" AND Location = '{selected_location}'"
-
-    query_7 += """
-    GROUP BY Food_type
-    ORDER BY Number_of_Listings DESC;
-    """
-    result_7 = pd.read_sql(query_7, conn)
+    result_7 = run_analysis('Most Commonly Available Food Types', params)
     st.dataframe(result_7)
 
 elif analysis_option == 'Number of Food Claims for Each Food Item':
     st.subheader('Q8: Number of Food Claims for Each Food Item')
-    query_8 = """
-    SELECT
-        T1.Food_ID,
-        T2.Food_Name,
-        COUNT(T1.Claim_ID) AS Number_of_Claims
-    FROM claims_data AS T1
-    JOIN food_listings_data AS T2 ON T1.Food_ID = T2.Food_ID
-    WHERE 1=1
-    """
-    if selected_status != 'All':
-        query_8 += f" AND T1.Status = '{selected_status}'"
-    if selected_food_type != 'All':
-        query_8 += f" AND T2.Food_type = '{selected_food_type}'"
-    if selected_meal_type != 'All':
-        query_8 += f" AND T2.Meal_Type = '{selected_meal_type}'"
-    if selected_location != 'All':
-        query_8 += f" AND T2.Location = '{selected_location}'"
-
-    query_8 += """
-    GROUP BY T1.Food_ID, T2.Food_Name
-    ORDER BY Number_of_Claims DESC;
-    """
-    result_8 = pd.read_sql(query_8, conn)
-    st.dataframe(result_8)
+    show_grid('Number of Food Claims for Each Food Item', params, 'food_item_claims')
 
     st.subheader('Top 20 Food Items by Number of Claims')
-    fig8, ax8 = plt.subplots(figsize=(12, 7))
-    sns.barplot(x='Food_Name', y='Number_of_Claims', data=result_8.head(20), ax=ax8)
-    plt.title('Top 20 Food Items by Number of Claims')
-    plt.xlabel('Food Item')
-    plt.ylabel('Number of Claims')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(fig8)
+    result_8 = grid_top('Number of Food Claims for Each Food Item', params, 20)
+
+    def draw():
+        fig8, ax8 = plt.subplots(figsize=(12, 7))
+        sns.barplot(x='Food_Name', y='Number_of_Claims', data=result_8.head(20), ax=ax8)
+        plt.title('Top 20 Food Items by Number of Claims')
+        plt.xlabel('Food Item')
+        plt.ylabel('Number of Claims')
+        plt.xticks(rotation=90)
+        plt.tight_layout()
+        return fig8
+
+    show_chart(draw)
 
 
 elif analysis_option == 'Providers with the Highest Number of Successful Food Claims (Top 20)':
     st.subheader('Q9: Providers with the Highest Number of Successful Food Claims (Top 20)')
-    query_9 = """
-    SELECT T2.Name, COUNT(T1.Claim_ID) AS Number_of_Claims
-    FROM claims_data AS T1
-    JOIN food_listings_data AS T3 ON T1.Food_ID = T3.Food_ID
-    JOIN provider_data AS T2 ON T3.Provider_ID = T2.Provider_ID
-    WHERE T1.Status = 'Completed'
-    """
-    if selected_provider_type != 'All':
-        query_9 += f" AND T2.Type = '{selected_provider_type}'"
-    if selected_food_type != 'All':
-        query_9 += f" AND T3.Food_type = '{selected_food_type}'"
-    if selected_meal_type != 'All':
-        query_9 += f" AND T3.Meal_Type = '{selected_meal_type}'"
-    if selected_location != 'All':
-        query_9 += f" AND T3.Location = '{selected_location}'"
-
-    query_9 += """
-    GROUP BY T2.Name
-    ORDER BY Number_of_Claims DESC
-    LIMIT 20;
-    """
-    result_9 = pd.read_sql(query_9, conn)
+    result_9 = run_analysis('Providers with the Highest Number of Successful Food Claims (Top 20)', params)
     st.dataframe(result_9)
 
-    fig9, ax9 = plt.subplots(figsize=(12, 7))
-    sns.barplot(x='Name', y='Number_of_Claims', data=result_9, ax=ax9)
-    plt.title('Top 20 Providers with Most Successful Claims')
-    plt.xlabel('Provider Name')
-    plt.ylabel('Number of Successful Claims')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(fig9)
+    def draw():
+        fig9, ax9 = plt.subplots(figsize=(12, 7))
+        sns.barplot(x='Name', y='Number_of_Claims', data=result_9, ax=ax9)
+        plt.title('Top 20 Providers with Most Successful Claims')
+        plt.xlabel('Provider Name')
+        plt.ylabel('Number of Successful Claims')
+        plt.xticks(rotation=90)
+        plt.tight_layout()
+        return fig9
+
+    show_chart(draw)
 
 
 elif analysis_option == 'Percentage of Food Claims by Status':
     st.subheader('Q10: Percentage of Food Claims by Status')
-    query_10 = """
-    SELECT
-        Status,
-        COUNT(*) AS Number_of_Claims,
-        (COUNT(*) * 100.0 / (SELECT COUNT(*) FROM claims_data)) AS Percentage
-    FROM claims_data
-    WHERE 1=1
-    """
-    if selected_status != 'All':
-        query_10 += f" AND Status = '{selected_status}'"
-    # Location filter is not directly applicable
-
-    query_10 += """
-    GROUP BY Status;
-    """
-    result_10 = pd.read_sql(query_10, conn)
+    result_10 = run_analysis('Percentage of Food Claims by Status', params)
     st.dataframe(result_10)
 
-    fig10, ax10 = plt.subplots(figsize=(6, 6))
-    ax10.pie(result_10['Number_of_Claims'], labels=result_10['Status'], autopct='%1.1f%%', startangle=90)
-    ax10.set_title('Percentage of Food Claims by Status')
-    st.pyplot(fig10)
+    if result_10.empty:
+        st.info('No claims match the selected filters.')
+    else:
+        def draw():
+            fig10, ax10 = plt.subplots(figsize=(6, 6))
+            ax10.pie(result_10['Number_of_Claims'], labels=result_10['Status'], autopct='%1.1f%%', startangle=90)
+            ax10.set_title('Percentage of Food Claims by Status')
+            return fig10
+
+        show_chart(draw)
 
 elif analysis_option == 'Average Quantity of Food Claimed per Receiver':
     st.subheader('Q11: Average Quantity of Food Claimed per Receiver')
-    query_11 = """
-    SELECT
-        T2.Name AS Receiver_Name,
-        AVG(T3.Quantity) AS Average_Quantity
-    FROM claims_data AS T1
-    JOIN receivers_data AS T2 ON T1.Receiver_ID = T2.Receiver_ID
-    JOIN food_listings_data AS T3 ON T1.Food_ID = T3.Food_ID
-    WHERE 1=1
-    """
-    if selected_status != 'All':
-        query_11 += f" AND T1.Status = '{selected_status}'"
-    if selected_receiver_type != 'All':
-        query_11 += f" AND T2.Type = '{selected_receiver_type}'"
-    if selected_food_type != 'All':
-        query_11 += f" AND T3.Food_type = '{selected_food_type}'"
-    if selected_meal_type != 'All':
-        query_11 += f" AND T3.Meal_Type = '{selected_meal_type}'"
-    if selected_location != 'All':
-        query_11 += f" AND T3.Location = '{selected_location}'"
-
-    query_11 += """
-    GROUP BY T2.Name
-    ORDER BY Average_Quantity DESC;
-    """
-    result_11 = pd.read_sql(query_11, conn)
+    result_11 = run_analysis('Average Quantity of Food Claimed per Receiver', params)
     st.dataframe(result_11)
 
     st.subheader('Top 20 Receivers by Average Quantity Claimed')
-    fig11, ax11 = plt.subplots(figsize=(12, 7))
-    sns.barplot(x='Receiver_Name', y='Average_Quantity', data=result_11.head(20), ax=ax11)
-    plt.title('Top 20 Receivers by Average Quantity Claimed')
-    plt.xlabel('Receiver Name')
-    plt.ylabel('Average Quantity')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(fig11)
+
+    def draw():
+        fig11, ax11 = plt.subplots(figsize=(12, 7))
+        sns.barplot(x='Receiver_Name', y='Average_Quantity', data=result_11.head(20), ax=ax11)
+        plt.title('Top 20 Receivers by Average Quantity Claimed')
+        plt.xlabel('Receiver Name')
+        plt.ylabel('Average Quantity')
+        plt.xticks(rotation=90)
+        plt.tight_layout()
+        return fig11
+
+    show_chart(draw)
 
 
 elif analysis_option == 'Percentage of Food Claims by Meal Type':
     st.subheader('Q12: Percentage of Food Claims by Meal Type')
-    query_12 = """
-    SELECT T1.Meal_Type, COUNT(T2.Claim_ID) AS Number_of_Claims
-    FROM food_listings_data AS T1
-    JOIN claims_data AS T2 ON T1.Food_ID = T2.Food_ID
-    JOIN receivers_data AS T3 ON T2.Receiver_ID = T3.Receiver_ID
-    WHERE 1=1
-    """
-    if selected_status != 'All':
-        query_12 += f" AND T2.Status = '{selected_status}'"
-    if selected_receiver_type != 'All':
-        query_12 += f" AND T3.Type = '{selected_receiver_type}'"
-    if selected_food_type != 'All':
-        query_12 += f" AND T1.Food_type = '{selected_food_type}'"
-    if selected_meal_type != 'All':
-        query_12 += f" AND T1.Meal_Type = '{selected_meal_type}'"
-    if selected_location != 'All':
-        query_12 += f" AND T1.Location = '{selected_location}'"
-
-    query_12 += """
-    GROUP BY T1.Meal_Type
-    ORDER BY Number_of_Claims DESC;
-    """
-    result_12 = pd.read_sql(query_12, conn)
+    result_12 = run_analysis('Percentage of Food Claims by Meal Type', params)
     st.dataframe(result_12)
 
-    fig12, ax12 = plt.subplots(figsize=(6, 6))
-    ax12.pie(result_12['Number_of_Claims'], labels=result_12['Meal_Type'], autopct='%1.1f%%', startangle=90)
-    ax12.set_title('Percentage of Food Claims by Meal Type')
-    st.pyplot(fig12)
+    if result_12.empty:
+        st.info('No claims match the selected filters.')
+    else:
+        def draw():
+            fig12, ax12 = plt.subplots(figsize=(6, 6))
+            ax12.pie(result_12['Number_of_Claims'], labels=result_12['Meal_Type'], autopct='%1.1f%%', startangle=90)
+            ax12.set_title('Percentage of Food Claims by Meal Type')
+            return fig12
+
+        show_chart(draw)
 
 elif analysis_option == 'Total Quantity of Food Donated by Each Provider':
     st.subheader('Q13: Total Quantity of Food Donated by Each Provider')
-    query_13 = """
-    SELECT T1.Name, SUM(T2.Quantity) AS Total_Quantity
-    FROM provider_data AS T1
-    JOIN food_listings_data AS T2 ON T1.Provider_ID = T2.Provider_ID
-    WHERE 1=1
-    """
-    if selected_provider_type != 'All':
-        query_13 += f" AND T1.Type = '{selected_provider_type}'"
-    if selected_food_type != 'All':
-        query_13 += f" AND T2.Food_type = '{selected_food_type}'"
-    if selected_meal_type != 'All':
-        query_13 += f" AND T2.Meal_Type = '{selected_meal_type}'"
-    if selected_location != 'All':
-        query_13 += f" AND T2.Location = '{selected_location}'"
-
-    query_13 += """
-    GROUP BY T1.Name ORDER BY Total_Quantity DESC;
-    """
-    result_13 = pd.read_sql(query_13, conn)
-    st.dataframe(result_13)
+    show_grid('Total Quantity of Food Donated by Each Provider', params, 'provider_quantity')
 
     st.subheader('Top 20 Providers by Total Quantity Donated')
-    fig13, ax13 = plt.subplots(figsize=(12, 7))
-    sns.barplot(x='Name', y='Total_Quantity', data=result_13.head(20), ax=ax13)
-    plt.title('Top 20 Providers by Total Quantity Donated')
-    plt.xlabel('Provider Name')
-    plt.ylabel('Total Quantity')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(fig13)
+    result_13 = grid_top('Total Quantity of Food Donated by Each Provider', params, 20)
+
+    def draw():
+        fig13, ax13 = plt.subplots(figsize=(12, 7))
+        sns.barplot(x='Name', y='Total_Quantity', data=result_13.head(20), ax=ax13)
+        plt.title('Top 20 Providers by Total Quantity Donated')
+        plt.xlabel('Provider Name')
+        plt.ylabel('Total Quantity')
+        plt.xticks(rotation=90)
+        plt.tight_layout()
+        return fig13
+
+    show_chart(draw)
 
 elif analysis_option == 'Number of Food Listings and Claims Over Time':
     st.subheader('Q15: Number of Food Listings and Claims Over Time')
-    query_15 = """
-    SELECT
-        strftime('%Y-%m-%d', T1.Timestamp) AS Date,
-        COUNT(T1.Claim_ID) AS Number_of_Claims,
-        0 AS Number_of_Listings
-    FROM claims_data AS T1
-    JOIN food_listings_data AS T2 ON T1.Food_ID = T2.Food_ID
-    JOIN receivers_data AS T3 ON T1.Receiver_ID = T3.Receiver_ID
-    WHERE 1=1
-    """
-    if selected_status != 'All':
-        query_15 += f" AND T1.Status = '{selected_status}'"
-    if selected_receiver_type != 'All':
-        query_15 += f" AND T3.Type = '{selected_receiver_type}'"
-    if selected_food_type != 'All':
-        query_15 += f" AND T2.Food_type = '{selected_food_type}'"
-    if selected_meal_type != 'All':
-        query_15 += f" AND T2.Meal_Type = '{selected_meal_type}'"
-    if selected_location != 'All':
-        query_15 += f" AND T2.Location = '{selected_location}'"
-
-    query_15 += """
-    GROUP BY Date
-
-    UNION ALL
-
-    SELECT
-        strftime('%Y-%m-%d', T1.Expiry_Date) AS Date,
-        0 AS Number_of_Claims,
-        COUNT(T1.Food_ID) AS Number_of_Listings
-    FROM food_listings_data AS T1
-    JOIN provider_data AS T2 ON T1.Provider_ID = T2.Provider_ID
-    WHERE 1=1
-    """
-    if selected_provider_type != 'All':
-        query_15 += f" AND T2.Type = '{selected_provider_type}'"
-    if selected_food_type != 'All':
-        query_15 += f" AND T1.Food_type = '{selected_food_type}'"
-    if selected_meal_type != 'All':
-        query_15 += f" AND T1.Meal_Type = '{selected_meal_type}'"
-    if selected_location != 'All':
-        query_15 += f" AND T1.Location = '{selected_location}'"
-
-    query_15 += """
-    GROUP BY Date
-    ORDER BY Date;
-    """
-    result_15 = pd.read_sql(query_15, conn)
+    params = dict(params, **time_range_params())
+    result_15 = run_analysis('Number of Food Listings and Claims Over Time', params)
     st.dataframe(result_15)
 
-    fig15, ax15 = plt.subplots(figsize=(15, 6))
-    sns.lineplot(x='Date', y='Number_of_Claims', data=result_15, label='Number of Claims', ax=ax15)
-    sns.lineplot(x='Date', y='Number_of_Listings', data=result_15, label='Number of Listings', ax=ax15)
-    plt.title('Number of Food Listings and Claims Over Time')
-    plt.xlabel('Date')
-    plt.ylabel('Number of Listings/Claims')
-    plt.xticks(rotation=90)
-    ax15.legend()
-    st.pyplot(fig15)
+    def draw():
+        fig15, ax15 = plt.subplots(figsize=(15, 6))
+        sns.lineplot(x='Date', y='Number_of_Claims', data=result_15, label='Number of Claims', ax=ax15)
+        sns.lineplot(x='Date', y='Number_of_Listings', data=result_15, label='Number of Listings', ax=ax15)
+        plt.title('Number of Food Listings and Claims Over Time')
+        plt.xlabel('Date')
+        plt.ylabel('Number of Listings/Claims')
+        plt.xticks(rotation=90)
+        ax15.legend()
+        return fig15
+
+    show_chart(draw)
 
 elif analysis_option == 'Number of Food Claims by Status Over Time':
     st.subheader('Number of Food Claims by Status Over Time')
-    query_claims_status_time = """
-    SELECT
-        strftime('%Y-%m-%d', T1.Timestamp) AS Date,
-        T1.Status,
-        COUNT(T1.Claim_ID) AS Number_of_Claims
-    FROM claims_data AS T1
-    JOIN food_listings_data AS T2 ON T1.Food_ID = T2.Food_ID
-    JOIN receivers_data AS T3 ON T1.Receiver_ID = T3.Receiver_ID
-    WHERE 1=1
-    """
-    if selected_status != 'All':
-        query_claims_status_time += f" AND T1.Status = '{selected_status}'"
-    if selected_receiver_type != 'All':
-        query_claims_status_time += f" AND T3.Type = '{selected_receiver_type}'"
-    if selected_food_type != 'All':
-        query_claims_status_time += f" AND T2.Food_type = '{selected_food_type}'"
-    if selected_meal_type != 'All':
-        query_claims_status_time += f" AND T2.Meal_Type = '{selected_meal_type}'"
-    if selected_location != 'All':
-        query_claims_status_time += f" AND T2.Location = '{selected_location}'"
-
-    query_claims_status_time += """
-    GROUP BY Date, T1.Status
-    ORDER BY Date, T1.Status;
-    """
-    claims_status_time_result = pd.read_sql(query_claims_status_time, conn)
+    params = dict(params, **time_range_params())
+    claims_status_time_result = run_analysis('Number of Food Claims by Status Over Time', params)
     st.dataframe(claims_status_time_result)
 
-    fig_claims_status, ax_claims_status = plt.subplots(figsize=(15, 6))
-    sns.lineplot(x='Date', y='Number_of_Claims', hue='Status', data=claims_status_time_result, ax=ax_claims_status)
-    plt.title('Number of Food Claims by Status Over Time')
-    plt.xlabel('Date')
-    plt.ylabel('Number of Claims')
-    plt.xticks(rotation=90)
-    ax_claims_status.legend(title='Status')
-    st.pyplot(fig_claims_status)
+    def draw():
+        fig_claims_status, ax_claims_status = plt.subplots(figsize=(15, 6))
+        sns.lineplot(x='Date', y='Number_of_Claims', hue='Status', data=claims_status_time_result, ax=ax_claims_status)
+        plt.title('Number of Food Claims by Status Over Time')
+        plt.xlabel('Date')
+        plt.ylabel('Number of Claims')
+        plt.xticks(rotation=90)
+        ax_claims_status.legend(title='Status')
+        return fig_claims_status
+
+    show_chart(draw)
 
 elif analysis_option == 'Number of Food Listings by Provider Type Over Time':
     st.subheader('Number of Food Listings by Provider Type Over Time')
-    query_listings_provider_time = """
-    SELECT
-        strftime('%Y-%m-%d', T1.Expiry_Date) AS Date,
-        T1.Provider_Type,
-        COUNT(T1.Food_ID) AS Number_of_Listings
-    FROM food_listings_data AS T1
-    JOIN provider_data AS T2 ON T1.Provider_ID = T2.Provider_ID
-    WHERE 1=1
-    """
-    if selected_provider_type != 'All':
-        query_listings_provider_time += f" AND T1.Provider_Type = '{selected_provider_type}'"
-    if selected_food_type != 'All':
-        query_listings_provider_time += f" AND T1.Food_type = '{selected_food_type}'"
-    if selected_meal_type != 'All':
-        query_listings_provider_time += f" AND T1.Meal_Type = '{selected_meal_type}'"
-    if selected_location != 'All':
-        query_listings_provider_time += f" AND T1.Location = '{selected_location}'"
-
-    query_listings_provider_time += """
-    GROUP BY Date, T1.Provider_Type
-    ORDER BY Date, T1.Provider_Type;
-    """
-    listings_provider_time_result = pd.read_sql(query_listings_provider_time, conn)
+    params = dict(params, **time_range_params())
+    listings_provider_time_result = run_analysis('Number of Food Listings by Provider Type Over Time', params)
     st.dataframe(listings_provider_time_result)
 
-    fig_listings_provider, ax_listings_provider = plt.subplots(figsize=(15, 6))
-    sns.lineplot(x='Date', y='Number_of_Listings', hue='Provider_Type', data=listings_provider_time_result, ax=ax_listings_provider)
-    plt.title('Number of Food Listings by Provider Type Over Time')
-    plt.xlabel('Date')
-    plt.ylabel('Number of Listings')
-    plt.xticks(rotation=90)
-    ax_listings_provider.legend(title='Provider Type')
-    st.pyplot(fig_listings_provider)
+    def draw():
+        fig_listings_provider, ax_listings_provider = plt.subplots(figsize=(15, 6))
+        sns.lineplot(x='Date', y='Number_of_Listings', hue='Provider_Type', data=listings_provider_time_result, ax=ax_listings_provider)
+        plt.title('Number of Food Listings by Provider Type Over Time')
+        plt.xlabel('Date')
+        plt.ylabel('Number of Listings')
+        plt.xticks(rotation=90)
+        ax_listings_provider.legend(title='Provider Type')
+        return fig_listings_provider
+
+    show_chart(draw)
 
 
 elif analysis_option == 'Total Quantity Donated by Provider (Top 20)':
     st.subheader('Total Quantity Donated by Provider (Top 20)')
-    query_18 = """
-    SELECT T1.Name, SUM(T2.Quantity) AS Total_Quantity
-    FROM provider_data AS T1
-    JOIN food_listings_data AS T2 ON T1.Provider_ID = T2.Provider_ID
-    WHERE 1=1
-    """
-    if selected_provider_type != 'All':
-        query_18 += f" AND T1.Type = '{selected_provider_type}'"
-    if selected_food_type != 'All':
-        query_18 += f" AND T2.Food_type = '{selected_food_type}'"
-    if selected_meal_type != 'All':
-        query_18 += f" AND T2.Meal_Type = '{selected_meal_type}'"
-    if selected_location != 'All':
-        query_18 += f" AND T2.Location = '{selected_location}'"
-    query_18 += """
-    GROUP BY T1.Name ORDER BY Total_Quantity DESC LIMIT 20;
-    """
-    result_18 = pd.read_sql(query_18, conn)
+    result_18 = run_analysis('Total Quantity Donated by Provider (Top 20)', params)
     st.dataframe(result_18)
 
-    fig18, ax18 = plt.subplots(figsize=(12, 7))
-    sns.barplot(x='Name', y='Total_Quantity', data=result_18, ax=ax18)
-    plt.title('Top 20 Providers by Total Quantity Donated')
-    plt.xlabel('Provider Name')
-    plt.ylabel('Total Quantity')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(fig18)
+    def draw():
+        fig18, ax18 = plt.subplots(figsize=(12, 7))
+        sns.barplot(x='Name', y='Total_Quantity', data=result_18, ax=ax18)
+        plt.title('Top 20 Providers by Total Quantity Donated')
+        plt.xlabel('Provider Name')
+        plt.ylabel('Total Quantity')
+        plt.xticks(rotation=90)
+        plt.tight_layout()
+        return fig18
+
+    show_chart(draw)
 
 elif analysis_option == 'Total Quantity Claimed by Receiver (Top 20)':
     st.subheader('Total Quantity Claimed by Receiver (Top 20)')
-    query_19 = """
-    SELECT
-        T2.Name AS Receiver_Name,
-        SUM(T3.Quantity) AS Total_Quantity
-    FROM claims_data AS T1
-    JOIN receivers_data AS T2 ON T1.Receiver_ID = T2.Receiver_ID
-    JOIN food_listings_data AS T3 ON T1.Food_ID = T3.Food_ID
-    WHERE 1=1
-    """
-    if selected_status != 'All':
-        query_19 += f" AND T1.Status = '{selected_status}'"
-    if selected_receiver_type != 'All':
-        query_19 += f" AND T2.Type = '{selected_receiver_type}'"
-    if selected_food_type != 'All':
-        query_19 += f" AND T3.Food_type = '{selected_food_type}'"
-    if selected_meal_type != 'All':
-        query_19 += f" AND T3.Meal_Type = '{selected_meal_type}'"
-    if selected_location != 'All':
-        query_19 += f" AND T3.Location = '{selected_location}'"
-    query_19 += """
-    GROUP BY T2.Name
-    ORDER BY Total_Quantity DESC
-    LIMIT 20;
-    """
-    result_19 = pd.read_sql(query_19, conn)
+    result_19 = run_analysis('Total Quantity Claimed by Receiver (Top 20)', params)
     st.dataframe(result_19)
 
-    fig19, ax19 = plt.subplots(figsize=(12, 7))
-    sns.barplot(x='Receiver_Name', y='Total_Quantity', data=result_19, ax=ax19)
-    plt.title('Top 20 Receivers by Total Quantity Claimed')
-    plt.xlabel('Receiver Name')
-    plt.ylabel('Total Quantity')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(fig19)
-
-
-# Close the connection
-conn.close()
+    def draw():
+        fig19, ax19 = plt.subplots(figsize=(12, 7))
+        sns.barplot(x='Receiver_Name', y='Total_Quantity', data=result_19, ax=ax19)
+        plt.title('Top 20 Receivers by Total Quantity Claimed')
+        plt.xlabel('Receiver Name')
+        plt.ylabel('Total Quantity')
+        plt.xticks(rotation=90)
+        plt.tight_layout()
+        return fig19
+
+    show_chart(draw)
+
+elif analysis_option == 'Available Food Nearing Expiry':
+    st.subheader('Available Food Nearing Expiry')
+    st.caption('Listings without a Completed claim, soonest expiry first, in the selected Location.')
+    col1, col2 = st.columns(2)
+    expiry_limit = col1.number_input('Number of listings', min_value=1, max_value=500, value=foodwaste_expiry.LIMIT)
+    expiring_after = col2.date_input('Expiring on or after', value=None, help='Empty means from now.')
+    expiry_params = foodwaste_expiry.expiry_params(selected_location, int(expiry_limit), expiring_after)
+    expiry_statement = foodwaste_expiry.expiry_statement(expiry_params)
+    columns, rows = monitor.observe(conn, analysis_option, expiry_params, expiry_statement,
+                                    lambda: fq.fetch(conn, expiry_statement, expiry_params))
+    if rows:
+        st.dataframe(pd.DataFrame(rows, columns=columns))
+    else:
+        st.info('No available listings expire in that range.')
+
+# Compute the analyses next to this one in the background, for the same filters
+prefetcher.prefetch([(a, prefetch_params(a, sidebar_params))
+                     for a in foodwaste_prefetch.neighbours(ANALYSIS_OPTIONS, analysis_option) if prefetchable(a)],
+                    feed.epoch)
+
+# --- Export ---
+# Streams the rows to a temporary file on the server in Arrow batches, hands it
+# to the download button and deletes it. Streamlit holds a download in memory,
+# so an export that grows past the limit is abandoned and refused.
+EXPORT_DIR = os.path.join(tempfile.gettempdir(), 'foodwaste_exports')
+DOWNLOAD_LIMIT_MB = 200
+
+if analysis_option == 'Contact Information by City':
+    analysis_exports = {
+        'Provider Contact Information': (fq.ANALYSES['Provider Contact Information'],
+                                         dict(params, city=selected_provider_city)),
+        'Receiver Contact Information': (fq.ANALYSES['Receiver Contact Information'],
+                                         dict(params, city=selected_receiver_city)),
+    }
+elif analysis_option == 'Available Food Nearing Expiry':
+    analysis_exports = {analysis_option: (expiry_statement, expiry_params)}
+else:
+    analysis_exports = {analysis_option: (analysis_statement(analysis_option, params), params)}
+
+if st.checkbox('Export rows to a file'):
+    import foodwaste_export  # loads pyarrow, so only once an export is asked for
+
+    st.caption('Writes the rows with the filters above to a file, in batches, without loading them into a table.')
+    fact_exports = {f"All {name} rows": (foodwaste_export.FACTS[name], sidebar_params)
+                    for name in foodwaste_export.FACTS}
+    exports = dict(analysis_exports, **fact_exports)
+    col1, col2 = st.columns(2)
+    export_choice = col1.selectbox('Rows', list(exports))
+    export_format = col2.selectbox('Format', foodwaste_export.FORMATS)
+    if st.button('Prepare export'):
+        os.makedirs(EXPORT_DIR, exist_ok=True)
+        export_sql, export_params = exports[export_choice]
+        with tempfile.NamedTemporaryFile(dir=EXPORT_DIR, suffix='.' + export_format, delete=False) as f:
+            export_path = f.name
+        try:
+            with st.spinner('Exporting...'):
+                exported = foodwaste_export.export(conn, export_sql, export_params, export_path, export_format,
+                                                   max_bytes=DOWNLOAD_LIMIT_MB * 2**20)
+            with open(export_path, 'rb') as f:
+                data = f.read()
+        except foodwaste_export.ExportTooLarge:
+            st.error(f"Over {DOWNLOAD_LIMIT_MB} MB, too large to download through the browser. Narrow the filters, "
+                     f"or run `python foodwaste_export.py` on the server.")
+        else:
+            st.write(f"{exported.rows:,} rows, {exported.bytes / 2**20:,.1f} MB")
+            st.download_button('Download', data, file_name=f"{export_choice}.{export_format}", on_click='ignore')
+        finally:
+            os.remove(export_path)
+
+# --- Admin: query instrumentation, only offered when the server enables it ---
+if foodwaste_monitor.admin_enabled() and st.sidebar.checkbox('Show query instrumentation (admin)'):
+    st.header('Query Instrumentation')
+    snapshot = monitor.snapshot()
+    st.caption(f"Rolling window of the last {monitor.window} calls per analysis; "
+               f"calls over {snapshot['slow_ms']:.0f} ms are logged with their query plan.")
+    st.subheader('Latency by Analysis')
+    st.dataframe(pd.DataFrame(snapshot['analyses']))
+    st.subheader('Latency by Analysis and Filter Set')
+    st.dataframe(pd.DataFrame(snapshot['filter_sets']))
+    st.subheader('Slow Queries')
+    for entry in snapshot['slow_queries']:
+        with st.expander(f"{entry['at']}  {entry['analysis']} ({entry['filters']}): {entry['ms']:.1f} ms"):
+            st.write({k: entry[k] for k in ('steps', 'rows', 'bytes')})
+            if entry['plan']:
+                st.code('\n'.join(entry['plan']))
+    st.subheader('Prefetch Cache')
+    prefetch_stats = prefetcher.stats()
+    st.caption("The latencies above are queries only; analyses served from the prefetch cache are counted here.")
+    col1, col2, col3 = st.columns(3)
+    col1.metric('Hits', prefetch_stats['hits'] + prefetch_stats['joined'])
+    col2.metric('Misses', prefetch_stats['misses'])
+    col3.metric('Hit rate', f"{prefetch_stats['hit_rate']:.0%}")
+    st.dataframe(pd.DataFrame([prefetch_stats]))
+    st.subheader('Change Feed')
+    st.dataframe(pd.DataFrame([feed.stats()]))
+    st.download_button('Download JSON export', monitor.to_json(), file_name='foodwaste_query_metrics.json',
+                       mime='application/json')
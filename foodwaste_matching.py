@@ -0,0 +1,209 @@
+"""
+Batch matching of open food listings to receivers in the same city.
+
+Every listing without a live claim that has not expired is scored against every receiver whose
+City is the listing's Location. The score of a (listing, receiver) pair is a
+weighted sum of
+
+    food_type   share of the receiver's Completed claims with the listing's Food_type
+    meal_type   share of the receiver's Completed claims with the listing's Meal_Type
+    history     the receiver's Completed claims, log-scaled to [0, 1]
+    urgency     how soon the listing expires: 1 / (1 + days left), 0 without an expiry
+
+The two shares are smoothed towards an even split, so receivers with no
+history still score. Listings and receivers are grouped by city and each city
+is scored as one NumPy matrix, then assigned greedily: in each round every
+open listing proposes to its best receiver with capacity left, and every
+receiver accepts its best proposals. Urgent listings score higher with every
+receiver, so they are served first.
+
+The result is a list of proposed claims. create_claims() submits them through
+a foodwaste_claims.ClaimService, which re-checks that each listing is still
+free.
+
+    python foodwaste_matching.py [database.db] [--capacity N] [--after 2025-03-01]
+"""
+
+import datetime
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+
+import foodwaste_claims
+import foodwaste_expiry
+import foodwaste_queries as fq
+
+WEIGHTS = {'food_type': 1.0, 'meal_type': 0.5, 'history': 0.5, 'urgency': 1.0}
+
+# Listings one receiver is offered per run
+CAPACITY = 1
+
+# Pseudo-claims spread evenly over the types when computing a receiver's shares
+PRIOR = 1.0
+
+Proposal = namedtuple('Proposal', 'food_id receiver_id location score')
+
+_LIVE = ', '.join(repr(s) for s in foodwaste_claims.LIVE)
+
+OPEN_LISTINGS = f"""
+    SELECT l.Food_ID, IFNULL(l.Location, ''), IFNULL(l.Food_type, ''), IFNULL(l.Meal_Type, ''), l.Expiry_Epoch
+    FROM food_listings_data AS l
+    WHERE (l.Expiry_Epoch IS NULL OR l.Expiry_Epoch >= :after)
+      AND NOT EXISTS (SELECT 1 FROM claims_data AS c
+                      WHERE c.Food_ID = l.Food_ID AND c.Status IN ({_LIVE}))
+    ORDER BY l.Food_ID;
+    """
+
+RECEIVERS = """
+    SELECT Receiver_ID, IFNULL(City, '') FROM receivers_data ORDER BY Receiver_ID;
+    """
+
+HISTORY = """
+    SELECT c.Receiver_ID, IFNULL(l.Food_type, ''), IFNULL(l.Meal_Type, ''), COUNT(*)
+    FROM claims_data AS c
+    JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+    WHERE c.Status = 'Completed'
+    GROUP BY 1, 2, 3;
+    """
+
+
+def _codes(values, index):
+    return np.fromiter((index.setdefault(v, len(index)) for v in values), dtype=np.int32, count=len(values))
+
+
+class MatchingInput:
+    """Open listings, receivers and receiver history as dictionary-encoded arrays."""
+
+    def __init__(self, conn, after=None):
+        now = foodwaste_expiry.epoch(datetime.datetime.now() if after is None else after)
+        params = {'after': now}
+        listings = conn.execute(OPEN_LISTINGS, params).fetchall()
+        receivers = conn.execute(RECEIVERS).fetchall()
+        history = conn.execute(HISTORY).fetchall()
+
+        # Cities, food types and meal types each share one dictionary across tables
+        cities, food_types, meal_types = {}, {}, {}
+        self.food_id = np.array([row[0] for row in listings], dtype=np.int64)
+        self.listing_city = _codes([row[1] for row in listings], cities)
+        self.food_type = _codes([row[2] for row in listings], food_types)
+        self.meal_type = _codes([row[3] for row in listings], meal_types)
+        expiry = np.array([np.nan if row[4] is None else row[4] for row in listings], dtype=np.float64)
+
+        self.receiver_id = np.array([row[0] for row in receivers], dtype=np.int64)
+        self.receiver_city = _codes([row[1] for row in receivers], cities)
+        self.cities = list(cities)
+
+        # Per-receiver claim counts by food type and meal type
+        n = len(self.receiver_id)
+        ids = np.array([row[0] for row in history], dtype=np.int64)
+        rows = np.searchsorted(self.receiver_id, ids)
+        rows[rows >= n] = 0
+        known = self.receiver_id[rows] == ids if n else np.zeros(len(ids), dtype=bool)
+        counts = np.array([row[3] for row in history], dtype=np.float64)
+        history_food = _codes([row[1] for row in history], food_types)
+        history_meal = _codes([row[2] for row in history], meal_types)
+        by_food = np.zeros((n, max(len(food_types), 1)))
+        by_meal = np.zeros((n, max(len(meal_types), 1)))
+        np.add.at(by_food, (rows[known], history_food[known]), counts[known])
+        np.add.at(by_meal, (rows[known], history_meal[known]), counts[known])
+        completed = by_food.sum(axis=1)
+
+        self.food_share = (by_food + PRIOR / by_food.shape[1]) / (completed[:, None] + PRIOR)
+        self.meal_share = (by_meal + PRIOR / by_meal.shape[1]) / (completed[:, None] + PRIOR)
+        self.history = np.log1p(completed) / np.log1p(max(completed.max(initial=0), 1))
+
+        # Days left until expiry, squashed so food expiring now scores 1
+        days = (expiry - now) / 86400
+        self.urgency = np.where(np.isnan(days), 0.0, 1.0 / (1.0 + days))
+
+
+def _assign(scores, capacity):
+    """
+    Greedy assignment on one city's (listings x receivers) score matrix.
+    Returns (listing, receiver) index pairs.
+    """
+    n_listings, n_receivers = scores.shape
+    left = np.full(n_receivers, capacity)
+    open_listings = np.ones(n_listings, dtype=bool)
+    pairs = []
+    while open_listings.any() and left.any():
+        masked = np.where(left > 0, scores, -np.inf)[open_listings]
+        listings = np.flatnonzero(open_listings)
+        choice = masked.argmax(axis=1)
+        offered = masked[np.arange(len(listings)), choice]
+        # Each receiver takes its best proposals first, up to the capacity it has left
+        order = np.lexsort((-offered, choice))
+        choice, listings = choice[order], listings[order]
+        first = np.searchsorted(choice, choice, side='left')
+        rank = np.arange(len(choice)) - first
+        accepted = rank < left[choice]
+        pairs.extend(zip(listings[accepted], choice[accepted]))
+        np.subtract.at(left, choice[accepted], 1)
+        open_listings[listings[accepted]] = False
+    return pairs
+
+
+def match(data, capacity=CAPACITY, weights=WEIGHTS):
+    """Proposed claims for every open listing that has a receiver in its city, best score first."""
+    listing_order = np.argsort(data.listing_city, kind='stable')
+    receiver_order = np.argsort(data.receiver_city, kind='stable')
+    listing_cities = data.listing_city[listing_order]
+    receiver_cities = data.receiver_city[receiver_order]
+    proposals = []
+    for city in np.intersect1d(listing_cities, receiver_cities):
+        listings = listing_order[np.searchsorted(listing_cities, city):np.searchsorted(listing_cities, city, 'right')]
+        receivers = receiver_order[np.searchsorted(receiver_cities, city):
+                                   np.searchsorted(receiver_cities, city, 'right')]
+        scores = (weights['food_type'] * data.food_share[receivers][:, data.food_type[listings]].T
+                  + weights['meal_type'] * data.meal_share[receivers][:, data.meal_type[listings]].T
+                  + weights['history'] * data.history[receivers][None, :]
+                  + weights['urgency'] * data.urgency[listings][:, None])
+        for i, j in _assign(scores, capacity):
+            proposals.append(Proposal(int(data.food_id[listings[i]]), int(data.receiver_id[receivers[j]]),
+                                      data.cities[city], float(scores[i, j])))
+    proposals.sort(key=lambda p: (-p.score, p.food_id))
+    return proposals
+
+
+def propose(conn, capacity=CAPACITY, after=None, weights=WEIGHTS):
+    """
+    Load the open listings from conn and match them as of after (a date,
+    datetime or ISO string, by default now): listings that expire before it
+    are left out, and urgency counts the days left from it.
+    """
+    return match(MatchingInput(conn, after), capacity, weights)
+
+
+def create_claims(service, proposals):
+    """Submit proposals as Pending claims; returns (claims created, proposals that lost a race)."""
+    futures = [(p, service.submit_create(p.food_id, p.receiver_id)) for p in proposals]
+    created, lost = [], []
+    for proposal, future in futures:
+        try:
+            created.append(future.result())
+        except foodwaste_claims.ClaimConflict:
+            lost.append(proposal)
+    return created, lost
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    capacity = CAPACITY
+    if '--capacity' in args:
+        i = args.index('--capacity')
+        capacity = int(args[i + 1])
+        del args[i:i + 2]
+    after = None
+    if '--after' in args:
+        i = args.index('--after')
+        after = args[i + 1]
+        del args[i:i + 2]
+    conn = fq.connect(args[0] if args else fq.DATABASE)
+    start = time.perf_counter()
+    proposals = propose(conn, capacity, after)
+    elapsed = time.perf_counter() - start
+    print(f"{len(proposals):,} proposed claims in {elapsed * 1000:.1f} ms")
+    for p in proposals[:20]:
+        print(f"  Food_ID {p.food_id:>7} -> Receiver_ID {p.receiver_id:>7}  {p.location:<24} {p.score:.3f}")
@@ -0,0 +1,243 @@
+"""
+Versioned schema migrations for database.db.
+
+The four food waste tables were originally written by pandas `to_sql`, as heap
+tables with no keys or indexes. Each migration below is applied once, in order,
+and the schema version is tracked in `PRAGMA user_version`.
+
+Scripts generated by other modules (the trigger builders of foodwaste_cube,
+foodwaste_rollups, ...) are frozen in migrations/ when they are released, so
+that a later change to a builder cannot alter what a released migration does
+on a fresh database. Such a change ships as a new migration instead.
+
+The dashboards only read the database: they refuse to start until this
+script has brought it to SCHEMA_VERSION.
+
+    python foodwaste_migrate.py [database.db]            apply pending migrations
+    python foodwaste_migrate.py [database.db] --explain  EXPLAIN QUERY PLAN report
+"""
+
+import os
+import sqlite3 as sql
+import sys
+
+import foodwaste_expiry
+import foodwaste_grid
+import foodwaste_queries as fq
+import foodwaste_rollups
+import foodwaste_search
+
+FROZEN = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+
+
+def frozen(name):
+    """The script of a released migration, as generated when it was released."""
+    with open(os.path.join(FROZEN, name)) as f:
+        return f.read()
+
+
+# (version, description, script). Never edit a released migration, append a new one.
+MIGRATIONS = [
+    (1, 'primary keys, foreign keys and covering indexes', """
+    ALTER TABLE provider_data RENAME TO provider_data_v0;
+    ALTER TABLE receivers_data RENAME TO receivers_data_v0;
+    ALTER TABLE food_listings_data RENAME TO food_listings_data_v0;
+    ALTER TABLE claims_data RENAME TO claims_data_v0;
+
+    CREATE TABLE provider_data (
+        Provider_ID INTEGER PRIMARY KEY,
+        Name TEXT,
+        Type TEXT,
+        Address TEXT,
+        City TEXT,
+        Contact TEXT
+    );
+    CREATE TABLE receivers_data (
+        Receiver_ID INTEGER PRIMARY KEY,
+        Name TEXT,
+        Type TEXT,
+        City TEXT,
+        Contact TEXT
+    );
+    CREATE TABLE food_listings_data (
+        Food_ID INTEGER PRIMARY KEY,
+        Food_Name TEXT,
+        Quantity INTEGER,
+        Expiry_Date TIMESTAMP,
+        Provider_ID INTEGER REFERENCES provider_data (Provider_ID),
+        Provider_Type TEXT,
+        Location TEXT,
+        Meal_Type TEXT,
+        Food_type TEXT
+    );
+    CREATE TABLE claims_data (
+        Claim_ID INTEGER PRIMARY KEY,
+        Food_ID INTEGER REFERENCES food_listings_data (Food_ID),
+        Receiver_ID INTEGER REFERENCES receivers_data (Receiver_ID),
+        Status TEXT,
+        Timestamp TIMESTAMP
+    );
+
+    INSERT INTO provider_data SELECT * FROM provider_data_v0;
+    INSERT INTO receivers_data SELECT * FROM receivers_data_v0;
+    INSERT INTO food_listings_data SELECT * FROM food_listings_data_v0;
+    INSERT INTO claims_data SELECT * FROM claims_data_v0;
+
+    DROP TABLE provider_data_v0;
+    DROP TABLE receivers_data_v0;
+    DROP TABLE food_listings_data_v0;
+    DROP TABLE claims_data_v0;
+
+    -- Type filter, Type/City group-bys and the Q1 city join
+    CREATE INDEX idx_provider_type ON provider_data (Type, City, Name);
+    CREATE INDEX idx_provider_city ON provider_data (City, Type);
+    CREATE INDEX idx_receivers_type ON receivers_data (Type, City, Name);
+    CREATE INDEX idx_receivers_city ON receivers_data (City, Type);
+
+    -- Provider joins, plus covering scans for the single-table listing analyses
+    CREATE INDEX idx_listings_provider ON food_listings_data (Provider_ID, Food_type, Meal_Type, Location, Quantity);
+    CREATE INDEX idx_listings_location ON food_listings_data (Location, Food_type, Meal_Type, Provider_Type, Quantity);
+    CREATE INDEX idx_listings_food_type ON food_listings_data (Food_type, Meal_Type, Location, Provider_Type, Quantity);
+
+    -- Status filter (covers every claims column), and both join directions
+    CREATE INDEX idx_claims_status ON claims_data (Status, Food_ID, Receiver_ID, Timestamp);
+    CREATE INDEX idx_claims_food ON claims_data (Food_ID, Status, Receiver_ID);
+    CREATE INDEX idx_claims_receiver ON claims_data (Receiver_ID, Status, Food_ID, Timestamp);
+    """),
+    (2, 'Key Metrics filter cube maintained by triggers', frozen('02_metrics_cube.sql')),
+    (3, 'per-table write counters and row counts', frozen('03_table_versions.sql')),
+    (4, 'day, week and month rollups for the over-time analyses', frozen('04_rollups.sql')),
+    (5, 'epoch and day-number columns for Timestamp and Expiry_Date', """
+    -- Computed by SQLite on every insert and update, so any ingestion path fills them
+    ALTER TABLE claims_data ADD COLUMN Timestamp_Epoch INTEGER
+        GENERATED ALWAYS AS (CAST(strftime('%s', Timestamp) AS INTEGER)) VIRTUAL;
+    ALTER TABLE claims_data ADD COLUMN Timestamp_Day INTEGER
+        GENERATED ALWAYS AS (CAST(strftime('%s', Timestamp) AS INTEGER) / 86400) VIRTUAL;
+    ALTER TABLE food_listings_data ADD COLUMN Expiry_Epoch INTEGER
+        GENERATED ALWAYS AS (CAST(strftime('%s', Expiry_Date) AS INTEGER)) VIRTUAL;
+    ALTER TABLE food_listings_data ADD COLUMN Expiry_Day INTEGER
+        GENERATED ALWAYS AS (CAST(strftime('%s', Expiry_Date) AS INTEGER) / 86400) VIRTUAL;
+
+    -- Date range scans and day bucketing, covering the filters the over-time analyses join on
+    CREATE INDEX idx_claims_day ON claims_data (Timestamp_Day, Status, Food_ID, Receiver_ID);
+    CREATE INDEX idx_claims_epoch ON claims_data (Timestamp_Epoch);
+    CREATE INDEX idx_listings_expiry_day ON food_listings_data (Expiry_Day, Provider_Type, Provider_ID,
+                                                                Food_type, Meal_Type, Location);
+    CREATE INDEX idx_listings_expiry_epoch ON food_listings_data (Expiry_Epoch);
+    """),
+    (6, 'per-city provider and receiver counts', frozen('06_city_stats.sql')),
+    (7, 'let bulk imports bypass the per-row derived-table triggers', frozen('07_bulk_load.sql')),
+    (8, 'optimistic-concurrency version on claims', """
+    ALTER TABLE claims_data ADD COLUMN Version INTEGER NOT NULL DEFAULT 0;
+    """),
+    (9, 'available listings by Location and expiry', frozen('09_expiry_queue.sql')),
+    (10, 'claims per listing and contact indexes for the paginated grids', frozen('10_grids.sql')),
+    (11, 'trigram search indexes over provider and receiver contacts', frozen('11_contact_search.sql')),
+    (12, 'change log for precise cache invalidation', frozen('12_changelog.sql')),
+    (13, 'Key Metrics cube at two Location levels instead of every roll-up', frozen('13_cube_levels.sql')),
+    (14, 'let bulk imports bypass the expiry queue and claims-per-listing triggers', frozen('14_bulk_load_queues.sql')),
+    (15, 'NULL-safe contact indexes for the paginated grids', frozen('15_grid_nulls.sql')),
+    (16, 'dimension tables for the repeated text columns', frozen('16_dimensions.sql')),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+class OutdatedSchema(Exception):
+    """The database has not had every migration yet."""
+
+
+def schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def require_current(path=fq.DATABASE):
+    """Raise OutdatedSchema unless every migration has been applied to path, which is opened read-only."""
+    conn = sql.connect(f'file:{path}?mode=ro', uri=True)
+    try:
+        version = schema_version(conn)
+    finally:
+        conn.close()
+    if version < SCHEMA_VERSION:
+        raise OutdatedSchema(f"{path} is at schema version {version}, the dashboards need {SCHEMA_VERSION}. "
+                             f"Run `python foodwaste_migrate.py {path}` first.")
+    return version
+
+
+def migrate(path=fq.DATABASE, target=None):
+    """Apply every pending migration (up to target) and return the versions that were applied."""
+    conn = sql.connect(path)
+    applied = []
+    try:
+        for version, description, script in MIGRATIONS:
+            if version <= schema_version(conn) or target is not None and version > target:
+                continue
+            conn.executescript(f"BEGIN IMMEDIATE;\n{script}")
+            # Checked before the version is recorded, so a failing migration leaves no trace
+            problems = conn.execute("PRAGMA foreign_key_check").fetchall()
+            if problems:
+                raise sql.IntegrityError(f"migration {version} left dangling foreign keys: {problems[:5]}")
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.execute("COMMIT")
+            applied.append(version)
+        if applied:
+            conn.execute("ANALYZE")
+            conn.commit()
+    except Exception:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return applied
+
+
+def explain(conn, statement, params):
+    """Return the EXPLAIN QUERY PLAN detail lines for a statement."""
+    return [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + statement, params)]
+
+
+def uses_index(plan):
+    return any('USING' in step and 'INDEX' in step or 'PRIMARY KEY' in step for step in plan)
+
+
+def explain_report(path=fq.DATABASE):
+    """
+    Print the query plan of every dashboard statement and return the names of
+    the ones that do not touch an index at all.
+    """
+    conn = sql.connect(path)
+    params = dict(fq.bind_ids(conn, fq.filter_params(city='')), **foodwaste_rollups.range_params())
+    params.update(foodwaste_expiry.expiry_params())
+    statements = list(fq.METRICS.items()) + list(fq.ANALYSES.items())
+    statements += [(f'{name} (rollup)', statement) for name, statement in foodwaste_rollups.ANALYSES.items()]
+    statements += [(f'Next expiring ({path})', statement) for path, statement in foodwaste_expiry.NEXT_EXPIRING.items()]
+    params.update(limit=foodwaste_grid.PAGE_SIZE, after_value=0, after_key=0)
+    for name, grid in foodwaste_grid.GRIDS.items():
+        for sort in grid.sorts:
+            statements += [(f'{name} grid by {sort} (page {page})', foodwaste_grid.page_statement(grid, sort, page == 1))
+                           for page in (1, 2)]
+        statements.append((f'{name} grid (row count)', grid.count))
+    params.update(query=foodwaste_search.match_query('market'), candidates=foodwaste_search.CANDIDATES)
+    statements.append(('Contact search', foodwaste_search.SEARCH))
+    missing = []
+    for name, statement in statements:
+        plan = explain(conn, statement, params)
+        ok = uses_index(plan)
+        if not ok:
+            missing.append(name)
+        print(f"[{'index' if ok else 'SCAN '}] {name}")
+        for step in plan:
+            print(f"          {step}")
+    conn.close()
+    return missing
+
+
+if __name__ == '__main__':
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    path = args[0] if args else fq.DATABASE
+    print(f"Applied migrations: {migrate(path) or 'none'} (schema version {schema_version(sql.connect(path))})")
+    if '--explain' in sys.argv:
+        missing = explain_report(path)
+        print(f"\n{len(missing)} statement(s) without an index: {missing}" if missing else "\nEvery statement uses an index.")
+        sys.exit(1 if missing else 0)
@@ -0,0 +1,174 @@
+"""
+Per-analysis query instrumentation for the dashboards.
+
+QueryMonitor.observe() wraps one query call and records its wall time, the
+number of SQLite VM steps it took (counted with a progress handler on the
+connection), and the rows and bytes it returned. Samples are kept per
+analysis and per (analysis, filter set) in a rolling window, from which the
+admin view reports p50 / p95 / p99 latency. A call slower than the slow-query
+threshold also goes into a bounded slow log, together with its EXPLAIN QUERY
+PLAN.
+
+The admin view shows statement text and plans, so the dashboard offers it
+only when FOODWASTE_ADMIN=on is set on the server (see admin_enabled()).
+
+snapshot() / to_json() give the same figures for monitoring. With
+FOODWASTE_METRICS_EXPORT set to a file path, the JSON is also rewritten
+there at most every EXPORT_INTERVAL seconds.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+import foodwaste_queries as fq
+
+# Samples kept per analysis and per (analysis, filter set)
+WINDOW = 1000
+# Calls slower than this many milliseconds go into the slow log
+SLOW_MS = float(os.environ.get('FOODWASTE_SLOW_MS', 100))
+SLOW_LOG_SIZE = 100
+# The progress handler fires every this many VM instructions
+STEP_GRANULARITY = 1000
+EXPORT_PATH = os.environ.get('FOODWASTE_METRICS_EXPORT')
+EXPORT_INTERVAL = 30
+
+PERCENTILES = (50, 95, 99)
+
+
+def admin_enabled():
+    """Whether FOODWASTE_ADMIN allows the admin instrumentation view; off unless set."""
+    setting = os.environ.get('FOODWASTE_ADMIN', 'off').lower()
+    if setting not in ('on', 'off'):
+        raise ValueError(f"FOODWASTE_ADMIN must be 'on' or 'off', not {setting!r}")
+    return setting == 'on'
+
+
+def filter_set(params):
+    """Readable key of the sidebar filters in effect, e.g. 'location=Chennai, status=Completed'."""
+    chosen = [f"{name}={params[name]}" for name in fq.FILTERS if params.get(name) is not None]
+    return ', '.join(chosen) or 'All'
+
+
+def result_size(result):
+    """(rows, bytes) of a DataFrame, a (columns, rows, ...) tuple or a single row as a dict."""
+    if hasattr(result, 'memory_usage'):
+        return len(result), int(result.memory_usage(index=False, deep=True).sum())
+    if isinstance(result, dict):
+        rows = [tuple(result.values())]
+    else:
+        rows = result[1]
+    return len(rows), sum(len(str(v).encode()) for row in rows for v in row)
+
+
+class _Series:
+    """Rolling window of samples for one key."""
+
+    def __init__(self, window):
+        self.calls = 0
+        self.samples = deque(maxlen=window)
+
+    def add(self, sample):
+        self.calls += 1
+        self.samples.append(sample)
+
+    def summary(self):
+        ms, steps, rows, size = np.array(self.samples, dtype=np.float64).T
+        summary = {'calls': self.calls, 'window': len(self.samples)}
+        summary.update({f'p{p}_ms': round(float(v), 3) for p, v in zip(PERCENTILES, np.percentile(ms, PERCENTILES))})
+        summary.update({'max_ms': round(float(ms.max()), 3), 'mean_steps': int(steps.mean()),
+                        'mean_rows': round(float(rows.mean()), 1), 'mean_bytes': int(size.mean())})
+        return summary
+
+
+class QueryMonitor:
+    """Latency, VM step, row and byte statistics of the queries run through observe()."""
+
+    def __init__(self, window=WINDOW, slow_ms=SLOW_MS, slow_log_size=SLOW_LOG_SIZE,
+                 export_path=EXPORT_PATH, export_interval=EXPORT_INTERVAL):
+        self.window = window
+        self.slow_ms = slow_ms
+        self.export_path = export_path
+        self.export_interval = export_interval
+        self._analyses = {}
+        self._filter_sets = {}
+        self._slow = deque(maxlen=slow_log_size)
+        self._lock = threading.Lock()
+        self._exported = 0.0
+
+    def observe(self, conn, analysis, params, statement, run):
+        """
+        Call run() (which queries conn) and record it under analysis. statement
+        is the SQL that run() executes, used for the slow log's query plan; None
+        when the call does not go through SQLite.
+        """
+        ticks = [0]
+
+        def tick():
+            ticks[0] += 1
+
+        conn.set_progress_handler(tick, STEP_GRANULARITY)
+        start = time.perf_counter()
+        try:
+            result = run()
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            conn.set_progress_handler(None, 0)
+        rows, size = result_size(result)
+        self.record(analysis, params, elapsed, ticks[0] * STEP_GRANULARITY, rows, size,
+                    conn=conn, statement=statement)
+        return result
+
+    def record(self, analysis, params, ms, steps, rows, size, conn=None, statement=None):
+        sample = (ms, steps, rows, size)
+        key = (analysis, filter_set(params))
+        with self._lock:
+            self._analyses.setdefault(analysis, _Series(self.window)).add(sample)
+            self._filter_sets.setdefault(key, _Series(self.window)).add(sample)
+        if ms >= self.slow_ms:
+            plan = None
+            if conn is not None and statement is not None:
+                plan = [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + statement, params)]
+            entry = {'at': time.strftime('%Y-%m-%d %H:%M:%S'), 'analysis': analysis, 'filters': key[1],
+                     'ms': round(ms, 3), 'steps': steps, 'rows': rows, 'bytes': size, 'plan': plan}
+            with self._lock:
+                self._slow.append(entry)
+        if self.export_path and time.monotonic() - self._exported >= self.export_interval:
+            self.export(self.export_path)
+
+    def snapshot(self):
+        """Every summary and the slow log as plain data, slowest p95 first."""
+        with self._lock:
+            analyses = [dict(analysis=name, **series.summary()) for name, series in self._analyses.items()]
+            filter_sets = [dict(analysis=name, filters=filters, **series.summary())
+                           for (name, filters), series in self._filter_sets.items()]
+            slow = list(self._slow)
+        return {
+            'generated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'slow_ms': self.slow_ms,
+            'analyses': sorted(analyses, key=lambda s: -s['p95_ms']),
+            'filter_sets': sorted(filter_sets, key=lambda s: -s['p95_ms']),
+            'slow_queries': slow[::-1],
+        }
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2)
+
+    def export(self, path):
+        """Write to_json() to path atomically, so a scraper never reads half a file."""
+        self._exported = time.monotonic()
+        directory = os.path.dirname(os.path.abspath(path))
+        with tempfile.NamedTemporaryFile('w', dir=directory, suffix='.tmp', delete=False) as f:
+            f.write(self.to_json())
+        os.replace(f.name, path)
+
+    def reset(self):
+        with self._lock:
+            self._analyses.clear()
+            self._filter_sets.clear()
+            self._slow.clear()
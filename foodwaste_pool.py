@@ -0,0 +1,107 @@
+"""
+Process-wide pool of read-only SQLite connections for the dashboards.
+
+Streamlit runs every rerun of every session on its own script thread. The
+pool lends each thread one connection for as long as the thread lives and
+takes it back when the thread ends, so a rerun never pays for connect(),
+PRAGMA setup or a cold page cache: it reuses a connection that earlier reruns
+have already warmed. Two sessions never share a connection, so their queries
+run side by side instead of queueing on one connection's mutex.
+
+Connections are opened with a `mode=ro` URI and `PRAGMA query_only`, so a
+dashboard bug cannot write to the database, and they read the file through
+mmap so every connection shares the OS page cache. Writers (migrations,
+imports, foodwaste_claims) keep their own connections.
+"""
+
+import sqlite3 as sql
+import threading
+import weakref
+from urllib.parse import quote
+
+import foodwaste_queries as fq
+
+# Bytes of the database file read through mmap instead of read()
+MMAP_SIZE = 256 * 1024 * 1024
+# Private page cache of each connection, in KiB
+CACHE_SIZE_KIB = 65_536
+# Idle connections kept for later threads; extra ones are closed when returned
+MAX_IDLE = 8
+
+
+class _Lease:
+    """Held in a thread-local slot; when the thread ends the lease is dropped and its connection returned."""
+
+    def __init__(self, conn, checkin):
+        self.conn = conn
+        self.returned = weakref.finalize(self, checkin, conn)
+
+
+class ReadPool:
+    """Read-only connections to one database, one per thread, reused across threads."""
+
+    def __init__(self, path=fq.DATABASE, max_idle=MAX_IDLE):
+        self.path = path
+        self.max_idle = max_idle
+        self.opened = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._idle = []
+        self._all = set()
+        self._closed = False
+
+    def _open(self):
+        uri = f"file:{quote(self.path)}?mode=ro"
+        conn = sql.connect(uri, uri=True, check_same_thread=False, cached_statements=fq.STATEMENT_CACHE_SIZE)
+        conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+        conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    def _checkout(self):
+        with self._lock:
+            if self._closed:
+                raise sql.ProgrammingError("the connection pool is closed")
+            if self._idle:
+                return self._idle.pop()
+            self.opened += 1
+        conn = self._open()
+        with self._lock:
+            self._all.add(conn)
+        return conn
+
+    def _checkin(self, conn):
+        with self._lock:
+            if not self._closed and len(self._idle) < self.max_idle:
+                if conn.in_transaction:
+                    conn.rollback()
+                self._idle.append(conn)
+                return
+            self._all.discard(conn)
+        conn.close()
+
+    def connection(self):
+        """The calling thread's connection, taken from the pool on first use."""
+        lease = getattr(self._local, 'lease', None)
+        if lease is None:
+            lease = self._local.lease = _Lease(self._checkout(), self._checkin)
+        return lease.conn
+
+    def release(self):
+        """Give the calling thread's connection back before the thread ends."""
+        lease = getattr(self._local, 'lease', None)
+        if lease is not None:
+            del self._local.lease
+            lease.returned()
+
+    def stats(self):
+        with self._lock:
+            return {'opened': self.opened, 'open': len(self._all), 'idle': len(self._idle)}
+
+    def close(self):
+        """Close every connection the pool has opened, idle or lent out."""
+        with self._lock:
+            self._closed = True
+            connections, self._all, self._idle = list(self._all), set(), []
+        for conn in connections:
+            conn.close()
@@ -0,0 +1,184 @@
+"""
+Background warmup and speculative prefetch of analysis results.
+
+Users tend to step through the analysis selectbox in order. A Prefetcher
+keeps a bounded, process-wide LRU cache of analysis results keyed by
+(analysis, bound parameters, data version) and a small thread pool that fills
+it ahead of time. The app calls prefetch() once at process start with every
+analysis for the default 'All' filters, and again after each interaction with
+the analyses next to the one on screen, for the filters the user has selected.
+
+get() serves from the cache, waits for a background computation that has
+already started, or computes the result in the caller's thread. stats()
+reports the hit rate, and how much background work was wasted (prefetched
+results evicted or invalidated before anyone read them).
+
+invalidate() drops the results a data change can alter (see
+foodwaste_changes). A computation of such a result that is still running
+when the change is seen is returned to its caller but not cached.
+
+Set FOODWASTE_PREFETCH=off to turn it off; get() then always computes.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Results kept across all sessions
+CAPACITY = 128
+WORKERS = 2
+# Analyses on each side of the current one to prefetch
+DEPTH = 1
+
+
+def enabled():
+    """Whether FOODWASTE_PREFETCH allows background work."""
+    setting = os.environ.get('FOODWASTE_PREFETCH', 'on').lower()
+    if setting not in ('on', 'off'):
+        raise ValueError(f"FOODWASTE_PREFETCH must be 'on' or 'off', not {setting!r}")
+    return setting == 'on'
+
+
+def neighbours(options, current, depth=DEPTH):
+    """The options within depth places of current, nearest first, after before."""
+    i = options.index(current)
+    around = []
+    for step in range(1, depth + 1):
+        around += [options[j] for j in (i + step, i - step) if 0 <= j < len(options)]
+    return around
+
+
+class Prefetcher:
+    """
+    compute(analysis, params) produces a result in whatever thread calls it;
+    background calls run on the pool's threads. Cached results are shared
+    between sessions, so callers must copy them before changing them.
+    """
+
+    def __init__(self, compute, capacity=CAPACITY, workers=WORKERS, active=None):
+        self.compute = compute
+        self.capacity = capacity
+        self.active = enabled() if active is None else active
+        self._results = OrderedDict()  # key -> [result, prefetched, used]
+        self._pending = {}
+        self._running = {}  # key -> [computations in progress, invalidated since they started]
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix='prefetch') if self.active else None
+        self.counts = dict.fromkeys(('requests', 'hits', 'joined', 'misses', 'prefetched', 'wasted', 'errors',
+                                     'invalidated'), 0)
+
+    @staticmethod
+    def key(analysis, params, version):
+        return analysis, tuple(sorted(params.items())), version
+
+    def _start(self, key):
+        with self._lock:
+            self._running.setdefault(key, [0, False])[0] += 1
+
+    def _finish(self, key):
+        """Caller holds the lock. Whether the result of the computation may be cached."""
+        running = self._running[key]
+        running[0] -= 1
+        if not running[0]:
+            del self._running[key]
+        return not running[1]
+
+    def _store(self, key, result, prefetched):
+        """Caller holds the lock."""
+        self._results[key] = [result, prefetched, not prefetched]
+        self._results.move_to_end(key)
+        while len(self._results) > self.capacity:
+            _, (_, was_prefetched, used) = self._results.popitem(last=False)
+            if was_prefetched and not used:
+                self.counts['wasted'] += 1
+
+    def get(self, analysis, params, version):
+        key = self.key(analysis, params, version)
+        with self._lock:
+            self.counts['requests'] += 1
+            entry = self._results.get(key)
+            if entry is not None:
+                self._results.move_to_end(key)
+                entry[2] = True
+                self.counts['hits'] += 1
+                return entry[0]
+            future = self._pending.get(key)
+            # A queued job that has not started yet is cheaper to run right here
+            if future is not None and future.cancel():
+                del self._pending[key]
+                future = None
+        if future is not None:
+            try:
+                result = future.result()
+            except Exception:
+                pass  # counted in errors; compute it here instead
+            else:
+                with self._lock:
+                    self.counts['joined'] += 1
+                    entry = self._results.get(key)
+                    if entry is not None:
+                        entry[2] = True
+                return result
+        self._start(key)
+        try:
+            result = self.compute(analysis, params)
+        finally:
+            with self._lock:
+                fresh = self._finish(key)
+        with self._lock:
+            self.counts['misses'] += 1
+            if fresh:
+                self._store(key, result, prefetched=False)
+        return result
+
+    def _background(self, key, analysis, params):
+        self._start(key)
+        try:
+            result = self.compute(analysis, params)
+        except Exception:
+            with self._lock:
+                self._finish(key)
+                self.counts['errors'] += 1
+                self._pending.pop(key, None)
+            raise
+        with self._lock:
+            self.counts['prefetched'] += 1
+            self._pending.pop(key, None)
+            if self._finish(key):
+                self._store(key, result, prefetched=True)
+        return result
+
+    def prefetch(self, requests, version):
+        """Queue (analysis, params) pairs that are neither cached nor already queued."""
+        if not self.active:
+            return
+        with self._lock:
+            for analysis, params in requests:
+                key = self.key(analysis, params, version)
+                if key not in self._results and key not in self._pending:
+                    self._pending[key] = self._executor.submit(self._background, key, analysis, params)
+
+    def invalidate(self, match=lambda key: True):
+        """Drop every cached result whose key satisfies match, and keep running computations of one from caching it."""
+        with self._lock:
+            for key in [k for k in self._results if match(k)]:
+                _, prefetched, used = self._results.pop(key)
+                self.counts['invalidated'] += 1
+                if prefetched and not used:
+                    self.counts['wasted'] += 1
+            for key, running in self._running.items():
+                if match(key):
+                    running[1] = True
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self.counts, cached=len(self._results), queued=len(self._pending), active=self.active)
+        served = stats['hits'] + stats['joined']
+        stats['hit_rate'] = served / stats['requests'] if stats['requests'] else 0.0
+        stats['waste_rate'] = stats['wasted'] / stats['prefetched'] if stats['prefetched'] else 0.0
+        return stats
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,348 @@
+"""
+Shared SQL for the food waste dashboards.
+
+Every analysis in foodwaste_management_app2.py is written here once, as a
+single parameterized statement. The sidebar filters are bound as named
+parameters (None meaning 'All'), so the statement text never changes between
+filter combinations and sqlite3 can reuse the prepared statement from its
+per-connection statement cache instead of parsing and planning it again.
+"""
+
+import sqlite3 as sql
+
+import foodwaste_cube
+
+DATABASE = 'database.db'
+
+# Sidebar filters, in the order they appear in the app
+FILTERS = ('status', 'provider_type', 'receiver_type', 'food_type', 'meal_type', 'location')
+
+# Large enough to hold every statement below plus the ad-hoc ones in the apps
+STATEMENT_CACHE_SIZE = 256
+
+
+def connect(path=DATABASE):
+    """Open a connection that can be shared by every Streamlit session thread."""
+    return sql.connect(path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+
+
+def filter_params(status='All', provider_type='All', receiver_type='All',
+                  food_type='All', meal_type='All', location='All', **extra):
+    """Turn the sidebar selections into bound parameters ('All' becomes NULL)."""
+    selected = dict(status=status, provider_type=provider_type, receiver_type=receiver_type,
+                    food_type=food_type, meal_type=meal_type, location=location)
+    params = {name: (None if value == 'All' else value) for name, value in selected.items()}
+    params.update(extra)
+    return params
+
+
+# Filter -> the dimension table holding its values (migration 16)
+FILTER_DIMENSIONS = {'status': 'dim_status', 'provider_type': 'dim_provider_type',
+                     'receiver_type': 'dim_receiver_type', 'food_type': 'dim_food_type',
+                     'meal_type': 'dim_meal_type', 'location': 'dim_city', 'city': 'dim_city'}
+
+
+def id_of(name, value=None):
+    """SQL for the ID of the value bound to :name (or of the SQL literal value) in its filter's dimension table."""
+    return f"(SELECT ID FROM {FILTER_DIMENSIONS[name]} WHERE Value = {value or ':' + name})"
+
+
+def bind_ids(conn, params):
+    """
+    params plus the ID of each sidebar filter's value, as :<filter>_id (NULL
+    for 'All' or a value the dimension does not hold), for where() to compare
+    the *_ID columns with. Bound rather than looked up in the statement:
+    SQLite leaves a term with a subquery out of its join Bloom filters.
+    """
+    names = [name for name in FILTERS if name in params]
+    if not names:
+        return dict(params)
+    ids = conn.execute("SELECT " + ', '.join(id_of(name) for name in names), params).fetchone()
+    return dict(params, **{f"{name}_id": value for name, value in zip(names, ids)})
+
+
+def where(**columns):
+    """
+    Render one predicate per filter, e.g. where(food_type='T2.Food_type') gives
+    "AND (:food_type IS NULL OR T2.Food_type = :food_type)". An *_ID column is
+    compared with the value's ID instead, :food_type_id (see bind_ids).
+    """
+    return ''.join(
+        f"\n    AND (:{name} IS NULL OR {column} = :{name}{'_id' if column.endswith('_ID') else ''})"
+        for name, column in columns.items()
+    )
+
+
+# --- Key Metrics ---
+METRICS = {
+    'Number of Providers': """
+    SELECT COUNT(DISTINCT Provider_ID)
+    FROM provider_data
+    WHERE 1=1""" + where(provider_type='Type_ID') + ";",
+
+    'Number of Receivers': """
+    SELECT COUNT(DISTINCT Receiver_ID)
+    FROM receivers_data
+    WHERE 1=1""" + where(receiver_type='Type_ID') + ";",
+
+    'Number of Claims': """
+    SELECT COUNT(T1.Claim_ID)
+    FROM claims_data AS T1
+    JOIN food_listings_data AS T2 ON T1.Food_ID = T2.Food_ID
+    JOIN receivers_data AS T3 ON T1.Receiver_ID = T3.Receiver_ID
+    WHERE 1=1""" + where(status='T1.Status_ID', receiver_type='T3.Type_ID', food_type='T2.Food_type_ID',
+                         meal_type='T2.Meal_Type_ID', location='T2.Location_ID') + ";",
+
+    'Total Quantity (Units)': """
+    SELECT SUM(T1.Quantity)
+    FROM food_listings_data AS T1
+    JOIN provider_data AS T2 ON T1.Provider_ID = T2.Provider_ID
+    WHERE 1=1""" + where(provider_type='T2.Type_ID', food_type='T1.Food_type_ID',
+                         meal_type='T1.Meal_Type_ID', location='T1.Location_ID') + ";",
+}
+
+
+# --- Analyses ---
+# Keyed by the label shown in the analysis selectbox. 'Contact Information by City'
+# is split in two because it shows a provider and a receiver table, each bound to
+# its own :city parameter.
+ANALYSES = {
+    # From the per-city counts in city_stats (foodwaste_cities). Same rows as joining
+    # provider_data to receivers_data on City: every city with a matching provider,
+    # and with a matching receiver too when a receiver Type is selected.
+    'Number of Food Providers and Receivers in Each City': """
+    SELECT
+        NULLIF(p.City, '') AS City,
+        p.Providers AS Number_of_Providers,
+        IFNULL(r.Receivers, 0) AS Number_of_Receivers
+    FROM city_stats AS p
+    LEFT JOIN city_stats AS r
+        ON r.Provider_Type = 'All' AND r.Receiver_Type = IFNULL(:receiver_type, 'All') AND r.City = p.City
+    WHERE p.Provider_Type = IFNULL(:provider_type, 'All') AND p.Receiver_Type = 'All'
+        AND p.Providers > 0
+        AND (:receiver_type IS NULL OR r.Receivers > 0)
+    ORDER BY p.City;
+    """,
+
+    'Percentage of Food Providers by Type': """
+    SELECT
+        Type,
+        COUNT(*) AS Number_of_Providers
+    FROM provider_data
+    WHERE 1=1""" + where(provider_type='Type_ID') + """
+    GROUP BY Type_ID
+    ORDER BY Number_of_Providers DESC;
+    """,
+
+    'Provider Contact Information': """
+    SELECT
+        Name,
+        Contact,
+        Type
+    FROM provider_data
+    WHERE City_ID = """ + id_of('city') + where(provider_type='Type_ID') + ";",
+
+    'Receiver Contact Information': """
+    SELECT
+        Name,
+        Contact,
+        Type
+    FROM receivers_data
+    WHERE City_ID = """ + id_of('city') + where(receiver_type='Type_ID') + ";",
+
+    'Receivers with the Most Claims': """
+    SELECT T1.Name, COUNT(*) AS Number_of_Claims
+    FROM receivers_data AS T1
+    JOIN claims_data AS T2 ON T1.Receiver_ID = T2.Receiver_ID
+    JOIN food_listings_data AS T3 ON T2.Food_ID = T3.Food_ID
+    WHERE 1=1""" + where(receiver_type='T1.Type_ID', status='T2.Status_ID', food_type='T3.Food_type_ID',
+                         meal_type='T3.Meal_Type_ID', location='T3.Location_ID') + """
+    GROUP BY T1.Name
+    ORDER BY Number_of_Claims DESC;
+    """,
+
+    'Receivers with the Most Completed Claims': """
+    SELECT T1.Name, COUNT(*) AS Number_of_Claims
+    FROM receivers_data AS T1
+    JOIN claims_data AS T2 ON T1.Receiver_ID = T2.Receiver_ID
+    JOIN food_listings_data AS T3 ON T2.Food_ID = T3.Food_ID
+    WHERE T2.Status_ID = """ + id_of('status', "'Completed'") + where(
+        receiver_type='T1.Type_ID', food_type='T3.Food_type_ID', meal_type='T3.Meal_Type_ID',
+        location='T3.Location_ID') + """
+    GROUP BY T1.Name
+    ORDER BY Number_of_Claims DESC;
+    """,
+
+    'Total Quantity of Food Available from All Providers': """
+    SELECT SUM(Quantity) AS Total_Quantity
+    FROM food_listings_data
+    WHERE 1=1""" + where(provider_type='Provider_Type_ID', food_type='Food_type_ID',
+                         meal_type='Meal_Type_ID', location='Location_ID') + ";",
+
+    'Location with the Highest Number of Food Listings': """
+    SELECT Location, COUNT(*) AS Number_of_Listings
+    FROM food_listings_data
+    WHERE 1=1""" + where(provider_type='Provider_Type_ID', food_type='Food_type_ID',
+                         meal_type='Meal_Type_ID', location='Location_ID') + """
+    GROUP BY Location_ID
+    ORDER BY Number_of_Listings DESC
+    LIMIT 1;
+    """,
+
+    'Cities with the Highest Number of Food Listings (Top 20)': """
+    SELECT T1.City, COUNT(T2.Food_ID) AS Number_of_Listings
+    FROM provider_data AS T1
+    JOIN food_listings_data AS T2 ON T1.Provider_ID = T2.Provider_ID
+    WHERE 1=1""" + where(provider_type='T1.Type_ID', food_type='T2.Food_type_ID',
+                         meal_type='T2.Meal_Type_ID', location='T2.Location_ID') + """
+    GROUP BY T1.City_ID
+    ORDER BY Number_of_Listings DESC
+    LIMIT 20;
+    """,
+
+    'Most Commonly Available Food Types': """
+    SELECT Food_type, COUNT(*) AS Number_of_Listings
+    FROM food_listings_data
+    WHERE 1=1""" + where(provider_type='Provider_Type_ID', food_type='Food_type_ID',
+                         meal_type='Meal_Type_ID', location='Location_ID') + """
+    GROUP BY Food_type_ID
+    ORDER BY Number_of_Listings DESC;
+    """,
+
+    'Number of Food Claims for Each Food Item': """
+    SELECT
+        T1.Food_ID,
+        T2.Food_Name,
+        COUNT(T1.Claim_ID) AS Number_of_Claims
+    FROM claims_data AS T1
+    JOIN food_listings_data AS T2 ON T1.Food_ID = T2.Food_ID
+    WHERE 1=1""" + where(status='T1.Status_ID', food_type='T2.Food_type_ID',
+                         meal_type='T2.Meal_Type_ID', location='T2.Location_ID') + """
+    GROUP BY T1.Food_ID, T2.Food_Name
+    ORDER BY Number_of_Claims DESC;
+    """,
+
+    'Providers with the Highest Number of Successful Food Claims (Top 20)': """
+    SELECT T2.Name, COUNT(T1.Claim_ID) AS Number_of_Claims
+    FROM claims_data AS T1
+    JOIN food_listings_data AS T3 ON T1.Food_ID = T3.Food_ID
+    JOIN provider_data AS T2 ON T3.Provider_ID = T2.Provider_ID
+    WHERE T1.Status_ID = """ + id_of('status', "'Completed'") + where(
+        provider_type='T2.Type_ID', food_type='T3.Food_type_ID', meal_type='T3.Meal_Type_ID',
+        location='T3.Location_ID') + """
+    GROUP BY T2.Name
+    ORDER BY Number_of_Claims DESC
+    LIMIT 20;
+    """,
+
+    # Numerator and filtered denominator from metrics_cube (foodwaste_cube)
+    'Percentage of Food Claims by Status': foodwaste_cube.claim_shares('Status', order_by='Status'),
+
+    'Average Quantity of Food Claimed per Receiver': """
+    SELECT
+        T2.Name AS Receiver_Name,
+        AVG(T3.Quantity) AS Average_Quantity
+    FROM claims_data AS T1
+    JOIN receivers_data AS T2 ON T1.Receiver_ID = T2.Receiver_ID
+    JOIN food_listings_data AS T3 ON T1.Food_ID = T3.Food_ID
+    WHERE 1=1""" + where(status='T1.Status_ID', receiver_type='T2.Type_ID', food_type='T3.Food_type_ID',
+                         meal_type='T3.Meal_Type_ID', location='T3.Location_ID') + """
+    GROUP BY T2.Name
+    ORDER BY Average_Quantity DESC;
+    """,
+
+    'Percentage of Food Claims by Meal Type': foodwaste_cube.claim_shares(
+        'Meal_Type', order_by='Number_of_Claims DESC, Meal_Type'),
+
+    'Total Quantity of Food Donated by Each Provider': """
+    SELECT T1.Name, SUM(T2.Quantity) AS Total_Quantity
+    FROM provider_data AS T1
+    JOIN food_listings_data AS T2 ON T1.Provider_ID = T2.Provider_ID
+    WHERE 1=1""" + where(provider_type='T1.Type_ID', food_type='T2.Food_type_ID',
+                         meal_type='T2.Meal_Type_ID', location='T2.Location_ID') + """
+    GROUP BY T1.Name ORDER BY Total_Quantity DESC;
+    """,
+
+    'Number of Food Listings and Claims Over Time': """
+    SELECT
+        date(T1.Timestamp_Day * 86400, 'unixepoch') AS Date,
+        COUNT(T1.Claim_ID) AS Number_of_Claims,
+        0 AS Number_of_Listings
+    FROM claims_data AS T1
+    JOIN food_listings_data AS T2 ON T1.Food_ID = T2.Food_ID
+    JOIN receivers_data AS T3 ON T1.Receiver_ID = T3.Receiver_ID
+    WHERE 1=1""" + where(status='T1.Status_ID', receiver_type='T3.Type_ID', food_type='T2.Food_type_ID',
+                         meal_type='T2.Meal_Type_ID', location='T2.Location_ID') + """
+    GROUP BY T1.Timestamp_Day
+
+    UNION ALL
+
+    SELECT
+        date(T1.Expiry_Day * 86400, 'unixepoch') AS Date,
+        0 AS Number_of_Claims,
+        COUNT(T1.Food_ID) AS Number_of_Listings
+    FROM food_listings_data AS T1
+    JOIN provider_data AS T2 ON T1.Provider_ID = T2.Provider_ID
+    WHERE 1=1""" + where(provider_type='T2.Type_ID', food_type='T1.Food_type_ID',
+                         meal_type='T1.Meal_Type_ID', location='T1.Location_ID') + """
+    GROUP BY T1.Expiry_Day
+    ORDER BY Date;
+    """,
+
+    'Number of Food Claims by Status Over Time': """
+    SELECT
+        date(T1.Timestamp_Day * 86400, 'unixepoch') AS Date,
+        T1.Status,
+        COUNT(T1.Claim_ID) AS Number_of_Claims
+    FROM claims_data AS T1
+    JOIN food_listings_data AS T2 ON T1.Food_ID = T2.Food_ID
+    JOIN receivers_data AS T3 ON T1.Receiver_ID = T3.Receiver_ID
+    WHERE 1=1""" + where(status='T1.Status_ID', receiver_type='T3.Type_ID', food_type='T2.Food_type_ID',
+                         meal_type='T2.Meal_Type_ID', location='T2.Location_ID') + """
+    GROUP BY T1.Timestamp_Day, T1.Status_ID
+    ORDER BY T1.Timestamp_Day, T1.Status;
+    """,
+
+    'Number of Food Listings by Provider Type Over Time': """
+    SELECT
+        date(T1.Expiry_Day * 86400, 'unixepoch') AS Date,
+        T1.Provider_Type,
+        COUNT(T1.Food_ID) AS Number_of_Listings
+    FROM food_listings_data AS T1
+    JOIN provider_data AS T2 ON T1.Provider_ID = T2.Provider_ID
+    WHERE 1=1""" + where(provider_type='T1.Provider_Type_ID', food_type='T1.Food_type_ID',
+                         meal_type='T1.Meal_Type_ID', location='T1.Location_ID') + """
+    GROUP BY T1.Expiry_Day, T1.Provider_Type_ID
+    ORDER BY T1.Expiry_Day, T1.Provider_Type;
+    """,
+
+    'Total Quantity Donated by Provider (Top 20)': """
+    SELECT T1.Name, SUM(T2.Quantity) AS Total_Quantity
+    FROM provider_data AS T1
+    JOIN food_listings_data AS T2 ON T1.Provider_ID = T2.Provider_ID
+    WHERE 1=1""" + where(provider_type='T1.Type_ID', food_type='T2.Food_type_ID',
+                         meal_type='T2.Meal_Type_ID', location='T2.Location_ID') + """
+    GROUP BY T1.Name ORDER BY Total_Quantity DESC LIMIT 20;
+    """,
+
+    'Total Quantity Claimed by Receiver (Top 20)': """
+    SELECT
+        T2.Name AS Receiver_Name,
+        SUM(T3.Quantity) AS Total_Quantity
+    FROM claims_data AS T1
+    JOIN receivers_data AS T2 ON T1.Receiver_ID = T2.Receiver_ID
+    JOIN food_listings_data AS T3 ON T1.Food_ID = T3.Food_ID
+    WHERE 1=1""" + where(status='T1.Status_ID', receiver_type='T2.Type_ID', food_type='T3.Food_type_ID',
+                         meal_type='T3.Meal_Type_ID', location='T3.Location_ID') + """
+    GROUP BY T2.Name
+    ORDER BY Total_Quantity DESC
+    LIMIT 20;
+    """,
+}
+
+
+def fetch(conn, statement, params):
+    """Run a statement with bound parameters and return (columns, rows)."""
+    cursor = conn.execute(statement, params)
+    columns = [d[0] for d in cursor.description]
+    return columns, cursor.fetchall()
@@ -0,0 +1,184 @@
+"""
+Day, week and month rollups for the over-time analyses.
+
+claims_rollup and listings_rollup hold one row per (grain, period, filter
+dimensions) with the number of claims or listings in it. Triggers keep them
+current as the base tables change, so the time-series charts read only the
+rollup rows for the chosen granularity and date range instead of calling
+strftime() on every base row.
+"""
+
+import foodwaste_cube
+import foodwaste_queries as fq
+
+GRAINS = ('day', 'week', 'month')
+
+# Period key of a timestamp at each grain; weeks start on Monday
+PERIODS = {
+    'day': "date({})",
+    'week': "date({}, '-6 days', 'weekday 1')",
+    'month': "strftime('%Y-%m-01', {})",
+}
+
+ROLLUPS = {
+    'claims_rollup': {
+        'dimensions': ('Status', 'Receiver_Type', 'Food_type', 'Meal_Type', 'Location'),
+        'measure': 'Claims',
+        'source': """
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM {claims} AS c
+        JOIN {listings} AS l ON l.Food_ID = c.Food_ID
+        JOIN {receivers} AS r ON r.Receiver_ID = c.Receiver_ID""",
+    },
+    'listings_rollup': {
+        # Provider_Type is the provider's Type; Listing_Provider_Type is the listing's own column
+        'dimensions': ('Provider_Type', 'Listing_Provider_Type', 'Food_type', 'Meal_Type', 'Location'),
+        'measure': 'Listings',
+        'source': """
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM {listings} AS l
+        JOIN {providers} AS p ON p.Provider_ID = l.Provider_ID""",
+    },
+}
+
+# Base table -> (placeholder, columns the rollups read, rollups that depend on it)
+TABLES = {
+    'claims_data': ('claims', ('Claim_ID', 'Food_ID', 'Receiver_ID', 'Status', 'Timestamp'), ('claims_rollup',)),
+    'food_listings_data': ('listings', ('Food_ID', 'Expiry_Date', 'Provider_ID', 'Provider_Type', 'Food_type',
+                                        'Meal_Type', 'Location'), ('claims_rollup', 'listings_rollup')),
+    'provider_data': ('providers', ('Provider_ID', 'Type'), ('listings_rollup',)),
+    'receivers_data': ('receivers', ('Receiver_ID', 'Type'), ('claims_rollup',)),
+}
+
+
+def apply_delta(rollup, source, sign='+'):
+    """
+    Add (or subtract) the rows of a source into the rollup, once per grain.
+    Rows are not grouped first: the upsert merges the rows that fall in the
+    same cell, which costs less than sorting every row by its cell.
+    """
+    spec = ROLLUPS[rollup]
+    dims, measure = spec['dimensions'], spec['measure']
+    period = 'CASE g.Grain ' + ' '.join(
+        f"WHEN '{grain}' THEN {expr.format('s.Ts')}" for grain, expr in PERIODS.items()) + ' END'
+    grains = ' UNION ALL '.join(f"SELECT '{grain}' AS Grain" for grain in GRAINS)
+    return f"""
+    INSERT INTO {rollup} (Grain, Period, {', '.join(dims)}, {measure})
+    SELECT g.Grain, IFNULL({period}, ''), {', '.join(f"IFNULL(s.{d}, '')" for d in dims)}, {sign}s.{measure}
+    FROM ({source}) AS s, ({grains}) AS g
+    WHERE true
+    ON CONFLICT DO UPDATE SET {measure} = {measure} + excluded.{measure};
+    """
+
+
+def triggers(when=''):
+    """CREATE TRIGGER statements feeding the rollups, each with an optional WHEN clause."""
+    names = {placeholder: table for table, (placeholder, _, _) in TABLES.items()}
+    script = ''
+    for table, (placeholder, columns, rollups) in TABLES.items():
+        def deltas(ref, sign):
+            tables = dict(names, **{placeholder: foodwaste_cube.row_subquery(ref, columns)})
+            return ''.join(apply_delta(r, ROLLUPS[r]['source'].format(**tables), sign) for r in rollups)
+
+        script += f"""
+    CREATE TRIGGER trg_rollup_{table}_insert AFTER INSERT ON {table}{when}
+    BEGIN{deltas('NEW', '+')}
+    END;
+    CREATE TRIGGER trg_rollup_{table}_delete AFTER DELETE ON {table}{when}
+    BEGIN{deltas('OLD', '-')}
+    END;
+    CREATE TRIGGER trg_rollup_{table}_update AFTER UPDATE OF {', '.join(columns)} ON {table}{when}
+    BEGIN{deltas('OLD', '-')}{deltas('NEW', '+')}
+    END;
+    """
+    return script
+
+
+def _tables():
+    names = {placeholder: table for table, (placeholder, _, _) in TABLES.items()}
+    script = ''
+    for rollup, spec in ROLLUPS.items():
+        dims = spec['dimensions']
+        script += f"""
+    CREATE TABLE {rollup} (
+        Grain TEXT NOT NULL,
+        Period TEXT NOT NULL,
+        {', '.join(d + ' TEXT NOT NULL' for d in dims)},
+        {spec['measure']} INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (Grain, Period, {', '.join(dims)})
+    ) WITHOUT ROWID;
+    {apply_delta(rollup, spec['source'].format(**names))}
+    """
+    return script
+
+
+SCHEMA = _tables() + triggers()
+
+# Only periods overlapping [:start, :end] are read; NULL leaves that end open
+RANGE = """Grain = :grain
+    AND (:start IS NULL OR Period >= CASE :grain """ + ' '.join(
+    f"WHEN '{grain}' THEN {expr.format(':start')}" for grain, expr in PERIODS.items()) + """ END)
+    AND (:end IS NULL OR Period <= :end)"""
+
+# Rollup versions of the over-time analyses in foodwaste_queries.ANALYSES. With
+# grain 'day' and an open range they return exactly the same rows.
+ANALYSES = {
+    'Number of Food Listings and Claims Over Time': """
+    SELECT
+        Period AS Date,
+        SUM(Claims) AS Number_of_Claims,
+        0 AS Number_of_Listings
+    FROM claims_rollup
+    WHERE """ + RANGE + fq.where(status='Status', receiver_type='Receiver_Type', food_type='Food_type',
+                                 meal_type='Meal_Type', location='Location') + """
+    GROUP BY Period
+    HAVING SUM(Claims) > 0
+
+    UNION ALL
+
+    SELECT
+        Period AS Date,
+        0 AS Number_of_Claims,
+        SUM(Listings) AS Number_of_Listings
+    FROM listings_rollup
+    WHERE """ + RANGE + fq.where(provider_type='Provider_Type', food_type='Food_type',
+                                 meal_type='Meal_Type', location='Location') + """
+    GROUP BY Period
+    HAVING SUM(Listings) > 0
+    ORDER BY Date;
+    """,
+
+    'Number of Food Claims by Status Over Time': """
+    SELECT
+        Period AS Date,
+        Status,
+        SUM(Claims) AS Number_of_Claims
+    FROM claims_rollup
+    WHERE """ + RANGE + fq.where(status='Status', receiver_type='Receiver_Type', food_type='Food_type',
+                                 meal_type='Meal_Type', location='Location') + """
+    GROUP BY Period, Status
+    HAVING SUM(Claims) > 0
+    ORDER BY Period, Status;
+    """,
+
+    'Number of Food Listings by Provider Type Over Time': """
+    SELECT
+        Period AS Date,
+        Listing_Provider_Type AS Provider_Type,
+        SUM(Listings) AS Number_of_Listings
+    FROM listings_rollup
+    WHERE """ + RANGE + fq.where(provider_type='Listing_Provider_Type', food_type='Food_type',
+                                 meal_type='Meal_Type', location='Location') + """
+    GROUP BY Period, Listing_Provider_Type
+    HAVING SUM(Listings) > 0
+    ORDER BY Period, Listing_Provider_Type;
+    """,
+}
+
+
+def range_params(grain='day', start=None, end=None):
+    """Extra bound parameters for the rollup analyses; start/end are dates or ISO strings."""
+    return {'grain': grain, 'start': None if start is None else str(start),
+            'end': None if end is None else str(end)}
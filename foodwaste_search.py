@@ -0,0 +1,144 @@
+"""
+Substring search over provider and receiver contacts.
+
+provider_search and receiver_search are FTS5 tables with the trigram
+tokenizer over the text columns of provider_data and receivers_data. They
+are external-content tables: the index points at the base rows by
+Provider_ID / Receiver_ID and stores no copy of the text. Any run of three or
+more characters of a name, address, city or phone number is then an index
+lookup instead of a LIKE '%...%' scan of every row, and matches come back
+ranked by bm25 with Name weighted highest.
+
+Each word of the search text is a separate term and a row must contain every
+term, in any of its columns. Words shorter than MIN_LENGTH cannot be looked up
+in a trigram index and are ignored. bm25 scores are relative to each table's
+own statistics, so providers and receivers are merged by score as a good
+approximation, not an exact ranking.
+
+Scoring is most of the cost of a search, so only the first CANDIDATES
+matches of each table that pass the sidebar Type filter are scored. A
+search with fewer matches is ranked exactly. A broad one, such as a word
+that is in every tenth name, returns the best of those candidates in a few
+milliseconds instead of scoring every match.
+
+Triggers keep both indexes in step with their tables. Bulk imports never
+write providers or receivers, so they are not guarded by bulk_load.
+
+    python foodwaste_search.py "market street" [database.db] [--limit N]
+"""
+
+import sys
+
+import foodwaste_queries as fq
+
+MIN_LENGTH = 3
+LIMIT = 20
+# Matches per table scored with bm25; a search matching more ranks only the first ones, in key order
+CANDIDATES = 1000
+
+COLUMNS = ('Kind', 'ID', 'Name', 'Type', 'Address', 'City', 'Contact')
+
+# FTS table -> (base table, key, indexed columns, bm25 weight of each column)
+TABLES = {
+    'provider_search': ('provider_data', 'Provider_ID', ('Name', 'Address', 'City', 'Contact'), (10, 2, 5, 1)),
+    'receiver_search': ('receivers_data', 'Receiver_ID', ('Name', 'City', 'Contact'), (10, 5, 1)),
+}
+
+
+def _entry(name, ref, delete=False):
+    """Statement adding the row ref (NEW or OLD) to the index, or removing it."""
+    table, key, columns, _ = TABLES[name]
+    targets = ['rowid', *columns]
+    values = [f'{ref}.{key}'] + [f'{ref}.{c}' for c in columns]
+    if delete:
+        targets, values = [name] + targets, ["'delete'"] + values
+    return f"""
+        INSERT INTO {name} ({', '.join(targets)}) VALUES ({', '.join(values)});"""
+
+
+def index(name):
+    """Statements creating one search index and filling it from its table."""
+    table, key, columns, weights = TABLES[name]
+    return f"""
+    CREATE VIRTUAL TABLE {name} USING fts5(
+        {', '.join(columns)}, content='{table}', content_rowid='{key}', tokenize='trigram');
+    INSERT INTO {name} ({name}, rank) VALUES ('rank', 'bm25({', '.join(f'{w:.1f}' for w in weights)})');
+    INSERT INTO {name} ({name}) VALUES ('rebuild');
+    """
+
+
+def triggers(name):
+    table, key, columns, _ = TABLES[name]
+    return f"""
+    CREATE TRIGGER trg_{name}_insert AFTER INSERT ON {table}
+    BEGIN{_entry(name, 'NEW')}
+    END;
+    CREATE TRIGGER trg_{name}_delete AFTER DELETE ON {table}
+    BEGIN{_entry(name, 'OLD', delete=True)}
+    END;
+    CREATE TRIGGER trg_{name}_update AFTER UPDATE OF {', '.join((key,) + columns)} ON {table}
+    BEGIN{_entry(name, 'OLD', delete=True)}{_entry(name, 'NEW')}
+    END;
+    """
+
+
+INDEXES = ''.join(index(name) for name in TABLES)
+SCHEMA = INDEXES + ''.join(triggers(name) for name in TABLES)
+
+
+def _matches(kind, name, type_filter):
+    table, key, _, _ = TABLES[name]
+    address = 't.Address' if 'Address' in TABLES[name][2] else 'NULL'
+    return f"""
+        SELECT * FROM (
+            SELECT '{kind}' AS Kind, t.{key} AS ID, t.Name, t.Type, {address} AS Address, t.City, t.Contact,
+                   {name}.rank AS Score
+            FROM {name}
+            JOIN {table} AS t ON t.{key} = {name}.rowid
+            WHERE {name} MATCH :query""" + fq.where(**{type_filter: 't.Type_ID'}) + f"""
+            LIMIT :candidates
+        )"""
+
+
+SEARCH = f"""
+    SELECT {', '.join(COLUMNS)}
+    FROM ({_matches('Provider', 'provider_search', 'provider_type')}
+        UNION ALL{_matches('Receiver', 'receiver_search', 'receiver_type')}
+    )
+    ORDER BY Score, Kind, ID
+    LIMIT :limit;
+    """
+
+
+def match_query(text):
+    """FTS5 query requiring every searchable word of text, or None when there is none."""
+    terms = [word for word in text.split() if len(word) >= MIN_LENGTH]
+    return ' '.join('"' + term.replace('"', '""') + '"' for term in terms) or None
+
+
+def search_params(text, params=None, limit=LIMIT, candidates=CANDIDATES):
+    """Bound parameters of SEARCH: the sidebar filters (see foodwaste_queries.filter_params), query and limits."""
+    return dict(params or fq.filter_params(), query=match_query(text), limit=limit, candidates=candidates)
+
+
+def search(conn, text, params=None, limit=LIMIT, candidates=CANDIDATES):
+    """The best matches for text among providers and receivers, as (columns, rows)."""
+    bound = search_params(text, fq.bind_ids(conn, params or fq.filter_params()), limit, candidates)
+    if bound['query'] is None:
+        return list(COLUMNS), []
+    return fq.fetch(conn, SEARCH, bound)
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    limit = LIMIT
+    if '--limit' in args:
+        i = args.index('--limit')
+        limit = int(args[i + 1])
+        del args[i:i + 2]
+    if not args:
+        sys.exit(__doc__)
+    columns, rows = search(fq.connect(args[1] if len(args) > 1 else fq.DATABASE), args[0], limit=limit)
+    print(' | '.join(columns))
+    for row in rows:
+        print(' | '.join('' if v is None else str(v) for v in row))
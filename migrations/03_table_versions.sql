@@ -0,0 +1,63 @@
+-- Migration 3: per-table write counters and row counts
+-- Frozen when released; never edit, append a new migration instead.
+    CREATE TABLE table_versions (
+        name TEXT PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0,
+        row_count INTEGER NOT NULL DEFAULT 0
+    );
+
+    INSERT INTO table_versions (name, row_count) SELECT 'provider_data', COUNT(*) FROM provider_data;
+    INSERT INTO table_versions (name, row_count) SELECT 'receivers_data', COUNT(*) FROM receivers_data;
+    INSERT INTO table_versions (name, row_count) SELECT 'food_listings_data', COUNT(*) FROM food_listings_data;
+    INSERT INTO table_versions (name, row_count) SELECT 'claims_data', COUNT(*) FROM claims_data;
+    CREATE TRIGGER trg_version_provider_data_insert AFTER INSERT ON provider_data
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count + 1 WHERE name = 'provider_data';
+    END;
+    CREATE TRIGGER trg_version_provider_data_delete AFTER DELETE ON provider_data
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count - 1 WHERE name = 'provider_data';
+    END;
+    CREATE TRIGGER trg_version_provider_data_update AFTER UPDATE ON provider_data
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE name = 'provider_data';
+    END;
+
+    CREATE TRIGGER trg_version_receivers_data_insert AFTER INSERT ON receivers_data
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count + 1 WHERE name = 'receivers_data';
+    END;
+    CREATE TRIGGER trg_version_receivers_data_delete AFTER DELETE ON receivers_data
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count - 1 WHERE name = 'receivers_data';
+    END;
+    CREATE TRIGGER trg_version_receivers_data_update AFTER UPDATE ON receivers_data
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE name = 'receivers_data';
+    END;
+
+    CREATE TRIGGER trg_version_food_listings_data_insert AFTER INSERT ON food_listings_data
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count + 1 WHERE name = 'food_listings_data';
+    END;
+    CREATE TRIGGER trg_version_food_listings_data_delete AFTER DELETE ON food_listings_data
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count - 1 WHERE name = 'food_listings_data';
+    END;
+    CREATE TRIGGER trg_version_food_listings_data_update AFTER UPDATE ON food_listings_data
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE name = 'food_listings_data';
+    END;
+
+    CREATE TRIGGER trg_version_claims_data_insert AFTER INSERT ON claims_data
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count + 1 WHERE name = 'claims_data';
+    END;
+    CREATE TRIGGER trg_version_claims_data_delete AFTER DELETE ON claims_data
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count - 1 WHERE name = 'claims_data';
+    END;
+    CREATE TRIGGER trg_version_claims_data_update AFTER UPDATE ON claims_data
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE name = 'claims_data';
+    END;
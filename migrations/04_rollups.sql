@@ -0,0 +1,315 @@
+-- Migration 4: day, week and month rollups for the over-time analyses
+-- Frozen when released; never edit, append a new migration instead.
+    CREATE TABLE claims_rollup (
+        Grain TEXT NOT NULL,
+        Period TEXT NOT NULL,
+        Status TEXT NOT NULL, Receiver_Type TEXT NOT NULL, Food_type TEXT NOT NULL, Meal_Type TEXT NOT NULL, Location TEXT NOT NULL,
+        Claims INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location)
+    ) WITHOUT ROWID;
+    
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    
+    CREATE TABLE listings_rollup (
+        Grain TEXT NOT NULL,
+        Period TEXT NOT NULL,
+        Provider_Type TEXT NOT NULL, Listing_Provider_Type TEXT NOT NULL, Food_type TEXT NOT NULL, Meal_Type TEXT NOT NULL, Location TEXT NOT NULL,
+        Listings INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location)
+    ) WITHOUT ROWID;
+    
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM food_listings_data AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    
+    CREATE TRIGGER trg_rollup_claims_data_insert AFTER INSERT ON claims_data
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM (SELECT NEW.Claim_ID AS Claim_ID, NEW.Food_ID AS Food_ID, NEW.Receiver_ID AS Receiver_ID, NEW.Status AS Status, NEW.Timestamp AS Timestamp) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    END;
+    CREATE TRIGGER trg_rollup_claims_data_delete AFTER DELETE ON claims_data
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM (SELECT OLD.Claim_ID AS Claim_ID, OLD.Food_ID AS Food_ID, OLD.Receiver_ID AS Receiver_ID, OLD.Status AS Status, OLD.Timestamp AS Timestamp) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    END;
+    CREATE TRIGGER trg_rollup_claims_data_update AFTER UPDATE OF Claim_ID, Food_ID, Receiver_ID, Status, Timestamp ON claims_data
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM (SELECT OLD.Claim_ID AS Claim_ID, OLD.Food_ID AS Food_ID, OLD.Receiver_ID AS Receiver_ID, OLD.Status AS Status, OLD.Timestamp AS Timestamp) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM (SELECT NEW.Claim_ID AS Claim_ID, NEW.Food_ID AS Food_ID, NEW.Receiver_ID AS Receiver_ID, NEW.Status AS Status, NEW.Timestamp AS Timestamp) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    END;
+    
+    CREATE TRIGGER trg_rollup_food_listings_data_insert AFTER INSERT ON food_listings_data
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN (SELECT NEW.Food_ID AS Food_ID, NEW.Expiry_Date AS Expiry_Date, NEW.Provider_ID AS Provider_ID, NEW.Provider_Type AS Provider_Type, NEW.Food_type AS Food_type, NEW.Meal_Type AS Meal_Type, NEW.Location AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM (SELECT NEW.Food_ID AS Food_ID, NEW.Expiry_Date AS Expiry_Date, NEW.Provider_ID AS Provider_ID, NEW.Provider_Type AS Provider_Type, NEW.Food_type AS Food_type, NEW.Meal_Type AS Meal_Type, NEW.Location AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    END;
+    CREATE TRIGGER trg_rollup_food_listings_data_delete AFTER DELETE ON food_listings_data
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN (SELECT OLD.Food_ID AS Food_ID, OLD.Expiry_Date AS Expiry_Date, OLD.Provider_ID AS Provider_ID, OLD.Provider_Type AS Provider_Type, OLD.Food_type AS Food_type, OLD.Meal_Type AS Meal_Type, OLD.Location AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM (SELECT OLD.Food_ID AS Food_ID, OLD.Expiry_Date AS Expiry_Date, OLD.Provider_ID AS Provider_ID, OLD.Provider_Type AS Provider_Type, OLD.Food_type AS Food_type, OLD.Meal_Type AS Meal_Type, OLD.Location AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    END;
+    CREATE TRIGGER trg_rollup_food_listings_data_update AFTER UPDATE OF Food_ID, Expiry_Date, Provider_ID, Provider_Type, Food_type, Meal_Type, Location ON food_listings_data
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN (SELECT OLD.Food_ID AS Food_ID, OLD.Expiry_Date AS Expiry_Date, OLD.Provider_ID AS Provider_ID, OLD.Provider_Type AS Provider_Type, OLD.Food_type AS Food_type, OLD.Meal_Type AS Meal_Type, OLD.Location AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM (SELECT OLD.Food_ID AS Food_ID, OLD.Expiry_Date AS Expiry_Date, OLD.Provider_ID AS Provider_ID, OLD.Provider_Type AS Provider_Type, OLD.Food_type AS Food_type, OLD.Meal_Type AS Meal_Type, OLD.Location AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN (SELECT NEW.Food_ID AS Food_ID, NEW.Expiry_Date AS Expiry_Date, NEW.Provider_ID AS Provider_ID, NEW.Provider_Type AS Provider_Type, NEW.Food_type AS Food_type, NEW.Meal_Type AS Meal_Type, NEW.Location AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM (SELECT NEW.Food_ID AS Food_ID, NEW.Expiry_Date AS Expiry_Date, NEW.Provider_ID AS Provider_ID, NEW.Provider_Type AS Provider_Type, NEW.Food_type AS Food_type, NEW.Meal_Type AS Meal_Type, NEW.Location AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    END;
+    
+    CREATE TRIGGER trg_rollup_provider_data_insert AFTER INSERT ON provider_data
+    BEGIN
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM food_listings_data AS l
+        JOIN (SELECT NEW.Provider_ID AS Provider_ID, NEW.Type AS Type) AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    END;
+    CREATE TRIGGER trg_rollup_provider_data_delete AFTER DELETE ON provider_data
+    BEGIN
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM food_listings_data AS l
+        JOIN (SELECT OLD.Provider_ID AS Provider_ID, OLD.Type AS Type) AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    END;
+    CREATE TRIGGER trg_rollup_provider_data_update AFTER UPDATE OF Provider_ID, Type ON provider_data
+    BEGIN
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM food_listings_data AS l
+        JOIN (SELECT OLD.Provider_ID AS Provider_ID, OLD.Type AS Type) AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM food_listings_data AS l
+        JOIN (SELECT NEW.Provider_ID AS Provider_ID, NEW.Type AS Type) AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    END;
+    
+    CREATE TRIGGER trg_rollup_receivers_data_insert AFTER INSERT ON receivers_data
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT NEW.Receiver_ID AS Receiver_ID, NEW.Type AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    END;
+    CREATE TRIGGER trg_rollup_receivers_data_delete AFTER DELETE ON receivers_data
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT OLD.Receiver_ID AS Receiver_ID, OLD.Type AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    END;
+    CREATE TRIGGER trg_rollup_receivers_data_update AFTER UPDATE OF Receiver_ID, Type ON receivers_data
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT OLD.Receiver_ID AS Receiver_ID, OLD.Type AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT NEW.Receiver_ID AS Receiver_ID, NEW.Type AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    END;
+    
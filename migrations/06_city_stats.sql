@@ -0,0 +1,112 @@
+-- Migration 6: per-city provider and receiver counts
+-- Frozen when released; never edit, append a new migration instead.
+    CREATE TABLE city_stats (
+        Provider_Type TEXT NOT NULL,
+        Receiver_Type TEXT NOT NULL,
+        City TEXT NOT NULL,
+        Providers INTEGER NOT NULL DEFAULT 0,
+        Receivers INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (Provider_Type, Receiver_Type, City)
+    ) WITHOUT ROWID;
+    
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, 'All', s.City, +COUNT(*), 0
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM provider_data) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT 'All', CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, s.City, 0, +COUNT(*)
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM receivers_data) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    
+    CREATE TRIGGER trg_city_provider_data_insert AFTER INSERT ON provider_data
+    BEGIN
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, 'All', s.City, +COUNT(*), 0
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT NEW.Type AS Type, NEW.City AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    END;
+    CREATE TRIGGER trg_city_provider_data_delete AFTER DELETE ON provider_data
+    BEGIN
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, 'All', s.City, -COUNT(*), 0
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT OLD.Type AS Type, OLD.City AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    END;
+    CREATE TRIGGER trg_city_provider_data_update AFTER UPDATE OF Type, City ON provider_data
+    BEGIN
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, 'All', s.City, -COUNT(*), 0
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT OLD.Type AS Type, OLD.City AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, 'All', s.City, +COUNT(*), 0
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT NEW.Type AS Type, NEW.City AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    END;
+    
+    CREATE TRIGGER trg_city_receivers_data_insert AFTER INSERT ON receivers_data
+    BEGIN
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT 'All', CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, s.City, 0, +COUNT(*)
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT NEW.Type AS Type, NEW.City AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    END;
+    CREATE TRIGGER trg_city_receivers_data_delete AFTER DELETE ON receivers_data
+    BEGIN
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT 'All', CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, s.City, 0, -COUNT(*)
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT OLD.Type AS Type, OLD.City AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    END;
+    CREATE TRIGGER trg_city_receivers_data_update AFTER UPDATE OF Type, City ON receivers_data
+    BEGIN
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT 'All', CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, s.City, 0, -COUNT(*)
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT OLD.Type AS Type, OLD.City AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT 'All', CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, s.City, 0, +COUNT(*)
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT NEW.Type AS Type, NEW.City AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    END;
+    
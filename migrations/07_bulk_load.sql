@@ -0,0 +1,1212 @@
+-- Migration 7: let bulk imports bypass the per-row derived-table triggers
+-- Frozen when released; never edit, append a new migration instead.
+    CREATE TABLE bulk_load (name TEXT PRIMARY KEY);
+
+    DROP TRIGGER trg_cube_claims_data_insert;
+    DROP TRIGGER trg_cube_claims_data_delete;
+    DROP TRIGGER trg_cube_claims_data_update;
+    DROP TRIGGER trg_cube_food_listings_data_insert;
+    DROP TRIGGER trg_cube_food_listings_data_delete;
+    DROP TRIGGER trg_cube_food_listings_data_update;
+    DROP TRIGGER trg_cube_provider_data_insert;
+    DROP TRIGGER trg_cube_provider_data_delete;
+    DROP TRIGGER trg_cube_provider_data_update;
+    DROP TRIGGER trg_cube_receivers_data_insert;
+    DROP TRIGGER trg_cube_receivers_data_delete;
+    DROP TRIGGER trg_cube_receivers_data_update;
+    DROP TRIGGER trg_version_provider_data_insert;
+    DROP TRIGGER trg_version_provider_data_delete;
+    DROP TRIGGER trg_version_provider_data_update;
+    DROP TRIGGER trg_version_receivers_data_insert;
+    DROP TRIGGER trg_version_receivers_data_delete;
+    DROP TRIGGER trg_version_receivers_data_update;
+    DROP TRIGGER trg_version_food_listings_data_insert;
+    DROP TRIGGER trg_version_food_listings_data_delete;
+    DROP TRIGGER trg_version_food_listings_data_update;
+    DROP TRIGGER trg_version_claims_data_insert;
+    DROP TRIGGER trg_version_claims_data_delete;
+    DROP TRIGGER trg_version_claims_data_update;
+    DROP TRIGGER trg_rollup_claims_data_insert;
+    DROP TRIGGER trg_rollup_claims_data_delete;
+    DROP TRIGGER trg_rollup_claims_data_update;
+    DROP TRIGGER trg_rollup_food_listings_data_insert;
+    DROP TRIGGER trg_rollup_food_listings_data_delete;
+    DROP TRIGGER trg_rollup_food_listings_data_update;
+    DROP TRIGGER trg_rollup_provider_data_insert;
+    DROP TRIGGER trg_rollup_provider_data_delete;
+    DROP TRIGGER trg_rollup_provider_data_update;
+    DROP TRIGGER trg_rollup_receivers_data_insert;
+    DROP TRIGGER trg_rollup_receivers_data_delete;
+    DROP TRIGGER trg_rollup_receivers_data_update;
+    DROP TRIGGER trg_city_provider_data_insert;
+    DROP TRIGGER trg_city_provider_data_delete;
+    DROP TRIGGER trg_city_provider_data_update;
+    DROP TRIGGER trg_city_receivers_data_insert;
+    DROP TRIGGER trg_city_receivers_data_delete;
+    DROP TRIGGER trg_city_receivers_data_update;
+    CREATE TRIGGER trg_cube_claims_data_insert AFTER INSERT ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        +SUM(s.Providers), +SUM(s.Receivers), +SUM(s.Claims), +SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM (SELECT NEW.Claim_ID AS Claim_ID, NEW.Food_ID AS Food_ID, NEW.Receiver_ID AS Receiver_ID, NEW.Status AS Status) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    CREATE TRIGGER trg_cube_claims_data_delete AFTER DELETE ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        -SUM(s.Providers), -SUM(s.Receivers), -SUM(s.Claims), -SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM (SELECT OLD.Claim_ID AS Claim_ID, OLD.Food_ID AS Food_ID, OLD.Receiver_ID AS Receiver_ID, OLD.Status AS Status) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    CREATE TRIGGER trg_cube_claims_data_update AFTER UPDATE OF Claim_ID, Food_ID, Receiver_ID, Status ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        -SUM(s.Providers), -SUM(s.Receivers), -SUM(s.Claims), -SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM (SELECT OLD.Claim_ID AS Claim_ID, OLD.Food_ID AS Food_ID, OLD.Receiver_ID AS Receiver_ID, OLD.Status AS Status) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        +SUM(s.Providers), +SUM(s.Receivers), +SUM(s.Claims), +SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM (SELECT NEW.Claim_ID AS Claim_ID, NEW.Food_ID AS Food_ID, NEW.Receiver_ID AS Receiver_ID, NEW.Status AS Status) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    
+    CREATE TRIGGER trg_cube_food_listings_data_insert AFTER INSERT ON food_listings_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        +SUM(s.Providers), +SUM(s.Receivers), +SUM(s.Claims), +SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN (SELECT NEW.Food_ID AS Food_ID, NEW.Quantity AS Quantity, NEW.Provider_ID AS Provider_ID, NEW.Food_type AS Food_type, NEW.Meal_Type AS Meal_Type, NEW.Location AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        +SUM(s.Providers), +SUM(s.Receivers), +SUM(s.Claims), +SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM (SELECT NEW.Food_ID AS Food_ID, NEW.Quantity AS Quantity, NEW.Provider_ID AS Provider_ID, NEW.Food_type AS Food_type, NEW.Meal_Type AS Meal_Type, NEW.Location AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    CREATE TRIGGER trg_cube_food_listings_data_delete AFTER DELETE ON food_listings_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        -SUM(s.Providers), -SUM(s.Receivers), -SUM(s.Claims), -SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN (SELECT OLD.Food_ID AS Food_ID, OLD.Quantity AS Quantity, OLD.Provider_ID AS Provider_ID, OLD.Food_type AS Food_type, OLD.Meal_Type AS Meal_Type, OLD.Location AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        -SUM(s.Providers), -SUM(s.Receivers), -SUM(s.Claims), -SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM (SELECT OLD.Food_ID AS Food_ID, OLD.Quantity AS Quantity, OLD.Provider_ID AS Provider_ID, OLD.Food_type AS Food_type, OLD.Meal_Type AS Meal_Type, OLD.Location AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    CREATE TRIGGER trg_cube_food_listings_data_update AFTER UPDATE OF Food_ID, Quantity, Provider_ID, Food_type, Meal_Type, Location ON food_listings_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        -SUM(s.Providers), -SUM(s.Receivers), -SUM(s.Claims), -SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN (SELECT OLD.Food_ID AS Food_ID, OLD.Quantity AS Quantity, OLD.Provider_ID AS Provider_ID, OLD.Food_type AS Food_type, OLD.Meal_Type AS Meal_Type, OLD.Location AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        -SUM(s.Providers), -SUM(s.Receivers), -SUM(s.Claims), -SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM (SELECT OLD.Food_ID AS Food_ID, OLD.Quantity AS Quantity, OLD.Provider_ID AS Provider_ID, OLD.Food_type AS Food_type, OLD.Meal_Type AS Meal_Type, OLD.Location AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        +SUM(s.Providers), +SUM(s.Receivers), +SUM(s.Claims), +SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN (SELECT NEW.Food_ID AS Food_ID, NEW.Quantity AS Quantity, NEW.Provider_ID AS Provider_ID, NEW.Food_type AS Food_type, NEW.Meal_Type AS Meal_Type, NEW.Location AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        +SUM(s.Providers), +SUM(s.Receivers), +SUM(s.Claims), +SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM (SELECT NEW.Food_ID AS Food_ID, NEW.Quantity AS Quantity, NEW.Provider_ID AS Provider_ID, NEW.Food_type AS Food_type, NEW.Meal_Type AS Meal_Type, NEW.Location AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    
+    CREATE TRIGGER trg_cube_provider_data_insert AFTER INSERT ON provider_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        +SUM(s.Providers), +SUM(s.Receivers), +SUM(s.Claims), +SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               1 AS Providers, 0 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT NEW.Provider_ID AS Provider_ID, NEW.Type AS Type) AS p) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        +SUM(s.Providers), +SUM(s.Receivers), +SUM(s.Claims), +SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM food_listings_data AS l
+        JOIN (SELECT NEW.Provider_ID AS Provider_ID, NEW.Type AS Type) AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    CREATE TRIGGER trg_cube_provider_data_delete AFTER DELETE ON provider_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        -SUM(s.Providers), -SUM(s.Receivers), -SUM(s.Claims), -SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               1 AS Providers, 0 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT OLD.Provider_ID AS Provider_ID, OLD.Type AS Type) AS p) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        -SUM(s.Providers), -SUM(s.Receivers), -SUM(s.Claims), -SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM food_listings_data AS l
+        JOIN (SELECT OLD.Provider_ID AS Provider_ID, OLD.Type AS Type) AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    CREATE TRIGGER trg_cube_provider_data_update AFTER UPDATE OF Provider_ID, Type ON provider_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        -SUM(s.Providers), -SUM(s.Receivers), -SUM(s.Claims), -SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               1 AS Providers, 0 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT OLD.Provider_ID AS Provider_ID, OLD.Type AS Type) AS p) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        -SUM(s.Providers), -SUM(s.Receivers), -SUM(s.Claims), -SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM food_listings_data AS l
+        JOIN (SELECT OLD.Provider_ID AS Provider_ID, OLD.Type AS Type) AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        +SUM(s.Providers), +SUM(s.Receivers), +SUM(s.Claims), +SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               1 AS Providers, 0 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT NEW.Provider_ID AS Provider_ID, NEW.Type AS Type) AS p) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        +SUM(s.Providers), +SUM(s.Receivers), +SUM(s.Claims), +SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM food_listings_data AS l
+        JOIN (SELECT NEW.Provider_ID AS Provider_ID, NEW.Type AS Type) AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    
+    CREATE TRIGGER trg_cube_receivers_data_insert AFTER INSERT ON receivers_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        +SUM(s.Providers), +SUM(s.Receivers), +SUM(s.Claims), +SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               0 AS Providers, 1 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT NEW.Receiver_ID AS Receiver_ID, NEW.Type AS Type) AS r) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        +SUM(s.Providers), +SUM(s.Receivers), +SUM(s.Claims), +SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT NEW.Receiver_ID AS Receiver_ID, NEW.Type AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    CREATE TRIGGER trg_cube_receivers_data_delete AFTER DELETE ON receivers_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        -SUM(s.Providers), -SUM(s.Receivers), -SUM(s.Claims), -SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               0 AS Providers, 1 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT OLD.Receiver_ID AS Receiver_ID, OLD.Type AS Type) AS r) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        -SUM(s.Providers), -SUM(s.Receivers), -SUM(s.Claims), -SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT OLD.Receiver_ID AS Receiver_ID, OLD.Type AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    CREATE TRIGGER trg_cube_receivers_data_update AFTER UPDATE OF Receiver_ID, Type ON receivers_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        -SUM(s.Providers), -SUM(s.Receivers), -SUM(s.Claims), -SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               0 AS Providers, 1 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT OLD.Receiver_ID AS Receiver_ID, OLD.Type AS Type) AS r) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        -SUM(s.Providers), -SUM(s.Receivers), -SUM(s.Claims), -SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT OLD.Receiver_ID AS Receiver_ID, OLD.Type AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        +SUM(s.Providers), +SUM(s.Receivers), +SUM(s.Claims), +SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               0 AS Providers, 1 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT NEW.Receiver_ID AS Receiver_ID, NEW.Type AS Type) AS r) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location, Providers, Receivers, Claims, Quantity)
+    SELECT
+        CASE WHEN m.mask & 1 THEN 'All' ELSE s.Status END,
+        CASE WHEN m.mask & 2 THEN 'All' ELSE s.Provider_Type END,
+        CASE WHEN m.mask & 4 THEN 'All' ELSE s.Receiver_Type END,
+        CASE WHEN m.mask & 8 THEN 'All' ELSE s.Food_type END,
+        CASE WHEN m.mask & 16 THEN 'All' ELSE s.Meal_Type END,
+        CASE WHEN m.mask & 32 THEN 'All' ELSE s.Location END,
+        +SUM(s.Providers), +SUM(s.Receivers), +SUM(s.Claims), +SUM(s.Quantity)
+    FROM (SELECT IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, IFNULL(Location, '') AS Location, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT NEW.Receiver_ID AS Receiver_ID, NEW.Type AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s, cube_masks AS m
+    WHERE NOT (m.mask & 1 AND s.Status = 'All')
+      AND NOT (m.mask & 2 AND s.Provider_Type = 'All')
+      AND NOT (m.mask & 4 AND s.Receiver_Type = 'All')
+      AND NOT (m.mask & 8 AND s.Food_type = 'All')
+      AND NOT (m.mask & 16 AND s.Meal_Type = 'All')
+      AND NOT (m.mask & 32 AND s.Location = 'All')
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Location) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    
+    CREATE TRIGGER trg_version_provider_data_insert AFTER INSERT ON provider_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count + 1 WHERE name = 'provider_data';
+    END;
+    CREATE TRIGGER trg_version_provider_data_delete AFTER DELETE ON provider_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count - 1 WHERE name = 'provider_data';
+    END;
+    CREATE TRIGGER trg_version_provider_data_update AFTER UPDATE ON provider_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE name = 'provider_data';
+    END;
+
+    CREATE TRIGGER trg_version_receivers_data_insert AFTER INSERT ON receivers_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count + 1 WHERE name = 'receivers_data';
+    END;
+    CREATE TRIGGER trg_version_receivers_data_delete AFTER DELETE ON receivers_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count - 1 WHERE name = 'receivers_data';
+    END;
+    CREATE TRIGGER trg_version_receivers_data_update AFTER UPDATE ON receivers_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE name = 'receivers_data';
+    END;
+
+    CREATE TRIGGER trg_version_food_listings_data_insert AFTER INSERT ON food_listings_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count + 1 WHERE name = 'food_listings_data';
+    END;
+    CREATE TRIGGER trg_version_food_listings_data_delete AFTER DELETE ON food_listings_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count - 1 WHERE name = 'food_listings_data';
+    END;
+    CREATE TRIGGER trg_version_food_listings_data_update AFTER UPDATE ON food_listings_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE name = 'food_listings_data';
+    END;
+
+    CREATE TRIGGER trg_version_claims_data_insert AFTER INSERT ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count + 1 WHERE name = 'claims_data';
+    END;
+    CREATE TRIGGER trg_version_claims_data_delete AFTER DELETE ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count - 1 WHERE name = 'claims_data';
+    END;
+    CREATE TRIGGER trg_version_claims_data_update AFTER UPDATE ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE name = 'claims_data';
+    END;
+
+    CREATE TRIGGER trg_rollup_claims_data_insert AFTER INSERT ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM (SELECT NEW.Claim_ID AS Claim_ID, NEW.Food_ID AS Food_ID, NEW.Receiver_ID AS Receiver_ID, NEW.Status AS Status, NEW.Timestamp AS Timestamp) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    END;
+    CREATE TRIGGER trg_rollup_claims_data_delete AFTER DELETE ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM (SELECT OLD.Claim_ID AS Claim_ID, OLD.Food_ID AS Food_ID, OLD.Receiver_ID AS Receiver_ID, OLD.Status AS Status, OLD.Timestamp AS Timestamp) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    END;
+    CREATE TRIGGER trg_rollup_claims_data_update AFTER UPDATE OF Claim_ID, Food_ID, Receiver_ID, Status, Timestamp ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM (SELECT OLD.Claim_ID AS Claim_ID, OLD.Food_ID AS Food_ID, OLD.Receiver_ID AS Receiver_ID, OLD.Status AS Status, OLD.Timestamp AS Timestamp) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM (SELECT NEW.Claim_ID AS Claim_ID, NEW.Food_ID AS Food_ID, NEW.Receiver_ID AS Receiver_ID, NEW.Status AS Status, NEW.Timestamp AS Timestamp) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    END;
+    
+    CREATE TRIGGER trg_rollup_food_listings_data_insert AFTER INSERT ON food_listings_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN (SELECT NEW.Food_ID AS Food_ID, NEW.Expiry_Date AS Expiry_Date, NEW.Provider_ID AS Provider_ID, NEW.Provider_Type AS Provider_Type, NEW.Food_type AS Food_type, NEW.Meal_Type AS Meal_Type, NEW.Location AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM (SELECT NEW.Food_ID AS Food_ID, NEW.Expiry_Date AS Expiry_Date, NEW.Provider_ID AS Provider_ID, NEW.Provider_Type AS Provider_Type, NEW.Food_type AS Food_type, NEW.Meal_Type AS Meal_Type, NEW.Location AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    END;
+    CREATE TRIGGER trg_rollup_food_listings_data_delete AFTER DELETE ON food_listings_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN (SELECT OLD.Food_ID AS Food_ID, OLD.Expiry_Date AS Expiry_Date, OLD.Provider_ID AS Provider_ID, OLD.Provider_Type AS Provider_Type, OLD.Food_type AS Food_type, OLD.Meal_Type AS Meal_Type, OLD.Location AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM (SELECT OLD.Food_ID AS Food_ID, OLD.Expiry_Date AS Expiry_Date, OLD.Provider_ID AS Provider_ID, OLD.Provider_Type AS Provider_Type, OLD.Food_type AS Food_type, OLD.Meal_Type AS Meal_Type, OLD.Location AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    END;
+    CREATE TRIGGER trg_rollup_food_listings_data_update AFTER UPDATE OF Food_ID, Expiry_Date, Provider_ID, Provider_Type, Food_type, Meal_Type, Location ON food_listings_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN (SELECT OLD.Food_ID AS Food_ID, OLD.Expiry_Date AS Expiry_Date, OLD.Provider_ID AS Provider_ID, OLD.Provider_Type AS Provider_Type, OLD.Food_type AS Food_type, OLD.Meal_Type AS Meal_Type, OLD.Location AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM (SELECT OLD.Food_ID AS Food_ID, OLD.Expiry_Date AS Expiry_Date, OLD.Provider_ID AS Provider_ID, OLD.Provider_Type AS Provider_Type, OLD.Food_type AS Food_type, OLD.Meal_Type AS Meal_Type, OLD.Location AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN (SELECT NEW.Food_ID AS Food_ID, NEW.Expiry_Date AS Expiry_Date, NEW.Provider_ID AS Provider_ID, NEW.Provider_Type AS Provider_Type, NEW.Food_type AS Food_type, NEW.Meal_Type AS Meal_Type, NEW.Location AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM (SELECT NEW.Food_ID AS Food_ID, NEW.Expiry_Date AS Expiry_Date, NEW.Provider_ID AS Provider_ID, NEW.Provider_Type AS Provider_Type, NEW.Food_type AS Food_type, NEW.Meal_Type AS Meal_Type, NEW.Location AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    END;
+    
+    CREATE TRIGGER trg_rollup_provider_data_insert AFTER INSERT ON provider_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM food_listings_data AS l
+        JOIN (SELECT NEW.Provider_ID AS Provider_ID, NEW.Type AS Type) AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    END;
+    CREATE TRIGGER trg_rollup_provider_data_delete AFTER DELETE ON provider_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM food_listings_data AS l
+        JOIN (SELECT OLD.Provider_ID AS Provider_ID, OLD.Type AS Type) AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    END;
+    CREATE TRIGGER trg_rollup_provider_data_update AFTER UPDATE OF Provider_ID, Type ON provider_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM food_listings_data AS l
+        JOIN (SELECT OLD.Provider_ID AS Provider_ID, OLD.Type AS Type) AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM food_listings_data AS l
+        JOIN (SELECT NEW.Provider_ID AS Provider_ID, NEW.Type AS Type) AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    END;
+    
+    CREATE TRIGGER trg_rollup_receivers_data_insert AFTER INSERT ON receivers_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT NEW.Receiver_ID AS Receiver_ID, NEW.Type AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    END;
+    CREATE TRIGGER trg_rollup_receivers_data_delete AFTER DELETE ON receivers_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT OLD.Receiver_ID AS Receiver_ID, OLD.Type AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    END;
+    CREATE TRIGGER trg_rollup_receivers_data_update AFTER UPDATE OF Receiver_ID, Type ON receivers_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT OLD.Receiver_ID AS Receiver_ID, OLD.Type AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT NEW.Receiver_ID AS Receiver_ID, NEW.Type AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    END;
+    
+    CREATE TRIGGER trg_city_provider_data_insert AFTER INSERT ON provider_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, 'All', s.City, +COUNT(*), 0
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT NEW.Type AS Type, NEW.City AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    END;
+    CREATE TRIGGER trg_city_provider_data_delete AFTER DELETE ON provider_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, 'All', s.City, -COUNT(*), 0
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT OLD.Type AS Type, OLD.City AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    END;
+    CREATE TRIGGER trg_city_provider_data_update AFTER UPDATE OF Type, City ON provider_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, 'All', s.City, -COUNT(*), 0
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT OLD.Type AS Type, OLD.City AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, 'All', s.City, +COUNT(*), 0
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT NEW.Type AS Type, NEW.City AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    END;
+    
+    CREATE TRIGGER trg_city_receivers_data_insert AFTER INSERT ON receivers_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT 'All', CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, s.City, 0, +COUNT(*)
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT NEW.Type AS Type, NEW.City AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    END;
+    CREATE TRIGGER trg_city_receivers_data_delete AFTER DELETE ON receivers_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT 'All', CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, s.City, 0, -COUNT(*)
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT OLD.Type AS Type, OLD.City AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    END;
+    CREATE TRIGGER trg_city_receivers_data_update AFTER UPDATE OF Type, City ON receivers_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT 'All', CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, s.City, 0, -COUNT(*)
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT OLD.Type AS Type, OLD.City AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT 'All', CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, s.City, 0, +COUNT(*)
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT NEW.Type AS Type, NEW.City AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    END;
+    
@@ -0,0 +1,95 @@
+-- Migration 9: available listings by Location and expiry
+-- Frozen when released; never edit, append a new migration instead.
+    CREATE TABLE expiry_queue (
+        Location TEXT NOT NULL,
+        Expiry_Epoch INTEGER NOT NULL,
+        Food_ID INTEGER NOT NULL,
+        PRIMARY KEY (Location, Expiry_Epoch, Food_ID)
+    ) WITHOUT ROWID;
+    CREATE INDEX idx_expiry_queue_epoch ON expiry_queue (Expiry_Epoch, Food_ID);
+
+    INSERT INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+    SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+    FROM food_listings_data AS l
+    WHERE l.Expiry_Epoch IS NOT NULL
+      AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+
+    CREATE TRIGGER trg_expiry_listings_insert AFTER INSERT ON food_listings_data
+    BEGIN
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = NEW.Food_ID);
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = NEW.Food_ID
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+    END;
+    CREATE TRIGGER trg_expiry_listings_delete AFTER DELETE ON food_listings_data
+    BEGIN
+        DELETE FROM expiry_queue
+        WHERE Location = IFNULL(OLD.Location, '') AND Expiry_Epoch = OLD.Expiry_Epoch AND Food_ID = OLD.Food_ID;
+    END;
+    CREATE TRIGGER trg_expiry_listings_update AFTER UPDATE OF Food_ID, Location, Expiry_Date ON food_listings_data
+    BEGIN
+        DELETE FROM expiry_queue
+        WHERE Location = IFNULL(OLD.Location, '') AND Expiry_Epoch = OLD.Expiry_Epoch AND Food_ID = OLD.Food_ID;
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = NEW.Food_ID);
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = NEW.Food_ID
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+    END;
+    CREATE TRIGGER trg_expiry_claims_insert AFTER INSERT ON claims_data
+    WHEN NEW.Status IN ('Completed')
+    BEGIN
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = NEW.Food_ID);
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = NEW.Food_ID
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+    END;
+    CREATE TRIGGER trg_expiry_claims_delete AFTER DELETE ON claims_data
+    WHEN OLD.Status IN ('Completed')
+    BEGIN
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = OLD.Food_ID);
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = OLD.Food_ID
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+    END;
+    CREATE TRIGGER trg_expiry_claims_update AFTER UPDATE OF Food_ID, Status ON claims_data
+    WHEN OLD.Status IN ('Completed') OR NEW.Status IN ('Completed')
+    BEGIN
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = OLD.Food_ID);
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = OLD.Food_ID
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = NEW.Food_ID);
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = NEW.Food_ID
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+    END;
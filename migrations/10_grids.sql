@@ -0,0 +1,55 @@
+-- Migration 10: claims per listing and contact indexes for the paginated grids
+-- Frozen when released; never edit, append a new migration instead.
+    CREATE TABLE item_claims (
+        Status TEXT NOT NULL,
+        Food_ID INTEGER NOT NULL,
+        Claims INTEGER NOT NULL,
+        PRIMARY KEY (Status, Food_ID)
+    ) WITHOUT ROWID;
+    CREATE INDEX idx_item_claims_rank ON item_claims (Status, Claims, Food_ID);
+
+    INSERT INTO item_claims (Status, Food_ID, Claims)
+    SELECT IFNULL(Status, ''), Food_ID, COUNT(*) FROM claims_data WHERE Food_ID IS NOT NULL GROUP BY 1, 2
+    UNION ALL
+    SELECT 'All', Food_ID, COUNT(*) FROM claims_data WHERE Food_ID IS NOT NULL GROUP BY 2;
+
+    CREATE INDEX idx_provider_city_name ON provider_data (City, Name);
+    CREATE INDEX idx_receivers_city_name ON receivers_data (City, Name);
+
+    CREATE TRIGGER trg_item_claims_insert AFTER INSERT ON claims_data
+    BEGIN
+        INSERT INTO item_claims (Status, Food_ID, Claims)
+        SELECT s.Status, NEW.Food_ID, +1
+        FROM (SELECT IFNULL(NEW.Status, '') AS Status UNION ALL SELECT 'All') AS s
+        WHERE NEW.Food_ID IS NOT NULL
+        ON CONFLICT (Status, Food_ID) DO UPDATE SET Claims = Claims + excluded.Claims;
+        DELETE FROM item_claims
+        WHERE Status IN (IFNULL(NEW.Status, ''), 'All') AND Food_ID = NEW.Food_ID AND Claims = 0;
+    END;
+    CREATE TRIGGER trg_item_claims_delete AFTER DELETE ON claims_data
+    BEGIN
+        INSERT INTO item_claims (Status, Food_ID, Claims)
+        SELECT s.Status, OLD.Food_ID, -1
+        FROM (SELECT IFNULL(OLD.Status, '') AS Status UNION ALL SELECT 'All') AS s
+        WHERE OLD.Food_ID IS NOT NULL
+        ON CONFLICT (Status, Food_ID) DO UPDATE SET Claims = Claims + excluded.Claims;
+        DELETE FROM item_claims
+        WHERE Status IN (IFNULL(OLD.Status, ''), 'All') AND Food_ID = OLD.Food_ID AND Claims = 0;
+    END;
+    CREATE TRIGGER trg_item_claims_update AFTER UPDATE OF Food_ID, Status ON claims_data
+    BEGIN
+        INSERT INTO item_claims (Status, Food_ID, Claims)
+        SELECT s.Status, OLD.Food_ID, -1
+        FROM (SELECT IFNULL(OLD.Status, '') AS Status UNION ALL SELECT 'All') AS s
+        WHERE OLD.Food_ID IS NOT NULL
+        ON CONFLICT (Status, Food_ID) DO UPDATE SET Claims = Claims + excluded.Claims;
+        DELETE FROM item_claims
+        WHERE Status IN (IFNULL(OLD.Status, ''), 'All') AND Food_ID = OLD.Food_ID AND Claims = 0;
+        INSERT INTO item_claims (Status, Food_ID, Claims)
+        SELECT s.Status, NEW.Food_ID, +1
+        FROM (SELECT IFNULL(NEW.Status, '') AS Status UNION ALL SELECT 'All') AS s
+        WHERE NEW.Food_ID IS NOT NULL
+        ON CONFLICT (Status, Food_ID) DO UPDATE SET Claims = Claims + excluded.Claims;
+        DELETE FROM item_claims
+        WHERE Status IN (IFNULL(NEW.Status, ''), 'All') AND Food_ID = NEW.Food_ID AND Claims = 0;
+    END;
@@ -0,0 +1,40 @@
+-- Migration 11: trigram search indexes over provider and receiver contacts
+-- Frozen when released; never edit, append a new migration instead.
+    CREATE VIRTUAL TABLE provider_search USING fts5(
+        Name, Address, City, Contact, content='provider_data', content_rowid='Provider_ID', tokenize='trigram');
+    INSERT INTO provider_search (provider_search, rank) VALUES ('rank', 'bm25(10.0, 2.0, 5.0, 1.0)');
+    INSERT INTO provider_search (provider_search) VALUES ('rebuild');
+    
+    CREATE VIRTUAL TABLE receiver_search USING fts5(
+        Name, City, Contact, content='receivers_data', content_rowid='Receiver_ID', tokenize='trigram');
+    INSERT INTO receiver_search (receiver_search, rank) VALUES ('rank', 'bm25(10.0, 5.0, 1.0)');
+    INSERT INTO receiver_search (receiver_search) VALUES ('rebuild');
+    
+    CREATE TRIGGER trg_provider_search_insert AFTER INSERT ON provider_data
+    BEGIN
+        INSERT INTO provider_search (rowid, Name, Address, City, Contact) VALUES (NEW.Provider_ID, NEW.Name, NEW.Address, NEW.City, NEW.Contact);
+    END;
+    CREATE TRIGGER trg_provider_search_delete AFTER DELETE ON provider_data
+    BEGIN
+        INSERT INTO provider_search (provider_search, rowid, Name, Address, City, Contact) VALUES ('delete', OLD.Provider_ID, OLD.Name, OLD.Address, OLD.City, OLD.Contact);
+    END;
+    CREATE TRIGGER trg_provider_search_update AFTER UPDATE OF Provider_ID, Name, Address, City, Contact ON provider_data
+    BEGIN
+        INSERT INTO provider_search (provider_search, rowid, Name, Address, City, Contact) VALUES ('delete', OLD.Provider_ID, OLD.Name, OLD.Address, OLD.City, OLD.Contact);
+        INSERT INTO provider_search (rowid, Name, Address, City, Contact) VALUES (NEW.Provider_ID, NEW.Name, NEW.Address, NEW.City, NEW.Contact);
+    END;
+    
+    CREATE TRIGGER trg_receiver_search_insert AFTER INSERT ON receivers_data
+    BEGIN
+        INSERT INTO receiver_search (rowid, Name, City, Contact) VALUES (NEW.Receiver_ID, NEW.Name, NEW.City, NEW.Contact);
+    END;
+    CREATE TRIGGER trg_receiver_search_delete AFTER DELETE ON receivers_data
+    BEGIN
+        INSERT INTO receiver_search (receiver_search, rowid, Name, City, Contact) VALUES ('delete', OLD.Receiver_ID, OLD.Name, OLD.City, OLD.Contact);
+    END;
+    CREATE TRIGGER trg_receiver_search_update AFTER UPDATE OF Receiver_ID, Name, City, Contact ON receivers_data
+    BEGIN
+        INSERT INTO receiver_search (receiver_search, rowid, Name, City, Contact) VALUES ('delete', OLD.Receiver_ID, OLD.Name, OLD.City, OLD.Contact);
+        INSERT INTO receiver_search (rowid, Name, City, Contact) VALUES (NEW.Receiver_ID, NEW.Name, NEW.City, NEW.Contact);
+    END;
+    
@@ -0,0 +1,146 @@
+-- Migration 12: change log for precise cache invalidation
+-- Frozen when released; never edit, append a new migration instead.
+    CREATE TABLE changelog (
+        Seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        Table_Name TEXT NOT NULL,
+        Row_ID INTEGER,
+        Op TEXT NOT NULL,
+        status TEXT, provider_type TEXT, receiver_type TEXT, food_type TEXT, meal_type TEXT, location TEXT, city TEXT
+    );
+    CREATE TRIGGER trg_changelog_trim AFTER INSERT ON changelog
+    BEGIN
+        DELETE FROM changelog WHERE Seq <= NEW.Seq - 100000;
+    END;
+
+    CREATE TRIGGER trg_changes_claims_data_insert AFTER INSERT ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'claims_data', r.Claim_ID, 'I',
+               IFNULL(r.Status, ''), CASE WHEN l.Provider_Type IS p.Type THEN IFNULL(l.Provider_Type, '') END, IFNULL(v.Type, ''), IFNULL(l.Food_type, ''), IFNULL(l.Meal_Type, ''), IFNULL(l.Location, ''), NULL
+        FROM (SELECT NEW.Claim_ID AS Claim_ID, NEW.Food_ID AS Food_ID, NEW.Receiver_ID AS Receiver_ID, NEW.Status AS Status) AS r
+        LEFT JOIN food_listings_data AS l ON l.Food_ID = r.Food_ID
+        LEFT JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID
+        LEFT JOIN receivers_data AS v ON v.Receiver_ID = r.Receiver_ID;
+    END;
+    CREATE TRIGGER trg_changes_claims_data_delete AFTER DELETE ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'claims_data', r.Claim_ID, 'D',
+               IFNULL(r.Status, ''), CASE WHEN l.Provider_Type IS p.Type THEN IFNULL(l.Provider_Type, '') END, IFNULL(v.Type, ''), IFNULL(l.Food_type, ''), IFNULL(l.Meal_Type, ''), IFNULL(l.Location, ''), NULL
+        FROM (SELECT OLD.Claim_ID AS Claim_ID, OLD.Food_ID AS Food_ID, OLD.Receiver_ID AS Receiver_ID, OLD.Status AS Status) AS r
+        LEFT JOIN food_listings_data AS l ON l.Food_ID = r.Food_ID
+        LEFT JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID
+        LEFT JOIN receivers_data AS v ON v.Receiver_ID = r.Receiver_ID;
+    END;
+    CREATE TRIGGER trg_changes_claims_data_update AFTER UPDATE ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'claims_data', r.Claim_ID, 'U',
+               IFNULL(r.Status, ''), CASE WHEN l.Provider_Type IS p.Type THEN IFNULL(l.Provider_Type, '') END, IFNULL(v.Type, ''), IFNULL(l.Food_type, ''), IFNULL(l.Meal_Type, ''), IFNULL(l.Location, ''), NULL
+        FROM (SELECT OLD.Claim_ID AS Claim_ID, OLD.Food_ID AS Food_ID, OLD.Receiver_ID AS Receiver_ID, OLD.Status AS Status) AS r
+        LEFT JOIN food_listings_data AS l ON l.Food_ID = r.Food_ID
+        LEFT JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID
+        LEFT JOIN receivers_data AS v ON v.Receiver_ID = r.Receiver_ID;
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'claims_data', r.Claim_ID, 'U',
+               IFNULL(r.Status, ''), CASE WHEN l.Provider_Type IS p.Type THEN IFNULL(l.Provider_Type, '') END, IFNULL(v.Type, ''), IFNULL(l.Food_type, ''), IFNULL(l.Meal_Type, ''), IFNULL(l.Location, ''), NULL
+        FROM (SELECT NEW.Claim_ID AS Claim_ID, NEW.Food_ID AS Food_ID, NEW.Receiver_ID AS Receiver_ID, NEW.Status AS Status) AS r
+        LEFT JOIN food_listings_data AS l ON l.Food_ID = r.Food_ID
+        LEFT JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID
+        LEFT JOIN receivers_data AS v ON v.Receiver_ID = r.Receiver_ID;
+    END;
+    
+    CREATE TRIGGER trg_changes_food_listings_data_insert AFTER INSERT ON food_listings_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'food_listings_data', r.Food_ID, 'I',
+               NULL, CASE WHEN r.Provider_Type IS p.Type THEN IFNULL(r.Provider_Type, '') END, NULL, IFNULL(r.Food_type, ''), IFNULL(r.Meal_Type, ''), IFNULL(r.Location, ''), NULL
+        FROM (SELECT NEW.Food_ID AS Food_ID, NEW.Provider_ID AS Provider_ID, NEW.Provider_Type AS Provider_Type, NEW.Food_type AS Food_type, NEW.Meal_Type AS Meal_Type, NEW.Location AS Location) AS r
+        LEFT JOIN provider_data AS p ON p.Provider_ID = r.Provider_ID;
+    END;
+    CREATE TRIGGER trg_changes_food_listings_data_delete AFTER DELETE ON food_listings_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'food_listings_data', r.Food_ID, 'D',
+               NULL, CASE WHEN r.Provider_Type IS p.Type THEN IFNULL(r.Provider_Type, '') END, NULL, IFNULL(r.Food_type, ''), IFNULL(r.Meal_Type, ''), IFNULL(r.Location, ''), NULL
+        FROM (SELECT OLD.Food_ID AS Food_ID, OLD.Provider_ID AS Provider_ID, OLD.Provider_Type AS Provider_Type, OLD.Food_type AS Food_type, OLD.Meal_Type AS Meal_Type, OLD.Location AS Location) AS r
+        LEFT JOIN provider_data AS p ON p.Provider_ID = r.Provider_ID;
+    END;
+    CREATE TRIGGER trg_changes_food_listings_data_update AFTER UPDATE ON food_listings_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'food_listings_data', r.Food_ID, 'U',
+               NULL, CASE WHEN r.Provider_Type IS p.Type THEN IFNULL(r.Provider_Type, '') END, NULL, IFNULL(r.Food_type, ''), IFNULL(r.Meal_Type, ''), IFNULL(r.Location, ''), NULL
+        FROM (SELECT OLD.Food_ID AS Food_ID, OLD.Provider_ID AS Provider_ID, OLD.Provider_Type AS Provider_Type, OLD.Food_type AS Food_type, OLD.Meal_Type AS Meal_Type, OLD.Location AS Location) AS r
+        LEFT JOIN provider_data AS p ON p.Provider_ID = r.Provider_ID;
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'food_listings_data', r.Food_ID, 'U',
+               NULL, CASE WHEN r.Provider_Type IS p.Type THEN IFNULL(r.Provider_Type, '') END, NULL, IFNULL(r.Food_type, ''), IFNULL(r.Meal_Type, ''), IFNULL(r.Location, ''), NULL
+        FROM (SELECT NEW.Food_ID AS Food_ID, NEW.Provider_ID AS Provider_ID, NEW.Provider_Type AS Provider_Type, NEW.Food_type AS Food_type, NEW.Meal_Type AS Meal_Type, NEW.Location AS Location) AS r
+        LEFT JOIN provider_data AS p ON p.Provider_ID = r.Provider_ID;
+    END;
+    
+    CREATE TRIGGER trg_changes_provider_data_insert AFTER INSERT ON provider_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'provider_data', r.Provider_ID, 'I',
+               NULL, IFNULL(r.Type, ''), NULL, NULL, NULL, NULL, IFNULL(r.City, '')
+        FROM (SELECT NEW.Provider_ID AS Provider_ID, NEW.Type AS Type, NEW.City AS City) AS r;
+    END;
+    CREATE TRIGGER trg_changes_provider_data_delete AFTER DELETE ON provider_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'provider_data', r.Provider_ID, 'D',
+               NULL, IFNULL(r.Type, ''), NULL, NULL, NULL, NULL, IFNULL(r.City, '')
+        FROM (SELECT OLD.Provider_ID AS Provider_ID, OLD.Type AS Type, OLD.City AS City) AS r;
+    END;
+    CREATE TRIGGER trg_changes_provider_data_update AFTER UPDATE ON provider_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'provider_data', r.Provider_ID, 'U',
+               NULL, IFNULL(r.Type, ''), NULL, NULL, NULL, NULL, IFNULL(r.City, '')
+        FROM (SELECT OLD.Provider_ID AS Provider_ID, OLD.Type AS Type, OLD.City AS City) AS r;
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'provider_data', r.Provider_ID, 'U',
+               NULL, IFNULL(r.Type, ''), NULL, NULL, NULL, NULL, IFNULL(r.City, '')
+        FROM (SELECT NEW.Provider_ID AS Provider_ID, NEW.Type AS Type, NEW.City AS City) AS r;
+    END;
+    
+    CREATE TRIGGER trg_changes_receivers_data_insert AFTER INSERT ON receivers_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'receivers_data', r.Receiver_ID, 'I',
+               NULL, NULL, IFNULL(r.Type, ''), NULL, NULL, NULL, IFNULL(r.City, '')
+        FROM (SELECT NEW.Receiver_ID AS Receiver_ID, NEW.Type AS Type, NEW.City AS City) AS r;
+    END;
+    CREATE TRIGGER trg_changes_receivers_data_delete AFTER DELETE ON receivers_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'receivers_data', r.Receiver_ID, 'D',
+               NULL, NULL, IFNULL(r.Type, ''), NULL, NULL, NULL, IFNULL(r.City, '')
+        FROM (SELECT OLD.Receiver_ID AS Receiver_ID, OLD.Type AS Type, OLD.City AS City) AS r;
+    END;
+    CREATE TRIGGER trg_changes_receivers_data_update AFTER UPDATE ON receivers_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'receivers_data', r.Receiver_ID, 'U',
+               NULL, NULL, IFNULL(r.Type, ''), NULL, NULL, NULL, IFNULL(r.City, '')
+        FROM (SELECT OLD.Receiver_ID AS Receiver_ID, OLD.Type AS Type, OLD.City AS City) AS r;
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'receivers_data', r.Receiver_ID, 'U',
+               NULL, NULL, IFNULL(r.Type, ''), NULL, NULL, NULL, IFNULL(r.City, '')
+        FROM (SELECT NEW.Receiver_ID AS Receiver_ID, NEW.Type AS Type, NEW.City AS City) AS r;
+    END;
+    
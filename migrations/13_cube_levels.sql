@@ -0,0 +1,466 @@
+-- Migration 13: Key Metrics cube at two Location levels instead of every roll-up
+-- Frozen when released; never edit, append a new migration instead.
+    DROP TRIGGER trg_cube_claims_data_insert;
+    DROP TRIGGER trg_cube_claims_data_delete;
+    DROP TRIGGER trg_cube_claims_data_update;
+    DROP TRIGGER trg_cube_food_listings_data_insert;
+    DROP TRIGGER trg_cube_food_listings_data_delete;
+    DROP TRIGGER trg_cube_food_listings_data_update;
+    DROP TRIGGER trg_cube_provider_data_insert;
+    DROP TRIGGER trg_cube_provider_data_delete;
+    DROP TRIGGER trg_cube_provider_data_update;
+    DROP TRIGGER trg_cube_receivers_data_insert;
+    DROP TRIGGER trg_cube_receivers_data_delete;
+    DROP TRIGGER trg_cube_receivers_data_update;
+    DROP TABLE metrics_cube;
+    DROP TABLE cube_masks;
+
+    CREATE TABLE metrics_cube (
+        Location TEXT NOT NULL, Status TEXT NOT NULL, Provider_Type TEXT NOT NULL, Receiver_Type TEXT NOT NULL, Food_type TEXT NOT NULL, Meal_Type TEXT NOT NULL,
+        Providers INTEGER NOT NULL DEFAULT 0,
+        Receivers INTEGER NOT NULL DEFAULT 0,
+        Claims INTEGER NOT NULL DEFAULT 0,
+        Quantity INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type)
+    ) WITHOUT ROWID;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               1 AS Providers, 0 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM provider_data AS p) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               0 AS Providers, 1 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM receivers_data AS r) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM food_listings_data AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    
+    CREATE TRIGGER trg_cube_claims_data_insert AFTER INSERT ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM (SELECT NEW.Claim_ID AS Claim_ID, NEW.Food_ID AS Food_ID, NEW.Receiver_ID AS Receiver_ID, NEW.Status AS Status) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    CREATE TRIGGER trg_cube_claims_data_delete AFTER DELETE ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM (SELECT OLD.Claim_ID AS Claim_ID, OLD.Food_ID AS Food_ID, OLD.Receiver_ID AS Receiver_ID, OLD.Status AS Status) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    CREATE TRIGGER trg_cube_claims_data_update AFTER UPDATE OF Claim_ID, Food_ID, Receiver_ID, Status ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM (SELECT OLD.Claim_ID AS Claim_ID, OLD.Food_ID AS Food_ID, OLD.Receiver_ID AS Receiver_ID, OLD.Status AS Status) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM (SELECT NEW.Claim_ID AS Claim_ID, NEW.Food_ID AS Food_ID, NEW.Receiver_ID AS Receiver_ID, NEW.Status AS Status) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    
+    CREATE TRIGGER trg_cube_food_listings_data_insert AFTER INSERT ON food_listings_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN (SELECT NEW.Food_ID AS Food_ID, NEW.Quantity AS Quantity, NEW.Provider_ID AS Provider_ID, NEW.Food_type AS Food_type, NEW.Meal_Type AS Meal_Type, NEW.Location AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM (SELECT NEW.Food_ID AS Food_ID, NEW.Quantity AS Quantity, NEW.Provider_ID AS Provider_ID, NEW.Food_type AS Food_type, NEW.Meal_Type AS Meal_Type, NEW.Location AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    CREATE TRIGGER trg_cube_food_listings_data_delete AFTER DELETE ON food_listings_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN (SELECT OLD.Food_ID AS Food_ID, OLD.Quantity AS Quantity, OLD.Provider_ID AS Provider_ID, OLD.Food_type AS Food_type, OLD.Meal_Type AS Meal_Type, OLD.Location AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM (SELECT OLD.Food_ID AS Food_ID, OLD.Quantity AS Quantity, OLD.Provider_ID AS Provider_ID, OLD.Food_type AS Food_type, OLD.Meal_Type AS Meal_Type, OLD.Location AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    CREATE TRIGGER trg_cube_food_listings_data_update AFTER UPDATE OF Food_ID, Quantity, Provider_ID, Food_type, Meal_Type, Location ON food_listings_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN (SELECT OLD.Food_ID AS Food_ID, OLD.Quantity AS Quantity, OLD.Provider_ID AS Provider_ID, OLD.Food_type AS Food_type, OLD.Meal_Type AS Meal_Type, OLD.Location AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM (SELECT OLD.Food_ID AS Food_ID, OLD.Quantity AS Quantity, OLD.Provider_ID AS Provider_ID, OLD.Food_type AS Food_type, OLD.Meal_Type AS Meal_Type, OLD.Location AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN (SELECT NEW.Food_ID AS Food_ID, NEW.Quantity AS Quantity, NEW.Provider_ID AS Provider_ID, NEW.Food_type AS Food_type, NEW.Meal_Type AS Meal_Type, NEW.Location AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM (SELECT NEW.Food_ID AS Food_ID, NEW.Quantity AS Quantity, NEW.Provider_ID AS Provider_ID, NEW.Food_type AS Food_type, NEW.Meal_Type AS Meal_Type, NEW.Location AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    
+    CREATE TRIGGER trg_cube_provider_data_insert AFTER INSERT ON provider_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               1 AS Providers, 0 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT NEW.Provider_ID AS Provider_ID, NEW.Type AS Type) AS p) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM food_listings_data AS l
+        JOIN (SELECT NEW.Provider_ID AS Provider_ID, NEW.Type AS Type) AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    CREATE TRIGGER trg_cube_provider_data_delete AFTER DELETE ON provider_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               1 AS Providers, 0 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT OLD.Provider_ID AS Provider_ID, OLD.Type AS Type) AS p) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM food_listings_data AS l
+        JOIN (SELECT OLD.Provider_ID AS Provider_ID, OLD.Type AS Type) AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    CREATE TRIGGER trg_cube_provider_data_update AFTER UPDATE OF Provider_ID, Type ON provider_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               1 AS Providers, 0 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT OLD.Provider_ID AS Provider_ID, OLD.Type AS Type) AS p) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM food_listings_data AS l
+        JOIN (SELECT OLD.Provider_ID AS Provider_ID, OLD.Type AS Type) AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               1 AS Providers, 0 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT NEW.Provider_ID AS Provider_ID, NEW.Type AS Type) AS p) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM food_listings_data AS l
+        JOIN (SELECT NEW.Provider_ID AS Provider_ID, NEW.Type AS Type) AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    
+    CREATE TRIGGER trg_cube_receivers_data_insert AFTER INSERT ON receivers_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               0 AS Providers, 1 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT NEW.Receiver_ID AS Receiver_ID, NEW.Type AS Type) AS r) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT NEW.Receiver_ID AS Receiver_ID, NEW.Type AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    CREATE TRIGGER trg_cube_receivers_data_delete AFTER DELETE ON receivers_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               0 AS Providers, 1 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT OLD.Receiver_ID AS Receiver_ID, OLD.Type AS Type) AS r) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT OLD.Receiver_ID AS Receiver_ID, OLD.Type AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    CREATE TRIGGER trg_cube_receivers_data_update AFTER UPDATE OF Receiver_ID, Type ON receivers_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               0 AS Providers, 1 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT OLD.Receiver_ID AS Receiver_ID, OLD.Type AS Type) AS r) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT OLD.Receiver_ID AS Receiver_ID, OLD.Type AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               0 AS Providers, 1 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT NEW.Receiver_ID AS Receiver_ID, NEW.Type AS Type) AS r) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT NEW.Receiver_ID AS Receiver_ID, NEW.Type AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+    
@@ -0,0 +1,134 @@
+-- Migration 14: let bulk imports bypass the expiry queue and claims-per-listing triggers
+-- Frozen when released; never edit, append a new migration instead.
+    DROP TRIGGER trg_expiry_listings_insert;
+    DROP TRIGGER trg_expiry_listings_delete;
+    DROP TRIGGER trg_expiry_listings_update;
+    DROP TRIGGER trg_expiry_claims_insert;
+    DROP TRIGGER trg_expiry_claims_delete;
+    DROP TRIGGER trg_expiry_claims_update;
+    DROP TRIGGER trg_item_claims_insert;
+    DROP TRIGGER trg_item_claims_delete;
+    DROP TRIGGER trg_item_claims_update;
+    CREATE TRIGGER trg_expiry_listings_insert AFTER INSERT ON food_listings_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = NEW.Food_ID);
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = NEW.Food_ID
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+    END;
+    CREATE TRIGGER trg_expiry_listings_delete AFTER DELETE ON food_listings_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        DELETE FROM expiry_queue
+        WHERE Location = IFNULL(OLD.Location, '') AND Expiry_Epoch = OLD.Expiry_Epoch AND Food_ID = OLD.Food_ID;
+    END;
+    CREATE TRIGGER trg_expiry_listings_update AFTER UPDATE OF Food_ID, Location, Expiry_Date ON food_listings_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        DELETE FROM expiry_queue
+        WHERE Location = IFNULL(OLD.Location, '') AND Expiry_Epoch = OLD.Expiry_Epoch AND Food_ID = OLD.Food_ID;
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = NEW.Food_ID);
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = NEW.Food_ID
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+    END;
+    CREATE TRIGGER trg_expiry_claims_insert AFTER INSERT ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load) AND (NEW.Status IN ('Completed'))
+    BEGIN
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = NEW.Food_ID);
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = NEW.Food_ID
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+    END;
+    CREATE TRIGGER trg_expiry_claims_delete AFTER DELETE ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load) AND (OLD.Status IN ('Completed'))
+    BEGIN
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = OLD.Food_ID);
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = OLD.Food_ID
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+    END;
+    CREATE TRIGGER trg_expiry_claims_update AFTER UPDATE OF Food_ID, Status ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load) AND (OLD.Status IN ('Completed') OR NEW.Status IN ('Completed'))
+    BEGIN
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = OLD.Food_ID);
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = OLD.Food_ID
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = NEW.Food_ID);
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = NEW.Food_ID
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+    END;
+
+    CREATE TRIGGER trg_item_claims_insert AFTER INSERT ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO item_claims (Status, Food_ID, Claims)
+        SELECT s.Status, NEW.Food_ID, +1
+        FROM (SELECT IFNULL(NEW.Status, '') AS Status UNION ALL SELECT 'All') AS s
+        WHERE NEW.Food_ID IS NOT NULL
+        ON CONFLICT (Status, Food_ID) DO UPDATE SET Claims = Claims + excluded.Claims;
+        DELETE FROM item_claims
+        WHERE Status IN (IFNULL(NEW.Status, ''), 'All') AND Food_ID = NEW.Food_ID AND Claims = 0;
+    END;
+    CREATE TRIGGER trg_item_claims_delete AFTER DELETE ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO item_claims (Status, Food_ID, Claims)
+        SELECT s.Status, OLD.Food_ID, -1
+        FROM (SELECT IFNULL(OLD.Status, '') AS Status UNION ALL SELECT 'All') AS s
+        WHERE OLD.Food_ID IS NOT NULL
+        ON CONFLICT (Status, Food_ID) DO UPDATE SET Claims = Claims + excluded.Claims;
+        DELETE FROM item_claims
+        WHERE Status IN (IFNULL(OLD.Status, ''), 'All') AND Food_ID = OLD.Food_ID AND Claims = 0;
+    END;
+    CREATE TRIGGER trg_item_claims_update AFTER UPDATE OF Food_ID, Status ON claims_data
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO item_claims (Status, Food_ID, Claims)
+        SELECT s.Status, OLD.Food_ID, -1
+        FROM (SELECT IFNULL(OLD.Status, '') AS Status UNION ALL SELECT 'All') AS s
+        WHERE OLD.Food_ID IS NOT NULL
+        ON CONFLICT (Status, Food_ID) DO UPDATE SET Claims = Claims + excluded.Claims;
+        DELETE FROM item_claims
+        WHERE Status IN (IFNULL(OLD.Status, ''), 'All') AND Food_ID = OLD.Food_ID AND Claims = 0;
+        INSERT INTO item_claims (Status, Food_ID, Claims)
+        SELECT s.Status, NEW.Food_ID, +1
+        FROM (SELECT IFNULL(NEW.Status, '') AS Status UNION ALL SELECT 'All') AS s
+        WHERE NEW.Food_ID IS NOT NULL
+        ON CONFLICT (Status, Food_ID) DO UPDATE SET Claims = Claims + excluded.Claims;
+        DELETE FROM item_claims
+        WHERE Status IN (IFNULL(NEW.Status, ''), 'All') AND Food_ID = NEW.Food_ID AND Claims = 0;
+    END;
@@ -0,0 +1,6 @@
+-- Migration 15: NULL-safe contact indexes for the paginated grids
+-- Frozen when released; never edit, append a new migration instead.
+    DROP INDEX idx_provider_city_name;
+    DROP INDEX idx_receivers_city_name;
+    CREATE INDEX idx_provider_city_name ON provider_data (City, IFNULL(Name, -9e999));
+    CREATE INDEX idx_receivers_city_name ON receivers_data (City, IFNULL(Name, -9e999));
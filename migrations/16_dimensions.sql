@@ -0,0 +1,1340 @@
+-- Migration 16: dimension tables for the repeated text columns
+-- Frozen when released; never edit, append a new migration instead.
+    CREATE TABLE dim_status (ID INTEGER PRIMARY KEY, Value TEXT NOT NULL UNIQUE);
+    INSERT INTO dim_status (Value)
+    SELECT DISTINCT * FROM (SELECT Status FROM claims_data WHERE Status IS NOT NULL)
+    ORDER BY 1;
+    CREATE TABLE dim_provider_type (ID INTEGER PRIMARY KEY, Value TEXT NOT NULL UNIQUE);
+    INSERT INTO dim_provider_type (Value)
+    SELECT DISTINCT * FROM (SELECT Type FROM provider_data WHERE Type IS NOT NULL UNION ALL SELECT Provider_Type FROM food_listings_data WHERE Provider_Type IS NOT NULL)
+    ORDER BY 1;
+    CREATE TABLE dim_receiver_type (ID INTEGER PRIMARY KEY, Value TEXT NOT NULL UNIQUE);
+    INSERT INTO dim_receiver_type (Value)
+    SELECT DISTINCT * FROM (SELECT Type FROM receivers_data WHERE Type IS NOT NULL)
+    ORDER BY 1;
+    CREATE TABLE dim_food_type (ID INTEGER PRIMARY KEY, Value TEXT NOT NULL UNIQUE);
+    INSERT INTO dim_food_type (Value)
+    SELECT DISTINCT * FROM (SELECT Food_type FROM food_listings_data WHERE Food_type IS NOT NULL)
+    ORDER BY 1;
+    CREATE TABLE dim_meal_type (ID INTEGER PRIMARY KEY, Value TEXT NOT NULL UNIQUE);
+    INSERT INTO dim_meal_type (Value)
+    SELECT DISTINCT * FROM (SELECT Meal_Type FROM food_listings_data WHERE Meal_Type IS NOT NULL)
+    ORDER BY 1;
+    CREATE TABLE dim_city (ID INTEGER PRIMARY KEY, Value TEXT NOT NULL UNIQUE);
+    INSERT INTO dim_city (Value)
+    SELECT DISTINCT * FROM (SELECT City FROM provider_data WHERE City IS NOT NULL UNION ALL SELECT City FROM receivers_data WHERE City IS NOT NULL UNION ALL SELECT Location FROM food_listings_data WHERE Location IS NOT NULL)
+    ORDER BY 1;
+    INSERT OR IGNORE INTO dim_status (Value) VALUES ('Cancelled'), ('Completed'), ('Pending');
+    CREATE TABLE provider_facts (
+        Provider_ID INTEGER PRIMARY KEY,
+        Name TEXT,
+        Type_ID INTEGER REFERENCES dim_provider_type (ID),
+        Address TEXT,
+        City_ID INTEGER REFERENCES dim_city (ID),
+        Contact TEXT
+    );
+    CREATE TABLE receivers_facts (
+        Receiver_ID INTEGER PRIMARY KEY,
+        Name TEXT,
+        Type_ID INTEGER REFERENCES dim_receiver_type (ID),
+        City_ID INTEGER REFERENCES dim_city (ID),
+        Contact TEXT
+    );
+    CREATE TABLE food_listings_facts (
+        Food_ID INTEGER PRIMARY KEY,
+        Food_Name TEXT,
+        Quantity INTEGER,
+        Expiry_Date TIMESTAMP,
+        Provider_ID INTEGER REFERENCES provider_facts (Provider_ID),
+        Provider_Type_ID INTEGER REFERENCES dim_provider_type (ID),
+        Location_ID INTEGER REFERENCES dim_city (ID),
+        Meal_Type_ID INTEGER REFERENCES dim_meal_type (ID),
+        Food_type_ID INTEGER REFERENCES dim_food_type (ID),
+        Expiry_Epoch INTEGER GENERATED ALWAYS AS (CAST(strftime('%s', Expiry_Date) AS INTEGER)) VIRTUAL,
+        Expiry_Day INTEGER GENERATED ALWAYS AS (CAST(strftime('%s', Expiry_Date) AS INTEGER) / 86400) VIRTUAL
+    );
+    CREATE TABLE claims_facts (
+        Claim_ID INTEGER PRIMARY KEY,
+        Food_ID INTEGER REFERENCES food_listings_facts (Food_ID),
+        Receiver_ID INTEGER REFERENCES receivers_facts (Receiver_ID),
+        Status_ID INTEGER REFERENCES dim_status (ID),
+        Timestamp TIMESTAMP,
+        Timestamp_Epoch INTEGER GENERATED ALWAYS AS (CAST(strftime('%s', Timestamp) AS INTEGER)) VIRTUAL,
+        Timestamp_Day INTEGER GENERATED ALWAYS AS (CAST(strftime('%s', Timestamp) AS INTEGER) / 86400) VIRTUAL,
+        Version INTEGER NOT NULL DEFAULT 0
+    );
+
+        INSERT INTO provider_facts (Provider_ID, Name, Type_ID, Address, City_ID, Contact)
+        SELECT s.Provider_ID, s.Name, (SELECT ID FROM dim_provider_type WHERE Value = s.Type), s.Address, (SELECT ID FROM dim_city WHERE Value = s.City), s.Contact FROM provider_data AS s;
+        INSERT INTO receivers_facts (Receiver_ID, Name, Type_ID, City_ID, Contact)
+        SELECT s.Receiver_ID, s.Name, (SELECT ID FROM dim_receiver_type WHERE Value = s.Type), (SELECT ID FROM dim_city WHERE Value = s.City), s.Contact FROM receivers_data AS s;
+        INSERT INTO food_listings_facts (Food_ID, Food_Name, Quantity, Expiry_Date, Provider_ID, Provider_Type_ID, Location_ID, Meal_Type_ID, Food_type_ID)
+        SELECT s.Food_ID, s.Food_Name, s.Quantity, s.Expiry_Date, s.Provider_ID, (SELECT ID FROM dim_provider_type WHERE Value = s.Provider_Type), (SELECT ID FROM dim_city WHERE Value = s.Location), (SELECT ID FROM dim_meal_type WHERE Value = s.Meal_Type), (SELECT ID FROM dim_food_type WHERE Value = s.Food_type) FROM food_listings_data AS s;
+        INSERT INTO claims_facts (Claim_ID, Food_ID, Receiver_ID, Status_ID, Timestamp, Version)
+        SELECT s.Claim_ID, s.Food_ID, s.Receiver_ID, (SELECT ID FROM dim_status WHERE Value = s.Status), s.Timestamp, s.Version FROM claims_data AS s;
+    DROP TABLE claims_data;
+    DROP TABLE food_listings_data;
+    DROP TABLE receivers_data;
+    DROP TABLE provider_data;
+    CREATE VIEW provider_data AS
+    SELECT f.Provider_ID, f.Name, (SELECT Value FROM dim_provider_type WHERE ID = f.Type_ID) AS Type, f.Address, (SELECT Value FROM dim_city WHERE ID = f.City_ID) AS City, f.Contact, f.Type_ID, f.City_ID
+    FROM provider_facts AS f;
+    CREATE TRIGGER trg_provider_data_insert INSTEAD OF INSERT ON provider_data
+    BEGIN
+        INSERT OR IGNORE INTO dim_provider_type (Value) SELECT NEW.Type WHERE NEW.Type IS NOT NULL;
+        INSERT OR IGNORE INTO dim_city (Value) SELECT NEW.City WHERE NEW.City IS NOT NULL;
+        INSERT INTO provider_facts (Provider_ID, Name, Type_ID, Address, City_ID, Contact) VALUES (NEW.Provider_ID, NEW.Name, (SELECT ID FROM dim_provider_type WHERE Value = NEW.Type), NEW.Address, (SELECT ID FROM dim_city WHERE Value = NEW.City), NEW.Contact);
+    END;
+    CREATE TRIGGER trg_provider_data_delete INSTEAD OF DELETE ON provider_data
+    BEGIN
+        DELETE FROM provider_facts WHERE Provider_ID = OLD.Provider_ID;
+    END;
+    CREATE TRIGGER trg_provider_data_update INSTEAD OF UPDATE ON provider_data
+    BEGIN
+        INSERT OR IGNORE INTO dim_provider_type (Value) SELECT NEW.Type WHERE NEW.Type IS NOT NULL;
+        INSERT OR IGNORE INTO dim_city (Value) SELECT NEW.City WHERE NEW.City IS NOT NULL;
+        UPDATE provider_facts SET (Provider_ID, Name, Type_ID, Address, City_ID, Contact) = (NEW.Provider_ID, NEW.Name, (SELECT ID FROM dim_provider_type WHERE Value = NEW.Type), NEW.Address, (SELECT ID FROM dim_city WHERE Value = NEW.City), NEW.Contact)
+        WHERE Provider_ID = OLD.Provider_ID;
+    END;
+    CREATE VIEW receivers_data AS
+    SELECT f.Receiver_ID, f.Name, (SELECT Value FROM dim_receiver_type WHERE ID = f.Type_ID) AS Type, (SELECT Value FROM dim_city WHERE ID = f.City_ID) AS City, f.Contact, f.Type_ID, f.City_ID
+    FROM receivers_facts AS f;
+    CREATE TRIGGER trg_receivers_data_insert INSTEAD OF INSERT ON receivers_data
+    BEGIN
+        INSERT OR IGNORE INTO dim_receiver_type (Value) SELECT NEW.Type WHERE NEW.Type IS NOT NULL;
+        INSERT OR IGNORE INTO dim_city (Value) SELECT NEW.City WHERE NEW.City IS NOT NULL;
+        INSERT INTO receivers_facts (Receiver_ID, Name, Type_ID, City_ID, Contact) VALUES (NEW.Receiver_ID, NEW.Name, (SELECT ID FROM dim_receiver_type WHERE Value = NEW.Type), (SELECT ID FROM dim_city WHERE Value = NEW.City), NEW.Contact);
+    END;
+    CREATE TRIGGER trg_receivers_data_delete INSTEAD OF DELETE ON receivers_data
+    BEGIN
+        DELETE FROM receivers_facts WHERE Receiver_ID = OLD.Receiver_ID;
+    END;
+    CREATE TRIGGER trg_receivers_data_update INSTEAD OF UPDATE ON receivers_data
+    BEGIN
+        INSERT OR IGNORE INTO dim_receiver_type (Value) SELECT NEW.Type WHERE NEW.Type IS NOT NULL;
+        INSERT OR IGNORE INTO dim_city (Value) SELECT NEW.City WHERE NEW.City IS NOT NULL;
+        UPDATE receivers_facts SET (Receiver_ID, Name, Type_ID, City_ID, Contact) = (NEW.Receiver_ID, NEW.Name, (SELECT ID FROM dim_receiver_type WHERE Value = NEW.Type), (SELECT ID FROM dim_city WHERE Value = NEW.City), NEW.Contact)
+        WHERE Receiver_ID = OLD.Receiver_ID;
+    END;
+    CREATE VIEW food_listings_data AS
+    SELECT f.Food_ID, f.Food_Name, f.Quantity, f.Expiry_Date, f.Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = f.Provider_Type_ID) AS Provider_Type, (SELECT Value FROM dim_city WHERE ID = f.Location_ID) AS Location, (SELECT Value FROM dim_meal_type WHERE ID = f.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_food_type WHERE ID = f.Food_type_ID) AS Food_type, f.Expiry_Epoch, f.Expiry_Day, f.Provider_Type_ID, f.Food_type_ID, f.Meal_Type_ID, f.Location_ID
+    FROM food_listings_facts AS f;
+    CREATE TRIGGER trg_food_listings_data_insert INSTEAD OF INSERT ON food_listings_data
+    BEGIN
+        INSERT OR IGNORE INTO dim_provider_type (Value) SELECT NEW.Provider_Type WHERE NEW.Provider_Type IS NOT NULL;
+        INSERT OR IGNORE INTO dim_food_type (Value) SELECT NEW.Food_type WHERE NEW.Food_type IS NOT NULL;
+        INSERT OR IGNORE INTO dim_meal_type (Value) SELECT NEW.Meal_Type WHERE NEW.Meal_Type IS NOT NULL;
+        INSERT OR IGNORE INTO dim_city (Value) SELECT NEW.Location WHERE NEW.Location IS NOT NULL;
+        INSERT INTO food_listings_facts (Food_ID, Food_Name, Quantity, Expiry_Date, Provider_ID, Provider_Type_ID, Location_ID, Meal_Type_ID, Food_type_ID) VALUES (NEW.Food_ID, NEW.Food_Name, NEW.Quantity, NEW.Expiry_Date, NEW.Provider_ID, (SELECT ID FROM dim_provider_type WHERE Value = NEW.Provider_Type), (SELECT ID FROM dim_city WHERE Value = NEW.Location), (SELECT ID FROM dim_meal_type WHERE Value = NEW.Meal_Type), (SELECT ID FROM dim_food_type WHERE Value = NEW.Food_type));
+    END;
+    CREATE TRIGGER trg_food_listings_data_delete INSTEAD OF DELETE ON food_listings_data
+    BEGIN
+        DELETE FROM food_listings_facts WHERE Food_ID = OLD.Food_ID;
+    END;
+    CREATE TRIGGER trg_food_listings_data_update INSTEAD OF UPDATE ON food_listings_data
+    BEGIN
+        INSERT OR IGNORE INTO dim_provider_type (Value) SELECT NEW.Provider_Type WHERE NEW.Provider_Type IS NOT NULL;
+        INSERT OR IGNORE INTO dim_food_type (Value) SELECT NEW.Food_type WHERE NEW.Food_type IS NOT NULL;
+        INSERT OR IGNORE INTO dim_meal_type (Value) SELECT NEW.Meal_Type WHERE NEW.Meal_Type IS NOT NULL;
+        INSERT OR IGNORE INTO dim_city (Value) SELECT NEW.Location WHERE NEW.Location IS NOT NULL;
+        UPDATE food_listings_facts SET (Food_ID, Food_Name, Quantity, Expiry_Date, Provider_ID, Provider_Type_ID, Location_ID, Meal_Type_ID, Food_type_ID) = (NEW.Food_ID, NEW.Food_Name, NEW.Quantity, NEW.Expiry_Date, NEW.Provider_ID, (SELECT ID FROM dim_provider_type WHERE Value = NEW.Provider_Type), (SELECT ID FROM dim_city WHERE Value = NEW.Location), (SELECT ID FROM dim_meal_type WHERE Value = NEW.Meal_Type), (SELECT ID FROM dim_food_type WHERE Value = NEW.Food_type))
+        WHERE Food_ID = OLD.Food_ID;
+    END;
+    CREATE VIEW claims_data AS
+    SELECT f.Claim_ID, f.Food_ID, f.Receiver_ID, (SELECT Value FROM dim_status WHERE ID = f.Status_ID) AS Status, f.Timestamp, f.Timestamp_Epoch, f.Timestamp_Day, f.Version, f.Status_ID
+    FROM claims_facts AS f;
+    CREATE TRIGGER trg_claims_data_insert INSTEAD OF INSERT ON claims_data
+    BEGIN
+        INSERT OR IGNORE INTO dim_status (Value) SELECT NEW.Status WHERE NEW.Status IS NOT NULL;
+        INSERT INTO claims_facts (Claim_ID, Food_ID, Receiver_ID, Status_ID, Timestamp, Version) VALUES (NEW.Claim_ID, NEW.Food_ID, NEW.Receiver_ID, (SELECT ID FROM dim_status WHERE Value = NEW.Status), NEW.Timestamp, IFNULL(NEW.Version, 0));
+    END;
+    CREATE TRIGGER trg_claims_data_delete INSTEAD OF DELETE ON claims_data
+    BEGIN
+        DELETE FROM claims_facts WHERE Claim_ID = OLD.Claim_ID;
+    END;
+    CREATE TRIGGER trg_claims_data_update INSTEAD OF UPDATE ON claims_data
+    BEGIN
+        INSERT OR IGNORE INTO dim_status (Value) SELECT NEW.Status WHERE NEW.Status IS NOT NULL;
+        UPDATE claims_facts SET (Claim_ID, Food_ID, Receiver_ID, Status_ID, Timestamp, Version) = (NEW.Claim_ID, NEW.Food_ID, NEW.Receiver_ID, (SELECT ID FROM dim_status WHERE Value = NEW.Status), NEW.Timestamp, IFNULL(NEW.Version, 0))
+        WHERE Claim_ID = OLD.Claim_ID;
+    END;
+
+    CREATE INDEX idx_provider_city ON provider_facts (City_ID, Type_ID);
+    CREATE INDEX idx_provider_city_name ON provider_facts (City_ID, IFNULL(Name, -9e999));
+    CREATE INDEX idx_provider_type ON provider_facts (Type_ID, City_ID, Name);
+    CREATE INDEX idx_receivers_city ON receivers_facts (City_ID, Type_ID);
+    CREATE INDEX idx_receivers_city_name ON receivers_facts (City_ID, IFNULL(Name, -9e999));
+    CREATE INDEX idx_receivers_type ON receivers_facts (Type_ID, City_ID, Name);
+    CREATE INDEX idx_listings_expiry_day ON food_listings_facts (Expiry_Day, Provider_Type_ID, Provider_ID,
+                                                                Food_type_ID, Meal_Type_ID, Location_ID);
+    CREATE INDEX idx_listings_expiry_epoch ON food_listings_facts (Expiry_Epoch);
+    CREATE INDEX idx_listings_food_type ON food_listings_facts (Food_type_ID, Meal_Type_ID, Location_ID, Provider_Type_ID, Quantity);
+    CREATE INDEX idx_listings_location ON food_listings_facts (Location_ID, Food_type_ID, Meal_Type_ID, Provider_Type_ID, Quantity);
+    CREATE INDEX idx_listings_provider ON food_listings_facts (Provider_ID, Food_type_ID, Meal_Type_ID, Location_ID, Quantity);
+    CREATE INDEX idx_claims_day ON claims_facts (Timestamp_Day, Status_ID, Food_ID, Receiver_ID);
+    CREATE INDEX idx_claims_epoch ON claims_facts (Timestamp_Epoch);
+    CREATE INDEX idx_claims_food ON claims_facts (Food_ID, Status_ID, Receiver_ID);
+    CREATE INDEX idx_claims_receiver ON claims_facts (Receiver_ID, Status_ID, Food_ID, Timestamp);
+    CREATE INDEX idx_claims_status ON claims_facts (Status_ID, Food_ID, Receiver_ID, Timestamp);
+
+    CREATE TRIGGER trg_changes_provider_data_delete AFTER DELETE ON provider_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'provider_data', r.Provider_ID, 'D',
+               NULL, IFNULL(r.Type, ''), NULL, NULL, NULL, NULL, IFNULL(r.City, '')
+        FROM (SELECT OLD.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = OLD.Type_ID) AS Type, (SELECT Value FROM dim_city WHERE ID = OLD.City_ID) AS City) AS r;
+    END;
+
+    CREATE TRIGGER trg_changes_provider_data_insert AFTER INSERT ON provider_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'provider_data', r.Provider_ID, 'I',
+               NULL, IFNULL(r.Type, ''), NULL, NULL, NULL, NULL, IFNULL(r.City, '')
+        FROM (SELECT NEW.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = NEW.Type_ID) AS Type, (SELECT Value FROM dim_city WHERE ID = NEW.City_ID) AS City) AS r;
+    END;
+
+    CREATE TRIGGER trg_changes_provider_data_update AFTER UPDATE ON provider_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'provider_data', r.Provider_ID, 'U',
+               NULL, IFNULL(r.Type, ''), NULL, NULL, NULL, NULL, IFNULL(r.City, '')
+        FROM (SELECT OLD.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = OLD.Type_ID) AS Type, (SELECT Value FROM dim_city WHERE ID = OLD.City_ID) AS City) AS r;
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'provider_data', r.Provider_ID, 'U',
+               NULL, IFNULL(r.Type, ''), NULL, NULL, NULL, NULL, IFNULL(r.City, '')
+        FROM (SELECT NEW.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = NEW.Type_ID) AS Type, (SELECT Value FROM dim_city WHERE ID = NEW.City_ID) AS City) AS r;
+    END;
+
+    CREATE TRIGGER trg_city_provider_data_delete AFTER DELETE ON provider_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, 'All', s.City, -COUNT(*), 0
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT (SELECT Value FROM dim_provider_type WHERE ID = OLD.Type_ID) AS Type, (SELECT Value FROM dim_city WHERE ID = OLD.City_ID) AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    END;
+
+    CREATE TRIGGER trg_city_provider_data_insert AFTER INSERT ON provider_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, 'All', s.City, +COUNT(*), 0
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT (SELECT Value FROM dim_provider_type WHERE ID = NEW.Type_ID) AS Type, (SELECT Value FROM dim_city WHERE ID = NEW.City_ID) AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    END;
+
+    CREATE TRIGGER trg_city_provider_data_update AFTER UPDATE OF Type_ID, City_ID ON provider_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, 'All', s.City, -COUNT(*), 0
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT (SELECT Value FROM dim_provider_type WHERE ID = OLD.Type_ID) AS Type, (SELECT Value FROM dim_city WHERE ID = OLD.City_ID) AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, 'All', s.City, +COUNT(*), 0
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT (SELECT Value FROM dim_provider_type WHERE ID = NEW.Type_ID) AS Type, (SELECT Value FROM dim_city WHERE ID = NEW.City_ID) AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    END;
+
+    CREATE TRIGGER trg_cube_provider_data_delete AFTER DELETE ON provider_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               1 AS Providers, 0 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT OLD.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = OLD.Type_ID) AS Type) AS p) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM food_listings_data AS l
+        JOIN (SELECT OLD.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = OLD.Type_ID) AS Type) AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+
+    CREATE TRIGGER trg_cube_provider_data_insert AFTER INSERT ON provider_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               1 AS Providers, 0 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT NEW.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = NEW.Type_ID) AS Type) AS p) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM food_listings_data AS l
+        JOIN (SELECT NEW.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = NEW.Type_ID) AS Type) AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+
+    CREATE TRIGGER trg_cube_provider_data_update AFTER UPDATE OF Provider_ID, Type_ID ON provider_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               1 AS Providers, 0 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT OLD.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = OLD.Type_ID) AS Type) AS p) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM food_listings_data AS l
+        JOIN (SELECT OLD.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = OLD.Type_ID) AS Type) AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               1 AS Providers, 0 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT NEW.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = NEW.Type_ID) AS Type) AS p) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM food_listings_data AS l
+        JOIN (SELECT NEW.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = NEW.Type_ID) AS Type) AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+
+    CREATE TRIGGER trg_provider_search_delete AFTER DELETE ON provider_facts
+    BEGIN
+        INSERT INTO provider_search (provider_search, rowid, Name, Address, City, Contact) VALUES ('delete', OLD.Provider_ID, OLD.Name, OLD.Address, (SELECT Value FROM dim_city WHERE ID = OLD.City_ID), OLD.Contact);
+    END;
+
+    CREATE TRIGGER trg_provider_search_insert AFTER INSERT ON provider_facts
+    BEGIN
+        INSERT INTO provider_search (rowid, Name, Address, City, Contact) VALUES (NEW.Provider_ID, NEW.Name, NEW.Address, (SELECT Value FROM dim_city WHERE ID = NEW.City_ID), NEW.Contact);
+    END;
+
+    CREATE TRIGGER trg_provider_search_update AFTER UPDATE OF Provider_ID, Name, Address, City_ID, Contact ON provider_facts
+    BEGIN
+        INSERT INTO provider_search (provider_search, rowid, Name, Address, City, Contact) VALUES ('delete', OLD.Provider_ID, OLD.Name, OLD.Address, (SELECT Value FROM dim_city WHERE ID = OLD.City_ID), OLD.Contact);
+        INSERT INTO provider_search (rowid, Name, Address, City, Contact) VALUES (NEW.Provider_ID, NEW.Name, NEW.Address, (SELECT Value FROM dim_city WHERE ID = NEW.City_ID), NEW.Contact);
+    END;
+
+    CREATE TRIGGER trg_rollup_provider_data_delete AFTER DELETE ON provider_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM food_listings_data AS l
+        JOIN (SELECT OLD.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = OLD.Type_ID) AS Type) AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    END;
+
+    CREATE TRIGGER trg_rollup_provider_data_insert AFTER INSERT ON provider_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM food_listings_data AS l
+        JOIN (SELECT NEW.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = NEW.Type_ID) AS Type) AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    END;
+
+    CREATE TRIGGER trg_rollup_provider_data_update AFTER UPDATE OF Provider_ID, Type_ID ON provider_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM food_listings_data AS l
+        JOIN (SELECT OLD.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = OLD.Type_ID) AS Type) AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM food_listings_data AS l
+        JOIN (SELECT NEW.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = NEW.Type_ID) AS Type) AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    END;
+
+    CREATE TRIGGER trg_version_provider_data_delete AFTER DELETE ON provider_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count - 1 WHERE name = 'provider_data';
+    END;
+
+    CREATE TRIGGER trg_version_provider_data_insert AFTER INSERT ON provider_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count + 1 WHERE name = 'provider_data';
+    END;
+
+    CREATE TRIGGER trg_version_provider_data_update AFTER UPDATE ON provider_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE name = 'provider_data';
+    END;
+
+    CREATE TRIGGER trg_changes_receivers_data_delete AFTER DELETE ON receivers_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'receivers_data', r.Receiver_ID, 'D',
+               NULL, NULL, IFNULL(r.Type, ''), NULL, NULL, NULL, IFNULL(r.City, '')
+        FROM (SELECT OLD.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_receiver_type WHERE ID = OLD.Type_ID) AS Type, (SELECT Value FROM dim_city WHERE ID = OLD.City_ID) AS City) AS r;
+    END;
+
+    CREATE TRIGGER trg_changes_receivers_data_insert AFTER INSERT ON receivers_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'receivers_data', r.Receiver_ID, 'I',
+               NULL, NULL, IFNULL(r.Type, ''), NULL, NULL, NULL, IFNULL(r.City, '')
+        FROM (SELECT NEW.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_receiver_type WHERE ID = NEW.Type_ID) AS Type, (SELECT Value FROM dim_city WHERE ID = NEW.City_ID) AS City) AS r;
+    END;
+
+    CREATE TRIGGER trg_changes_receivers_data_update AFTER UPDATE ON receivers_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'receivers_data', r.Receiver_ID, 'U',
+               NULL, NULL, IFNULL(r.Type, ''), NULL, NULL, NULL, IFNULL(r.City, '')
+        FROM (SELECT OLD.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_receiver_type WHERE ID = OLD.Type_ID) AS Type, (SELECT Value FROM dim_city WHERE ID = OLD.City_ID) AS City) AS r;
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'receivers_data', r.Receiver_ID, 'U',
+               NULL, NULL, IFNULL(r.Type, ''), NULL, NULL, NULL, IFNULL(r.City, '')
+        FROM (SELECT NEW.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_receiver_type WHERE ID = NEW.Type_ID) AS Type, (SELECT Value FROM dim_city WHERE ID = NEW.City_ID) AS City) AS r;
+    END;
+
+    CREATE TRIGGER trg_city_receivers_data_delete AFTER DELETE ON receivers_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT 'All', CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, s.City, 0, -COUNT(*)
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT (SELECT Value FROM dim_receiver_type WHERE ID = OLD.Type_ID) AS Type, (SELECT Value FROM dim_city WHERE ID = OLD.City_ID) AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    END;
+
+    CREATE TRIGGER trg_city_receivers_data_insert AFTER INSERT ON receivers_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT 'All', CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, s.City, 0, +COUNT(*)
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT (SELECT Value FROM dim_receiver_type WHERE ID = NEW.Type_ID) AS Type, (SELECT Value FROM dim_city WHERE ID = NEW.City_ID) AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    END;
+
+    CREATE TRIGGER trg_city_receivers_data_update AFTER UPDATE OF Type_ID, City_ID ON receivers_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT 'All', CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, s.City, 0, -COUNT(*)
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT (SELECT Value FROM dim_receiver_type WHERE ID = OLD.Type_ID) AS Type, (SELECT Value FROM dim_city WHERE ID = OLD.City_ID) AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    INSERT INTO city_stats (Provider_Type, Receiver_Type, City, Providers, Receivers)
+    SELECT 'All', CASE g.rollup WHEN 1 THEN 'All' ELSE s.Type END, s.City, 0, +COUNT(*)
+    FROM (SELECT IFNULL(Type, '') AS Type, IFNULL(City, '') AS City FROM (SELECT (SELECT Value FROM dim_receiver_type WHERE ID = NEW.Type_ID) AS Type, (SELECT Value FROM dim_city WHERE ID = NEW.City_ID) AS City)) AS s,
+         (SELECT 0 AS rollup UNION ALL SELECT 1) AS g
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers;
+    
+    END;
+
+    CREATE TRIGGER trg_cube_receivers_data_delete AFTER DELETE ON receivers_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               0 AS Providers, 1 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT OLD.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_receiver_type WHERE ID = OLD.Type_ID) AS Type) AS r) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT OLD.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_receiver_type WHERE ID = OLD.Type_ID) AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+
+    CREATE TRIGGER trg_cube_receivers_data_insert AFTER INSERT ON receivers_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               0 AS Providers, 1 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT NEW.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_receiver_type WHERE ID = NEW.Type_ID) AS Type) AS r) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT NEW.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_receiver_type WHERE ID = NEW.Type_ID) AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+
+    CREATE TRIGGER trg_cube_receivers_data_update AFTER UPDATE OF Receiver_ID, Type_ID ON receivers_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               0 AS Providers, 1 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT OLD.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_receiver_type WHERE ID = OLD.Type_ID) AS Type) AS r) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT OLD.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_receiver_type WHERE ID = OLD.Type_ID) AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               'All' AS Food_type, 'All' AS Meal_Type, 'All' AS Location,
+               0 AS Providers, 1 AS Receivers, 0 AS Claims, 0 AS Quantity
+        FROM (SELECT NEW.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_receiver_type WHERE ID = NEW.Type_ID) AS Type) AS r) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT NEW.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_receiver_type WHERE ID = NEW.Type_ID) AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+
+    CREATE TRIGGER trg_receiver_search_delete AFTER DELETE ON receivers_facts
+    BEGIN
+        INSERT INTO receiver_search (receiver_search, rowid, Name, City, Contact) VALUES ('delete', OLD.Receiver_ID, OLD.Name, (SELECT Value FROM dim_city WHERE ID = OLD.City_ID), OLD.Contact);
+    END;
+
+    CREATE TRIGGER trg_receiver_search_insert AFTER INSERT ON receivers_facts
+    BEGIN
+        INSERT INTO receiver_search (rowid, Name, City, Contact) VALUES (NEW.Receiver_ID, NEW.Name, (SELECT Value FROM dim_city WHERE ID = NEW.City_ID), NEW.Contact);
+    END;
+
+    CREATE TRIGGER trg_receiver_search_update AFTER UPDATE OF Receiver_ID, Name, City_ID, Contact ON receivers_facts
+    BEGIN
+        INSERT INTO receiver_search (receiver_search, rowid, Name, City, Contact) VALUES ('delete', OLD.Receiver_ID, OLD.Name, (SELECT Value FROM dim_city WHERE ID = OLD.City_ID), OLD.Contact);
+        INSERT INTO receiver_search (rowid, Name, City, Contact) VALUES (NEW.Receiver_ID, NEW.Name, (SELECT Value FROM dim_city WHERE ID = NEW.City_ID), NEW.Contact);
+    END;
+
+    CREATE TRIGGER trg_rollup_receivers_data_delete AFTER DELETE ON receivers_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT OLD.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_receiver_type WHERE ID = OLD.Type_ID) AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    END;
+
+    CREATE TRIGGER trg_rollup_receivers_data_insert AFTER INSERT ON receivers_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT NEW.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_receiver_type WHERE ID = NEW.Type_ID) AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    END;
+
+    CREATE TRIGGER trg_rollup_receivers_data_update AFTER UPDATE OF Receiver_ID, Type_ID ON receivers_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT OLD.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_receiver_type WHERE ID = OLD.Type_ID) AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN (SELECT NEW.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_receiver_type WHERE ID = NEW.Type_ID) AS Type) AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    END;
+
+    CREATE TRIGGER trg_version_receivers_data_delete AFTER DELETE ON receivers_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count - 1 WHERE name = 'receivers_data';
+    END;
+
+    CREATE TRIGGER trg_version_receivers_data_insert AFTER INSERT ON receivers_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count + 1 WHERE name = 'receivers_data';
+    END;
+
+    CREATE TRIGGER trg_version_receivers_data_update AFTER UPDATE ON receivers_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE name = 'receivers_data';
+    END;
+
+    CREATE TRIGGER trg_changes_food_listings_data_delete AFTER DELETE ON food_listings_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'food_listings_data', r.Food_ID, 'D',
+               NULL, CASE WHEN r.Provider_Type IS p.Type THEN IFNULL(r.Provider_Type, '') END, NULL, IFNULL(r.Food_type, ''), IFNULL(r.Meal_Type, ''), IFNULL(r.Location, ''), NULL
+        FROM (SELECT OLD.Food_ID AS Food_ID, OLD.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = OLD.Provider_Type_ID) AS Provider_Type, (SELECT Value FROM dim_food_type WHERE ID = OLD.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = OLD.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = OLD.Location_ID) AS Location) AS r
+        LEFT JOIN provider_data AS p ON p.Provider_ID = r.Provider_ID;
+    END;
+
+    CREATE TRIGGER trg_changes_food_listings_data_insert AFTER INSERT ON food_listings_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'food_listings_data', r.Food_ID, 'I',
+               NULL, CASE WHEN r.Provider_Type IS p.Type THEN IFNULL(r.Provider_Type, '') END, NULL, IFNULL(r.Food_type, ''), IFNULL(r.Meal_Type, ''), IFNULL(r.Location, ''), NULL
+        FROM (SELECT NEW.Food_ID AS Food_ID, NEW.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = NEW.Provider_Type_ID) AS Provider_Type, (SELECT Value FROM dim_food_type WHERE ID = NEW.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = NEW.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = NEW.Location_ID) AS Location) AS r
+        LEFT JOIN provider_data AS p ON p.Provider_ID = r.Provider_ID;
+    END;
+
+    CREATE TRIGGER trg_changes_food_listings_data_update AFTER UPDATE ON food_listings_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'food_listings_data', r.Food_ID, 'U',
+               NULL, CASE WHEN r.Provider_Type IS p.Type THEN IFNULL(r.Provider_Type, '') END, NULL, IFNULL(r.Food_type, ''), IFNULL(r.Meal_Type, ''), IFNULL(r.Location, ''), NULL
+        FROM (SELECT OLD.Food_ID AS Food_ID, OLD.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = OLD.Provider_Type_ID) AS Provider_Type, (SELECT Value FROM dim_food_type WHERE ID = OLD.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = OLD.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = OLD.Location_ID) AS Location) AS r
+        LEFT JOIN provider_data AS p ON p.Provider_ID = r.Provider_ID;
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'food_listings_data', r.Food_ID, 'U',
+               NULL, CASE WHEN r.Provider_Type IS p.Type THEN IFNULL(r.Provider_Type, '') END, NULL, IFNULL(r.Food_type, ''), IFNULL(r.Meal_Type, ''), IFNULL(r.Location, ''), NULL
+        FROM (SELECT NEW.Food_ID AS Food_ID, NEW.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = NEW.Provider_Type_ID) AS Provider_Type, (SELECT Value FROM dim_food_type WHERE ID = NEW.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = NEW.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = NEW.Location_ID) AS Location) AS r
+        LEFT JOIN provider_data AS p ON p.Provider_ID = r.Provider_ID;
+    END;
+
+    CREATE TRIGGER trg_cube_food_listings_data_delete AFTER DELETE ON food_listings_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN (SELECT OLD.Food_ID AS Food_ID, OLD.Quantity AS Quantity, OLD.Provider_ID AS Provider_ID, (SELECT Value FROM dim_food_type WHERE ID = OLD.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = OLD.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = OLD.Location_ID) AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM (SELECT OLD.Food_ID AS Food_ID, OLD.Quantity AS Quantity, OLD.Provider_ID AS Provider_ID, (SELECT Value FROM dim_food_type WHERE ID = OLD.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = OLD.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = OLD.Location_ID) AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+
+    CREATE TRIGGER trg_cube_food_listings_data_insert AFTER INSERT ON food_listings_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN (SELECT NEW.Food_ID AS Food_ID, NEW.Quantity AS Quantity, NEW.Provider_ID AS Provider_ID, (SELECT Value FROM dim_food_type WHERE ID = NEW.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = NEW.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = NEW.Location_ID) AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM (SELECT NEW.Food_ID AS Food_ID, NEW.Quantity AS Quantity, NEW.Provider_ID AS Provider_ID, (SELECT Value FROM dim_food_type WHERE ID = NEW.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = NEW.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = NEW.Location_ID) AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+
+    CREATE TRIGGER trg_cube_food_listings_data_update AFTER UPDATE OF Food_ID, Quantity, Provider_ID, Food_type_ID, Meal_Type_ID, Location_ID ON food_listings_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN (SELECT OLD.Food_ID AS Food_ID, OLD.Quantity AS Quantity, OLD.Provider_ID AS Provider_ID, (SELECT Value FROM dim_food_type WHERE ID = OLD.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = OLD.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = OLD.Location_ID) AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM (SELECT OLD.Food_ID AS Food_ID, OLD.Quantity AS Quantity, OLD.Provider_ID AS Provider_ID, (SELECT Value FROM dim_food_type WHERE ID = OLD.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = OLD.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = OLD.Location_ID) AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM claims_data AS c
+        JOIN (SELECT NEW.Food_ID AS Food_ID, NEW.Quantity AS Quantity, NEW.Provider_ID AS Provider_ID, (SELECT Value FROM dim_food_type WHERE ID = NEW.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = NEW.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = NEW.Location_ID) AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT 'All' AS Status, p.Type AS Provider_Type, 'All' AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 0 AS Claims, IFNULL(l.Quantity, 0) AS Quantity
+        FROM (SELECT NEW.Food_ID AS Food_ID, NEW.Quantity AS Quantity, NEW.Provider_ID AS Provider_ID, (SELECT Value FROM dim_food_type WHERE ID = NEW.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = NEW.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = NEW.Location_ID) AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+
+    CREATE TRIGGER trg_expiry_listings_delete AFTER DELETE ON food_listings_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        DELETE FROM expiry_queue
+        WHERE Location = IFNULL((SELECT Value FROM dim_city WHERE ID = OLD.Location_ID), '') AND Expiry_Epoch = OLD.Expiry_Epoch AND Food_ID = OLD.Food_ID;
+    END;
+
+    CREATE TRIGGER trg_expiry_listings_insert AFTER INSERT ON food_listings_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = NEW.Food_ID);
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = NEW.Food_ID
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+    END;
+
+    CREATE TRIGGER trg_expiry_listings_update AFTER UPDATE OF Food_ID, Location_ID, Expiry_Date ON food_listings_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        DELETE FROM expiry_queue
+        WHERE Location = IFNULL((SELECT Value FROM dim_city WHERE ID = OLD.Location_ID), '') AND Expiry_Epoch = OLD.Expiry_Epoch AND Food_ID = OLD.Food_ID;
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = NEW.Food_ID);
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = NEW.Food_ID
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+    END;
+
+    CREATE TRIGGER trg_rollup_food_listings_data_delete AFTER DELETE ON food_listings_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN (SELECT OLD.Food_ID AS Food_ID, OLD.Expiry_Date AS Expiry_Date, OLD.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = OLD.Provider_Type_ID) AS Provider_Type, (SELECT Value FROM dim_food_type WHERE ID = OLD.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = OLD.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = OLD.Location_ID) AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM (SELECT OLD.Food_ID AS Food_ID, OLD.Expiry_Date AS Expiry_Date, OLD.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = OLD.Provider_Type_ID) AS Provider_Type, (SELECT Value FROM dim_food_type WHERE ID = OLD.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = OLD.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = OLD.Location_ID) AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    END;
+
+    CREATE TRIGGER trg_rollup_food_listings_data_insert AFTER INSERT ON food_listings_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN (SELECT NEW.Food_ID AS Food_ID, NEW.Expiry_Date AS Expiry_Date, NEW.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = NEW.Provider_Type_ID) AS Provider_Type, (SELECT Value FROM dim_food_type WHERE ID = NEW.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = NEW.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = NEW.Location_ID) AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM (SELECT NEW.Food_ID AS Food_ID, NEW.Expiry_Date AS Expiry_Date, NEW.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = NEW.Provider_Type_ID) AS Provider_Type, (SELECT Value FROM dim_food_type WHERE ID = NEW.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = NEW.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = NEW.Location_ID) AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    END;
+
+    CREATE TRIGGER trg_rollup_food_listings_data_update AFTER UPDATE OF Food_ID, Expiry_Date, Provider_ID, Provider_Type_ID, Food_type_ID, Meal_Type_ID, Location_ID ON food_listings_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN (SELECT OLD.Food_ID AS Food_ID, OLD.Expiry_Date AS Expiry_Date, OLD.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = OLD.Provider_Type_ID) AS Provider_Type, (SELECT Value FROM dim_food_type WHERE ID = OLD.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = OLD.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = OLD.Location_ID) AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM (SELECT OLD.Food_ID AS Food_ID, OLD.Expiry_Date AS Expiry_Date, OLD.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = OLD.Provider_Type_ID) AS Provider_Type, (SELECT Value FROM dim_food_type WHERE ID = OLD.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = OLD.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = OLD.Location_ID) AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM claims_data AS c
+        JOIN (SELECT NEW.Food_ID AS Food_ID, NEW.Expiry_Date AS Expiry_Date, NEW.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = NEW.Provider_Type_ID) AS Provider_Type, (SELECT Value FROM dim_food_type WHERE ID = NEW.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = NEW.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = NEW.Location_ID) AS Location) AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    INSERT INTO listings_rollup (Grain, Period, Provider_Type, Listing_Provider_Type, Food_type, Meal_Type, Location, Listings)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Provider_Type, ''), IFNULL(s.Listing_Provider_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Listings)
+    FROM (
+        SELECT l.Expiry_Date AS Ts, p.Type AS Provider_Type, l.Provider_Type AS Listing_Provider_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Listings
+        FROM (SELECT NEW.Food_ID AS Food_ID, NEW.Expiry_Date AS Expiry_Date, NEW.Provider_ID AS Provider_ID, (SELECT Value FROM dim_provider_type WHERE ID = NEW.Provider_Type_ID) AS Provider_Type, (SELECT Value FROM dim_food_type WHERE ID = NEW.Food_type_ID) AS Food_type, (SELECT Value FROM dim_meal_type WHERE ID = NEW.Meal_Type_ID) AS Meal_Type, (SELECT Value FROM dim_city WHERE ID = NEW.Location_ID) AS Location) AS l
+        JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Listings = Listings + excluded.Listings;
+    
+    END;
+
+    CREATE TRIGGER trg_version_food_listings_data_delete AFTER DELETE ON food_listings_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count - 1 WHERE name = 'food_listings_data';
+    END;
+
+    CREATE TRIGGER trg_version_food_listings_data_insert AFTER INSERT ON food_listings_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count + 1 WHERE name = 'food_listings_data';
+    END;
+
+    CREATE TRIGGER trg_version_food_listings_data_update AFTER UPDATE ON food_listings_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE name = 'food_listings_data';
+    END;
+
+    CREATE TRIGGER trg_changes_claims_data_delete AFTER DELETE ON claims_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'claims_data', r.Claim_ID, 'D',
+               IFNULL(r.Status, ''), CASE WHEN l.Provider_Type IS p.Type THEN IFNULL(l.Provider_Type, '') END, IFNULL(v.Type, ''), IFNULL(l.Food_type, ''), IFNULL(l.Meal_Type, ''), IFNULL(l.Location, ''), NULL
+        FROM (SELECT OLD.Claim_ID AS Claim_ID, OLD.Food_ID AS Food_ID, OLD.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_status WHERE ID = OLD.Status_ID) AS Status) AS r
+        LEFT JOIN food_listings_data AS l ON l.Food_ID = r.Food_ID
+        LEFT JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID
+        LEFT JOIN receivers_data AS v ON v.Receiver_ID = r.Receiver_ID;
+    END;
+
+    CREATE TRIGGER trg_changes_claims_data_insert AFTER INSERT ON claims_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'claims_data', r.Claim_ID, 'I',
+               IFNULL(r.Status, ''), CASE WHEN l.Provider_Type IS p.Type THEN IFNULL(l.Provider_Type, '') END, IFNULL(v.Type, ''), IFNULL(l.Food_type, ''), IFNULL(l.Meal_Type, ''), IFNULL(l.Location, ''), NULL
+        FROM (SELECT NEW.Claim_ID AS Claim_ID, NEW.Food_ID AS Food_ID, NEW.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_status WHERE ID = NEW.Status_ID) AS Status) AS r
+        LEFT JOIN food_listings_data AS l ON l.Food_ID = r.Food_ID
+        LEFT JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID
+        LEFT JOIN receivers_data AS v ON v.Receiver_ID = r.Receiver_ID;
+    END;
+
+    CREATE TRIGGER trg_changes_claims_data_update AFTER UPDATE ON claims_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'claims_data', r.Claim_ID, 'U',
+               IFNULL(r.Status, ''), CASE WHEN l.Provider_Type IS p.Type THEN IFNULL(l.Provider_Type, '') END, IFNULL(v.Type, ''), IFNULL(l.Food_type, ''), IFNULL(l.Meal_Type, ''), IFNULL(l.Location, ''), NULL
+        FROM (SELECT OLD.Claim_ID AS Claim_ID, OLD.Food_ID AS Food_ID, OLD.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_status WHERE ID = OLD.Status_ID) AS Status) AS r
+        LEFT JOIN food_listings_data AS l ON l.Food_ID = r.Food_ID
+        LEFT JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID
+        LEFT JOIN receivers_data AS v ON v.Receiver_ID = r.Receiver_ID;
+        INSERT INTO changelog (Table_Name, Row_ID, Op, status, provider_type, receiver_type, food_type, meal_type, location, city)
+        SELECT 'claims_data', r.Claim_ID, 'U',
+               IFNULL(r.Status, ''), CASE WHEN l.Provider_Type IS p.Type THEN IFNULL(l.Provider_Type, '') END, IFNULL(v.Type, ''), IFNULL(l.Food_type, ''), IFNULL(l.Meal_Type, ''), IFNULL(l.Location, ''), NULL
+        FROM (SELECT NEW.Claim_ID AS Claim_ID, NEW.Food_ID AS Food_ID, NEW.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_status WHERE ID = NEW.Status_ID) AS Status) AS r
+        LEFT JOIN food_listings_data AS l ON l.Food_ID = r.Food_ID
+        LEFT JOIN provider_data AS p ON p.Provider_ID = l.Provider_ID
+        LEFT JOIN receivers_data AS v ON v.Receiver_ID = r.Receiver_ID;
+    END;
+
+    CREATE TRIGGER trg_cube_claims_data_delete AFTER DELETE ON claims_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM (SELECT OLD.Claim_ID AS Claim_ID, OLD.Food_ID AS Food_ID, OLD.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_status WHERE ID = OLD.Status_ID) AS Status) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+
+    CREATE TRIGGER trg_cube_claims_data_insert AFTER INSERT ON claims_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM (SELECT NEW.Claim_ID AS Claim_ID, NEW.Food_ID AS Food_ID, NEW.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_status WHERE ID = NEW.Status_ID) AS Status) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+
+    CREATE TRIGGER trg_cube_claims_data_update AFTER UPDATE OF Claim_ID, Food_ID, Receiver_ID, Status_ID ON claims_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, -s.Providers, -s.Receivers, -s.Claims, -s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM (SELECT OLD.Claim_ID AS Claim_ID, OLD.Food_ID AS Food_ID, OLD.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_status WHERE ID = OLD.Status_ID) AS Status) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    INSERT INTO metrics_cube (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type, Providers, Receivers, Claims, Quantity)
+    SELECT CASE WHEN g.rolled THEN 'All' ELSE s.Location END, s.Status, s.Provider_Type, s.Receiver_Type, s.Food_type, s.Meal_Type, +s.Providers, +s.Receivers, +s.Claims, +s.Quantity
+    FROM (SELECT IFNULL(Location, '') AS Location, IFNULL(Status, '') AS Status, IFNULL(Provider_Type, '') AS Provider_Type, IFNULL(Receiver_Type, '') AS Receiver_Type, IFNULL(Food_type, '') AS Food_type, IFNULL(Meal_Type, '') AS Meal_Type, SUM(Providers) AS Providers, SUM(Receivers) AS Receivers, SUM(Claims) AS Claims, SUM(Quantity) AS Quantity FROM (
+        SELECT c.Status AS Status, 'All' AS Provider_Type, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location,
+               0 AS Providers, 0 AS Receivers, 1 AS Claims, 0 AS Quantity
+        FROM (SELECT NEW.Claim_ID AS Claim_ID, NEW.Food_ID AS Food_ID, NEW.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_status WHERE ID = NEW.Status_ID) AS Status) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) GROUP BY 1, 2, 3, 4, 5, 6) AS s,
+         (SELECT 0 AS rolled UNION ALL SELECT 1) AS g
+    WHERE NOT (g.rolled AND s.Location = 'All')
+    ON CONFLICT (Location, Status, Provider_Type, Receiver_Type, Food_type, Meal_Type) DO UPDATE SET Providers = Providers + excluded.Providers, Receivers = Receivers + excluded.Receivers, Claims = Claims + excluded.Claims, Quantity = Quantity + excluded.Quantity;
+    
+    END;
+
+    CREATE TRIGGER trg_expiry_claims_delete AFTER DELETE ON claims_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load) AND ((SELECT Value FROM dim_status WHERE ID = OLD.Status_ID) IN ('Completed'))
+    BEGIN
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = OLD.Food_ID);
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = OLD.Food_ID
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+    END;
+
+    CREATE TRIGGER trg_expiry_claims_insert AFTER INSERT ON claims_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load) AND ((SELECT Value FROM dim_status WHERE ID = NEW.Status_ID) IN ('Completed'))
+    BEGIN
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = NEW.Food_ID);
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = NEW.Food_ID
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+    END;
+
+    CREATE TRIGGER trg_expiry_claims_update AFTER UPDATE OF Food_ID, Status_ID ON claims_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load) AND ((SELECT Value FROM dim_status WHERE ID = OLD.Status_ID) IN ('Completed') OR (SELECT Value FROM dim_status WHERE ID = NEW.Status_ID) IN ('Completed'))
+    BEGIN
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = OLD.Food_ID);
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = OLD.Food_ID
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+        DELETE FROM expiry_queue
+        WHERE (Location, Expiry_Epoch, Food_ID) IN (
+            SELECT IFNULL(Location, ''), Expiry_Epoch, Food_ID FROM food_listings_data WHERE Food_ID = NEW.Food_ID);
+        INSERT OR IGNORE INTO expiry_queue (Location, Expiry_Epoch, Food_ID)
+        SELECT IFNULL(l.Location, ''), l.Expiry_Epoch, l.Food_ID
+        FROM food_listings_data AS l
+        WHERE l.Food_ID = NEW.Food_ID
+          AND l.Expiry_Epoch IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Completed'));
+    END;
+
+    CREATE TRIGGER trg_item_claims_delete AFTER DELETE ON claims_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO item_claims (Status, Food_ID, Claims)
+        SELECT s.Status, OLD.Food_ID, -1
+        FROM (SELECT IFNULL((SELECT Value FROM dim_status WHERE ID = OLD.Status_ID), '') AS Status UNION ALL SELECT 'All') AS s
+        WHERE OLD.Food_ID IS NOT NULL
+        ON CONFLICT (Status, Food_ID) DO UPDATE SET Claims = Claims + excluded.Claims;
+        DELETE FROM item_claims
+        WHERE Status IN (IFNULL((SELECT Value FROM dim_status WHERE ID = OLD.Status_ID), ''), 'All') AND Food_ID = OLD.Food_ID AND Claims = 0;
+    END;
+
+    CREATE TRIGGER trg_item_claims_insert AFTER INSERT ON claims_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO item_claims (Status, Food_ID, Claims)
+        SELECT s.Status, NEW.Food_ID, +1
+        FROM (SELECT IFNULL((SELECT Value FROM dim_status WHERE ID = NEW.Status_ID), '') AS Status UNION ALL SELECT 'All') AS s
+        WHERE NEW.Food_ID IS NOT NULL
+        ON CONFLICT (Status, Food_ID) DO UPDATE SET Claims = Claims + excluded.Claims;
+        DELETE FROM item_claims
+        WHERE Status IN (IFNULL((SELECT Value FROM dim_status WHERE ID = NEW.Status_ID), ''), 'All') AND Food_ID = NEW.Food_ID AND Claims = 0;
+    END;
+
+    CREATE TRIGGER trg_item_claims_update AFTER UPDATE OF Food_ID, Status_ID ON claims_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        INSERT INTO item_claims (Status, Food_ID, Claims)
+        SELECT s.Status, OLD.Food_ID, -1
+        FROM (SELECT IFNULL((SELECT Value FROM dim_status WHERE ID = OLD.Status_ID), '') AS Status UNION ALL SELECT 'All') AS s
+        WHERE OLD.Food_ID IS NOT NULL
+        ON CONFLICT (Status, Food_ID) DO UPDATE SET Claims = Claims + excluded.Claims;
+        DELETE FROM item_claims
+        WHERE Status IN (IFNULL((SELECT Value FROM dim_status WHERE ID = OLD.Status_ID), ''), 'All') AND Food_ID = OLD.Food_ID AND Claims = 0;
+        INSERT INTO item_claims (Status, Food_ID, Claims)
+        SELECT s.Status, NEW.Food_ID, +1
+        FROM (SELECT IFNULL((SELECT Value FROM dim_status WHERE ID = NEW.Status_ID), '') AS Status UNION ALL SELECT 'All') AS s
+        WHERE NEW.Food_ID IS NOT NULL
+        ON CONFLICT (Status, Food_ID) DO UPDATE SET Claims = Claims + excluded.Claims;
+        DELETE FROM item_claims
+        WHERE Status IN (IFNULL((SELECT Value FROM dim_status WHERE ID = NEW.Status_ID), ''), 'All') AND Food_ID = NEW.Food_ID AND Claims = 0;
+    END;
+
+    CREATE TRIGGER trg_rollup_claims_data_delete AFTER DELETE ON claims_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM (SELECT OLD.Claim_ID AS Claim_ID, OLD.Food_ID AS Food_ID, OLD.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_status WHERE ID = OLD.Status_ID) AS Status, OLD.Timestamp AS Timestamp) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    END;
+
+    CREATE TRIGGER trg_rollup_claims_data_insert AFTER INSERT ON claims_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM (SELECT NEW.Claim_ID AS Claim_ID, NEW.Food_ID AS Food_ID, NEW.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_status WHERE ID = NEW.Status_ID) AS Status, NEW.Timestamp AS Timestamp) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    END;
+
+    CREATE TRIGGER trg_rollup_claims_data_update AFTER UPDATE OF Claim_ID, Food_ID, Receiver_ID, Status_ID, Timestamp ON claims_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), -SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM (SELECT OLD.Claim_ID AS Claim_ID, OLD.Food_ID AS Food_ID, OLD.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_status WHERE ID = OLD.Status_ID) AS Status, OLD.Timestamp AS Timestamp) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    INSERT INTO claims_rollup (Grain, Period, Status, Receiver_Type, Food_type, Meal_Type, Location, Claims)
+    SELECT g.Grain, IFNULL(CASE g.Grain WHEN 'day' THEN date(s.Ts) WHEN 'week' THEN date(s.Ts, '-6 days', 'weekday 1') WHEN 'month' THEN strftime('%Y-%m-01', s.Ts) END, ''), IFNULL(s.Status, ''), IFNULL(s.Receiver_Type, ''), IFNULL(s.Food_type, ''), IFNULL(s.Meal_Type, ''), IFNULL(s.Location, ''), +SUM(s.Claims)
+    FROM (
+        SELECT c.Timestamp AS Ts, c.Status AS Status, r.Type AS Receiver_Type,
+               l.Food_type AS Food_type, l.Meal_Type AS Meal_Type, l.Location AS Location, 1 AS Claims
+        FROM (SELECT NEW.Claim_ID AS Claim_ID, NEW.Food_ID AS Food_ID, NEW.Receiver_ID AS Receiver_ID, (SELECT Value FROM dim_status WHERE ID = NEW.Status_ID) AS Status, NEW.Timestamp AS Timestamp) AS c
+        JOIN food_listings_data AS l ON l.Food_ID = c.Food_ID
+        JOIN receivers_data AS r ON r.Receiver_ID = c.Receiver_ID) AS s, (SELECT 'day' AS Grain UNION ALL SELECT 'week' AS Grain UNION ALL SELECT 'month' AS Grain) AS g
+    WHERE true
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+    ON CONFLICT DO UPDATE SET Claims = Claims + excluded.Claims;
+    
+    END;
+
+    CREATE TRIGGER trg_version_claims_data_delete AFTER DELETE ON claims_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count - 1 WHERE name = 'claims_data';
+    END;
+
+    CREATE TRIGGER trg_version_claims_data_insert AFTER INSERT ON claims_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1, row_count = row_count + 1 WHERE name = 'claims_data';
+    END;
+
+    CREATE TRIGGER trg_version_claims_data_update AFTER UPDATE ON claims_facts
+    WHEN NOT EXISTS (SELECT 1 FROM bulk_load)
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE name = 'claims_data';
+    END;
+
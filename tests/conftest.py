@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+import synthetic  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def synthetic_db(tmp_path_factory):
+    """A small migrated synthetic database, shared by the tests that only read it."""
+    return synthetic.build(str(tmp_path_factory.mktemp('db') / 'foodwaste.db'), claims=3000)
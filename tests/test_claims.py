@@ -0,0 +1,75 @@
+"""foodwaste_claims.ClaimService: startup failures, its counters and failures within a group commit."""
+
+import shutil
+import sqlite3 as sql
+from concurrent.futures import wait
+
+import pytest
+
+import foodwaste_claims
+
+
+@pytest.fixture
+def path(synthetic_db, tmp_path):
+    path = str(tmp_path / 'claims.db')
+    shutil.copy(synthetic_db, path)
+    return path
+
+
+def unclaimed_many(path, n):
+    conn = sql.connect(path)
+    food_ids = [row[0] for row in conn.execute("""
+        SELECT Food_ID FROM food_listings_data AS l
+        WHERE NOT EXISTS (SELECT 1 FROM claims_data AS c
+                          WHERE c.Food_ID = l.Food_ID AND c.Status IN ('Pending', 'Completed'))
+        ORDER BY Food_ID LIMIT ?""", (n,))]
+    conn.close()
+    return food_ids
+
+
+def unclaimed(path):
+    return unclaimed_many(path, 1)[0]
+
+
+def test_unopenable_database_raises(tmp_path):
+    with pytest.raises(sql.OperationalError):
+        foodwaste_claims.ClaimService(str(tmp_path / 'missing' / 'claims.db'))
+
+
+def test_stats_count_every_write_and_conflict(path):
+    service = foodwaste_claims.ClaimService(path)
+    try:
+        claim = service.create(unclaimed(path), 1)
+        moves = [service.submit_transition(claim.claim_id, status, claim.version)
+                 for status in ('Completed', 'Cancelled', 'Completed')]
+        wait(moves)
+        assert sum(move.exception() is None for move in moves) == 1
+        stats = service.stats()
+    finally:
+        service.close()
+    assert stats['writes'] == 4
+    assert stats['conflicts'] == 2
+
+
+def test_a_failing_write_fails_alone(path):
+    first, second, third = unclaimed_many(path, 3)
+    conn = sql.connect(path)
+    top = conn.execute("SELECT MAX(Claim_ID) FROM claims_data").fetchone()[0]
+    conn.execute("CREATE TRIGGER block AFTER INSERT ON claims_facts WHEN NEW.Food_ID = %d "
+                 "BEGIN SELECT RAISE(ABORT, 'blocked'); END" % second)
+    conn.close()
+    # A long max_wait puts the three writes in one group commit
+    service = foodwaste_claims.ClaimService(path, max_wait=0.5)
+    try:
+        futures = [service.submit_create(food_id, 1) for food_id in (first, second, third)]
+        wait(futures)
+        stats = service.stats()
+    finally:
+        service.close()
+    assert stats['batches'] == 1
+    assert isinstance(futures[1].exception(), sql.IntegrityError)
+    assert [futures[0].result().food_id, futures[2].result().food_id] == [first, third]
+    conn = sql.connect(path)
+    stored = conn.execute("SELECT Food_ID FROM claims_data WHERE Claim_ID > ? ORDER BY Claim_ID", (top,)).fetchall()
+    conn.close()
+    assert stored == [(first,), (third,)]
@@ -0,0 +1,108 @@
+"""
+The derived tables must equal their from-scratch rebuild after an import, a
+claim write, an update and a delete, whichever path maintained them.
+"""
+
+import shutil
+
+import pytest
+
+import foodwaste_cities
+import foodwaste_claims
+import foodwaste_cube
+import foodwaste_expiry
+import foodwaste_grid
+import foodwaste_import
+import foodwaste_rollups
+from test_import import claims
+
+# Derived table -> the condition its rows must meet to count; cells whose
+# deltas cancelled out stay behind as zeroes, and a rebuild has none
+DERIVED = dict(
+    metrics_cube=' OR '.join(f"{m} != 0" for m in foodwaste_cube.MEASURES),
+    **{rollup: f"{spec['measure']} != 0" for rollup, spec in foodwaste_rollups.ROLLUPS.items()},
+    city_stats='Providers != 0 OR Receivers != 0',
+    expiry_queue='1',
+    item_claims='Claims != 0',
+)
+
+
+def snapshot(conn):
+    return {table: conn.execute(f"SELECT * FROM {table} WHERE {where} ORDER BY 1, 2, 3").fetchall()
+            for table, where in DERIVED.items()}
+
+
+def rebuilt(conn):
+    """The derived tables filled from the base tables alone, read inside a savepoint that is rolled back."""
+    conn.execute("SAVEPOINT rebuild")
+    try:
+        for table in DERIVED:
+            conn.execute(f"DELETE FROM {table}")
+        for source in foodwaste_cube.SOURCES.values():
+            conn.execute(foodwaste_cube.apply_delta(source.format(**foodwaste_cube.TABLE_NAMES)))
+        names = {p: t for t, (p, _, _) in foodwaste_rollups.TABLES.items()}
+        for rollup, spec in foodwaste_rollups.ROLLUPS.items():
+            conn.execute(foodwaste_rollups.apply_delta(rollup, spec['source'].format(**names)))
+        for table in foodwaste_cities.SIDES:
+            conn.execute(foodwaste_cities.apply_delta(table, table))
+        conn.execute(foodwaste_expiry.apply_delta('food_listings_data', 'food_listings_data'))
+        conn.execute(foodwaste_grid.apply_delta('claims_data'))
+        return snapshot(conn)
+    finally:
+        conn.execute("ROLLBACK TO rebuild")
+        conn.execute("RELEASE rebuild")
+
+
+def nothing(conn, path):
+    pass
+
+
+def bulk_import(conn, path):
+    top = conn.execute("SELECT MAX(Food_ID) FROM food_listings_data").fetchone()[0]
+    listings = [{'Food_Name': 'Rice', 'Quantity': None if i % 7 == 0 else i % 40 + 1,
+                 'Expiry_Date': f'2025-04-{i % 28 + 1:02d} 00:00:00', 'Provider_ID': i % 50 + 1,
+                 'Provider_Type': 'Restaurant', 'Location': None if i % 11 == 0 else f'City {i % 30}',
+                 'Meal_Type': 'Dinner', 'Food_type': 'Vegan'} for i in range(500)]
+    foodwaste_import.import_rows(conn, 'listings', listings, batch_size=200)
+    rows = claims(path, 1500)
+    for i, row in enumerate(rows[::3]):
+        row['Food_ID'] = top + 1 + i % 500
+    foodwaste_import.import_rows(conn, 'claims', rows, batch_size=400)
+
+
+def claim_writes(conn, path):
+    food_ids = [row[0] for row in conn.execute("""
+        SELECT Food_ID FROM food_listings_data AS l
+        WHERE NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID)
+        ORDER BY Food_ID LIMIT 20""")]
+    for i, food_id in enumerate(food_ids):
+        claim = foodwaste_claims.create_claim(conn, food_id, i + 1)
+        if i % 2:
+            foodwaste_claims.transition(conn, claim.claim_id, 'Completed', claim.version)
+
+
+def updates_and_deletes(conn, path):
+    conn.execute("BEGIN")
+    conn.execute("UPDATE claims_data SET Status = 'Completed' WHERE Claim_ID % 13 = 0")
+    conn.execute("UPDATE food_listings_data SET Location = 'Moved', Quantity = NULL WHERE Food_ID % 17 = 0")
+    conn.execute("UPDATE provider_data SET Type = 'Moved', City = 'Moved' WHERE Provider_ID % 19 = 0")
+    conn.execute("UPDATE receivers_data SET Type = NULL WHERE Receiver_ID % 23 = 0")
+    conn.execute("DELETE FROM claims_data WHERE Claim_ID % 5 = 0 OR Food_ID % 29 = 0")
+    conn.execute("DELETE FROM food_listings_data WHERE Food_ID % 29 = 0")
+    conn.execute("COMMIT")
+
+
+@pytest.mark.parametrize('change', [nothing, bulk_import, claim_writes, updates_and_deletes])
+def test_derived_tables_equal_their_rebuild(synthetic_db, tmp_path, change):
+    path = str(tmp_path / 'derived.db')
+    shutil.copy(synthetic_db, path)
+    conn = foodwaste_import.connect_writer(path)
+    try:
+        change(conn, path)
+        got, expected = snapshot(conn), rebuilt(conn)
+        for table in DERIVED:
+            assert got[table] == expected[table], table
+        for name, row_count in conn.execute("SELECT name, row_count FROM table_versions").fetchall():
+            assert row_count == conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0], name
+    finally:
+        conn.close()
@@ -0,0 +1,139 @@
+"""foodwaste_engine.ColumnarEngine must return what the SQL analyses return."""
+
+import math
+import random
+import shutil
+import sqlite3 as sql
+
+import pytest
+
+import foodwaste_engine
+import foodwaste_queries as fq
+
+COMBOS = 20
+
+
+@pytest.fixture(scope='module')
+def path(synthetic_db, tmp_path_factory):
+    """
+    The synthetic database with NULL quantities: a tenth of the listings, every
+    listing of provider 1, and every listing claimed by receiver 1, so that
+    SUM and AVG meet groups that are partly and wholly NULL. Some names,
+    types, cities and food types are NULL too, and must group apart from ''.
+    """
+    path = str(tmp_path_factory.mktemp('engine') / 'nulls.db')
+    shutil.copy(synthetic_db, path)
+    conn = sql.connect(path)
+    with conn:
+        conn.execute("UPDATE food_listings_data SET Quantity = NULL WHERE Food_ID % 10 = 3 OR Provider_ID = 1")
+        conn.execute("UPDATE food_listings_data SET Quantity = NULL "
+                     "WHERE Food_ID IN (SELECT Food_ID FROM claims_data WHERE Receiver_ID = 1)")
+        conn.execute("UPDATE provider_data SET Name = NULL, City = NULL WHERE Provider_ID % 7 = 2")
+        conn.execute("UPDATE provider_data SET Name = '' WHERE Provider_ID % 7 = 3")
+        conn.execute("UPDATE receivers_data SET Name = NULL, Type = NULL WHERE Receiver_ID % 5 = 2")
+        conn.execute("UPDATE food_listings_data SET Food_type = NULL WHERE Food_ID % 9 = 4")
+    conn.close()
+    return path
+
+
+@pytest.fixture(scope='module')
+def engine(path):
+    engine = foodwaste_engine.ColumnarEngine(path)
+    yield engine
+    engine.close()
+
+
+def combos(engine, n):
+    rng = random.Random(3)
+    choices = {
+        'status': engine.status.values,
+        'provider_type': engine.provider_type.values,
+        'receiver_type': engine.receiver_type.values,
+        'food_type': engine.food_type.values,
+        'meal_type': engine.meal_type.values,
+        'location': engine.location.values[:50],
+    }
+    yield fq.filter_params()
+    for _ in range(n - 1):
+        yield fq.filter_params(**{k: rng.choice([x for x in v if x is not None]) if rng.random() < 0.4 else 'All'
+                                  for k, v in choices.items()})
+
+
+def same(a, b):
+    if isinstance(a, float) or isinstance(b, float):
+        return a is not None and b is not None and math.isclose(a, b, rel_tol=1e-9)
+    return a == b
+
+
+def check(analysis, expected, got):
+    (sql_columns, sql_rows), (columns, rows) = expected, got
+    assert list(sql_columns) == list(columns)
+    assert len(sql_rows) == len(rows)
+    if 'LIMIT' in fq.ANALYSES[analysis]:
+        # Compare the ranked metric only: which of several tied rows make the cut is unspecified
+        pairs = zip((r[-1] for r in sql_rows), (r[-1] for r in rows))
+    else:
+        # Ties in ORDER BY may come back in either order, so rows are compared as multisets
+        pairs = zip(sorted(sql_rows, key=repr), sorted(rows, key=repr))
+        pairs = ((x, y) for a, b in pairs for x, y in zip(a, b))
+    for a, b in pairs:
+        assert same(a, b), (a, b)
+
+
+@pytest.mark.parametrize('analysis', list(foodwaste_engine.ColumnarEngine.ANALYSES))
+def test_analysis_matches_sql(engine, path, analysis):
+    conn = fq.connect(path)
+    try:
+        for params in combos(engine, COMBOS):
+            expected = fq.fetch(conn, fq.ANALYSES[analysis], fq.bind_ids(conn, params))
+            check(analysis, expected, engine.run(analysis, params))
+    finally:
+        conn.close()
+
+
+def test_null_quantities_are_skipped(engine, path):
+    conn = fq.connect(path)
+    params = fq.filter_params()
+    name = conn.execute("SELECT Name FROM provider_data WHERE Provider_ID = 1").fetchone()[0]
+    assert dict(engine.run('Total Quantity of Food Donated by Each Provider', params)[1])[name] is None
+    receiver = conn.execute("SELECT Name FROM receivers_data WHERE Receiver_ID = 1").fetchone()[0]
+    averages = dict(engine.run('Average Quantity of Food Claimed per Receiver', params)[1])
+    expected = dict(fq.fetch(conn, fq.ANALYSES['Average Quantity of Food Claimed per Receiver'],
+                             fq.bind_ids(conn, params))[1])
+    assert averages[receiver] is None and expected[receiver] is None
+    conn.close()
+
+
+def test_null_text_decodes_to_none(engine, path):
+    params = fq.filter_params()
+    conn = fq.connect(path)
+    for analysis in ('Percentage of Food Providers by Type', 'Most Commonly Available Food Types',
+                     'Number of Food Providers and Receivers in Each City',
+                     'Total Quantity of Food Donated by Each Provider'):
+        rows = engine.run(analysis, params)[1]
+        expected = fq.fetch(conn, fq.ANALYSES[analysis], fq.bind_ids(conn, params))[1]
+        assert [r[0] for r in rows].count(None) == [r[0] for r in expected].count(None)
+    names = [r[0] for r in engine.run('Total Quantity of Food Donated by Each Provider', params)[1]]
+    assert None in names and '' in names
+    conn.close()
+
+
+def reference_rows(engine, params):
+    """Claims matching the five fact-view filters, computed with plain boolean masks."""
+    np = foodwaste_engine.np
+    mask = (engine.claim_listing >= 0) & (engine.claim_receiver >= 0)
+    for name, rows in (('food_type', engine.claim_listing), ('meal_type', engine.claim_listing),
+                       ('location', engine.claim_listing), ('receiver_type', engine.claim_receiver)):
+        if params[name] is not None:
+            column = getattr(engine, name)
+            mask &= column.codes[np.where(rows >= 0, rows, 0)] == column.code(params[name])
+    if params['status'] is not None:
+        mask &= engine.status.codes == engine.status.code(params['status'])
+    return np.flatnonzero(mask)
+
+
+def test_bitmap_index_matches_masks(engine):
+    for params in combos(engine, COMBOS):
+        engine.claim_index._cache.clear()
+        assert list(engine._claim_mask(params)) == list(reference_rows(engine, params))
+        assert list(engine._claim_mask(params)) == list(reference_rows(engine, params))  # memoized
@@ -0,0 +1,64 @@
+"""foodwaste_expiry: the nearing-expiry queue must match a scan of the base tables and skip expired food."""
+
+import datetime
+import shutil
+import sqlite3 as sql
+
+import pytest
+
+import foodwaste_expiry
+
+SCAN = """
+    SELECT l.Food_ID
+    FROM food_listings_data AS l
+    WHERE (:location IS NULL OR l.Location = :location)
+      AND l.Expiry_Epoch >= :after
+      AND NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID AND c.Status = 'Completed')
+    ORDER BY l.Expiry_Epoch, l.Food_ID
+    LIMIT :limit;
+    """
+
+
+@pytest.fixture
+def conn(synthetic_db, tmp_path):
+    path = str(tmp_path / 'expiry.db')
+    shutil.copy(synthetic_db, path)
+    conn = sql.connect(path, isolation_level=None)
+    yield conn
+    conn.close()
+
+
+def unclaimed(conn, n):
+    return [row[0] for row in conn.execute("""
+        SELECT Food_ID FROM food_listings_data AS l
+        WHERE NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID)
+        ORDER BY Food_ID LIMIT ?""", (n,))]
+
+
+def ids(conn, **kwargs):
+    return [row[0] for row in foodwaste_expiry.next_expiring(conn, **kwargs)[1]]
+
+
+def test_expired_food_is_left_out_by_default(conn):
+    expired, fresh = unclaimed(conn, 2)
+    now = datetime.datetime.now()
+    for food_id, moment in ((expired, now - datetime.timedelta(hours=1)), (fresh, now + datetime.timedelta(hours=1))):
+        conn.execute("UPDATE food_listings_data SET Expiry_Date = ? WHERE Food_ID = ?",
+                     (moment.strftime('%Y-%m-%d %H:%M:%S'), food_id))
+    # The synthetic listings all expired in 2025, so the fresh one is the only one left
+    assert ids(conn) == [fresh]
+    assert ids(conn, after=now - datetime.timedelta(days=1))[:2] == [expired, fresh]
+
+
+def test_queue_matches_a_scan_after_writes(conn):
+    location = conn.execute("SELECT Location FROM food_listings_data ORDER BY Food_ID LIMIT 1").fetchone()[0]
+    food_id = conn.execute("SELECT Food_ID FROM expiry_queue ORDER BY Expiry_Epoch, Food_ID LIMIT 1").fetchone()[0]
+    conn.execute("UPDATE food_listings_data SET Expiry_Date = datetime(Expiry_Date, '-3 days') WHERE Food_ID % 11 = 0")
+    conn.execute("DELETE FROM claims_data WHERE Claim_ID % 7 = 0")
+    conn.execute("INSERT INTO claims_data (Claim_ID, Food_ID, Receiver_ID, Status, Timestamp) "
+                 "SELECT MAX(Claim_ID) + 1, ?, 1, 'Completed', '2025-03-02 10:00:00' FROM claims_data", (food_id,))
+    for where in (None, location):
+        params = foodwaste_expiry.expiry_params(where, 50, '2025-02-01')
+        assert ids(conn, location=where, limit=50, after='2025-02-01') == [
+            row[0] for row in conn.execute(SCAN, params)]
+    assert food_id not in ids(conn, limit=500, after='2025-02-01')
@@ -0,0 +1,38 @@
+"""foodwaste_export must write the rows its statement returns, and stop at its byte limit."""
+
+import pyarrow.csv
+import pyarrow.parquet
+import pytest
+
+import foodwaste_export
+import foodwaste_queries as fq
+
+
+@pytest.fixture(scope='module')
+def conn(synthetic_db):
+    conn = fq.connect(synthetic_db)
+    yield conn
+    conn.close()
+
+
+@pytest.mark.parametrize('fmt', foodwaste_export.FORMATS)
+@pytest.mark.parametrize('name, filters', [('claims', {}), ('claims', {'status': 'Completed'}),
+                                           ('listings', {'meal_type': 'Dinner'}),
+                                           ('Percentage of Food Claims by Status', {})])
+def test_export_holds_every_row(conn, tmp_path, name, filters, fmt):
+    params = fq.filter_params(**filters)
+    sql = foodwaste_export.statement(name, params)
+    expected = conn.execute(sql, fq.bind_ids(conn, params)).fetchall()
+    path = str(tmp_path / f'out.{fmt}')
+    result = foodwaste_export.export(conn, sql, params, path, batch_size=500)
+    table = pyarrow.parquet.read_table(path) if fmt == 'parquet' else pyarrow.csv.read_csv(path)
+    assert result.rows == table.num_rows == len(expected)
+    if fmt == 'parquet':
+        assert [tuple(row.values()) for row in table.to_pylist()] == expected
+
+
+def test_export_stops_at_its_byte_limit(conn, tmp_path):
+    params = fq.filter_params()
+    with pytest.raises(foodwaste_export.ExportTooLarge):
+        foodwaste_export.export(conn, foodwaste_export.FACTS['claims'], params, str(tmp_path / 'out.csv'),
+                                batch_size=100, max_bytes=10_000)
@@ -0,0 +1,58 @@
+"""foodwaste_grid keyset pages must cover every row once, in order, when sort values are NULL."""
+
+import shutil
+import sqlite3 as sql
+
+import pytest
+
+import foodwaste_grid
+import foodwaste_queries as fq
+
+LIMIT = 2
+
+
+@pytest.fixture(scope='module')
+def conn(synthetic_db, tmp_path_factory):
+    """
+    The synthetic database with NULL names: every other provider and receiver
+    in the busiest city, and one provider whose listings all have a NULL
+    quantity, so that it totals NULL.
+    """
+    path = str(tmp_path_factory.mktemp('grid') / 'nulls.db')
+    shutil.copy(synthetic_db, path)
+    conn = sql.connect(path)
+    with conn:
+        city = busiest_city(conn)
+        conn.execute("UPDATE provider_data SET Name = NULL WHERE City = ? AND Provider_ID % 2 = 0", (city,))
+        conn.execute("UPDATE receivers_data SET Name = NULL WHERE City = ? AND Receiver_ID % 2 = 0", (city,))
+        conn.execute("UPDATE provider_data SET Name = 'No quantity' WHERE Provider_ID = 1")
+        conn.execute("UPDATE food_listings_data SET Quantity = NULL WHERE Provider_ID = 1")
+    yield conn
+    conn.close()
+
+
+def busiest_city(conn):
+    return conn.execute("SELECT City FROM provider_data GROUP BY City ORDER BY COUNT(*) DESC, City LIMIT 1").fetchone()[0]
+
+
+def pages(conn, grid, params, sort):
+    rows, after = [], None
+    while True:
+        page = foodwaste_grid.fetch_page(conn, grid, params, sort, after, LIMIT)
+        rows += page.rows
+        if page.after is None:
+            return rows
+        after = page.after
+
+
+@pytest.mark.parametrize('name, sort', [(name, sort) for name, grid in foodwaste_grid.GRIDS.items()
+                                        for sort in grid.sorts])
+def test_pages_cover_every_row_in_order(conn, name, sort):
+    grid = foodwaste_grid.GRIDS[name]
+    params = fq.bind_ids(conn, fq.filter_params(city=busiest_city(conn)))
+    column, descending = grid.sorts[sort]
+    direction = 'DESC' if descending else 'ASC'
+    expected = conn.execute(f"SELECT * FROM ({grid.source}) ORDER BY {column} {direction}, {grid.key} {direction}",
+                            params).fetchall()
+    assert any(None in row for row in expected) or not grid.nullable
+    assert pages(conn, grid, params, sort) == expected
@@ -0,0 +1,68 @@
+"""foodwaste_import must commit batch by batch, releasing the write lock in between."""
+
+import random
+import shutil
+import sqlite3 as sql
+
+import pytest
+
+import foodwaste_import
+
+BATCH = 200
+
+
+@pytest.fixture
+def path(synthetic_db, tmp_path):
+    path = str(tmp_path / 'import.db')
+    shutil.copy(synthetic_db, path)
+    return path
+
+
+def claims(path, n, seed=5):
+    conn = sql.connect(path)
+    foods = conn.execute("SELECT MAX(Food_ID) FROM food_listings_data").fetchone()[0]
+    receivers = conn.execute("SELECT MAX(Receiver_ID) FROM receivers_data").fetchone()[0]
+    conn.close()
+    rng = random.Random(seed)
+    return [{'Food_ID': rng.randint(1, foods), 'Receiver_ID': rng.randint(1, receivers),
+             'Status': rng.choice(('Pending', 'Completed', 'Cancelled')), 'Timestamp': '2025-03-10 12:00:00'}
+            for _ in range(n)]
+
+
+def test_the_lock_is_released_between_batches(path):
+    other = sql.connect(path, timeout=0, isolation_level=None)
+    locked = []
+
+    def rows():
+        for i, row in enumerate(claims(path, 3 * BATCH)):
+            if i and i % BATCH == 0:
+                try:
+                    other.execute("BEGIN IMMEDIATE")
+                    other.execute("ROLLBACK")
+                    locked.append(False)
+                except sql.OperationalError:
+                    locked.append(True)
+            yield row
+
+    conn = foodwaste_import.connect_writer(path)
+    try:
+        result = foodwaste_import.import_rows(conn, 'claims', rows(), batch_size=BATCH)
+    finally:
+        conn.close()
+        other.close()
+    assert result.batches == 3
+    assert locked == [False, False]
+
+
+def test_a_bad_batch_leaves_the_earlier_ones_committed(path):
+    rows = claims(path, 2 * BATCH)
+    rows[BATCH + 1]['Food_ID'] = -1
+    conn = foodwaste_import.connect_writer(path)
+    try:
+        before = conn.execute("SELECT COUNT(*) FROM claims_data").fetchone()[0]
+        with pytest.raises(sql.IntegrityError):
+            foodwaste_import.import_rows(conn, 'claims', rows, batch_size=BATCH)
+        assert conn.execute("SELECT COUNT(*) FROM claims_data").fetchone()[0] == before + BATCH
+        assert conn.execute("SELECT COUNT(*) FROM bulk_load").fetchone()[0] == 0
+    finally:
+        conn.close()
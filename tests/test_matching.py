@@ -0,0 +1,60 @@
+"""foodwaste_matching: proposals stay in their city, skip expired food and put the soonest expiry first."""
+
+import datetime
+import shutil
+import sqlite3 as sql
+from collections import Counter
+
+import numpy as np
+import pytest
+
+import foodwaste_matching
+
+
+@pytest.fixture
+def conn(synthetic_db, tmp_path):
+    path = str(tmp_path / 'matching.db')
+    shutil.copy(synthetic_db, path)
+    conn = sql.connect(path, isolation_level=None)
+    yield conn
+    conn.close()
+
+
+def expire(conn, food_id, moment):
+    conn.execute("UPDATE food_listings_data SET Expiry_Date = ? WHERE Food_ID = ?",
+                 (moment.strftime('%Y-%m-%d %H:%M:%S'), food_id))
+
+
+def test_proposals_respect_cities_and_capacity(conn):
+    proposals = foodwaste_matching.propose(conn, capacity=2, after='2025-03-01')
+    cities = dict(conn.execute("SELECT Receiver_ID, City FROM receivers_data"))
+    assert proposals
+    assert all(cities[p.receiver_id] == p.location for p in proposals)
+    assert len({p.food_id for p in proposals}) == len(proposals)
+    assert max(Counter(p.receiver_id for p in proposals).values()) <= 2
+
+
+def test_expired_food_is_left_out_and_the_soonest_is_most_urgent(conn):
+    open_ids = [row[0] for row in conn.execute(f"""
+        SELECT Food_ID FROM food_listings_data AS l
+        WHERE NOT EXISTS (SELECT 1 FROM claims_data AS c WHERE c.Food_ID = l.Food_ID
+                          AND c.Status IN ({foodwaste_matching._LIVE}))
+        ORDER BY Food_ID LIMIT 3""")]
+    now = datetime.datetime.now()
+    for food_id, days in zip(open_ids, (-1, 1, 10)):
+        expire(conn, food_id, now + datetime.timedelta(days=days))
+    # The synthetic listings all expired in 2025, so only the two fresh ones are open now
+    data = foodwaste_matching.MatchingInput(conn)
+    assert data.food_id.tolist() == open_ids[1:]
+    soon, later = data.urgency
+    assert 0.4 < soon < 0.6 and 0.05 < later < 0.1
+    assert {p.food_id for p in foodwaste_matching.match(data)} <= set(open_ids[1:])
+
+
+def test_urgency_counts_days_left_from_after(conn):
+    data = foodwaste_matching.MatchingInput(conn, '2025-03-01')
+    expiry = np.array([conn.execute("SELECT Expiry_Epoch FROM food_listings_data WHERE Food_ID = ?",
+                                    (int(food_id),)).fetchone()[0] for food_id in data.food_id[:50]])
+    order = np.argsort(expiry, kind='stable')
+    assert (np.diff(data.urgency[:50][order]) <= 0).all()
+    assert data.urgency.max() <= 1.0
@@ -0,0 +1,55 @@
+"""foodwaste_pool.ReadPool: read-only connections, one per thread, reused once a thread is done."""
+
+import sqlite3 as sql
+import threading
+
+import pytest
+
+import foodwaste_pool
+
+
+@pytest.fixture
+def pool(synthetic_db):
+    pool = foodwaste_pool.ReadPool(synthetic_db)
+    yield pool
+    pool.close()
+
+
+def on_thread(pool, release=True):
+    """The id of the connection a new thread is lent; without release it goes back when the thread ends."""
+    lent = []
+
+    def run():
+        lent.append(id(pool.connection()))
+        if release:
+            pool.release()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    return lent[0]
+
+
+def test_connections_are_read_only(pool):
+    conn = pool.connection()
+    assert conn.execute("SELECT COUNT(*) FROM claims_data").fetchone()[0] > 0
+    with pytest.raises(sql.OperationalError):
+        conn.execute("DELETE FROM claims_data")
+
+
+def test_a_thread_keeps_its_connection(pool):
+    assert pool.connection() is pool.connection()
+    assert on_thread(pool) != id(pool.connection())
+
+
+@pytest.mark.parametrize('release', [True, False])
+def test_connections_are_reused_across_threads(pool, release):
+    first = on_thread(pool, release)
+    assert on_thread(pool, release) == first
+    assert pool.stats()['opened'] == 1
+
+
+def test_closed_pool_lends_nothing(pool):
+    pool.close()
+    with pytest.raises(sql.ProgrammingError):
+        pool.connection()
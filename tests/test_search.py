@@ -0,0 +1,64 @@
+"""foodwaste_search must find the rows a LIKE scan finds, and follow writes to the contact tables."""
+
+import shutil
+
+import pytest
+
+import foodwaste_import
+import foodwaste_queries as fq
+import foodwaste_search
+
+WIDE = 10_000
+
+
+@pytest.fixture
+def conn(synthetic_db, tmp_path):
+    path = str(tmp_path / 'search.db')
+    shutil.copy(synthetic_db, path)
+    conn = foodwaste_import.connect_writer(path)
+    yield conn
+    conn.close()
+
+
+def scanned(conn, text, params):
+    """(Kind, ID) of every contact holding every searchable word of text, by LIKE '%word%'."""
+    words = [w for w in text.split() if len(w) >= foodwaste_search.MIN_LENGTH]
+    found = set()
+    for kind, name in (('Provider', 'provider_search'), ('Receiver', 'receiver_search')):
+        table, key, columns, _ = foodwaste_search.TABLES[name]
+        type_filter = 'provider_type' if kind == 'Provider' else 'receiver_type'
+        where = ' AND '.join('(' + ' OR '.join(f"{c} LIKE '%' || :w{i} || '%'" for c in columns) + ')'
+                             for i in range(len(words)))
+        query = f"SELECT {key} FROM {table} WHERE {where} AND (:t IS NULL OR Type = :t)"
+        bound = {f'w{i}': w for i, w in enumerate(words)}
+        found |= {(kind, row[0]) for row in conn.execute(query, dict(bound, t=params[type_filter]))}
+    return found
+
+
+def searched(conn, text, params):
+    _, rows = foodwaste_search.search(conn, text, params, limit=WIDE, candidates=WIDE)
+    return {(row[0], row[1]) for row in rows}
+
+
+@pytest.mark.parametrize('text, filters', [('Provider 1', {}), ('market street', {}), ('City 13', {}),
+                                           ('555-00000', {'provider_type': 'Restaurant'}),
+                                           ('eceiver', {'receiver_type': 'Shelter'}), ('nowhere', {})])
+def test_search_finds_what_a_scan_finds(conn, text, filters):
+    params = fq.filter_params(**filters)
+    assert searched(conn, text, params) == scanned(conn, text, params)
+
+
+def test_search_follows_writes(conn):
+    params = fq.filter_params()
+    conn.execute("UPDATE provider_data SET Name = 'Harbour Pantry' WHERE Provider_ID = 2")
+    conn.execute("DELETE FROM receivers_data WHERE Receiver_ID NOT IN (SELECT Receiver_ID FROM claims_data) "
+                 "AND City = 'City 16'")
+    conn.execute("INSERT INTO receivers_data (Name, Type, City, Contact) "
+                 "VALUES ('Harbour Shelter', 'Shelter', 'City 16', '+1-777')")
+    for text in ('harbour', 'Provider 2', 'City 16'):
+        assert searched(conn, text, params) == scanned(conn, text, params)
+    assert ('Provider', 2) in searched(conn, 'harbour pantry', params)
+
+
+def test_short_words_are_ignored(conn):
+    assert foodwaste_search.search(conn, 'a b', fq.filter_params()) == (list(foodwaste_search.COLUMNS), [])